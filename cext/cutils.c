@@ -14,6 +14,7 @@
  * limitations under the License.
  */
 
+#define PY_SSIZE_T_CLEAN
 #include <Python.h>
 
 #ifdef _MSC_VER
@@ -27,20 +28,27 @@ typedef unsigned __int64 uint64_t;
 #include <stdint.h>
 #endif
 
+#include <string.h>
+
 static int32_t FNV1_OFFSET_BASIS = 0x811c9dc5;
 static int32_t FNV1_PRIME = 0x01000193;
 
 
 PyObject* hashcode(PyObject* self, PyObject *args);
 PyObject* schema_id(PyObject* self, PyObject *args);
+PyObject* write_binary_object(PyObject* self, PyObject *args);
+PyObject* read_binary_object(PyObject* self, PyObject *args);
 
 PyObject* str_hashcode(PyObject* data);
 int32_t str_hashcode_(PyObject* data, int lower);
 PyObject* b_hashcode(PyObject* data);
+int32_t b_hashcode_(const char* buf, Py_ssize_t sz);
 
 static PyMethodDef methods[] = {
     {"hashcode", (PyCFunction) hashcode, METH_VARARGS, ""},
     {"schema_id", (PyCFunction) schema_id, METH_VARARGS, ""},
+    {"write_binary_object", (PyCFunction) write_binary_object, METH_VARARGS, ""},
+    {"read_binary_object", (PyCFunction) read_binary_object, METH_VARARGS, ""},
     {NULL, NULL, 0, NULL}       /* Sentinel */
 };
 
@@ -59,6 +67,9 @@ static struct PyModuleDef moduledef = {
 static char* hashcode_input_err = "supported only strings, bytearrays, bytes and memoryview";
 static char* schema_id_input_err = "input argument must be dict or int";
 static char* schema_field_type_err = "schema keys must be strings";
+static char* field_plan_err = "field plan must be a tuple of (name, field ID, type code, default) tuples";
+static char* buffer_underflow_err = "binary object data is truncated";
+static char* type_code_err = "binary object expected";
 
 PyMODINIT_FUNC PyInit__cutils(void) {
 	return PyModule_Create(&moduledef);
@@ -112,7 +123,6 @@ int32_t str_hashcode_(PyObject *str, int lower) {
 }
 
 PyObject* b_hashcode(PyObject* data) {
-    int32_t res = 1;
     Py_ssize_t sz; char* buf;
 
     if (PyBytes_CheckExact(data)) {
@@ -133,12 +143,18 @@ PyObject* b_hashcode(PyObject* data) {
         return NULL;
     }
 
+    return PyLong_FromLong(b_hashcode_(buf, sz));
+}
+
+int32_t b_hashcode_(const char* buf, Py_ssize_t sz) {
+    int32_t res = 1;
+
     Py_ssize_t i;
     for (i = 0; i < sz; i++) {
         res = 31 * res + (signed char)buf[i];
     }
 
-    return PyLong_FromLong(res);
+    return res;
 }
 
 PyObject* schema_id(PyObject* self, PyObject *args) {
@@ -190,3 +206,526 @@ PyObject* schema_id(PyObject* self, PyObject *args) {
         return NULL;
     }
 }
+
+/* Binary object serialization. */
+
+#define TC_BYTE 1
+#define TC_SHORT 2
+#define TC_INT 3
+#define TC_LONG 4
+#define TC_FLOAT 5
+#define TC_DOUBLE 6
+#define TC_CHAR 7
+#define TC_BOOL 8
+#define TC_STRING 9
+#define TC_NULL 101
+#define TC_COMPLEX_OBJECT 103
+
+#define FLAG_OFFSET_ONE_BYTE 0x0008
+#define FLAG_OFFSET_TWO_BYTES 0x0010
+#define FLAG_COMPACT_FOOTER 0x0020
+
+#define HEADER_LEN 24
+
+typedef struct {
+    char* data;
+    Py_ssize_t len;
+    Py_ssize_t cap;
+} out_buf;
+
+static int buf_reserve(out_buf* buf, Py_ssize_t size) {
+    if (buf->len + size <= buf->cap) {
+        return 0;
+    }
+
+    Py_ssize_t cap = buf->cap ? buf->cap : 256;
+    while (cap < buf->len + size) {
+        cap *= 2;
+    }
+
+    char* data = PyMem_Realloc(buf->data, cap);
+    if (!data) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    buf->data = data;
+    buf->cap = cap;
+    return 0;
+}
+
+/* Writes an unsigned value of the given width in little-endian byte order. */
+static void put_le(char* dst, uint64_t value, int width) {
+    int i;
+    for (i = 0; i < width; i++) {
+        dst[i] = (char)(value >> (8 * i));
+    }
+}
+
+static int write_le(out_buf* buf, uint64_t value, int width) {
+    if (buf_reserve(buf, width) < 0) {
+        return -1;
+    }
+
+    put_le(buf->data + buf->len, value, width);
+    buf->len += width;
+    return 0;
+}
+
+static int write_typed(out_buf* buf, int type_code, uint64_t value, int width) {
+    if (buf_reserve(buf, width + 1) < 0) {
+        return -1;
+    }
+
+    buf->data[buf->len] = (char)type_code;
+    put_le(buf->data + buf->len + 1, value, width);
+    buf->len += width + 1;
+    return 0;
+}
+
+/*
+ * Writes the value of a primitive or string field.
+ *
+ * Returns 1 if the value is written, 0 if the value should be written
+ * by the Python fallback, -1 on error.
+ */
+static int write_field(out_buf* buf, long type_code, PyObject* value) {
+    switch (type_code) {
+        case TC_BYTE: case TC_SHORT: case TC_INT: case TC_LONG: case TC_FLOAT: case TC_DOUBLE:
+        case TC_CHAR: case TC_BOOL: case TC_STRING:
+            break;
+        default:
+            return 0;
+    }
+
+    if (value == Py_None) {
+        return write_le(buf, TC_NULL, 1) < 0 ? -1 : 1;
+    }
+
+    switch (type_code) {
+        case TC_BYTE: case TC_SHORT: case TC_INT: case TC_LONG: {
+            if (!PyLong_CheckExact(value)) {
+                return 0;
+            }
+
+            int overflow;
+            long long v = PyLong_AsLongLongAndOverflow(value, &overflow);
+            if (overflow) {
+                return 0;
+            }
+            if (v == -1 && PyErr_Occurred()) {
+                return -1;
+            }
+
+            int width = type_code == TC_BYTE ? 1 : type_code == TC_SHORT ? 2 : type_code == TC_INT ? 4 : 8;
+            return write_typed(buf, type_code, (uint64_t)v, width) < 0 ? -1 : 1;
+        }
+        case TC_FLOAT: {
+            if (!PyFloat_CheckExact(value)) {
+                return 0;
+            }
+
+            float f = (float)PyFloat_AS_DOUBLE(value);
+            uint32_t bits;
+            memcpy(&bits, &f, sizeof(bits));
+            return write_typed(buf, type_code, bits, 4) < 0 ? -1 : 1;
+        }
+        case TC_DOUBLE: {
+            if (!PyFloat_CheckExact(value)) {
+                return 0;
+            }
+
+            double d = PyFloat_AS_DOUBLE(value);
+            uint64_t bits;
+            memcpy(&bits, &d, sizeof(bits));
+            return write_typed(buf, type_code, bits, 8) < 0 ? -1 : 1;
+        }
+        case TC_CHAR: {
+            if (!PyUnicode_CheckExact(value) || PyUnicode_GET_LENGTH(value) != 1) {
+                return 0;
+            }
+
+            Py_UCS4 ch = PyUnicode_READ_CHAR(value, 0);
+            if (ch > 0xffff || (ch >= 0xd800 && ch <= 0xdfff)) {
+                return 0;
+            }
+
+            return write_typed(buf, type_code, ch, 2) < 0 ? -1 : 1;
+        }
+        case TC_BOOL: {
+            if (!PyBool_Check(value)) {
+                return 0;
+            }
+
+            return write_typed(buf, type_code, value == Py_True, 1) < 0 ? -1 : 1;
+        }
+        case TC_STRING: {
+            if (!PyUnicode_CheckExact(value)) {
+                return 0;
+            }
+
+            Py_ssize_t sz;
+            const char* data = PyUnicode_AsUTF8AndSize(value, &sz);
+            if (!data) {
+                /* let the fallback report the encoding error */
+                PyErr_Clear();
+                return 0;
+            }
+
+            if (write_typed(buf, type_code, (uint64_t)sz, 4) < 0 || buf_reserve(buf, sz) < 0) {
+                return -1;
+            }
+
+            memcpy(buf->data + buf->len, data, sz);
+            buf->len += sz;
+            return 1;
+        }
+    }
+
+    return 0;
+}
+
+static int write_fallback(out_buf* buf, PyObject* fallback, Py_ssize_t index, PyObject* value) {
+    PyObject* data = PyObject_CallFunction(fallback, "nO", index, value);
+    if (!data) {
+        return -1;
+    }
+
+    Py_buffer view;
+    if (PyObject_GetBuffer(data, &view, PyBUF_SIMPLE) < 0) {
+        Py_DECREF(data);
+        return -1;
+    }
+
+    int res = buf_reserve(buf, view.len);
+    if (res == 0) {
+        memcpy(buf->data + buf->len, view.buf, view.len);
+        buf->len += view.len;
+    }
+
+    PyBuffer_Release(&view);
+    Py_DECREF(data);
+    return res;
+}
+
+/*
+ * Serializes a Complex object in a single pass.
+ *
+ * Arguments: object, field plan (a tuple of (name, field ID, type code,
+ * default) tuples in the schema order), version, flags, type ID, schema ID
+ * and the fallback callable, that takes the field index and value and
+ * returns the serialized field.
+ *
+ * Returns a tuple of the serialized object (bytes) and its hash code.
+ */
+PyObject* write_binary_object(PyObject* self, PyObject *args) {
+    PyObject *obj, *plan, *fallback;
+    int version, flags, type_id, s_id;
+
+    if (!PyArg_ParseTuple(args, "OO!iiiiO", &obj, &PyTuple_Type, &plan, &version, &flags, &type_id, &s_id,
+                          &fallback)) {
+        return NULL;
+    }
+
+    Py_ssize_t fields_len = PyTuple_GET_SIZE(plan);
+    out_buf buf = {NULL, 0, 0};
+    PyObject* result = NULL;
+
+    uint32_t* offsets = PyMem_Malloc((fields_len ? fields_len : 1) * sizeof(uint32_t));
+    if (!offsets) {
+        return PyErr_NoMemory();
+    }
+
+    if (buf_reserve(&buf, HEADER_LEN + fields_len * 9) < 0) {
+        goto exit;
+    }
+    buf.len = HEADER_LEN;
+
+    Py_ssize_t i;
+    for (i = 0; i < fields_len; i++) {
+        PyObject* item = PyTuple_GET_ITEM(plan, i);
+        if (!PyTuple_CheckExact(item) || PyTuple_GET_SIZE(item) != 4) {
+            PyErr_SetString(PyExc_ValueError, field_plan_err);
+            goto exit;
+        }
+
+        long type_code = PyLong_AsLong(PyTuple_GET_ITEM(item, 2));
+        if (type_code == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+
+        PyObject* value = PyObject_GetAttr(obj, PyTuple_GET_ITEM(item, 0));
+        if (!value) {
+            if (!PyErr_ExceptionMatches(PyExc_AttributeError)) {
+                goto exit;
+            }
+            PyErr_Clear();
+            value = PyTuple_GET_ITEM(item, 3);
+            Py_INCREF(value);
+        }
+
+        offsets[i] = (uint32_t)buf.len;
+        int res = write_field(&buf, type_code, value);
+        if (res == 0) {
+            res = write_fallback(&buf, fallback, i, value);
+        }
+        Py_DECREF(value);
+
+        if (res < 0) {
+            goto exit;
+        }
+    }
+
+    /* offsets grow with the fields, so the last one is the largest */
+    uint32_t max_offset = fields_len ? offsets[fields_len - 1] : 0;
+    int offset_width = 4;
+    if (max_offset < 255) {
+        flags |= FLAG_OFFSET_ONE_BYTE;
+        offset_width = 1;
+    }
+    else if (max_offset < 65535) {
+        flags |= FLAG_OFFSET_TWO_BYTES;
+        offset_width = 2;
+    }
+
+    Py_ssize_t schema_offset = buf.len;
+    int compact = flags & FLAG_COMPACT_FOOTER;
+    for (i = 0; i < fields_len; i++) {
+        if (!compact) {
+            int32_t field_id = (int32_t)PyLong_AsLong(PyTuple_GET_ITEM(PyTuple_GET_ITEM(plan, i), 1));
+            if (field_id == -1 && PyErr_Occurred()) {
+                goto exit;
+            }
+            if (write_le(&buf, (uint32_t)field_id, 4) < 0) {
+                goto exit;
+            }
+        }
+        if (write_le(&buf, offsets[i], offset_width) < 0) {
+            goto exit;
+        }
+    }
+
+    int32_t hash_code = b_hashcode_(buf.data + HEADER_LEN, schema_offset - HEADER_LEN);
+
+    char* header = buf.data;
+    header[0] = (char)TC_COMPLEX_OBJECT;
+    header[1] = (char)version;
+    put_le(header + 2, (uint32_t)flags & 0xffff, 2);
+    put_le(header + 4, (uint32_t)type_id, 4);
+    put_le(header + 8, (uint32_t)hash_code, 4);
+    put_le(header + 12, (uint32_t)buf.len, 4);
+    put_le(header + 16, (uint32_t)s_id, 4);
+    put_le(header + 20, (uint32_t)schema_offset, 4);
+
+    result = Py_BuildValue("(y#i)", buf.data, buf.len, hash_code);
+
+exit:
+    PyMem_Free(offsets);
+    PyMem_Free(buf.data);
+    return result;
+}
+
+static uint64_t get_le(const unsigned char* src, int width) {
+    uint64_t value = 0;
+    int i;
+    for (i = width - 1; i >= 0; i--) {
+        value = (value << 8) | src[i];
+    }
+    return value;
+}
+
+/*
+ * Decodes the value of a primitive or string field.
+ *
+ * Returns a new reference to the value and advances the position, or
+ * returns NULL without an exception set, if the value should be decoded
+ * by the Python fallback, or NULL with an exception set on error.
+ */
+static PyObject* read_field(const unsigned char* buf, Py_ssize_t len, Py_ssize_t* pos) {
+    Py_ssize_t p = *pos + 1;
+    int width;
+    PyObject* value;
+
+    switch (buf[*pos]) {
+        case TC_NULL:
+            *pos = p;
+            Py_RETURN_NONE;
+        case TC_BYTE: width = 1; break;
+        case TC_SHORT: case TC_CHAR: width = 2; break;
+        case TC_INT: case TC_FLOAT: case TC_STRING: width = 4; break;
+        case TC_LONG: case TC_DOUBLE: width = 8; break;
+        case TC_BOOL: width = 1; break;
+        default:
+            return NULL;
+    }
+
+    if (p + width > len) {
+        PyErr_SetString(PyExc_ValueError, buffer_underflow_err);
+        return NULL;
+    }
+
+    uint64_t raw = get_le(buf + p, width);
+    p += width;
+
+    switch (buf[*pos]) {
+        case TC_BYTE:
+            value = PyLong_FromLong((int8_t)raw);
+            break;
+        case TC_SHORT:
+            value = PyLong_FromLong((int16_t)raw);
+            break;
+        case TC_INT:
+            value = PyLong_FromLong((int32_t)raw);
+            break;
+        case TC_LONG:
+            value = PyLong_FromLongLong((int64_t)raw);
+            break;
+        case TC_FLOAT: {
+            uint32_t bits = (uint32_t)raw;
+            float f;
+            memcpy(&f, &bits, sizeof(f));
+            value = PyFloat_FromDouble(f);
+            break;
+        }
+        case TC_DOUBLE: {
+            double d;
+            memcpy(&d, &raw, sizeof(d));
+            value = PyFloat_FromDouble(d);
+            break;
+        }
+        case TC_CHAR:
+            if (raw >= 0xd800 && raw <= 0xdfff) {
+                /* let the fallback report the decoding error */
+                return NULL;
+            }
+            value = PyUnicode_FromOrdinal((int)raw);
+            break;
+        case TC_BOOL:
+            value = PyBool_FromLong(raw != 0);
+            break;
+        default: {
+            /* string */
+            Py_ssize_t sz = (int32_t)raw;
+            if (sz < 0 || p + sz > len) {
+                PyErr_SetString(PyExc_ValueError, buffer_underflow_err);
+                return NULL;
+            }
+            value = PyUnicode_DecodeUTF8((const char*)buf + p, sz, NULL);
+            p += sz;
+        }
+    }
+
+    if (value) {
+        *pos = p;
+    }
+    return value;
+}
+
+/*
+ * Decodes a Complex object in a single pass.
+ *
+ * Arguments: buffer, offset of the object (its type code), data class,
+ * field plan (a tuple of the field names in the schema order) and
+ * the fallback callable, that takes the offset of a field and returns
+ * a tuple of the decoded value and the offset of the next field.
+ *
+ * Returns a tuple of the data class instance and the offset of the data,
+ * that follows the object.
+ */
+PyObject* read_binary_object(PyObject* self, PyObject *args) {
+    PyObject *buf_obj, *data_class, *plan, *fallback;
+    Py_ssize_t pos;
+
+    if (!PyArg_ParseTuple(args, "OnOO!O", &buf_obj, &pos, &data_class, &PyTuple_Type, &plan, &fallback)) {
+        return NULL;
+    }
+
+    Py_buffer view;
+    if (PyObject_GetBuffer(buf_obj, &view, PyBUF_SIMPLE) < 0) {
+        return NULL;
+    }
+
+    const unsigned char* buf = view.buf;
+    Py_ssize_t len = view.len;
+    PyObject *obj = NULL, *result = NULL;
+
+    if (pos < 0 || pos + HEADER_LEN > len) {
+        PyErr_SetString(PyExc_ValueError, buffer_underflow_err);
+        goto exit;
+    }
+    if (buf[pos] != TC_COMPLEX_OBJECT) {
+        PyErr_SetString(PyExc_ValueError, type_code_err);
+        goto exit;
+    }
+
+    int32_t length = (int32_t)get_le(buf + pos + 12, 4);
+
+    obj = PyObject_CallObject(data_class, NULL);
+    if (!obj) {
+        goto exit;
+    }
+
+    PyObject* version = PyLong_FromLong((int8_t)buf[pos + 1]);
+    if (!version) {
+        goto exit;
+    }
+    int res = PyObject_SetAttrString(obj, "version", version);
+    Py_DECREF(version);
+    if (res < 0) {
+        goto exit;
+    }
+
+    Py_ssize_t p = pos + HEADER_LEN;
+    Py_ssize_t fields_len = PyTuple_GET_SIZE(plan);
+    Py_ssize_t i;
+    for (i = 0; i < fields_len; i++) {
+        if (p >= len) {
+            PyErr_SetString(PyExc_ValueError, buffer_underflow_err);
+            goto exit;
+        }
+
+        PyObject* value = read_field(buf, len, &p);
+        if (!value) {
+            if (PyErr_Occurred()) {
+                goto exit;
+            }
+
+            PyObject* decoded = PyObject_CallFunction(fallback, "n", p);
+            if (!decoded) {
+                goto exit;
+            }
+
+            if (!PyTuple_Check(decoded) || PyTuple_GET_SIZE(decoded) != 2) {
+                Py_DECREF(decoded);
+                PyErr_SetString(PyExc_TypeError, "fallback must return a tuple of (value, offset)");
+                goto exit;
+            }
+
+            p = PyLong_AsSsize_t(PyTuple_GET_ITEM(decoded, 1));
+            value = PyTuple_GET_ITEM(decoded, 0);
+            Py_INCREF(value);
+            Py_DECREF(decoded);
+            if (p == -1 && PyErr_Occurred()) {
+                Py_DECREF(value);
+                goto exit;
+            }
+        }
+
+        /*
+         * the instance is just created, so skip the `__setattr__` of the data
+         * class, that only drops the (empty) serialized data of the instance
+         */
+        res = PyObject_GenericSetAttr(obj, PyTuple_GET_ITEM(plan, i), value);
+        Py_DECREF(value);
+        if (res < 0) {
+            goto exit;
+        }
+    }
+
+    result = Py_BuildValue("(On)", obj, pos + length);
+
+exit:
+    Py_XDECREF(obj);
+    PyBuffer_Release(&view);
+    return result;
+}
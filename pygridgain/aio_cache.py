@@ -14,12 +14,13 @@
 # limitations under the License.
 #
 import asyncio
-from typing import Any, Iterable, Optional, Union, List
+from typing import Any, Callable, Iterable, Optional, Tuple, Union, List
 
 from .api.tx_api import get_tx_connection
 from .datatypes import ExpiryPolicy
 from .datatypes.internal import AnyDataObject
 from .exceptions import CacheCreationError, CacheError, ParameterError
+from .near_cache import DEFAULT_MAX_ENTRIES, EVICTION_LRU
 from .utils import status_to_exception
 from .api.cache_config import (
     cache_create_async, cache_get_or_create_async, cache_destroy_async, cache_get_configuration_async,
@@ -33,7 +34,7 @@ from .api.key_value import (
     cache_remove_if_equals_async, cache_replace_if_equals_async, cache_get_size_async,
 )
 from .cursors import AioScanCursor, AioVectorCursor
-from .cache import __parse_settings, BaseCache
+from .cache import __parse_settings, _merge_dicts, BaseCache
 
 
 async def get_cache(client: 'AioClient', settings: Union[str, dict]) -> 'AioCache':
@@ -98,6 +99,30 @@ class AioCache(BaseCache):
             return tx_conn
         return await self.client.get_best_node(self, key, key_hint)
 
+    async def _run_by_node(self, fun: Callable, keys: Iterable, merge_values: Callable = None):
+        """
+        Splits the keys by their primary nodes and runs the batch operation
+        on each node concurrently.
+
+        :param fun: async API function, that takes a connection, cache info
+         and a list of keys,
+        :param keys: keys or (key, key_hint) tuples,
+        :param merge_values: (optional) callable, that merges the result
+         values of the node batches,
+        :return: API result.
+        """
+        keys = list(keys)
+        tx_conn = get_tx_connection()
+        if tx_conn:
+            return self._merge_batch_results([await fun(tx_conn, self.cache_info, keys)], merge_values)
+
+        async def run(node, node_keys):
+            # check out in the task, that makes the request
+            return await fun(await self.client._checkout(node), self.cache_info, node_keys)
+
+        results = await self.client._run_batches(run, await self.client._group_by_node(self, keys))
+        return self._merge_batch_results(results, merge_values)
+
     async def settings(self) -> Optional[dict]:
         """
         Lazy Cache settings. See the :ref:`example <sql_cache_read>`
@@ -123,10 +148,39 @@ class AioCache(BaseCache):
         """
         Destroys cache with a given name.
         """
+        self.client._near_caches.pop(self.cache_id, None)
         conn = await self._get_best_node()
         return await cache_destroy_async(conn, self.cache_id)
 
-    @status_to_exception(CacheError)
+    async def with_near_cache(
+            self, max_entries: int = DEFAULT_MAX_ENTRIES, max_memory: Optional[int] = None,
+            ttl: Optional[float] = None, eviction_policy: str = EVICTION_LRU
+    ) -> 'AioCache':
+        """
+        Enables the client-side near cache, that keeps the recently read
+        values. The near cache is shared by all the objects of this cache,
+        that belong to the same client, and is invalidated by their writes.
+        Changes made by other clients or by SQL queries are not tracked, so
+        set the `ttl` to limit the staleness of values. Enabling the near
+        cache again replaces the existing one.
+
+        The entries do not outlive the cluster entries under the expiry
+        policy, configured for the cache (it is read from the cache
+        configuration once), nor under the one, set with
+        :py:meth:`with_expire_policy`.
+
+        :param max_entries: (optional) maximum number of entries. Default
+         is 10000,
+        :param max_memory: (optional) maximum estimated size of the entries
+         in bytes. Default is None (not limited),
+        :param ttl: (optional) time (in seconds) after which the entry is
+         re-read from the cluster. Default is None (not limited, apart from
+         the expiry policies),
+        :param eviction_policy: (optional) 'lru' or 'lfu'. Default is 'lru',
+        :return: this cache.
+        """
+        return self._enable_near_cache(max_entries, max_memory, ttl, eviction_policy, await self.settings())
+
     async def get(self, key, key_hint: object = None) -> Any:
         """
         Retrieves a value from cache by key.
@@ -139,6 +193,20 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
+        near_cache = self._get_near_cache_for_read()
+        if near_cache is None:
+            return await self._get(key, key_hint)
+
+        found, value = near_cache.get((key, key_hint))
+        if not found:
+            generation = near_cache.generation
+            value = await self._get(key, key_hint)
+            if value is not None:
+                near_cache.put((key, key_hint), value, self.cache_info.expiry_policy, generation)
+        return value
+
+    @status_to_exception(CacheError)
+    async def _get(self, key, key_hint):
         conn = await self._get_best_node(key, key_hint)
         result = await cache_get_async(conn, self.cache_info, key, key_hint=key_hint)
         result.value = await self.client.unwrap_binary(result.value)
@@ -160,10 +228,12 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        conn = await self._get_best_node(key, key_hint)
-        return await cache_put_async(conn, self.cache_info, key, value, key_hint=key_hint, value_hint=value_hint)
+        try:
+            conn = await self._get_best_node(key, key_hint)
+            return await cache_put_async(conn, self.cache_info, key, value, key_hint=key_hint, value_hint=value_hint)
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
 
-    @status_to_exception(CacheError)
     async def get_all(self, keys: list) -> dict:
         """
         Retrieves multiple key-value pairs from cache.
@@ -171,8 +241,20 @@ class AioCache(BaseCache):
         :param keys: list of keys or tuples of (key, key_hint),
         :return: a dict of key-value pairs.
         """
-        conn = await self._get_best_node()
-        result = await cache_get_all_async(conn, self.cache_info, keys)
+        near_cache = self._get_near_cache_for_read()
+        if near_cache is None:
+            return await self._get_all(keys)
+
+        values, missing, generation = self._near_get_all(near_cache, keys)
+        if missing:
+            missing_values = await self._get_all(missing)
+            self._near_put_all(near_cache, missing, missing_values, generation)
+            values.update(missing_values)
+        return values
+
+    @status_to_exception(CacheError)
+    async def _get_all(self, keys: list):
+        result = await self._run_by_node(cache_get_all_async, keys, _merge_dicts)
         if result.value:
             keys = list(result.value.keys())
             values = await asyncio.gather(*[self.client.unwrap_binary(value) for value in result.value.values()])
@@ -191,8 +273,13 @@ class AioCache(BaseCache):
          to save. Each key or value can be an item of representable
          Python type or a tuple of (item, hint),
         """
-        conn = await self._get_best_node()
-        return await cache_put_all_async(conn, self.cache_info, pairs)
+        try:
+            return await self._run_by_node(
+                lambda conn, cache_info, keys: cache_put_all_async(conn, cache_info, {k: pairs[k] for k in keys}),
+                pairs
+            )
+        finally:
+            self._invalidate_near_cache(pairs)
 
     @status_to_exception(CacheError)
     async def replace(self, key, value, key_hint: object = None, value_hint: object = None):
@@ -209,8 +296,13 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        conn = await self._get_best_node(key, key_hint)
-        result = await cache_replace_async(conn, self.cache_info, key, value, key_hint=key_hint, value_hint=value_hint)
+        try:
+            conn = await self._get_best_node(key, key_hint)
+            result = await cache_replace_async(
+                conn, self.cache_info, key, value, key_hint=key_hint, value_hint=value_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
         result.value = await self.client.unwrap_binary(result.value)
         return result
 
@@ -222,11 +314,14 @@ class AioCache(BaseCache):
         :param keys: (optional) list of cache keys or (key, key type
          hint) tuples to clear (default: clear all).
         """
-        conn = await self._get_best_node()
-        if keys:
-            return await cache_clear_keys_async(conn, self.cache_info, keys)
-        else:
-            return await cache_clear_async(conn, self.cache_info)
+        try:
+            if keys:
+                return await self._run_by_node(cache_clear_keys_async, keys)
+            else:
+                conn = await self._get_best_node()
+                return await cache_clear_async(conn, self.cache_info)
+        finally:
+            self._invalidate_near_cache(keys or None)
 
     @status_to_exception(CacheError)
     async def clear_key(self, key, key_hint: object = None):
@@ -240,8 +335,11 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        conn = await self._get_best_node(key, key_hint)
-        return await cache_clear_key_async(conn, self.cache_info, key, key_hint=key_hint)
+        try:
+            conn = await self._get_best_node(key, key_hint)
+            return await cache_clear_key_async(conn, self.cache_info, key, key_hint=key_hint)
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
 
     @status_to_exception(CacheError)
     async def clear_keys(self, keys: Iterable):
@@ -250,8 +348,11 @@ class AioCache(BaseCache):
 
         :param keys: a list of keys or (key, type hint) tuples
         """
-        conn = await self._get_best_node()
-        return await cache_clear_keys_async(conn, self.cache_info, keys)
+        keys = list(keys)
+        try:
+            return await self._run_by_node(cache_clear_keys_async, keys)
+        finally:
+            self._invalidate_near_cache(keys)
 
     @status_to_exception(CacheError)
     async def contains_key(self, key, key_hint=None) -> bool:
@@ -277,8 +378,7 @@ class AioCache(BaseCache):
         :param keys: a list of keys or (key, type hint) tuples,
         :return: boolean `True` when all keys are present, `False` otherwise.
         """
-        conn = await self._get_best_node()
-        return await cache_contains_keys_async(conn, self.cache_info, keys)
+        return await self._run_by_node(cache_contains_keys_async, keys, all)
 
     @status_to_exception(CacheError)
     async def get_and_put(self, key, value, key_hint=None, value_hint=None) -> Any:
@@ -297,8 +397,11 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        conn = await self._get_best_node(key, key_hint)
-        result = await cache_get_and_put_async(conn, self.cache_info, key, value, key_hint, value_hint)
+        try:
+            conn = await self._get_best_node(key, key_hint)
+            result = await cache_get_and_put_async(conn, self.cache_info, key, value, key_hint, value_hint)
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
 
         result.value = await self.client.unwrap_binary(result.value)
         return result
@@ -320,8 +423,11 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        conn = await self._get_best_node(key, key_hint)
-        result = await cache_get_and_put_if_absent_async(conn, self.cache_info, key, value, key_hint, value_hint)
+        try:
+            conn = await self._get_best_node(key, key_hint)
+            result = await cache_get_and_put_if_absent_async(conn, self.cache_info, key, value, key_hint, value_hint)
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
         result.value = await self.client.unwrap_binary(result.value)
         return result
 
@@ -341,8 +447,11 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        conn = await self._get_best_node(key, key_hint)
-        return await cache_put_if_absent_async(conn, self.cache_info, key, value, key_hint, value_hint)
+        try:
+            conn = await self._get_best_node(key, key_hint)
+            return await cache_put_if_absent_async(conn, self.cache_info, key, value, key_hint, value_hint)
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
 
     @status_to_exception(CacheError)
     async def get_and_remove(self, key, key_hint=None) -> Any:
@@ -357,8 +466,11 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        conn = await self._get_best_node(key, key_hint)
-        result = await cache_get_and_remove_async(conn, self.cache_info, key, key_hint)
+        try:
+            conn = await self._get_best_node(key, key_hint)
+            result = await cache_get_and_remove_async(conn, self.cache_info, key, key_hint)
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
         result.value = await self.client.unwrap_binary(result.value)
         return result
 
@@ -380,8 +492,11 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        conn = await self._get_best_node(key, key_hint)
-        result = await cache_get_and_replace_async(conn, self.cache_info, key, value, key_hint, value_hint)
+        try:
+            conn = await self._get_best_node(key, key_hint)
+            result = await cache_get_and_replace_async(conn, self.cache_info, key, value, key_hint, value_hint)
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
         result.value = await self.client.unwrap_binary(result.value)
         return result
 
@@ -397,8 +512,11 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        conn = await self._get_best_node(key, key_hint)
-        return await cache_remove_key_async(conn, self.cache_info, key, key_hint)
+        try:
+            conn = await self._get_best_node(key, key_hint)
+            return await cache_remove_key_async(conn, self.cache_info, key, key_hint)
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
 
     @status_to_exception(CacheError)
     async def remove_keys(self, keys: list):
@@ -408,16 +526,22 @@ class AioCache(BaseCache):
 
         :param keys: list of keys or tuples of (key, key_hint) to remove.
         """
-        conn = await self._get_best_node()
-        return await cache_remove_keys_async(conn, self.cache_info, keys)
+        keys = list(keys)
+        try:
+            return await self._run_by_node(cache_remove_keys_async, keys)
+        finally:
+            self._invalidate_near_cache(keys)
 
     @status_to_exception(CacheError)
     async def remove_all(self):
         """
         Removes all cache entries, notifying listeners and cache writers.
         """
-        conn = await self._get_best_node()
-        return await cache_remove_all_async(conn, self.cache_info)
+        try:
+            conn = await self._get_best_node()
+            return await cache_remove_all_async(conn, self.cache_info)
+        finally:
+            self._invalidate_near_cache()
 
     @status_to_exception(CacheError)
     async def remove_if_equals(self, key, sample, key_hint=None, sample_hint=None):
@@ -435,8 +559,11 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        conn = await self._get_best_node(key, key_hint)
-        return await cache_remove_if_equals_async(conn, self.cache_info, key, sample, key_hint, sample_hint)
+        try:
+            conn = await self._get_best_node(key, key_hint)
+            return await cache_remove_if_equals_async(conn, self.cache_info, key, sample, key_hint, sample_hint)
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
 
     @status_to_exception(CacheError)
     async def replace_if_equals(self, key, sample, value, key_hint=None, sample_hint=None, value_hint=None) -> Any:
@@ -458,9 +585,13 @@ class AioCache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        conn = await self._get_best_node(key, key_hint)
-        result = await cache_replace_if_equals_async(conn, self.cache_info, key, sample, value, key_hint, sample_hint,
-                                                     value_hint)
+        try:
+            conn = await self._get_best_node(key, key_hint)
+            result = await cache_replace_if_equals_async(
+                conn, self.cache_info, key, sample, value, key_hint, sample_hint, value_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
         result.value = await self.client.unwrap_binary(result.value)
         return result
 
@@ -477,7 +608,7 @@ class AioCache(BaseCache):
         conn = await self._get_best_node()
         return await cache_get_size_async(conn, self.cache_info, peek_modes)
 
-    def scan(self, page_size: int = 1, partitions: int = -1, local: bool = False) -> AioScanCursor:
+    def scan(self, page_size: int = 1, partitions: int = -1, local: bool = False, prefetch: int = 0) -> AioScanCursor:
         """
         Returns all key-value pairs from the cache, similar to `get_all`, but
         with internal pagination, which is slower, but safer.
@@ -488,12 +619,15 @@ class AioCache(BaseCache):
          (negative to query entire cache),
         :param local: (optional) pass True if this query should be executed
          on local node only. Defaults to False,
+        :param prefetch: (optional) number of pages to request in background
+         ahead of the iteration. Default is 0 (request the next page when
+         the current one is exhausted),
         :return: async scan query cursor
         """
-        return AioScanCursor(self.client, self.cache_info, page_size, partitions, local)
+        return AioScanCursor(self.client, self.cache_info, page_size, partitions, local, prefetch)
 
     def vector(self, type_name: str, field: str, clause_vector: List[float],
-               k: int, threshold: float, page_size: int = 1) -> AioVectorCursor:
+               k: int, threshold: float, page_size: int = 1, prefetch: int = 0) -> AioVectorCursor:
         """
         Ignite supports vector queries based on Apache Lucene engine.
 
@@ -503,6 +637,35 @@ class AioCache(BaseCache):
         :param k: [K]NN, how many vectors to return.
         :param page_size: (optional) page size. Default size is 1 (slowest
          and safest),
+        :param prefetch: (optional) number of pages to request in background
+         ahead of the iteration. Default is 0 (request the next page when
+         the current one is exhausted),
         :return: Scan query cursor.
         """
-        return AioVectorCursor(self.client, self.cache_info, page_size, type_name, field, clause_vector, k, threshold)
+        return AioVectorCursor(
+            self.client, self.cache_info, page_size, type_name, field, clause_vector, k, threshold, prefetch
+        )
+
+    async def vector_batch(self, type_name: str, field: str, vectors: Iterable[List[float]], k: int,
+                           threshold: float, page_size: Optional[int] = None) -> List[List[Tuple[Any, Any]]]:
+        """
+        Runs a vector query for each of the search vectors. The queries are
+        run concurrently, each in its own cursor.
+
+        :param type_name: Name of the type.
+        :param field: Name of the field.
+        :param vectors: Search vectors.
+        :param k: [K]NN, how many vectors to return per query.
+        :param threshold: Similarity threshold.
+        :param page_size: (optional) page size. Default is `k`, so the results
+         of a query usually come in a single round trip,
+        :return: list of the query results in the order of `vectors`. The
+         results of a query are a list of (key, value) pairs.
+        """
+        page_size = page_size or k
+
+        async def run(clause_vector):
+            async with self.vector(type_name, field, clause_vector, k, threshold, page_size=page_size) as cursor:
+                return [tuple(entry) async for entry in cursor]
+
+        return list(await asyncio.gather(*[run(vector) for vector in vectors]))
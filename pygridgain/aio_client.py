@@ -14,10 +14,12 @@
 # limitations under the License.
 #
 import asyncio
+import contextvars
 import random
 import sys
+import time
 from itertools import chain
-from typing import Iterable, Type, Union, Any, Dict, Optional, Sequence
+from typing import Callable, Iterable, Type, Union, Any, Dict, List, Optional, Sequence, Tuple
 
 from .aio_cluster import AioCluster
 from .api import cache_get_node_partitions_async
@@ -27,14 +29,19 @@ from .cache import BaseCache
 from .client import BaseClient
 from .cursors import AioSqlFieldsCursor
 from .aio_cache import AioCache, get_cache, create_cache, get_or_create_cache
-from .connection import AioConnection
-from .constants import AFFINITY_RETRIES, AFFINITY_DELAY
+from .batch import AioBatch
+from .data_streamer import AioDataStreamer, DEFAULT_BATCH_SIZE, DEFAULT_PARALLEL_OPS_PER_NODE
+from .connection import AioConnection, AioConnectionPool
+from .connection.reconnect import AioReconnectScheduler
+from .constants import AFFINITY_RETRIES, AFFINITY_DELAY, POOL_IDLE_TIMEOUT
 from .datatypes import BinaryObject, TransactionConcurrency, TransactionIsolation
+from .datatypes.decoder import decode_value_async
+from .datatypes.primitive_arrays import ARRAY_FORMAT_LIST
 from .exceptions import BinaryTypeError, CacheError, ReconnectError, connection_errors, NotSupportedError
 from .queries.cache_info import CacheInfo
 from .stream import AioBinaryStream, READ_BACKWARD
 from .transaction import AioTransaction
-from .utils import cache_id, entity_id, status_to_exception
+from .utils import cache_id, entity_id, is_hinted, status_to_exception
 
 
 __all__ = ['AioClient']
@@ -62,7 +69,9 @@ class AioClient(BaseClient):
     """
 
     def __init__(self, compact_footer: bool = None, partition_aware: bool = True,
-                 event_listeners: Optional[Sequence] = None, **kwargs):
+                 event_listeners: Optional[Sequence] = None, direct_decode: bool = False,
+                 pool_size: Union[int, Tuple[int, int]] = None, pool_idle_timeout: float = POOL_IDLE_TIMEOUT,
+                 array_format: str = ARRAY_FORMAT_LIST, binary_metadata_cache: Optional[str] = None, **kwargs):
         """
         Initialize client.
 
@@ -78,8 +87,33 @@ class AioClient(BaseClient):
          placement from the key before to issue the key operation to the
          server node, `True` by default,
         :param event_listeners: (optional) event listeners,
+        :param direct_decode: (optional) decode the responses in a single pass
+         over the received buffer, bypassing the ctypes-based parsers. Gives
+         the same results, but faster on large responses. `False` by default,
+        :param pool_size: (optional) number of connections per server node,
+         or a (min, max) pair. The pool opens the connections up to the max
+         on demand, when all of its connections are busy, and closes the idle
+         ones down to the min. Default is one connection per node,
+        :param pool_idle_timeout: (optional) time (in seconds) after which
+         an idle pooled connection above the pool min is closed. Default
+         is 60 seconds,
+        :param array_format: (optional) how the short, int, long, float and
+         double arrays are decoded: 'list' (Python lists, default), 'array'
+         (`array.array`) or 'numpy' (NumPy arrays, requires NumPy),
+        :param binary_metadata_cache: (optional) path to the file, in which
+         the Complex object types metadata, received from the cluster, is kept
+         for the next client processes, so they do not request it again.
+         Default is None (no file),
         :param handshake_timeout: (optional) sets timeout (in seconds) for performing handshake (connection)
          with node. Default is 10.0 seconds,
+        :param coalesce_delay: (optional) time (in seconds) for which
+         the outgoing requests are buffered, so the requests, issued
+         concurrently, are written with a single write. 0 buffers them until
+         the event loop runs out of ready callbacks. Default is None
+         (write each request at once),
+        :param coalesce_size: (optional) size (in bytes) of the buffered
+         requests, that triggers the write regardless of the delay.
+         Default is 64 KiB,
         :param use_ssl: (optional) set to True if Ignite server uses SSL
          on its binary connector. Defaults to use SSL when username
          and password has been supplied, not to use SSL otherwise,
@@ -109,8 +143,12 @@ class AioClient(BaseClient):
          cluster,
         :param password: (optional) password to authenticate to Ignite cluster.
         """
-        super().__init__(compact_footer, partition_aware, event_listeners, **kwargs)
+        super().__init__(
+            compact_footer, partition_aware, event_listeners, direct_decode, pool_size, pool_idle_timeout,
+            array_format, binary_metadata_cache, **kwargs
+        )
         self._registry_mux = asyncio.Lock()
+        self._reconnect_scheduler = AioReconnectScheduler()
         self._affinity_query_mux = asyncio.Lock()
 
     def connect(self, *args):
@@ -123,9 +161,10 @@ class AioClient(BaseClient):
         return _ConnectionContextManager(self, nodes)
 
     async def _connect(self, nodes):
+        self._bind_binary_metadata_cache(nodes)
         for i, node in enumerate(nodes):
             host, port = node
-            conn = AioConnection(self, host, port, **self._connection_args)
+            conn = self._create_node(AioConnectionPool, AioConnection, host, port)
 
             if not self.partition_aware:
                 try:
@@ -140,37 +179,52 @@ class AioClient(BaseClient):
 
             self._nodes.append(conn)
 
+        self._invalidate_nodes_by_uuid()
         if self.partition_aware:
             connect_results = await asyncio.gather(
                 *[conn.connect() for conn in self._nodes],
                 return_exceptions=True
             )
 
-            reconnect_coro = []
-            for i, res in enumerate(connect_results):
-                if isinstance(res, Exception):
-                    if isinstance(res, connection_errors):
-                        reconnect_coro.append(self._nodes[i].reconnect())
-                    else:
-                        raise res
-
-            await asyncio.gather(*reconnect_coro, return_exceptions=True)
+            for res in connect_results:
+                if isinstance(res, Exception) and not isinstance(res, connection_errors):
+                    raise res
 
         if self.protocol_context is None:
             raise ReconnectError('Can not connect.')
 
+        # schedule the reconnection
+        self._reconnect_failed_nodes()
+
+        await asyncio.gather(*[self._pools[conn].fill() for conn in self._nodes if conn.alive])
+
     async def close(self):
-        await asyncio.gather(*[conn.close() for conn in self._nodes], return_exceptions=True)
+        self._reconnect_scheduler.stop()
+        if self._affinity_refresh is not None:
+            self._affinity_refresh.cancel()
+        await asyncio.gather(
+            *[self._pools[conn].close() if conn in self._pools else conn.close() for conn in self._nodes],
+            return_exceptions=True
+        )
         self._nodes.clear()
+        self._invalidate_nodes_by_uuid()
+        self._pools.clear()
+
+    async def _checkout(self, node: AioConnection) -> AioConnection:
+        pool = self._pools.get(node)
+        return await pool.acquire() if pool else node
 
     async def random_node(self) -> AioConnection:
         """
-        Returns random usable node.
+        Returns random usable node (a pooled connection to it).
 
         This method is not a part of the public API. Unless you wish to
         extend the `pygridgain` capabilities (with additional testing, logging,
         examining connections, et c.) you probably should not use it.
         """
+        return await self._checkout(await self._get_usable_node())
+
+    async def _get_usable_node(self) -> AioConnection:
         if self.partition_aware:
             # if partition awareness is used just pick a random connected node
             return await self._get_random_node()
@@ -182,8 +236,9 @@ class AioClient(BaseClient):
             if node.alive:
                 return node
 
-            # close current (supposedly failed) node
-            await self._nodes[self._current_node].close()
+            if not self._reconnect_scheduler.scheduled(node):
+                # close current (supposedly failed) node
+                await node.close()
 
             # advance the node index
             self._current_node += 1
@@ -193,11 +248,18 @@ class AioClient(BaseClient):
             # prepare the list of node indexes to try to connect to
             for i in chain(range(self._current_node, len(self._nodes)), range(self._current_node)):
                 node = self._nodes[i]
+                if node.alive:
+                    # e.g. reconnected in background
+                    self._current_node = i
+                    return node
+                if self._reconnect_scheduler.scheduled(node):
+                    continue
                 try:
                     await node.connect()
                 except connection_errors:
                     pass
                 else:
+                    self._current_node = i
                     return node
 
             # no nodes left
@@ -266,11 +328,26 @@ class AioClient(BaseClient):
         :param data_class: Complex object class,
         :param affinity_key_field: (optional) affinity parameter.
         """
+        await self._confirm_binary_type(data_class)
         if not await self.query_binary_type(data_class.type_id, data_class.schema_id):
             await self.put_binary_type(data_class.type_name, affinity_key_field, schema=data_class.schema)
 
         self._registry[data_class.type_id][data_class.schema_id] = data_class
 
+    async def _confirm_binary_type(self, data_class: Type):
+        """
+        Confirms the field types of the class, if it was built from the binary
+        metadata cache, with the server. It is done before the field types
+        are relied on, i.e. before writing the objects of the class.
+
+        :param data_class: Complex object class.
+        """
+        if data_class in self._cached_classes:
+            async with self._registry_mux:
+                type_id = self._cached_classes.get(data_class)
+                if type_id is not None:
+                    self._sync_binary_registry(type_id, await self.get_binary_type(type_id))
+
     async def query_binary_type(self, binary_type: Union[int, str], schema: Union[int, dict] = None):
         """
         Queries the registry of Complex object classes.
@@ -286,7 +363,8 @@ class AioClient(BaseClient):
 
         if not result:
             async with self._registry_mux:
-                result = self._get_from_registry(type_id, schema)
+                result = self._get_from_registry(type_id, schema) or \
+                    self._load_from_binary_metadata_cache(type_id, schema)
 
                 if not result:
                     type_info = await self.get_binary_type(type_id)
@@ -295,6 +373,55 @@ class AioClient(BaseClient):
 
         return result
 
+    async def prefetch_binary_types(self, binary_types: Iterable[Union[int, str]]) -> dict:
+        """
+        Fetches the given Complex object types with all their schemas
+        and registers them, so decoding of the values of these types does not
+        wait for the type metadata. The types are requested from the connected
+        nodes concurrently.
+
+        :param binary_types: Complex object type names or IDs,
+        :return: dict with the number of the requested `types`, the number
+         of the types `found` in the cluster, the number of the registered
+         `schemas` and the `duration` of the prefetch in seconds.
+        """
+        started = time.monotonic()
+        type_ids = list(dict.fromkeys(entity_id(binary_type) for binary_type in binary_types))
+        nodes = [n for n in self._nodes if n.alive] or [await self._get_usable_node()]
+        type_infos = await asyncio.gather(*[
+            self._fetch_binary_type(nodes[i % len(nodes)], type_id) for i, type_id in enumerate(type_ids)
+        ])
+        return self._register_prefetched(type_infos, started)
+
+    async def _fetch_binary_type(self, node: AioConnection, type_id: int) -> Tuple[int, dict]:
+        result = self._process_get_binary_type_result(await get_binary_type_async(await self._checkout(node), type_id))
+        if result.status != 0:
+            raise BinaryTypeError(result.message)
+        return type_id, result.value
+
+    async def warmup(
+        self, caches: Iterable[Union[str, 'AioCache']] = (), binary_types: Iterable[Union[int, str]] = ()
+    ) -> dict:
+        """
+        Prepares the client for the traffic: fetches the Complex object types
+        of the given caches' query entities (keys and values) and the given
+        types. See :py:meth:`prefetch_binary_types`.
+
+        :param caches: (optional) cache names or caches,
+        :param binary_types: (optional) Complex object type names or IDs,
+        :return: prefetch report. Its `duration` includes the time to read
+         the cache configurations.
+        """
+        started = time.monotonic()
+        binary_types = list(binary_types)
+        caches = [cache if isinstance(cache, BaseCache) else await self.get_cache(cache) for cache in caches]
+        for settings in await asyncio.gather(*[cache.settings() for cache in caches]):
+            binary_types.extend(self._query_entity_types(settings))
+
+        report = await self.prefetch_binary_types(binary_types)
+        report['duration'] = time.monotonic() - started
+        return report
+
     async def unwrap_binary(self, value: Any) -> Any:
         """
         Detects and recursively unwraps Binary Object.
@@ -306,6 +433,8 @@ class AioClient(BaseClient):
         if isinstance(value, tuple) and len(value) == 2:
             if type(value[0]) is bytes and type(value[1]) is int:
                 blob, offset = value
+                if self.direct_decode:
+                    return await decode_value_async(self, blob)
                 with AioBinaryStream(self, blob) as stream:
                     data_class = await BinaryObject.parse_async(stream)
                     return await BinaryObject.to_python_async(stream.read_ctype(data_class, direction=READ_BACKWARD),
@@ -359,52 +488,135 @@ class AioClient(BaseClient):
          should be converted,
         :return: Ignite connection object.
         """
-        conn = await self.random_node()
+        conn = await self._get_usable_node()
 
         if self.partition_aware and key is not None:
-            caches = self._caches_to_update_affinity()
-            if caches:
-                async with self._affinity_query_mux:
-                    while True:
-                        caches = self._caches_to_update_affinity()
-                        if not caches:
-                            break
-
-                        try:
-                            full_affinity = await self._get_affinity(conn, caches)
-                            self._update_affinity(full_affinity)
-
-                            asyncio.ensure_future(
-                                asyncio.gather(
-                                    *[node.reconnect() for node in self._nodes if not node.alive],
-                                    return_exceptions=True
-                                )
-                            )
-
-                            break
-                        except connection_errors:
-                            # retry if connection failed
-                            conn = await self.random_node()
-                            pass
-                        except CacheError:
-                            # server did not create mapping in time
-                            return conn
-
-            c_id = cache.cache_id if isinstance(cache, BaseCache) else cache_id(cache)
-            parts = self._cache_partition_mapping(c_id).get('number_of_partitions')
-
-            if not parts:
-                return conn
-
-            key, key_hint = self._get_affinity_key(c_id, key, key_hint)
-
-            hashcode = await key_hint.hashcode_async(key, client=self)
-
-            best_node = self._get_node_by_hashcode(c_id, hashcode, parts)
-            if best_node:
-                return best_node
-
-        return conn
+            conn, mapping_ready = await self._refresh_affinity(conn)
+            if mapping_ready:
+                best_node = await self._get_primary_node(cache, key, key_hint)
+                if best_node:
+                    return await self._checkout(best_node)
+
+        return await self._checkout(conn)
+
+    async def _refresh_affinity(self, conn: 'AioConnection') -> Tuple['AioConnection', bool]:
+        """
+        Update partition mapping of the registered caches, if needed.
+        The mapping of the newly registered caches is requested at once.
+        The outdated mapping is refreshed in background, and is used
+        meanwhile: the keys of the lost nodes go to the random ones.
+
+        :param conn: connection to query the mapping with,
+        :return: the connection, that was finally used, and False if server
+         did not create the mapping in time, True otherwise.
+        """
+        if self._has_unmapped_caches():
+            started = time.monotonic()
+            async with self._affinity_query_mux:
+                while True:
+                    caches = self._caches_to_update_affinity()
+                    if not caches:
+                        break
+
+                    try:
+                        full_affinity = await self._get_affinity(conn, caches)
+                        self._update_affinity(full_affinity)
+                        self._record_affinity_refresh(started, True)
+                        break
+                    except connection_errors:
+                        # retry if connection failed
+                        conn = await self._get_usable_node()
+                        pass
+                    except CacheError:
+                        # server did not create mapping in time
+                        self._record_affinity_refresh(started, False)
+                        return conn, False
+
+            self._reconnect_failed_nodes()
+
+        elif self._affinity_outdated():
+            self._start_affinity_refresh()
+
+        return conn, True
+
+    def _start_affinity_refresh(self):
+        """
+        Starts the background task, that refreshes the outdated mapping,
+        unless it is already running.
+        """
+        if self._affinity_refresh is None:
+            # the task should not inherit the caller's transaction or batch
+            self._affinity_refresh = contextvars.Context().run(
+                asyncio.ensure_future, self._refresh_affinity_in_background()
+            )
+
+    async def _refresh_affinity_in_background(self):
+        try:
+            async with self._affinity_query_mux:
+                caches = self._caches_to_update_affinity()
+                if caches:
+                    started = time.monotonic()
+                    try:
+                        full_affinity = await self._get_affinity(await self._get_usable_node(), caches)
+                    except connection_errors + (CacheError, ReconnectError):
+                        # the next request retries
+                        self._record_affinity_refresh(started, False)
+                    else:
+                        self._update_affinity(full_affinity)
+                        self._record_affinity_refresh(started, True)
+                        self._reconnect_failed_nodes()
+        finally:
+            self._affinity_refresh = None
+
+    async def _get_primary_node(
+            self, cache: Union[int, str, 'BaseCache'], key: Any, key_hint: 'GridGainDataType' = None
+    ) -> Optional['AioConnection']:
+        c_id = cache.cache_id if isinstance(cache, BaseCache) else cache_id(cache)
+        parts = self._cache_partition_mapping(c_id).get('number_of_partitions')
+
+        if not parts:
+            return None
+
+        key, key_hint = self._get_affinity_key(c_id, key, key_hint)
+        hashcode = await key_hint.hashcode_async(key, client=self)
+
+        return self._get_node_by_hashcode(c_id, hashcode, parts)
+
+    async def _group_by_node(self, cache: 'BaseCache', keys: list) -> List[Tuple['AioConnection', list]]:
+        """
+        Splits the keys of a batch operation by their primary nodes.
+
+        :param cache: Ignite cache,
+        :param keys: list of keys or (key, key_hint) tuples,
+        :return: list of (node, keys) pairs. Contains a single pair with all
+         the keys, if the data placement is unknown. The nodes are not checked
+         out, so the connection is reserved by the thread (task), that makes
+         the request.
+        """
+        conn = await self._get_usable_node()
+
+        if self.partition_aware and len(keys) > 1:
+            conn, mapping_ready = await self._refresh_affinity(conn)
+            if mapping_ready:
+                groups = {}
+                for item in keys:
+                    key, key_hint = item if is_hinted(item) else (item, None)
+                    node = await self._get_primary_node(cache, key, key_hint) or conn
+                    groups.setdefault(node, []).append(item)
+                return list(groups.items())
+
+        return [(conn, keys)]
+
+    @staticmethod
+    async def _run_batches(fun: Callable, batches: Sequence[tuple]) -> list:
+        """
+        Awaits `fun` with each of the argument tuples concurrently.
+
+        :param fun: coroutine function,
+        :param batches: argument tuples,
+        :return: list of results in the order of `batches`.
+        """
+        return await asyncio.gather(*[fun(*args) for args in batches])
 
     async def create_cache(self, settings: Union[str, dict]) -> 'AioCache':
         """
@@ -461,7 +673,8 @@ class AioClient(BaseClient):
         enforce_join_order: bool = False, collocated: bool = False,
         lazy: bool = False, include_field_names: bool = False,
         max_rows: int = -1, timeout: int = 0,
-        cache: Union[int, str, 'AioCache'] = None
+        cache: Union[int, str, 'AioCache'] = None, prefetch: int = 0,
+        as_columns: bool = False
     ) -> AioSqlFieldsCursor:
         """
         Runs an SQL query and returns its result.
@@ -497,6 +710,13 @@ class AioClient(BaseClient):
          Zero disables timeout (default),
         :param cache: (optional) Name or ID of the cache to use to infer schema.
          If set, 'schema' argument is ignored,
+        :param prefetch: (optional) number of pages to request in background
+         ahead of the iteration. Default is 0 (request the next page when
+         the current one is exhausted),
+        :param as_columns: (optional) decode each result page into a list
+         of :class:`~pygridgain.columnar.Column` (typed arrays with null masks)
+         instead of the rows. The cursor then yields pages instead of rows.
+         Use `fetch_columns` to collect the whole result. Defaults to False,
         :return: async sql fields cursor with result rows as a lists. If
          `include_field_names` was set, the first row will hold field names.
         """
@@ -512,7 +732,8 @@ class AioClient(BaseClient):
 
         return AioSqlFieldsCursor(self, c_info, query_str, page_size, query_args, schema, statement_type,
                                   distributed_joins, local, replicated_only, enforce_join_order, collocated,
-                                  lazy, include_field_names, max_rows, timeout)
+                                  lazy, include_field_names, max_rows, timeout, prefetch=prefetch,
+                                  as_columns=as_columns)
 
     def get_cluster(self) -> 'AioCluster':
         """
@@ -522,6 +743,38 @@ class AioClient(BaseClient):
         """
         return AioCluster(self)
 
+    def data_streamer(
+        self, cache: Union[str, 'AioCache'], batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: Optional[float] = None, parallel_ops_per_node: int = DEFAULT_PARALLEL_OPS_PER_NODE
+    ) -> 'AioDataStreamer':
+        """
+        Create data streamer to load large amounts of data into the cache.
+
+        :param cache: cache or cache name,
+        :param batch_size: (optional) number of entries per node, that
+         triggers sending a batch. Default is 512,
+        :param flush_interval: (optional) time (in seconds) after which all
+         the buffered entries are sent, regardless of the batch size.
+         Default is None (send full batches only),
+        :param parallel_ops_per_node: (optional) maximum number of batches
+         in flight per node. Default is 4,
+        :return: :py:class:`~pygridgain.data_streamer.AioDataStreamer` instance.
+        """
+        if not isinstance(cache, AioCache):
+            cache = AioCache(self, cache)
+        return AioDataStreamer(cache, batch_size, flush_interval, parallel_ops_per_node)
+
+    def batch(self) -> 'AioBatch':
+        """
+        Create a pipeline of the asynchronous operations. The requests
+        of the submitted operations are written with a single write
+        per connection, and the operations complete as their responses
+        arrive.
+
+        :return: :py:class:`~pygridgain.batch.AioBatch` instance.
+        """
+        return AioBatch(self)
+
     def tx_start(self, concurrency: TransactionConcurrency = TransactionConcurrency.PESSIMISTIC,
                  isolation: TransactionIsolation = TransactionIsolation.REPEATABLE_READ,
                  timeout: int = 0, label: Optional[str] = None) -> 'AioTransaction':
@@ -28,7 +28,7 @@ from pygridgain.queries.op_codes import (
 from pygridgain.utils import deprecated
 from .result import APIResult
 from ..queries.cache_info import CacheInfo
-from ..queries.response import SQLResponse
+from ..queries.response import SQLColumnsResponse, SQLResponse
 
 
 def scan(conn: 'Connection', cache_info: CacheInfo, page_size: int, partitions: int = -1,
@@ -269,7 +269,7 @@ def sql_fields(
     local: bool = False, replicated_only: bool = False,
     enforce_join_order: bool = False, collocated: bool = False,
     lazy: bool = False, include_field_names: bool = False, max_rows: int = -1,
-    timeout: int = 0
+    timeout: int = 0, as_columns: bool = False
 ) -> APIResult:
     """
     Performs SQL fields query.
@@ -299,6 +299,8 @@ def sql_fields(
     :param max_rows: (optional) query-wide maximum of rows.
     :param timeout: (optional) non-negative timeout value in ms. Zero disables
      timeout.
+    :param as_columns: (optional) decode the result rows into a list
+     of :class:`~pygridgain.columnar.Column`.
     :return: API result data object. Contains zero status and a value
      of type dict with results on success, non-zero status and an error
      description otherwise.
@@ -306,13 +308,13 @@ def sql_fields(
      Value dict is of following format:
 
      * `cursor`: int, cursor ID,
-     * `data`: list, result values,
+     * `data`: list, result values (or columns),
      * `more`: bool, True if more data is available for subsequent
        ‘sql_fields_cursor_get_page’ calls.
     """
     return __sql_fields(conn, cache_info, query_str, page_size, query_args, schema, statement_type, distributed_joins,
                         local, replicated_only, enforce_join_order, collocated, lazy, include_field_names, max_rows,
-                        timeout)
+                        timeout, as_columns)
 
 
 async def sql_fields_async(
@@ -322,19 +324,19 @@ async def sql_fields_async(
         local: bool = False, replicated_only: bool = False,
         enforce_join_order: bool = False, collocated: bool = False,
         lazy: bool = False, include_field_names: bool = False, max_rows: int = -1,
-        timeout: int = 0
+        timeout: int = 0, as_columns: bool = False
 ) -> APIResult:
     """
     Async version of sql_fields.
     """
     return await __sql_fields(conn, cache_info, query_str, page_size, query_args, schema, statement_type,
                               distributed_joins, local, replicated_only, enforce_join_order, collocated, lazy,
-                              include_field_names, max_rows, timeout)
+                              include_field_names, max_rows, timeout, as_columns)
 
 
 def __sql_fields(
         conn, cache_info, query_str, page_size, query_args, schema, statement_type, distributed_joins, local,
-        replicated_only, enforce_join_order, collocated, lazy, include_field_names, max_rows, timeout
+        replicated_only, enforce_join_order, collocated, lazy, include_field_names, max_rows, timeout, as_columns
 ):
     if query_args is None:
         query_args = []
@@ -358,7 +360,7 @@ def __sql_fields(
             ('timeout', Long),
             ('include_field_names', Bool),
         ],
-        response_type=SQLResponse
+        response_type=SQLColumnsResponse if as_columns else SQLResponse
     )
 
     return query_perform(
@@ -385,13 +387,18 @@ def __sql_fields(
     )
 
 
-def sql_fields_cursor_get_page(conn: 'Connection', cursor: int, field_count: int) -> APIResult:
+def sql_fields_cursor_get_page(
+    conn: 'Connection', cursor: int, field_count: int, field_names: list = None
+) -> APIResult:
     """
     Retrieves the next query result page by cursor ID from `sql_fields`.
 
     :param conn: connection to GridGain server,
     :param cursor: cursor ID,
     :param field_count: a number of fields in a row,
+    :param field_names: (optional) field names (or indexes) of the result.
+     If set, the rows are decoded into a list
+     of :class:`~pygridgain.columnar.Column`,
     :return: API result data object. Contains zero status and a value
      of type dict with results on success, non-zero status and an error
      description otherwise.
@@ -402,17 +409,29 @@ def sql_fields_cursor_get_page(conn: 'Connection', cursor: int, field_count: int
      * `more`: bool, True if more data is available for subsequent
        ‘sql_fields_cursor_get_page’ calls.
     """
-    return __sql_fields_cursor_get_page(conn, cursor, field_count)
+    return __sql_fields_cursor_get_page(conn, cursor, field_count, field_names)
 
 
-async def sql_fields_cursor_get_page_async(conn: 'AioConnection', cursor: int, field_count: int) -> APIResult:
+async def sql_fields_cursor_get_page_async(
+    conn: 'AioConnection', cursor: int, field_count: int, field_names: list = None
+) -> APIResult:
     """
     Async version sql_fields_cursor_get_page.
     """
-    return await __sql_fields_cursor_get_page(conn, cursor, field_count)
+    return await __sql_fields_cursor_get_page(conn, cursor, field_count, field_names)
+
 
+def __sql_fields_cursor_get_page(conn, cursor, field_count, field_names):
+    if field_names is not None:
+        query_struct = Query(
+            OP_QUERY_SQL_FIELDS_CURSOR_GET_PAGE,
+            [
+                ('cursor', Long),
+            ],
+            response_type=SQLColumnsResponse
+        )
+        return query_perform(query_struct, conn, query_params={'cursor': cursor}, field_names=field_names)
 
-def __sql_fields_cursor_get_page(conn, cursor, field_count):
     query_struct = Query(
         OP_QUERY_SQL_FIELDS_CURSOR_GET_PAGE,
         [
@@ -0,0 +1,115 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Pipelined execution of the asynchronous operations.
+
+The operations, submitted to a batch, run concurrently. Their requests
+are not written to the connections one by one, but collected until
+the event loop runs out of ready callbacks, and then written with a single
+write per connection. The responses are matched to the requests by the query
+IDs, so each operation completes as soon as its response arrives.
+"""
+import asyncio
+import contextvars
+from typing import Awaitable, Dict, List
+
+from pygridgain.exceptions import SocketError
+
+__all__ = ['AioBatch']
+
+current_batch = contextvars.ContextVar('current_batch', default=None)
+
+
+class AioBatch:
+    """
+    Pipeline of the asynchronous operations. Create it with
+    :py:meth:`~pygridgain.aio_client.AioClient.batch`::
+
+        async with client.batch() as batch:
+            for key, value in data.items():
+                batch.submit(cache.put(key, value))
+            value_fut = batch.submit(other_cache.get(key))
+
+        value = value_fut.result()
+
+    Leaving the context waits for all the submitted operations. If any
+    of them failed, the first error is raised.
+    """
+    def __init__(self, client: 'AioClient'):
+        """
+        :param client: asynchronous client.
+        """
+        self.client = client
+        self._tasks = []
+        # connection -> list of (query ID, request data)
+        self._frames: Dict['AioConnection', List] = {}
+        self._flush_scheduled = False
+
+        self.requests = 0
+        self.writes = 0
+
+    def submit(self, operation: Awaitable) -> asyncio.Future:
+        """
+        Schedules the operation to run within the batch.
+
+        :param operation: coroutine of the asynchronous cache or client
+         operation, e.g. `cache.put(key, value)`,
+        :return: future of the operation result.
+        """
+        token = current_batch.set(self)
+        try:
+            # the task copies the current context, so its requests
+            # are collected by this batch
+            task = asyncio.ensure_future(operation)
+        finally:
+            current_batch.reset(token)
+        self._tasks.append(task)
+        return task
+
+    def _write(self, conn: 'AioConnection', query_id: int, data):
+        self.requests += 1
+        self._frames.setdefault(conn, []).append((query_id, data))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        frames, self._frames = self._frames, {}
+        for conn, conn_frames in frames.items():
+            if conn.closed:
+                # the pending requests of a lost connection are already
+                # failed, the rest were closed while queued
+                err = SocketError('Attempt to use closed connection.')
+                for query_id, _ in conn_frames:
+                    fut = conn._pending_reqs.pop(query_id, None)
+                    if fut is not None and not fut.done():
+                        fut.set_exception(err)
+                continue
+
+            conn._transport.write(b''.join(data for _, data in conn_frames))
+            self.writes += 1
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        tasks, self._tasks = self._tasks, []
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if exc_type is None:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
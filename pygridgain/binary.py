@@ -42,8 +42,13 @@ from .datatypes import (
 )
 from .datatypes.base import GridGainDataTypeProps
 from .exceptions import ParseError
+from .stream import AioBinaryStream, BinaryStream
 from .utils import entity_id, schema_id
 
+try:
+    from ._cutils import write_binary_object as _write_binary_object
+except ImportError:
+    _write_binary_object = None
 
 ALLOWED_FIELD_TYPES = [
     Null, ByteObject, ShortObject, IntObject, LongObject, FloatObject,
@@ -57,6 +62,56 @@ ALLOWED_FIELD_TYPES = [
     MapObject, BinaryObject, WrappedDataObject,
 ]
 
+# field types, written by the C extension without calling their `from_python`
+C_WRITTEN_FIELD_TYPES = [
+    ByteObject, ShortObject, IntObject, LongObject, FloatObject, DoubleObject, CharObject, BoolObject, String,
+]
+
+
+def _field_plan(obj) -> tuple:
+    """
+    Field plan of the Complex object class for the C extension: a tuple
+    of (field name, field ID, type code or 0 if the field is written
+    in Python, default value) in the schema order. The plan is built once
+    per schema.
+
+    :param obj: Generic object instance,
+    :return: tuple of the schema ID and the field plan.
+    """
+    cls = type(obj)
+    s_id = obj.schema_id
+    cached = cls.__dict__.get('_field_plan')
+    if cached is None or cached[0] != s_id:
+        plan = tuple(
+            (
+                name,
+                entity_id(name),
+                int.from_bytes(field_type.type_code, byteorder=PROTOCOL_BYTE_ORDER)
+                if field_type in C_WRITTEN_FIELD_TYPES else 0,
+                getattr(field_type, 'default', None),
+            )
+            for name, field_type in obj.schema.items()
+        )
+        cached = (s_id, plan)
+        cls._field_plan = cached
+    return cached
+
+
+def _replace_schema(cls, schema: OrderedDict):
+    """
+    Replaces the schema of the Complex object class in place with the one
+    with the same field names, but other field types. The field plan and
+    the attrs-generated methods are rebuilt on the next use, the existing
+    objects of the class are written with the new field types.
+
+    :param cls: Complex object class,
+    :param schema: new schema.
+    """
+    cls._schema = schema
+    cls._field_plan = None
+    if attr.has(cls):
+        del cls.__attrs_attrs__
+
 
 class GenericObjectProps(GridGainDataTypeProps):
     """
@@ -120,16 +175,25 @@ class GenericObjectMeta(GenericObjectPropsMeta):
             :param stream: BinaryStream
             :param save_to_buf: Optional. If True, save serialized data to buffer.
             """
+            schema_items = list(self.schema.items())
+            if _write_binary_object:
+                def write_field(index, value):
+                    with BinaryStream(stream.client) as field_stream:
+                        schema_items[index][1].from_python(field_stream, value)
+                        return field_stream.getvalue()
+
+                write_object(self, stream, write_field, save_to_buf)
+                return
+
             initial_pos = stream.tell()
             header, header_class = write_header(self, stream)
 
             offsets = [ctypes.sizeof(header_class)]
-            schema_items = list(self.schema.items())
             for field_name, field_type in schema_items:
                 val = getattr(self, field_name, getattr(field_type, 'default', None))
                 field_start_pos = stream.tell()
                 field_type.from_python(stream, val)
-                offsets.append(max(offsets) + stream.tell() - field_start_pos)
+                offsets.append(offsets[-1] + stream.tell() - field_start_pos)
 
             write_footer(self, stream, header, header_class, schema_items, offsets, initial_pos, save_to_buf)
 
@@ -137,19 +201,57 @@ class GenericObjectMeta(GenericObjectPropsMeta):
             """
             Async version of _from_python
             """
+            schema_items = list(self.schema.items())
+            if _write_binary_object:
+                # fields, that are not written by the C extension, are written
+                # beforehand, since they may need to register binary types
+                _, plan = _field_plan(self)
+                written = {}
+                for index, (field_name, _, type_code, default) in enumerate(plan):
+                    if not type_code:
+                        with AioBinaryStream(stream.client) as field_stream:
+                            await schema_items[index][1].from_python_async(
+                                field_stream, getattr(self, field_name, default)
+                            )
+                            written[index] = field_stream.getvalue()
+
+                def write_field(index, value):
+                    if index in written:
+                        return written[index]
+                    with AioBinaryStream(stream.client) as field_stream:
+                        schema_items[index][1].from_python(field_stream, value)
+                        return field_stream.getvalue()
+
+                write_object(self, stream, write_field, save_to_buf)
+                return
+
             initial_pos = stream.tell()
             header, header_class = write_header(self, stream)
 
             offsets = [ctypes.sizeof(header_class)]
-            schema_items = list(self.schema.items())
             for field_name, field_type in schema_items:
                 val = getattr(self, field_name, getattr(field_type, 'default', None))
                 field_start_pos = stream.tell()
                 await field_type.from_python_async(stream, val)
-                offsets.append(max(offsets) + stream.tell() - field_start_pos)
+                offsets.append(offsets[-1] + stream.tell() - field_start_pos)
 
             write_footer(self, stream, header, header_class, schema_items, offsets, initial_pos, save_to_buf)
 
+        def write_object(obj, stream, write_field, save_to_buf):
+            # header, fields, footer and hash code are written in one pass
+            # by the C extension, `write_field` writes the rest of the fields
+            s_id, plan = _field_plan(obj)
+            flags = BinaryObject.USER_TYPE | BinaryObject.HAS_SCHEMA
+            if stream.compact_footer:
+                flags |= BinaryObject.COMPACT_FOOTER
+
+            data, hash_code = _write_binary_object(obj, plan, obj.version, flags, obj.type_id, s_id, write_field)
+            stream.write(data)
+
+            if save_to_buf:
+                obj._buffer = data
+            obj._hashcode = hash_code
+
         def write_header(obj, stream):
             header_class = BinaryObject.get_header_class()
             header = header_class()
@@ -0,0 +1,177 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+File-backed cache of the binary type metadata.
+
+A new client knows nothing about the Complex object types, so the first
+read of each type costs a metadata request to the cluster. The metadata
+cache keeps the binary type metadata, once received from the cluster,
+in a file, so the next client processes start with it.
+
+The metadata is kept per cluster (the cluster is identified by the node
+addresses, passed to `connect()`) and per type and schema IDs. The types
+or schemas, that are not cached, are requested from the cluster as usual
+and added to the file.
+
+The schema ID is derived from the field names only, so a cached schema
+may have stale field types, e.g. if the cluster was recreated at the same
+addresses. The cached field names are used for reading as they are, but
+the field types are confirmed by the cluster before they are relied on
+(before writing the objects of the type, or parsing them without the C
+extension). On mismatch, the cached entry of the type is replaced with
+the cluster's one, or dropped, if the cluster does not know the type.
+"""
+import json
+import os
+import tempfile
+from threading import Lock
+from typing import Iterable, List, Optional, Tuple
+
+__all__ = ['BinaryMetadataCache']
+
+FORMAT_VERSION = 1
+
+
+def cluster_key(nodes: Iterable[Tuple[str, int]]) -> str:
+    """
+    Identifies the cluster by the addresses of its nodes.
+
+    :param nodes: (host, port) pairs,
+    :return: string key.
+    """
+    return ','.join(sorted(f'{host}:{port}' for host, port in nodes))
+
+
+class BinaryMetadataCache:
+    """
+    Binary type metadata, stored in a JSON file. The file is read on the
+    first lookup and is rewritten atomically (by replacing it with a temporary
+    file), merging the metadata, added by the other processes meanwhile.
+    """
+    def __init__(self, path: str):
+        """
+        :param path: path to the cache file. It is created on the first write.
+        """
+        self.path = os.path.abspath(path)
+        self.cluster = None
+        self._lock = Lock()
+        self._clusters = None
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # no cache yet, or it is damaged and will be rewritten
+            return {}
+        if not isinstance(data, dict) or data.get('version') != FORMAT_VERSION:
+            return {}
+        return data.get('clusters', {})
+
+    def _types(self) -> dict:
+        if self._clusters is None:
+            self._clusters = self._read()
+        return self._clusters.setdefault(self.cluster, {})
+
+    def get(self, type_id: int, schema_id: int) -> Optional[Tuple[str, List[Tuple[str, int]]]]:
+        """
+        Looks up the cached schema.
+
+        :param type_id: Complex object type ID,
+        :param schema_id: Complex object schema ID,
+        :return: None if not cached, or a tuple of the type name and a list
+         of (field name, field type ID) of the schema.
+        """
+        if self.cluster is None:
+            return None
+        with self._lock:
+            type_info = self._types().get(str(type_id))
+            if type_info is None:
+                return None
+            fields = type_info['schemas'].get(str(schema_id))
+            if fields is None:
+                return None
+            return type_info['type_name'], [tuple(field) for field in fields]
+
+    def put(self, type_id: int, type_name: str, schemas: dict):
+        """
+        Stores the binary type metadata, received from the cluster. If it does
+        not match the cached one, e.g. the field types have changed, the cached
+        schemas of the type are dropped.
+
+        :param type_id: Complex object type ID,
+        :param type_name: Complex object type name,
+        :param schemas: dict of {schema ID: list of (field name, field type ID)}.
+        """
+        if self.cluster is None:
+            return
+        with self._lock:
+            type_info = self._types().get(str(type_id))
+            schemas = {str(s_id): [list(field) for field in fields] for s_id, fields in schemas.items()}
+            if type_info is not None and type_info['type_name'] == type_name and \
+                    all(type_info['schemas'].get(s_id) == fields for s_id, fields in schemas.items()):
+                # nothing new
+                return
+
+            clusters = self._merge()
+            types = clusters[self.cluster]
+            type_info = types.get(str(type_id))
+            if type_info is None or type_info['type_name'] != type_name or \
+                    any(type_info['schemas'].get(s_id, fields) != fields for s_id, fields in schemas.items()):
+                # a new type, or the type has changed on the cluster
+                type_info = types[str(type_id)] = {'type_name': type_name, 'schemas': {}}
+            type_info['schemas'].update(schemas)
+            self._write({'version': FORMAT_VERSION, 'clusters': clusters})
+
+    def drop(self, type_id: int):
+        """
+        Removes the binary type metadata, that the cluster does not know.
+
+        :param type_id: Complex object type ID.
+        """
+        if self.cluster is None:
+            return
+        with self._lock:
+            if str(type_id) not in self._types():
+                return
+
+            clusters = self._merge()
+            clusters[self.cluster].pop(str(type_id), None)
+            self._write({'version': FORMAT_VERSION, 'clusters': clusters})
+
+    def _merge(self) -> dict:
+        # merge with the metadata, written by the other processes
+        clusters = self._read()
+        clusters.update({c: types for c, types in self._clusters.items() if c not in clusters})
+        types = clusters.setdefault(self.cluster, {})
+        for t_id, t_info in self._clusters.get(self.cluster, {}).items():
+            types.setdefault(t_id, t_info)
+        self._clusters = clusters
+        return clusters
+
+    def _write(self, data: dict):
+        directory = os.path.dirname(self.path)
+        fd, tmp_path = tempfile.mkstemp(prefix='.pygridgain-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # the cache is an optimization, a failed write is not an error
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
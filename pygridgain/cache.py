@@ -14,14 +14,15 @@
 # limitations under the License.
 #
 import datetime
-from typing import Any, Iterable, Optional, Tuple, Union, List
+from typing import Any, Callable, Iterable, Optional, Tuple, Union, List
 
 from .api.tx_api import get_tx_connection
 from .datatypes import prop_codes, ExpiryPolicy
 from .datatypes.internal import AnyDataObject
 from .exceptions import CacheCreationError, CacheError, ParameterError, SQLError, NotSupportedByClusterError
+from .near_cache import DEFAULT_MAX_ENTRIES, EVICTION_LRU, NearCache
 from .queries.cache_info import CacheInfo
-from .utils import cache_id, status_to_exception
+from .utils import cache_id, is_hinted, status_to_exception
 from .api.cache_config import (
     cache_create, cache_create_with_config, cache_get_or_create, cache_get_or_create_with_config, cache_destroy,
     cache_get_configuration
@@ -158,6 +159,98 @@ class BaseCache:
 
         return cache_cls(self.client, self.name, expiry_policy)
 
+    @property
+    def near_cache(self) -> Optional[NearCache]:
+        """
+        Near cache of this cache, or None if it is not enabled.
+        """
+        return self._client._near_caches.get(self.cache_id)
+
+    def _enable_near_cache(
+            self, max_entries: int, max_memory: Optional[int], ttl: Optional[float], eviction_policy: str,
+            settings: dict
+    ):
+        self._client._near_caches[self.cache_id] = NearCache(
+            max_entries, max_memory, ttl, eviction_policy, settings.get(prop_codes.PROP_EXPIRY_POLICY)
+        )
+        return self
+
+    def _get_near_cache_for_read(self) -> Optional[NearCache]:
+        # transactions read from the cluster to keep their isolation
+        return None if get_tx_connection() else self.near_cache
+
+    @staticmethod
+    def _near_key(key, key_hint=None):
+        if key_hint is None:
+            if is_hinted(key):
+                return key
+            key_hint = AnyDataObject.map_python_type(key)
+        return key, key_hint
+
+    def _near_get_all(self, near_cache: NearCache, keys: Iterable):
+        """
+        Looks up the keys in the near cache.
+
+        :return: tuple of the found key-value pairs, the list of missing
+         keys and the near cache generation to put them with.
+        """
+        generation = near_cache.generation
+        values, missing = {}, []
+        for key in keys:
+            found, value = near_cache.get(self._near_key(key))
+            if found:
+                values[key[0] if is_hinted(key) else key] = value
+            else:
+                missing.append(key)
+        return values, missing, generation
+
+    def _near_put_all(self, near_cache: NearCache, keys: list, values: dict, generation: int):
+        for key in keys:
+            value = values.get(key[0] if is_hinted(key) else key)
+            if value is not None:
+                near_cache.put(self._near_key(key), value, self.cache_info.expiry_policy, generation)
+
+    def _invalidate_near_cache(self, keys: Optional[Iterable] = None):
+        """
+        Drops the given keys or (key, key_hint) tuples from the near cache,
+        if it is enabled.
+
+        :param keys: (optional) keys to drop (default: drop all).
+        """
+        near_cache = self.near_cache
+        if near_cache is not None:
+            if keys is None:
+                near_cache.clear()
+            else:
+                near_cache.invalidate(self._near_key(key) for key in keys)
+
+    @staticmethod
+    def _merge_batch_results(results: list, merge_values: Callable = None):
+        """
+        Merges the results of a batch operation, that was split by nodes.
+
+        :param results: API results of the node batches,
+        :param merge_values: (optional) callable, that merges the list
+         of result values. The first result value is kept if not set,
+        :return: the first failed result, or the merged result.
+        """
+        for result in results:
+            if result.status != 0:
+                return result
+
+        result = results[0]
+        if merge_values and len(results) > 1:
+            result.value = merge_values([r.value for r in results])
+        return result
+
+
+def _merge_dicts(values: list) -> dict:
+    merged = {}
+    for value in values:
+        if value:
+            merged.update(value)
+    return merged
+
 
 class Cache(BaseCache):
     """
@@ -182,6 +275,30 @@ class Cache(BaseCache):
         tx_conn = get_tx_connection()
         return tx_conn if tx_conn else self.client.get_best_node(self, key, key_hint)
 
+    def _run_by_node(self, fun: Callable, keys: Iterable, merge_values: Callable = None):
+        """
+        Splits the keys by their primary nodes and runs the batch operation
+        on each node in parallel.
+
+        :param fun: API function, that takes a connection, cache info
+         and a list of keys,
+        :param keys: keys or (key, key_hint) tuples,
+        :param merge_values: (optional) callable, that merges the result
+         values of the node batches,
+        :return: API result.
+        """
+        keys = list(keys)
+        tx_conn = get_tx_connection()
+        if tx_conn:
+            return self._merge_batch_results([fun(tx_conn, self.cache_info, keys)], merge_values)
+
+        def run(node, node_keys):
+            # check out in the thread, that makes the request
+            return fun(self.client._checkout(node), self.cache_info, node_keys)
+
+        results = self.client._run_batches(run, self.client._group_by_node(self, keys))
+        return self._merge_batch_results(results, merge_values)
+
     @property
     def settings(self) -> Optional[dict]:
         """
@@ -209,9 +326,38 @@ class Cache(BaseCache):
         """
         Destroys cache with a given name.
         """
+        self.client._near_caches.pop(self.cache_id, None)
         return cache_destroy(self._get_best_node(), self.cache_id)
 
-    @status_to_exception(CacheError)
+    def with_near_cache(
+            self, max_entries: int = DEFAULT_MAX_ENTRIES, max_memory: Optional[int] = None,
+            ttl: Optional[float] = None, eviction_policy: str = EVICTION_LRU
+    ) -> 'Cache':
+        """
+        Enables the client-side near cache, that keeps the recently read
+        values. The near cache is shared by all the objects of this cache,
+        that belong to the same client, and is invalidated by their writes.
+        Changes made by other clients or by SQL queries are not tracked, so
+        set the `ttl` to limit the staleness of values. Enabling the near
+        cache again replaces the existing one.
+
+        The entries do not outlive the cluster entries under the expiry
+        policy, configured for the cache (it is read from the cache
+        configuration once), nor under the one, set with
+        :py:meth:`with_expire_policy`.
+
+        :param max_entries: (optional) maximum number of entries. Default
+         is 10000,
+        :param max_memory: (optional) maximum estimated size of the entries
+         in bytes. Default is None (not limited),
+        :param ttl: (optional) time (in seconds) after which the entry is
+         re-read from the cluster. Default is None (not limited, apart from
+         the expiry policies),
+        :param eviction_policy: (optional) 'lru' or 'lfu'. Default is 'lru',
+        :return: this cache.
+        """
+        return self._enable_near_cache(max_entries, max_memory, ttl, eviction_policy, self.settings)
+
     def get(self, key, key_hint: object = None) -> Any:
         """
         Retrieves a value from cache by key.
@@ -224,6 +370,20 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
+        near_cache = self._get_near_cache_for_read()
+        if near_cache is None:
+            return self._get(key, key_hint)
+
+        found, value = near_cache.get((key, key_hint))
+        if not found:
+            generation = near_cache.generation
+            value = self._get(key, key_hint)
+            if value is not None:
+                near_cache.put((key, key_hint), value, self.cache_info.expiry_policy, generation)
+        return value
+
+    @status_to_exception(CacheError)
+    def _get(self, key, key_hint):
         result = cache_get(
             self._get_best_node(key, key_hint),
             self.cache_info,
@@ -249,13 +409,15 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        return cache_put(
-            self._get_best_node(key, key_hint),
-            self.cache_info, key, value,
-            key_hint=key_hint, value_hint=value_hint
-        )
+        try:
+            return cache_put(
+                self._get_best_node(key, key_hint),
+                self.cache_info, key, value,
+                key_hint=key_hint, value_hint=value_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
 
-    @status_to_exception(CacheError)
     def get_all(self, keys: list) -> dict:
         """
         Retrieves multiple key-value pairs from cache.
@@ -263,7 +425,20 @@ class Cache(BaseCache):
         :param keys: list of keys or tuples of (key, key_hint),
         :return: a dict of key-value pairs.
         """
-        result = cache_get_all(self._get_best_node(), self.cache_info, keys)
+        near_cache = self._get_near_cache_for_read()
+        if near_cache is None:
+            return self._get_all(keys)
+
+        values, missing, generation = self._near_get_all(near_cache, keys)
+        if missing:
+            missing_values = self._get_all(missing)
+            self._near_put_all(near_cache, missing, missing_values, generation)
+            values.update(missing_values)
+        return values
+
+    @status_to_exception(CacheError)
+    def _get_all(self, keys: list):
+        result = self._run_by_node(cache_get_all, keys, _merge_dicts)
         if result.value:
             for key, value in result.value.items():
                 result.value[key] = self.client.unwrap_binary(value)
@@ -279,7 +454,12 @@ class Cache(BaseCache):
          to save. Each key or value can be an item of representable
          Python type or a tuple of (item, hint),
         """
-        return cache_put_all(self._get_best_node(), self.cache_info, pairs)
+        try:
+            return self._run_by_node(
+                lambda conn, cache_info, keys: cache_put_all(conn, cache_info, {k: pairs[k] for k in keys}), pairs
+            )
+        finally:
+            self._invalidate_near_cache(pairs)
 
     @status_to_exception(CacheError)
     def replace(
@@ -298,11 +478,14 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        result = cache_replace(
-            self._get_best_node(key, key_hint),
-            self.cache_info, key, value,
-            key_hint=key_hint, value_hint=value_hint
-        )
+        try:
+            result = cache_replace(
+                self._get_best_node(key, key_hint),
+                self.cache_info, key, value,
+                key_hint=key_hint, value_hint=value_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
         result.value = self.client.unwrap_binary(result.value)
         return result
 
@@ -314,11 +497,13 @@ class Cache(BaseCache):
         :param keys: (optional) list of cache keys or (key, key type
          hint) tuples to clear (default: clear all).
         """
-        conn = self._get_best_node()
-        if keys:
-            return cache_clear_keys(conn, self.cache_info, keys)
-        else:
-            return cache_clear(conn, self.cache_info)
+        try:
+            if keys:
+                return self._run_by_node(cache_clear_keys, keys)
+            else:
+                return cache_clear(self._get_best_node(), self.cache_info)
+        finally:
+            self._invalidate_near_cache(keys or None)
 
     @status_to_exception(CacheError)
     def clear_key(self, key, key_hint: object = None):
@@ -332,12 +517,15 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        return cache_clear_key(
-            self._get_best_node(key, key_hint),
-            self.cache_info,
-            key,
-            key_hint=key_hint
-        )
+        try:
+            return cache_clear_key(
+                self._get_best_node(key, key_hint),
+                self.cache_info,
+                key,
+                key_hint=key_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
 
     @status_to_exception(CacheError)
     def clear_keys(self, keys: Iterable):
@@ -346,8 +534,11 @@ class Cache(BaseCache):
 
         :param keys: a list of keys or (key, type hint) tuples
         """
-
-        return cache_clear_keys(self._get_best_node(), self.cache_info, keys)
+        keys = list(keys)
+        try:
+            return self._run_by_node(cache_clear_keys, keys)
+        finally:
+            self._invalidate_near_cache(keys)
 
     @status_to_exception(CacheError)
     def contains_key(self, key, key_hint=None) -> bool:
@@ -377,7 +568,7 @@ class Cache(BaseCache):
         :param keys: a list of keys or (key, type hint) tuples,
         :return: boolean `True` when all keys are present, `False` otherwise.
         """
-        return cache_contains_keys(self._get_best_node(), self.cache_info, keys)
+        return self._run_by_node(cache_contains_keys, keys, all)
 
     @status_to_exception(CacheError)
     def get_and_put(self, key, value, key_hint=None, value_hint=None) -> Any:
@@ -396,12 +587,15 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        result = cache_get_and_put(
-            self._get_best_node(key, key_hint),
-            self.cache_info,
-            key, value,
-            key_hint, value_hint
-        )
+        try:
+            result = cache_get_and_put(
+                self._get_best_node(key, key_hint),
+                self.cache_info,
+                key, value,
+                key_hint, value_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
         result.value = self.client.unwrap_binary(result.value)
         return result
 
@@ -424,12 +618,15 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        result = cache_get_and_put_if_absent(
-            self._get_best_node(key, key_hint),
-            self.cache_info,
-            key, value,
-            key_hint, value_hint
-        )
+        try:
+            result = cache_get_and_put_if_absent(
+                self._get_best_node(key, key_hint),
+                self.cache_info,
+                key, value,
+                key_hint, value_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
         result.value = self.client.unwrap_binary(result.value)
         return result
 
@@ -449,12 +646,15 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        return cache_put_if_absent(
-            self._get_best_node(key, key_hint),
-            self.cache_info,
-            key, value,
-            key_hint, value_hint
-        )
+        try:
+            return cache_put_if_absent(
+                self._get_best_node(key, key_hint),
+                self.cache_info,
+                key, value,
+                key_hint, value_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
 
     @status_to_exception(CacheError)
     def get_and_remove(self, key, key_hint=None) -> Any:
@@ -469,12 +669,15 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        result = cache_get_and_remove(
-            self._get_best_node(key, key_hint),
-            self.cache_info,
-            key,
-            key_hint
-        )
+        try:
+            result = cache_get_and_remove(
+                self._get_best_node(key, key_hint),
+                self.cache_info,
+                key,
+                key_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
         result.value = self.client.unwrap_binary(result.value)
         return result
 
@@ -498,12 +701,15 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        result = cache_get_and_replace(
-            self._get_best_node(key, key_hint),
-            self.cache_info,
-            key, value,
-            key_hint, value_hint
-        )
+        try:
+            result = cache_get_and_replace(
+                self._get_best_node(key, key_hint),
+                self.cache_info,
+                key, value,
+                key_hint, value_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
         result.value = self.client.unwrap_binary(result.value)
         return result
 
@@ -519,9 +725,12 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        return cache_remove_key(
-            self._get_best_node(key, key_hint), self.cache_info, key, key_hint
-        )
+        try:
+            return cache_remove_key(
+                self._get_best_node(key, key_hint), self.cache_info, key, key_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
 
     @status_to_exception(CacheError)
     def remove_keys(self, keys: list):
@@ -531,16 +740,21 @@ class Cache(BaseCache):
 
         :param keys: list of keys or tuples of (key, key_hint) to remove.
         """
-        return cache_remove_keys(
-            self._get_best_node(), self.cache_info, keys
-        )
+        keys = list(keys)
+        try:
+            return self._run_by_node(cache_remove_keys, keys)
+        finally:
+            self._invalidate_near_cache(keys)
 
     @status_to_exception(CacheError)
     def remove_all(self):
         """
         Removes all cache entries, notifying listeners and cache writers.
         """
-        return cache_remove_all(self._get_best_node(), self.cache_info)
+        try:
+            return cache_remove_all(self._get_best_node(), self.cache_info)
+        finally:
+            self._invalidate_near_cache()
 
     @status_to_exception(CacheError)
     def remove_if_equals(self, key, sample, key_hint=None, sample_hint=None):
@@ -558,12 +772,15 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        return cache_remove_if_equals(
-            self._get_best_node(key, key_hint),
-            self.cache_info,
-            key, sample,
-            key_hint, sample_hint
-        )
+        try:
+            return cache_remove_if_equals(
+                self._get_best_node(key, key_hint),
+                self.cache_info,
+                key, sample,
+                key_hint, sample_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
 
     @status_to_exception(CacheError)
     def replace_if_equals(
@@ -588,12 +805,15 @@ class Cache(BaseCache):
         if key_hint is None:
             key_hint = AnyDataObject.map_python_type(key)
 
-        result = cache_replace_if_equals(
-            self._get_best_node(key, key_hint),
-            self.cache_info,
-            key, sample, value,
-            key_hint, sample_hint, value_hint
-        )
+        try:
+            result = cache_replace_if_equals(
+                self._get_best_node(key, key_hint),
+                self.cache_info,
+                key, sample, value,
+                key_hint, sample_hint, value_hint
+            )
+        finally:
+            self._invalidate_near_cache([(key, key_hint)])
         result.value = self.client.unwrap_binary(result.value)
         return result
 
@@ -611,7 +831,7 @@ class Cache(BaseCache):
             self._get_best_node(), self.cache_info, peek_modes
         )
 
-    def scan(self, page_size: int = 1, partitions: int = -1, local: bool = False) -> ScanCursor:
+    def scan(self, page_size: int = 1, partitions: int = -1, local: bool = False, prefetch: int = 0) -> ScanCursor:
         """
         Returns all key-value pairs from the cache, similar to `get_all`, but
         with internal pagination, which is slower, but safer.
@@ -622,14 +842,18 @@ class Cache(BaseCache):
          (negative to query entire cache),
         :param local: (optional) pass True if this query should be executed
          on local node only. Defaults to False,
+        :param prefetch: (optional) number of pages to request in background
+         ahead of the iteration. Default is 0 (request the next page when
+         the current one is exhausted),
         :return: Scan query cursor.
         """
-        return ScanCursor(self.client, self.cache_info, page_size, partitions, local)
+        return ScanCursor(self.client, self.cache_info, page_size, partitions, local, prefetch)
 
     def select_row(
             self, query_str: str, page_size: int = 1,
             query_args: Optional[list] = None, distributed_joins: bool = False,
-            replicated_only: bool = False, local: bool = False, timeout: int = 0
+            replicated_only: bool = False, local: bool = False, timeout: int = 0,
+            prefetch: int = 0
     ) -> SqlCursor:
         """
         Executes a simplified SQL SELECT query over data stored in the cache.
@@ -647,6 +871,9 @@ class Cache(BaseCache):
          on local node only. Defaults to False,
         :param timeout: (optional) non-negative timeout value in ms. Zero
          disables timeout (default),
+        :param prefetch: (optional) number of pages to request in background
+         ahead of the iteration. Default is 0 (request the next page when
+         the current one is exhausted),
         :return: Sql cursor.
         """
         type_name = self.settings[
@@ -656,10 +883,10 @@ class Cache(BaseCache):
             raise SQLError('Value type is unknown')
 
         return SqlCursor(self.client, self.cache_info, type_name, query_str, page_size, query_args,
-                         distributed_joins, replicated_only, local, timeout)
+                         distributed_joins, replicated_only, local, timeout, prefetch=prefetch)
 
     def vector(self, type_name: str, field: str, clause_vector: List[float],
-               k: int, threshold: float, page_size: int = 1) -> VectorCursor:
+               k: int, threshold: float, page_size: int = 1, prefetch: int = 0) -> VectorCursor:
         """
         Ignite supports vector queries based on Apache Lucene engine.
 
@@ -669,6 +896,35 @@ class Cache(BaseCache):
         :param k: [K]NN, how many vectors to return.
         :param page_size: (optional) page size. Default size is 1 (slowest
          and safest),
+        :param prefetch: (optional) number of pages to request in background
+         ahead of the iteration. Default is 0 (request the next page when
+         the current one is exhausted),
         :return: Scan query cursor.
         """
-        return VectorCursor(self.client, self.cache_info, page_size, type_name, field, clause_vector, k, threshold)
+        return VectorCursor(
+            self.client, self.cache_info, page_size, type_name, field, clause_vector, k, threshold, prefetch
+        )
+
+    def vector_batch(self, type_name: str, field: str, vectors: Iterable[List[float]], k: int, threshold: float,
+                     page_size: Optional[int] = None) -> List[List[Tuple[Any, Any]]]:
+        """
+        Runs a vector query for each of the search vectors. The queries are
+        run concurrently, each in its own cursor.
+
+        :param type_name: Name of the type.
+        :param field: Name of the field.
+        :param vectors: Search vectors.
+        :param k: [K]NN, how many vectors to return per query.
+        :param threshold: Similarity threshold.
+        :param page_size: (optional) page size. Default is `k`, so the results
+         of a query usually come in a single round trip,
+        :return: list of the query results in the order of `vectors`. The
+         results of a query are a list of (key, value) pairs.
+        """
+        page_size = page_size or k
+
+        def run(clause_vector):
+            with self.vector(type_name, field, clause_vector, k, threshold, page_size=page_size) as cursor:
+                return list(cursor)
+
+        return self.client._run_batches(run, [(vector,) for vector in vectors])
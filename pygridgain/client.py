@@ -41,31 +41,45 @@ the local (class-wise) registry for GridGain Complex objects.
 """
 import time
 from collections import defaultdict, OrderedDict
+from functools import partial
 import random
 import re
+from concurrent.futures import ThreadPoolExecutor, wait
 from itertools import chain
-from typing import Iterable, Type, Union, Any, Dict, Optional, Sequence
+from threading import Lock, Thread
+from typing import Callable, Iterable, Type, Union, Any, Dict, List, Optional, Sequence, Tuple
 
 from .api import cache_get_node_partitions
 from .api.binary import get_binary_type, put_binary_type
 from .api.cache_config import cache_get_names
+from .binary_cache import BinaryMetadataCache, cluster_key
 from .cluster import Cluster
 from .cursors import SqlFieldsCursor
+from .data_streamer import DataStreamer, DEFAULT_BATCH_SIZE, DEFAULT_PARALLEL_OPS_PER_NODE
 from .cache import Cache, create_cache, get_cache, get_or_create_cache, BaseCache
-from .connection import Connection
-from .constants import DEFAULT_HOST, DEFAULT_PORT, PROTOCOL_BYTE_ORDER, AFFINITY_RETRIES, AFFINITY_DELAY
+from .connection import Connection, ConnectionPool
+from .connection.buffer_pool import BufferPool
+from .connection.reconnect import ReconnectScheduler
+from .connection.pool import parse_pool_size
+from .constants import (
+    DEFAULT_HOST, DEFAULT_PORT, PROTOCOL_BYTE_ORDER, AFFINITY_RETRIES, AFFINITY_DELAY, POOL_IDLE_TIMEOUT,
+    MAX_CONNECT_THREADS
+)
 from .datatypes import BinaryObject, AnyDataObject, TransactionConcurrency, TransactionIsolation
+from .datatypes.prop_codes import PROP_QUERY_ENTITIES
 from .datatypes.base import GridGainDataType
+from .datatypes.decoder import decode_value
 from .datatypes.internal import tc_map
-from .exceptions import BinaryTypeError, CacheError, ReconnectError, connection_errors
+from .datatypes.primitive_arrays import ARRAY_FORMAT_LIST, ARRAY_FORMAT_NUMPY, ARRAY_FORMATS, numpy
+from .exceptions import BinaryTypeError, CacheError, ParameterError, ReconnectError, connection_errors
 from .queries.cache_info import CacheInfo
 from .stream import BinaryStream, READ_BACKWARD
 from .transaction import Transaction
 from .utils import (
-    cache_id, capitalize, entity_id, schema_id, process_delimiter, status_to_exception, is_iterable,
+    cache_id, capitalize, entity_id, schema_id, process_delimiter, status_to_exception, is_iterable, is_hinted,
     get_field_by_id, unsigned
 )
-from .binary import GenericObjectMeta
+from .binary import GenericObjectMeta, _replace_schema
 from .monitoring import _EventListeners
 
 
@@ -78,16 +92,40 @@ class BaseClient:
     _ident_start = re.compile(r'^[^a-zA-Z_]+', re.UNICODE)
 
     def __init__(self, compact_footer: bool = None, partition_aware: bool = False,
-                 event_listeners: Optional[Sequence] = None, **kwargs):
+                 event_listeners: Optional[Sequence] = None, direct_decode: bool = False,
+                 pool_size: Union[int, Tuple[int, int]] = None, pool_idle_timeout: float = POOL_IDLE_TIMEOUT,
+                 array_format: str = ARRAY_FORMAT_LIST, binary_metadata_cache: Optional[str] = None, **kwargs):
+        if array_format not in ARRAY_FORMATS:
+            raise ParameterError(f'Unknown array format: {array_format}.')
+        if array_format == ARRAY_FORMAT_NUMPY and numpy is None:
+            raise ParameterError('NumPy is required for the numpy array format.')
+
         self._compact_footer = compact_footer
+        self._direct_decode = direct_decode
+        self._array_format = array_format
         self._partition_aware = partition_aware
         self._connection_args = kwargs
+        self._pool_size = parse_pool_size(pool_size)
+        self._pool_idle_timeout = pool_idle_timeout
         self._registry = defaultdict(dict)
+        self._binary_metadata_cache = BinaryMetadataCache(binary_metadata_cache) if binary_metadata_cache else None
+        # classes, built from the binary metadata cache and not yet confirmed
+        # by the server: {class: type ID}
+        self._cached_classes = {}
         self._nodes = []
+        self._nodes_by_uuid = None
+        self._pools = {}
+        self._near_caches = {}
         self._current_node = 0
         self._partition_aware = partition_aware
         self.affinity_version = (0, 0)
         self._affinity = {'version': self.affinity_version, 'partition_mapping': defaultdict(dict)}
+        # background refresh of the outdated mapping (thread or task)
+        self._affinity_refresh = None
+        self.affinity_refreshes = 0
+        self.failed_affinity_refreshes = 0
+        self.last_affinity_refresh_latency = None
+        self.max_affinity_refresh_latency = 0.0
         self._protocol_context = None
         self._event_listeners = _EventListeners(event_listeners)
 
@@ -141,6 +179,66 @@ class BaseClient:
         else:
             self._compact_footer = value
 
+    @property
+    def direct_decode(self) -> bool:
+        """
+        Whether the responses are decoded with the single-pass decoder
+        (:class:`~pygridgain.datatypes.decoder.DirectDecoder`) instead of
+        the ctypes-based parsers.
+        """
+        return self._direct_decode
+
+    @property
+    def array_format(self) -> str:
+        """
+        How the numeric primitive arrays are decoded: 'list', 'array'
+        (`array.array`) or 'numpy' (NumPy arrays).
+        """
+        return self._array_format
+
+    def pool_metrics(self) -> List[dict]:
+        """
+        Connection pool usage metrics, one dict per server node. See
+        :py:meth:`~pygridgain.connection.pool.BasePool.metrics` for the keys.
+
+        :return: list of dicts.
+        """
+        return [self._pools[node].metrics() for node in self._nodes if node in self._pools]
+
+    def affinity_metrics(self) -> dict:
+        """
+        Partition mapping refresh metrics.
+
+        :return: dict with the numbers of successful (`refreshes`) and failed
+         (`failed_refreshes`) mapping requests, the time (in seconds) taken
+         by the last (`last_refresh_latency`) and the longest
+         (`max_refresh_latency`) of them, and `refresh_in_progress` flag.
+        """
+        return {
+            'refreshes': self.affinity_refreshes,
+            'failed_refreshes': self.failed_affinity_refreshes,
+            'last_refresh_latency': self.last_affinity_refresh_latency,
+            'max_refresh_latency': self.max_affinity_refresh_latency,
+            'refresh_in_progress': self._affinity_refresh is not None,
+        }
+
+    def _clear_near_caches(self):
+        """
+        Drops the entries of all the near caches, e.g. when a transaction,
+        that could change any of them, is committed.
+        """
+        for near_cache in list(self._near_caches.values()):
+            near_cache.clear()
+
+    def _create_node(self, pool_class, conn_class, host, port):
+        conn = conn_class(self, host, port, **self._connection_args)
+        min_size, max_size = self._pool_size
+        self._pools[conn] = pool_class(
+            conn, partial(conn_class, self, host, port, **self._connection_args), min_size, max_size,
+            self._pool_idle_timeout
+        )
+        return conn
+
     @staticmethod
     def _process_connect_args(*args):
         if len(args) == 0:
@@ -161,6 +259,13 @@ class BaseClient:
 
         binary_fields = result.value.pop('binary_fields')
         old_format_schemas = result.value.pop('schema')
+        if self._binary_metadata_cache is not None:
+            self._binary_metadata_cache.put(
+                result.value['type_id'], result.value['type_name'], {
+                    s_id: [self._field_by_id(binary_fields, field_id) for field_id in field_ids]
+                    for s_id, field_ids in old_format_schemas.items()
+                }
+            )
         result.value['schemas'] = []
         for s_id, field_ids in old_format_schemas.items():
             result.value['schemas'].append(self._convert_schema(field_ids, binary_fields))
@@ -175,11 +280,16 @@ class BaseClient:
             # we probably have a binary object type ID
             return BinaryObject
 
+    @staticmethod
+    def _field_by_id(binary_fields: list, field_id: int) -> Tuple[str, int]:
+        binary_field = next(x for x in binary_fields if x['field_id'] == field_id)
+        return binary_field['field_name'], binary_field['type_id']
+
     def _convert_schema(self, field_ids: list, binary_fields: list) -> OrderedDict:
         converted_schema = OrderedDict()
         for field_id in field_ids:
-            binary_field = next(x for x in binary_fields if x['field_id'] == field_id)
-            converted_schema[binary_field['field_name']] = self._convert_type(binary_field['type_id'])
+            field_name, type_id = self._field_by_id(binary_fields, field_id)
+            converted_schema[field_name] = self._convert_type(type_id)
         return converted_schema
 
     @staticmethod
@@ -229,6 +339,7 @@ class BaseClient:
         :param type_id: Complex object type ID.
         :param type_info: Complex object type info.
         """
+        self._confirm_cached_classes(type_id, type_info)
         if type_info['type_exists']:
             for schema in type_info['schemas']:
                 if not self._registry[type_id].get(schema_id(schema), None):
@@ -238,6 +349,103 @@ class BaseClient:
                     )
                     self._registry[type_id][schema_id(schema)] = data_class
 
+    def _confirm_cached_classes(self, type_id: int, type_info: dict):
+        """
+        Checks the classes, built from the binary metadata cache, against
+        the type info, received from the server. The schema ID is derived
+        from the field names only, so a cached schema may have stale field
+        types, e.g. if the cluster was recreated at the same addresses. Such
+        classes get the server's field types, the classes of the types,
+        that the server does not know, are dropped from the registry.
+
+        :param type_id: Complex object type ID,
+        :param type_info: Complex object type info from the server.
+        """
+        cached_classes = [data_class for data_class, t_id in self._cached_classes.items() if t_id == type_id]
+        if cached_classes and not type_info['type_exists']:
+            self._binary_metadata_cache.drop(type_id)
+        schemas = {schema_id(schema): schema for schema in type_info['schemas']} if type_info['type_exists'] else {}
+        for data_class in cached_classes:
+            del self._cached_classes[data_class]
+            s_id = data_class.schema_id
+            if self._registry[type_id].get(s_id) is not data_class:
+                # replaced with a user class
+                continue
+            schema = schemas.get(s_id)
+            if schema is None:
+                del self._registry[type_id][s_id]
+            elif data_class.schema != schema:
+                _replace_schema(data_class, schema)
+
+    def _bind_binary_metadata_cache(self, nodes: Iterable[Tuple[str, int]]):
+        """
+        Selects the part of the binary metadata cache, that belongs
+        to the cluster of the given nodes.
+        """
+        if self._binary_metadata_cache is not None:
+            self._binary_metadata_cache.cluster = cluster_key(nodes)
+
+    def _load_from_binary_metadata_cache(self, type_id: int, schema: Union[int, dict]) -> Optional[Type]:
+        """
+        Fills the registry from the binary metadata cache.
+
+        :param type_id: Complex object type ID,
+        :param schema: Complex object schema or schema ID,
+        :return: found dataclass or None, if the schema is not cached.
+        """
+        if self._binary_metadata_cache is None or not schema:
+            return None
+
+        s_id = schema_id(schema)
+        cached = self._binary_metadata_cache.get(type_id, s_id)
+        if cached is None:
+            return None
+
+        type_name, fields = cached
+        cached_schema = OrderedDict((field_name, self._convert_type(tc)) for field_name, tc in fields)
+        if schema_id(cached_schema) != s_id:
+            # the file is damaged, let the server decide
+            return None
+
+        if not self._registry[type_id].get(s_id):
+            data_class = self._create_dataclass(self._create_type_name(type_name), cached_schema)
+            self._registry[type_id][s_id] = data_class
+            self._cached_classes[data_class] = type_id
+        return self._get_from_registry(type_id, schema)
+
+    @staticmethod
+    def _query_entity_types(settings: dict) -> List[str]:
+        """
+        Collects the key and value type names of the cache query entities.
+
+        :param settings: cache properties,
+        :return: list of Complex object type names.
+        """
+        type_names = []
+        for entity in settings.get(PROP_QUERY_ENTITIES) or []:
+            for type_name in (entity.get('key_type_name'), entity.get('value_type_name')):
+                # the standard Java types are not Complex objects
+                if type_name and not type_name.startswith('java.'):
+                    type_names.append(type_name)
+        return type_names
+
+    def _register_prefetched(self, type_infos: Iterable[Tuple[int, dict]], started: float) -> dict:
+        """
+        Registers the prefetched binary types.
+
+        :param type_infos: pairs of (type ID, result of `get_binary_type`),
+        :param started: time of the prefetch start,
+        :return: prefetch report.
+        """
+        types = found = schemas = 0
+        for type_id, type_info in type_infos:
+            types += 1
+            if type_info['type_exists']:
+                found += 1
+                schemas += len(type_info['schemas'])
+                self._sync_binary_registry(type_id, type_info)
+        return {'types': types, 'found': found, 'schemas': schemas, 'duration': time.monotonic() - started}
+
     def _get_from_registry(self, type_id, schema):
         """
         Get binary type info from registry.
@@ -276,8 +484,95 @@ class BaseClient:
 
         full_mapping = full_affinity.get('partition_mapping')
         if full_mapping:
+            # caches of the same group share the node mapping,
+            # so they can share the partition table as well
+            partition_tables = {}
+            for cache_partition_mapping in full_mapping.values():
+                node_mapping = cache_partition_mapping.get('node_mapping')
+                if node_mapping:
+                    table = partition_tables.get(id(node_mapping))
+                    if table is None:
+                        table = self._build_partition_table(
+                            node_mapping, cache_partition_mapping['number_of_partitions']
+                        )
+                        partition_tables[id(node_mapping)] = table
+                    cache_partition_mapping['partition_table'] = table
+
             self._affinity['partition_mapping'].update(full_mapping)
 
+    @staticmethod
+    def _build_partition_table(node_mapping: dict, parts: int) -> list:
+        """
+        Flattens the node mapping into a list of node UUIDs, indexed
+        by partition number.
+
+        :param node_mapping: dict of {node UUID: set of partitions},
+        :param parts: number of partitions,
+        :return: list of node UUIDs (None for an unassigned partition).
+        """
+        table = [None] * parts
+        for node_uuid, partitions in node_mapping.items():
+            for part in partitions:
+                if 0 <= part < parts:
+                    table[part] = node_uuid
+        return table
+
+    def _invalidate_nodes_by_uuid(self):
+        """
+        Drop the node UUID lookup table. Called when the node list changes
+        or when a node gets a new UUID upon (re)connection.
+        """
+        self._nodes_by_uuid = None
+
+    def _get_node_by_uuid(self, node_uuid):
+        nodes_by_uuid = self._nodes_by_uuid
+        if nodes_by_uuid is None:
+            nodes_by_uuid = {}
+            for node in self._nodes:
+                if node.uuid is not None:
+                    nodes_by_uuid.setdefault(node.uuid, node)
+            self._nodes_by_uuid = nodes_by_uuid
+        return nodes_by_uuid.get(node_uuid)
+
+    def _has_unmapped_caches(self) -> bool:
+        """
+        Tells if any registered cache has never got its mapping. The mapping
+        of such a cache is requested at once, since there is nothing to use
+        meanwhile.
+        """
+        return not all(list(self._affinity['partition_mapping'].values()))
+
+    def _affinity_outdated(self) -> bool:
+        return self._affinity['version'] < self.affinity_version
+
+    def _record_affinity_refresh(self, started: float, success: bool):
+        latency = time.monotonic() - started
+        if success:
+            self.affinity_refreshes += 1
+        else:
+            self.failed_affinity_refreshes += 1
+        self.last_affinity_refresh_latency = latency
+        self.max_affinity_refresh_latency = max(self.max_affinity_refresh_latency, latency)
+
+    def _schedule_reconnect(self, node):
+        """
+        Hands the failed node over to the background reconnection.
+        The failed pooled connections, other than the primary one, are dropped
+        by the pool instead.
+
+        :param node: primary connection to the node.
+        """
+        if node in self._pools:
+            self._reconnect_scheduler.schedule(node)
+
+    def _reconnect_failed_nodes(self):
+        # only the partition aware client keeps all the nodes connected,
+        # the other one connects the next node on failover
+        if self.partition_aware:
+            for node in list(self._nodes):
+                if not node.alive:
+                    self._schedule_reconnect(node)
+
     def _caches_to_update_affinity(self):
         if self._affinity['version'] < self.affinity_version:
             return list(self._affinity['partition_mapping'].keys())
@@ -304,21 +599,13 @@ class BaseClient:
 
         assert 0 <= part < parts, 'Partition calculation has failed'
 
-        node_mapping = self._cache_partition_mapping(cache_id).get('node_mapping')
-        if not node_mapping:
+        partition_table = self._cache_partition_mapping(cache_id).get('partition_table')
+        if not partition_table:
             return None
 
-        node_uuid, best_conn = None, None
-        for u, p in node_mapping.items():
-            if part in p:
-                node_uuid = u
-                break
-
+        node_uuid = partition_table[part]
         if node_uuid:
-            for n in self._nodes:
-                if n.uuid == node_uuid:
-                    best_conn = n
-                    break
+            best_conn = self._get_node_by_uuid(node_uuid)
             if best_conn and best_conn.alive:
                 return best_conn
 
@@ -342,7 +629,10 @@ class Client(BaseClient):
     """
 
     def __init__(self, compact_footer: bool = None, partition_aware: bool = True,
-                 event_listeners: Optional[Sequence] = None, **kwargs):
+                 event_listeners: Optional[Sequence] = None, direct_decode: bool = False,
+                 pool_size: Union[int, Tuple[int, int]] = None, pool_idle_timeout: float = POOL_IDLE_TIMEOUT,
+                 array_format: str = ARRAY_FORMAT_LIST, connect_timeout: Optional[float] = None,
+                 binary_metadata_cache: Optional[str] = None, **kwargs):
         """
         Initialize client.
 
@@ -358,12 +648,38 @@ class Client(BaseClient):
          placement from the key before to issue the key operation to the
          server node, `True` by default,
         :param event_listeners: (optional) event listeners,
+        :param direct_decode: (optional) decode the responses in a single pass
+         over the received buffer, bypassing the ctypes-based parsers. Gives
+         the same results, but faster on large responses. `False` by default,
+        :param pool_size: (optional) number of connections per server node,
+         or a (min, max) pair. The pool opens the connections up to the max
+         on demand, when all of its connections are busy, and closes the idle
+         ones down to the min. Default is one connection per node,
+        :param pool_idle_timeout: (optional) time (in seconds) after which
+         an idle pooled connection above the pool min is closed. Default
+         is 60 seconds,
+        :param array_format: (optional) how the short, int, long, float and
+         double arrays are decoded: 'list' (Python lists, default), 'array'
+         (`array.array`) or 'numpy' (NumPy arrays, requires NumPy),
+        :param connect_timeout: (optional) time (in seconds) in which
+         :py:meth:`connect` should be done. The nodes, that are not connected
+         in time, are connected in background. If no node is connected in time,
+         the rest of the nodes are tried one by one, as without the timeout.
+         Default is None (wait for all the nodes),
+        :param binary_metadata_cache: (optional) path to the file, in which
+         the Complex object types metadata, received from the cluster, is kept
+         for the next client processes, so they do not request it again.
+         Default is None (no file),
         :param timeout: (optional) sets timeout (in seconds) for each socket
          operation including `connect`. 0 means non-blocking mode, which is
          virtually guaranteed to fail. Can accept integer or float value.
          Default is None (blocking mode),
         :param handshake_timeout: (optional) sets timeout (in seconds) for performing handshake (connection)
          with node. Default is 10.0 seconds,
+        :param multiplexed: (optional) allow many threads to share the client
+         connections with several requests in flight. The responses are read
+         in a background thread per connection and matched to the requests
+         by query ID. Default is False,
         :param use_ssl: (optional) set to True if Ignite server uses SSL
          on its binary connector. Defaults to use SSL when username
          and password has been supplied, not to use SSL otherwise,
@@ -393,7 +709,18 @@ class Client(BaseClient):
          cluster,
         :param password: (optional) password to authenticate to Ignite cluster.
         """
-        super().__init__(compact_footer, partition_aware, event_listeners, **kwargs)
+        super().__init__(
+            compact_footer, partition_aware, event_listeners, direct_decode, pool_size, pool_idle_timeout,
+            array_format, binary_metadata_cache, **kwargs
+        )
+        if connect_timeout is not None and connect_timeout <= 0:
+            raise ParameterError('connect_timeout should be positive.')
+        self._connect_timeout = connect_timeout
+        self._batch_executor = None
+        self._batch_executor_lock = Lock()
+        self._affinity_refresh_lock = Lock()
+        self._reconnect_scheduler = ReconnectScheduler()
+        self._buffer_pool = BufferPool()
 
     def connect(self, *args):
         """
@@ -407,46 +734,111 @@ class Client(BaseClient):
     def _connect(self, nodes):
         # the following code is quite twisted, because the protocol version
         # is initially unknown
-
-        # TODO: open first node in foreground, others − in background
-        for i, node in enumerate(nodes):
+        deadline = time.monotonic() + self._connect_timeout if self._connect_timeout else None
+        self._bind_binary_metadata_cache(nodes)
+        for node in nodes:
             host, port = node
-            conn = Connection(self, host, port, **self._connection_args)
-
+            self._nodes.append(self._create_node(ConnectionPool, Connection, host, port))
+
+        # open the first reachable node in foreground; the handshakes are
+        # bounded by the rest of the connect timeout, but when it is used up,
+        # the untried nodes are still tried one by one
+        failed, rest = [], []
+        for i, conn in enumerate(self._nodes):
+            remaining = deadline - time.monotonic() if deadline is not None else 0
             try:
-                if self.protocol_context is None or self.partition_aware:
-                    # open connection before adding to the pool
-                    conn.connect()
+                conn.connect(handshake_timeout=remaining if remaining > 0 else None)
+                self._pools[conn].fill()
+            except connection_errors:
+                failed.append(conn)
+            else:
+                # now we have the protocol version
+                if not self.partition_aware:
+                    # do not try to open more nodes
+                    self._current_node = i
+                rest = self._nodes[i + 1:]
+                break
 
-                    # now we have the protocol version
-                    if not self.partition_aware:
-                        # do not try to open more nodes
-                        self._current_node = i
+        self._invalidate_nodes_by_uuid()
+        if self.protocol_context is None:
+            raise ReconnectError('Can not connect.')
+
+        if self.partition_aware:
+            # schedule the reconnection
+            for conn in failed:
+                self._schedule_reconnect(conn)
 
+            # open the others in parallel
+            self._connect_in_parallel(rest, deadline)
+
+    def _connect_in_parallel(self, nodes: List[Connection], deadline: Optional[float]):
+        """
+        Opens the connections in parallel threads and waits for them until
+        the deadline. The nodes, that failed to connect, are reconnected
+        in background.
+
+        :param nodes: connections to open,
+        :param deadline: time (as of `time.monotonic()`) to stop waiting,
+         None to wait for all the nodes.
+        """
+        if not nodes:
+            return
+
+        def connect(conn):
+            try:
+                conn.connect()
+                pool = self._pools.get(conn)
+                if pool is None:
+                    # the client was closed while connecting
+                    conn.close()
+                else:
+                    pool.fill()
             except connection_errors:
-                if self.partition_aware:
-                    # schedule the reconnection
-                    conn.reconnect()
+                self._schedule_reconnect(conn)
 
-            self._nodes.append(conn)
+        executor = ThreadPoolExecutor(min(len(nodes), MAX_CONNECT_THREADS), thread_name_prefix='pygridgain-connect')
+        futures = [executor.submit(connect, conn) for conn in nodes]
+        executor.shutdown(wait=False)
 
-        if self.protocol_context is None:
-            raise ReconnectError('Can not connect.')
+        timeout = max(deadline - time.monotonic(), 0) if deadline is not None else None
+        done, _ = wait(futures, timeout=timeout)
+        for future in done:
+            # raise handshake errors, such as authentication failure
+            future.result()
 
     def close(self):
+        self._reconnect_scheduler.stop()
         for conn in self._nodes:
-            conn.close()
+            pool = self._pools.get(conn)
+            if pool:
+                pool.close()
+            else:
+                conn.close()
         self._nodes.clear()
+        self._invalidate_nodes_by_uuid()
+        self._pools.clear()
+
+        with self._batch_executor_lock:
+            executor, self._batch_executor = self._batch_executor, None
+        if executor:
+            executor.shutdown(wait=False)
+
+    def _checkout(self, node: Connection) -> Connection:
+        pool = self._pools.get(node)
+        return pool.acquire() if pool else node
 
     @property
     def random_node(self) -> Connection:
         """
-        Returns random usable node.
+        Returns random usable node (a pooled connection to it).
 
         This method is not a part of the public API. Unless you wish to
         extend the `pygridgain` capabilities (with additional testing,
         logging, examining connections, et c.) you probably should not use it.
         """
+        return self._checkout(self._get_usable_node())
+
+    def _get_usable_node(self) -> Connection:
         if self.partition_aware:
             # if partition awareness is used just pick a random connected node
             return self._get_random_node()
@@ -458,8 +850,9 @@ class Client(BaseClient):
             if node.alive:
                 return node
 
-            # close current (supposedly failed) node
-            self._nodes[self._current_node].close()
+            if not self._reconnect_scheduler.scheduled(node):
+                # close current (supposedly failed) node
+                node.close()
 
             # advance the node index
             self._current_node += 1
@@ -470,11 +863,18 @@ class Client(BaseClient):
             num_nodes = len(self._nodes)
             for i in chain(range(self._current_node, num_nodes), range(self._current_node)):
                 node = self._nodes[i]
+                if node.alive:
+                    # e.g. reconnected in background
+                    self._current_node = i
+                    return node
+                if self._reconnect_scheduler.scheduled(node):
+                    continue
                 try:
                     node.connect()
                 except connection_errors:
                     pass
                 else:
+                    self._current_node = i
                     return node
 
             # no nodes left
@@ -547,10 +947,23 @@ class Client(BaseClient):
         :param data_class: Complex object class,
         :param affinity_key_field: (optional) affinity parameter.
         """
+        self._confirm_binary_type(data_class)
         if not self.query_binary_type(data_class.type_id, data_class.schema_id):
             self.put_binary_type(data_class.type_name, affinity_key_field, schema=data_class.schema)
         self._registry[data_class.type_id][data_class.schema_id] = data_class
 
+    def _confirm_binary_type(self, data_class: Type):
+        """
+        Confirms the field types of the class, if it was built from the binary
+        metadata cache, with the server. It is done before the field types
+        are relied on, i.e. before writing the objects of the class.
+
+        :param data_class: Complex object class.
+        """
+        type_id = self._cached_classes.get(data_class)
+        if type_id is not None:
+            self._sync_binary_registry(type_id, self.get_binary_type(type_id))
+
     def query_binary_type(self, binary_type: Union[int, str], schema: Union[int, dict] = None):
         """
         Queries the registry of Complex object classes.
@@ -562,7 +975,7 @@ class Client(BaseClient):
         """
         type_id = entity_id(binary_type)
 
-        result = self._get_from_registry(type_id, schema)
+        result = self._get_from_registry(type_id, schema) or self._load_from_binary_metadata_cache(type_id, schema)
         if not result:
             type_info = self.get_binary_type(type_id)
             self._sync_binary_registry(type_id, type_info)
@@ -570,6 +983,56 @@ class Client(BaseClient):
 
         return result
 
+    def prefetch_binary_types(self, binary_types: Iterable[Union[int, str]]) -> dict:
+        """
+        Fetches the given Complex object types with all their schemas
+        and registers them, so decoding of the values of these types does not
+        wait for the type metadata. The types are requested from the connected
+        nodes in parallel.
+
+        :param binary_types: Complex object type names or IDs,
+        :return: dict with the number of the requested `types`, the number
+         of the types `found` in the cluster, the number of the registered
+         `schemas` and the `duration` of the prefetch in seconds.
+        """
+        started = time.monotonic()
+        type_ids = list(dict.fromkeys(entity_id(binary_type) for binary_type in binary_types))
+        nodes = [n for n in self._nodes if n.alive] or [self._get_usable_node()]
+        batches = [(node, type_ids[i::len(nodes)]) for i, node in enumerate(nodes) if i < len(type_ids)]
+        type_infos = chain.from_iterable(self._run_batches(self._fetch_binary_types, batches)) if batches else []
+        return self._register_prefetched(type_infos, started)
+
+    def _fetch_binary_types(self, node: Connection, type_ids: List[int]) -> List[Tuple[int, dict]]:
+        type_infos = []
+        for type_id in type_ids:
+            result = self._process_get_binary_type_result(get_binary_type(self._checkout(node), type_id))
+            if result.status != 0:
+                raise BinaryTypeError(result.message)
+            type_infos.append((type_id, result.value))
+        return type_infos
+
+    def warmup(self, caches: Iterable[Union[str, 'Cache']] = (), binary_types: Iterable[Union[int, str]] = ()) -> dict:
+        """
+        Prepares the client for the traffic: fetches the Complex object types
+        of the given caches' query entities (keys and values) and the given
+        types. See :py:meth:`prefetch_binary_types`.
+
+        :param caches: (optional) cache names or caches,
+        :param binary_types: (optional) Complex object type names or IDs,
+        :return: prefetch report. Its `duration` includes the time to read
+         the cache configurations.
+        """
+        started = time.monotonic()
+        binary_types = list(binary_types)
+        for cache in caches:
+            if not isinstance(cache, BaseCache):
+                cache = self.get_cache(cache)
+            binary_types.extend(self._query_entity_types(cache.settings))
+
+        report = self.prefetch_binary_types(binary_types)
+        report['duration'] = time.monotonic() - started
+        return report
+
     def unwrap_binary(self, value: Any) -> Any:
         """
         Detects and recursively unwraps Binary Object or collections of BinaryObject.
@@ -581,6 +1044,8 @@ class Client(BaseClient):
         if isinstance(value, tuple) and len(value) == 2:
             if type(value[0]) is bytes and type(value[1]) is int:
                 blob, offset = value
+                if self.direct_decode:
+                    return decode_value(self, blob)
                 with BinaryStream(self, blob) as stream:
                     data_class = BinaryObject.parse(stream)
                     return BinaryObject.to_python(stream.read_ctype(data_class, direction=READ_BACKWARD), client=self)
@@ -630,44 +1095,141 @@ class Client(BaseClient):
          should be converted,
         :return: Ignite connection object.
         """
-        conn = self.random_node
+        conn = self._get_usable_node()
 
         if self.partition_aware and key is not None:
+            conn, mapping_ready = self._refresh_affinity(conn)
+            if mapping_ready:
+                best_node = self._get_primary_node(cache, key, key_hint)
+                if best_node:
+                    return self._checkout(best_node)
+
+        return self._checkout(conn)
+
+    def _refresh_affinity(self, conn: 'Connection') -> Tuple['Connection', bool]:
+        """
+        Update partition mapping of the registered caches, if needed.
+        The mapping of the newly registered caches is requested at once.
+        The outdated mapping is refreshed in background, and is used
+        meanwhile: the keys of the lost nodes go to the random ones.
+
+        :param conn: connection to query the mapping with,
+        :return: the connection, that was finally used, and False if server
+         did not create the mapping in time, True otherwise.
+        """
+        if self._has_unmapped_caches():
+            started = time.monotonic()
+            caches = self._caches_to_update_affinity()
+            # update partition mapping
+            while True:
+                try:
+                    full_affinity = self._get_affinity(conn, caches)
+                    break
+                except connection_errors:
+                    # retry if connection failed
+                    conn = self._get_usable_node()
+                    pass
+                except CacheError:
+                    # server did not create mapping in time
+                    self._record_affinity_refresh(started, False)
+                    return conn, False
+
+            self._update_affinity(full_affinity)
+            self._record_affinity_refresh(started, True)
+
+            self._reconnect_failed_nodes()
+
+        elif self._affinity_outdated():
+            self._start_affinity_refresh()
+
+        return conn, True
+
+    def _start_affinity_refresh(self):
+        """
+        Starts the background thread, that refreshes the outdated mapping,
+        unless it is already running.
+        """
+        with self._affinity_refresh_lock:
+            if self._affinity_refresh is not None:
+                return
+            thread = Thread(target=self._refresh_affinity_in_background, name='pygridgain-affinity', daemon=True)
+            self._affinity_refresh = thread
+        thread.start()
+
+    def _refresh_affinity_in_background(self):
+        try:
             caches = self._caches_to_update_affinity()
             if caches:
-                # update partition mapping
-                while True:
-                    try:
-                        full_affinity = self._get_affinity(conn, caches)
-                        break
-                    except connection_errors:
-                        # retry if connection failed
-                        conn = self.random_node
-                        pass
-                    except CacheError:
-                        # server did not create mapping in time
-                        return conn
-
-                self._update_affinity(full_affinity)
-
-                for node in self._nodes:
-                    if not node.alive:
-                        node.reconnect()
-
-            c_id = cache.cache_id if isinstance(cache, BaseCache) else cache_id(cache)
-            parts = self._cache_partition_mapping(c_id).get('number_of_partitions')
-
-            if not parts:
-                return conn
-
-            key, key_hint = self._get_affinity_key(c_id, key, key_hint)
-            hashcode = key_hint.hashcode(key, client=self)
-
-            best_node = self._get_node_by_hashcode(c_id, hashcode, parts)
-            if best_node:
-                return best_node
+                started = time.monotonic()
+                try:
+                    full_affinity = self._get_affinity(self._get_usable_node(), caches)
+                except connection_errors + (CacheError, ReconnectError):
+                    # the next request retries
+                    self._record_affinity_refresh(started, False)
+                else:
+                    self._update_affinity(full_affinity)
+                    self._record_affinity_refresh(started, True)
+                    self._reconnect_failed_nodes()
+        finally:
+            with self._affinity_refresh_lock:
+                self._affinity_refresh = None
+
+    def _get_primary_node(
+            self, cache: Union[int, str, 'BaseCache'], key: Any, key_hint: 'GridGainDataType' = None
+    ) -> Optional['Connection']:
+        c_id = cache.cache_id if isinstance(cache, BaseCache) else cache_id(cache)
+        parts = self._cache_partition_mapping(c_id).get('number_of_partitions')
+
+        if not parts:
+            return None
 
-        return conn
+        key, key_hint = self._get_affinity_key(c_id, key, key_hint)
+        hashcode = key_hint.hashcode(key, client=self)
+
+        return self._get_node_by_hashcode(c_id, hashcode, parts)
+
+    def _group_by_node(self, cache: 'BaseCache', keys: list) -> List[Tuple['Connection', list]]:
+        """
+        Splits the keys of a batch operation by their primary nodes.
+
+        :param cache: Ignite cache,
+        :param keys: list of keys or (key, key_hint) tuples,
+        :return: list of (node, keys) pairs. Contains a single pair with all
+         the keys, if the data placement is unknown. The nodes are not checked
+         out, so the connection is reserved by the thread (task), that makes
+         the request.
+        """
+        conn = self._get_usable_node()
+
+        if self.partition_aware and len(keys) > 1:
+            conn, mapping_ready = self._refresh_affinity(conn)
+            if mapping_ready:
+                groups = {}
+                for item in keys:
+                    key, key_hint = item if is_hinted(item) else (item, None)
+                    node = self._get_primary_node(cache, key, key_hint) or conn
+                    groups.setdefault(node, []).append(item)
+                return list(groups.items())
+
+        return [(conn, keys)]
+
+    def _run_batches(self, fun: Callable, batches: Sequence[tuple]) -> list:
+        """
+        Calls `fun` with each of the argument tuples in parallel threads.
+
+        :param fun: callable,
+        :param batches: argument tuples,
+        :return: list of results in the order of `batches`.
+        """
+        if len(batches) == 1:
+            return [fun(*batches[0])]
+
+        with self._batch_executor_lock:
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(thread_name_prefix='pygridgain-batch')
+            executor = self._batch_executor
+
+        return [f.result() for f in [executor.submit(fun, *args) for args in batches]]
 
     def create_cache(self, settings: Union[str, dict]) -> 'Cache':
         """
@@ -723,7 +1285,8 @@ class Client(BaseClient):
         enforce_join_order: bool = False, collocated: bool = False,
         lazy: bool = False, include_field_names: bool = False,
         max_rows: int = -1, timeout: int = 0,
-        cache: Union[int, str, Cache] = None
+        cache: Union[int, str, Cache] = None, prefetch: int = 0,
+        as_columns: bool = False
     ) -> SqlFieldsCursor:
         """
         Runs an SQL query and returns its result.
@@ -759,6 +1322,13 @@ class Client(BaseClient):
          Zero disables timeout (default),
         :param cache: (optional) Name or ID of the cache to use to infer schema.
          If set, 'schema' argument is ignored,
+        :param prefetch: (optional) number of pages to request in background
+         ahead of the iteration. Default is 0 (request the next page when
+         the current one is exhausted),
+        :param as_columns: (optional) decode each result page into a list
+         of :class:`~pygridgain.columnar.Column` (typed arrays with null masks)
+         instead of the rows. The cursor then yields pages instead of rows.
+         Use `fetch_columns` to collect the whole result. Defaults to False,
         :return: sql fields cursor with result rows as a lists. If
          `include_field_names` was set, the first row will hold field names.
         """
@@ -774,7 +1344,8 @@ class Client(BaseClient):
 
         return SqlFieldsCursor(self, c_info, query_str, page_size, query_args, schema, statement_type,
                                distributed_joins, local, replicated_only, enforce_join_order, collocated, lazy,
-                               include_field_names, max_rows, timeout)
+                               include_field_names, max_rows, timeout, prefetch=prefetch,
+                               as_columns=as_columns)
 
     def get_cluster(self) -> 'Cluster':
         """
@@ -784,6 +1355,27 @@ class Client(BaseClient):
         """
         return Cluster(self)
 
+    def data_streamer(
+        self, cache: Union[str, 'Cache'], batch_size: int = DEFAULT_BATCH_SIZE, flush_interval: Optional[float] = None,
+        parallel_ops_per_node: int = DEFAULT_PARALLEL_OPS_PER_NODE
+    ) -> 'DataStreamer':
+        """
+        Create data streamer to load large amounts of data into the cache.
+
+        :param cache: cache or cache name,
+        :param batch_size: (optional) number of entries per node, that
+         triggers sending a batch. Default is 512,
+        :param flush_interval: (optional) time (in seconds) after which all
+         the buffered entries are sent, regardless of the batch size.
+         Default is None (send full batches only),
+        :param parallel_ops_per_node: (optional) maximum number of batches
+         in flight per node. Default is 4,
+        :return: :py:class:`~pygridgain.data_streamer.DataStreamer` instance.
+        """
+        if not isinstance(cache, Cache):
+            cache = self.get_cache(cache)
+        return DataStreamer(cache, batch_size, flush_interval, parallel_ops_per_node)
+
     def tx_start(self, concurrency: TransactionConcurrency = TransactionConcurrency.PESSIMISTIC,
                  isolation: TransactionIsolation = TransactionIsolation.REPEATABLE_READ,
                  timeout: int = 0, label: Optional[str] = None) -> 'Transaction':
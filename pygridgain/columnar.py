@@ -0,0 +1,214 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Columnar decoding of the SQL fields query results.
+
+The rows of a result page are decoded straight from the response buffer
+into per-column storage. Columns of numeric or boolean values are kept
+in NumPy arrays, if NumPy is installed, or in :py:class:`array.array`
+otherwise, with NULLs marked in a separate mask. Columns of other types
+(or of mixed types) are kept as lists of Python values.
+"""
+from array import array
+import struct
+from typing import List, Optional, Union
+
+from pygridgain.datatypes.type_codes import (
+    TC_BOOL, TC_BYTE, TC_DOUBLE, TC_FLOAT, TC_INT, TC_LONG, TC_NULL, TC_SHORT
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ['Column']
+
+# type code -> (array type code, unpacker, NumPy dtype)
+_NUMERIC = {
+    TC_BYTE[0]: ('b', struct.Struct('<b'), 'int8'),
+    TC_SHORT[0]: ('h', struct.Struct('<h'), 'int16'),
+    TC_INT[0]: ('i', struct.Struct('<i'), 'int32'),
+    TC_LONG[0]: ('q', struct.Struct('<q'), 'int64'),
+    TC_FLOAT[0]: ('f', struct.Struct('<f'), 'float32'),
+    TC_DOUBLE[0]: ('d', struct.Struct('<d'), 'float64'),
+    TC_BOOL[0]: ('b', struct.Struct('<?'), 'bool'),
+}
+
+_NULL = TC_NULL[0]
+
+
+class Column:
+    """
+    Values of a result column.
+    """
+    def __init__(self, name: Union[str, int], values, mask=None, dtype: Optional[str] = None):
+        """
+        :param name: field name, or the field index if the field names
+         were not requested,
+        :param values: NumPy array, `array.array` or list of values. Values
+         of a typed array at the masked positions are undefined,
+        :param mask: (optional) NULL mask, where True (or 1) marks NULLs.
+         None if there are no NULLs in the column,
+        :param dtype: (optional) NumPy type name of a typed array, None
+         for a list.
+        """
+        self.name = name
+        self.values = values
+        self.mask = mask
+        self.dtype = dtype
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return f'{type(self).__name__}(name={self.name!r}, dtype={self.dtype!r}, length={len(self)})'
+
+    def to_list(self) -> list:
+        """
+        :return: list of the column values with NULLs as None.
+        """
+        values = self.values.tolist() if hasattr(self.values, 'tolist') else list(self.values)
+        if self.dtype == 'bool':
+            values = [bool(v) for v in values]
+        if self.mask is None:
+            return values
+        return [None if null else v for v, null in zip(values, self.mask)]
+
+    @classmethod
+    def concat(cls, columns: List['Column']) -> 'Column':
+        """
+        Joins the pieces of a column, e.g. from the subsequent result pages.
+
+        :param columns: column pieces,
+        :return: joined column.
+        """
+        first = columns[0]
+        if len(columns) == 1:
+            return first
+
+        if first.dtype is None or any(c.dtype != first.dtype for c in columns):
+            return cls(first.name, [v for c in columns for v in c.to_list()], None)
+
+        if all(c.mask is None for c in columns):
+            mask = None
+        else:
+            mask = bytearray()
+            for c in columns:
+                mask += bytes(c.mask) if c.mask is not None else bytes(len(c))
+            mask = _finish_mask(mask)
+
+        if numpy is not None:
+            values = numpy.concatenate([c.values for c in columns])
+        else:
+            values = array(first.values.typecode)
+            for c in columns:
+                values.extend(c.values)
+        return cls(first.name, values, mask, first.dtype)
+
+
+def _finish_mask(mask: bytearray):
+    if numpy is not None:
+        return numpy.frombuffer(mask, dtype='bool')
+    return mask
+
+
+class _ColumnBuilder:
+    """
+    Collects the values of a column while the page is being decoded.
+    """
+    def __init__(self, name):
+        self.name = name
+        self.type_code = None
+        self.unpacker = None
+        self.values = []
+        self.mask = bytearray()
+        self.has_nulls = False
+        self.typed = False
+
+    def append_null(self):
+        self.values.append(0 if self.typed else None)
+        self.mask.append(1)
+        self.has_nulls = True
+
+    def append(self, type_code, value):
+        """
+        Appends the value, that does not fit the current column type.
+        """
+        if self.type_code is None:
+            numeric = _NUMERIC.get(type_code)
+            if numeric is not None:
+                # the first non-NULL value defines the type of the column
+                self.type_code, self.typed = type_code, True
+                self.unpacker = numeric[1]
+                self.values = array(numeric[0], [0] * len(self.values))
+                self.values.append(value)
+                self.mask.append(0)
+                return
+
+        if self.typed:
+            # mixed types, fall back to a list
+            self.values = [None if null else v for v, null in zip(self.values.tolist(), self.mask)]
+            if self.type_code == TC_BOOL[0]:
+                self.values = [v if v is None else bool(v) for v in self.values]
+            self.typed = False
+        # make the fast path never match
+        self.type_code = -1
+        self.values.append(value)
+        self.mask.append(0)
+
+    def build(self) -> Column:
+        if not self.typed:
+            return Column(self.name, self.values, None)
+
+        dtype = _NUMERIC[self.type_code][2]
+        mask = _finish_mask(self.mask) if self.has_nulls else None
+        values = self.values
+        if numpy is not None:
+            values = numpy.frombuffer(values, dtype=dtype if dtype != 'bool' else 'int8')
+            if dtype == 'bool':
+                values = values.astype('bool')
+        return Column(self.name, values, mask, dtype)
+
+
+def decode_columns(decoder, names: list, row_count: int, pos: int):
+    """
+    Decodes the rows of the SQL fields query result page into columns.
+
+    :param decoder: :class:`~pygridgain.datatypes.decoder.DirectDecoder`
+     of the response buffer,
+    :param names: field names or indexes,
+    :param row_count: number of rows,
+    :param pos: offset of the first row,
+    :return: tuple of the list of :class:`Column` and the new offset.
+    """
+    buf = decoder.buf
+    builders = [_ColumnBuilder(name) for name in names]
+    for _ in range(row_count):
+        for builder in builders:
+            type_code = buf[pos]
+            if type_code == builder.type_code:
+                unpacker = builder.unpacker
+                builder.values.append(unpacker.unpack_from(buf, pos + 1)[0])
+                builder.mask.append(0)
+                pos += unpacker.size + 1
+            elif type_code == _NULL:
+                builder.append_null()
+                pos += 1
+            else:
+                value, pos = decoder.decode_any(pos)
+                builder.append(type_code, value)
+    return [builder.build() for builder in builders], pos
@@ -21,5 +21,6 @@ as well as GridGain protocol handshaking.
 
 from .connection import Connection
 from .aio_connection import AioConnection
+from .pool import ConnectionPool, AioConnectionPool
 
-__all__ = ['Connection', 'AioConnection']
+__all__ = ['Connection', 'AioConnection', 'ConnectionPool', 'AioConnectionPool']
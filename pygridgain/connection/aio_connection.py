@@ -16,23 +16,45 @@
 
 import asyncio
 from collections import OrderedDict
+import struct
+import time
 from typing import Union
 
 from pygridgain.constants import PROTOCOLS, PROTOCOL_BYTE_ORDER
-from pygridgain.exceptions import HandshakeError, SocketError, connection_errors, AuthenticationError
+from pygridgain.exceptions import HandshakeError, ParameterError, SocketError, connection_errors, AuthenticationError
 from .bitmask_feature import BitmaskFeature
 from .connection import BaseConnection
 
 from .handshake import HandshakeRequest, HandshakeResponse
 from .protocol_context import ProtocolContext
 from .ssl import create_ssl_context
+from ..batch import current_batch
 from ..stream.binary_stream import BinaryStreamBase
 
+DEFAULT_COALESCE_SIZE = 64 * 1024
 
-class BaseProtocol(asyncio.Protocol):
+RECEIVE_BUFFER_SIZE = 64 * 1024
+MIN_READ_SIZE = 4 * 1024
+
+_FRAME_LENGTH = struct.Struct('<i')
+
+
+class BaseProtocol(asyncio.BufferedProtocol):
+    """
+    Splits the incoming data into the response frames.
+
+    The data is received right into a buffer, and the complete frames
+    are passed on as memory views of it. The frames, that were passed on,
+    are never overwritten: when the buffer is full, the incomplete frame
+    is moved to a new buffer, and the old one is released with the last
+    of its frames.
+    """
     def __init__(self, conn, handshake_fut):
         super().__init__()
-        self._buffer = bytearray()
+        self._buffer = bytearray(RECEIVE_BUFFER_SIZE)
+        # the incomplete frame starts at `_start`, the received data ends at `_end`
+        self._start = 0
+        self._end = 0
         self._conn = conn
         self._handshake_fut = handshake_fut
 
@@ -45,26 +67,41 @@ class BaseProtocol(asyncio.Protocol):
         except Exception as e:
             self._handshake_fut.set_exception(e)
 
-    def data_received(self, data: bytes) -> None:
-        self._buffer += data
-        while self.__has_full_response():
-            packet_sz = self.__packet_size(self._buffer)
-            packet = self._buffer[0:packet_sz]
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if len(self._buffer) - self._end < MIN_READ_SIZE:
+            self.__renew_buffer(MIN_READ_SIZE)
+        return memoryview(self._buffer)[self._end:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._end += nbytes
+        buffer, start, end = self._buffer, self._start, self._end
+        view = None
+        while end - start >= 4:
+            frame_end = start + 4 + _FRAME_LENGTH.unpack_from(buffer, start)[0]
+            if frame_end > end:
+                # make room for the whole frame at once
+                if frame_end > len(buffer):
+                    self._start = start
+                    self.__renew_buffer(frame_end - end)
+                return
+
+            if view is None:
+                view = memoryview(buffer)
+            packet = view[start:frame_end]
+            self._start = start = frame_end
             if not self._handshake_fut.done():
                 hs_response = self.__parse_handshake(packet, self._conn.client)
                 self._handshake_fut.set_result(hs_response)
             else:
                 self._conn.process_message(packet)
-            self._buffer = self._buffer[packet_sz:len(self._buffer)]
 
-    def __has_full_response(self):
-        if len(self._buffer) > 4:
-            response_len = int.from_bytes(self._buffer[0:4], byteorder=PROTOCOL_BYTE_ORDER, signed=True)
-            return response_len + 4 <= len(self._buffer)
+        self._start = start
 
-    @staticmethod
-    def __packet_size(buffer):
-        return int.from_bytes(buffer[0:4], byteorder=PROTOCOL_BYTE_ORDER, signed=True) + 4
+    def __renew_buffer(self, free_size):
+        pending = self._end - self._start
+        buffer = bytearray(max(RECEIVE_BUFFER_SIZE, pending + free_size))
+        buffer[:pending] = memoryview(self._buffer)[self._start:self._end]
+        self._buffer, self._start, self._end = buffer, 0, pending
 
     def __process_connection_error(self, exc):
         connected = self._handshake_fut.done()
@@ -94,7 +131,7 @@ class AioConnection(BaseConnection):
     """
 
     def __init__(self, client: 'AioClient', host: str, port: int, username: str = None, password: str = None,
-                 **ssl_params):
+                 coalesce_delay: float = None, coalesce_size: int = DEFAULT_COALESCE_SIZE, **ssl_params):
         """
         Initialize connection.
 
@@ -106,6 +143,14 @@ class AioConnection(BaseConnection):
         :param port: Ignite server node's port number,
         :param handshake_timeout: (optional) sets timeout (in seconds) for performing handshake (connection)
          with node. Default is 10.0 seconds,
+        :param coalesce_delay: (optional) time (in seconds) for which
+         the outgoing requests are buffered, so the requests, issued
+         concurrently, are written with a single write. 0 buffers them until
+         the event loop runs out of ready callbacks. Default is None
+         (write each request at once),
+        :param coalesce_size: (optional) size (in bytes) of the buffered
+         requests, that triggers the write regardless of the delay.
+         Default is 64 KiB,
         :param use_ssl: (optional) set to True if Ignite server uses SSL
          on its binary connector. Defaults to use SSL when username
          and password has been supplied, not to use SSL otherwise,
@@ -135,8 +180,22 @@ class AioConnection(BaseConnection):
          cluster,
         :param password: (optional) password to authenticate to Ignite cluster.
         """
+        if coalesce_delay is not None and coalesce_delay < 0:
+            raise ParameterError('coalesce_delay should be non-negative.')
+        if not isinstance(coalesce_size, int) or coalesce_size < 1:
+            raise ParameterError('coalesce_size should be a positive integer.')
+
         super().__init__(client, host, port, username, password, **ssl_params)
+        self.coalesce_delay = coalesce_delay
+        self.coalesce_size = coalesce_size
         self._pending_reqs = {}
+        self._write_buffer = []
+        self._write_buffer_size = 0
+        self._write_handle = None
+
+        self.writes = 0
+        self.coalesced_frames = 0
+        self.max_coalesced_frames = 0
         self._transport = None
         self._loop = asyncio.get_event_loop()
         self._closed = False
@@ -147,6 +206,10 @@ class AioConnection(BaseConnection):
         """ Tells if socket is closed. """
         return self._closed or not self._transport or self._transport.is_closing()
 
+    @property
+    def in_use(self) -> int:
+        return len(self._pending_reqs)
+
     async def connect(self):
         """
         Connect to the given server node with protocol version fallback.
@@ -188,8 +251,11 @@ class AioConnection(BaseConnection):
 
     def process_connection_lost(self, err, reconnect=False):
         self.failed = True
+        # the buffered requests are failed with the rest of the pending ones
+        self._drop_writes()
         for _, fut in self._pending_reqs.items():
-            fut.set_exception(err)
+            if not fut.done():
+                fut.set_exception(err)
         self._pending_reqs.clear()
 
         if self._transport_closed_fut and not self._transport_closed_fut.done():
@@ -197,13 +263,14 @@ class AioConnection(BaseConnection):
 
         if reconnect and not self._closed:
             self._on_connection_lost(err)
-            self._loop.create_task(self._reconnect())
+            self.client._schedule_reconnect(self)
 
     def process_message(self, data):
         req_id = int.from_bytes(data[4:12], byteorder=PROTOCOL_BYTE_ORDER, signed=True)
-        if req_id in self._pending_reqs:
-            self._pending_reqs[req_id].set_result(data)
-            del self._pending_reqs[req_id]
+        fut = self._pending_reqs.pop(req_id, None)
+        # the request could be cancelled while waiting for the response
+        if fut is not None and not fut.done():
+            fut.set_result(data)
 
     async def _connect_version(self) -> Union[dict, OrderedDict]:
         """
@@ -241,7 +308,7 @@ class AioConnection(BaseConnection):
         except connection_errors:
             pass
 
-    async def request(self, query_id, data: Union[bytes, bytearray]) -> bytearray:
+    async def request(self, query_id, data: Union[bytes, bytearray]) -> memoryview:
         """
         Perform request.
         :param query_id: id of query.
@@ -255,8 +322,63 @@ class AioConnection(BaseConnection):
     async def _send(self, query_id, data):
         fut = self._loop.create_future()
         self._pending_reqs[query_id] = fut
-        self._transport.write(data)
-        return await fut
+        batch = current_batch.get()
+        if batch is not None:
+            batch._write(self, query_id, data)
+        elif self.coalesce_delay is None:
+            self._transport.write(data)
+        else:
+            self._coalesce(data)
+        try:
+            return await fut
+        finally:
+            self.last_used = time.monotonic()
+            if self.pool is not None:
+                self.pool.release(self)
+
+    def _coalesce(self, data):
+        self._write_buffer.append(data)
+        self._write_buffer_size += len(data)
+        if self._write_buffer_size >= self.coalesce_size:
+            self._flush_writes()
+        elif self._write_handle is None:
+            if self.coalesce_delay:
+                self._write_handle = self._loop.call_later(self.coalesce_delay, self._flush_writes)
+            else:
+                self._write_handle = self._loop.call_soon(self._flush_writes)
+
+    def _flush_writes(self):
+        frames = self._write_buffer
+        self._drop_writes()
+        if not frames or self._transport is None or self._transport.is_closing():
+            return
+
+        self._transport.writelines(frames)
+        self.writes += 1
+        self.coalesced_frames += len(frames)
+        self.max_coalesced_frames = max(self.max_coalesced_frames, len(frames))
+
+    def _drop_writes(self):
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
+        self._write_buffer = []
+        self._write_buffer_size = 0
+
+    def coalescing_metrics(self) -> dict:
+        """
+        Write coalescing metrics.
+
+        :return: dict with the number of coalesced `writes`, the number
+         of requests (`frames`) they carried, the average (`avg_frames`)
+         and the maximum (`max_frames`) number of requests per write.
+        """
+        return {
+            'writes': self.writes,
+            'frames': self.coalesced_frames,
+            'avg_frames': self.coalesced_frames / self.writes if self.writes else 0.0,
+            'max_frames': self.max_coalesced_frames,
+        }
 
     async def close(self):
         self._closed = True
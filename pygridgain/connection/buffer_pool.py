@@ -0,0 +1,117 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Pool of the receive buffers.
+
+The synchronous connection reads the length of a response first and then
+receives the response straight into a buffer of the right size. The
+buffers are taken from the pool and returned to it, when the response is
+decoded, so the large responses (`get_all`, scan and SQL pages) do not
+allocate and zero-fill a new buffer every time.
+"""
+from threading import Lock
+from typing import Union
+
+__all__ = ['BufferPool']
+
+DEFAULT_MAX_BUFFERS = 16
+DEFAULT_MAX_POOLED_SIZE = 16 * 1024 * 1024
+DEFAULT_MAX_POOLED_BYTES = 64 * 1024 * 1024
+
+MIN_BUFFER_SIZE = 4096
+
+
+def _round_size(size: int) -> int:
+    # power of two sizes make the buffers reusable for the close sizes
+    return max(MIN_BUFFER_SIZE, 1 << (size - 1).bit_length())
+
+
+class BufferPool:
+    """
+    Thread-safe free list of the reusable receive buffers.
+    """
+    def __init__(
+        self, max_buffers: int = DEFAULT_MAX_BUFFERS, max_pooled_size: int = DEFAULT_MAX_POOLED_SIZE,
+        max_pooled_bytes: int = DEFAULT_MAX_POOLED_BYTES
+    ):
+        """
+        :param max_buffers: (optional) maximum number of the free buffers
+         to keep,
+        :param max_pooled_size: (optional) buffers larger than this are
+         not kept, and not rounded up on allocation,
+        :param max_pooled_bytes: (optional) maximum total size of the free
+         buffers to keep.
+        """
+        self.max_buffers = max_buffers
+        self.max_pooled_size = max_pooled_size
+        self.max_pooled_bytes = max_pooled_bytes
+        self._free = []
+        self._free_bytes = 0
+        self._lock = Lock()
+        self.allocations = 0
+        self.reuses = 0
+
+    def acquire(self, size: int) -> memoryview:
+        """
+        Takes a buffer of at least the given size from the pool, or allocates
+        a new one.
+
+        :param size: required size in bytes,
+        :return: memoryview of exactly `size` bytes. Its contents
+         is undefined.
+        """
+        with self._lock:
+            best = None
+            for i, buf in enumerate(self._free):
+                if len(buf) >= size and (best is None or len(buf) < len(self._free[best])):
+                    best = i
+            if best is not None:
+                buf = self._free.pop(best)
+                self._free_bytes -= len(buf)
+                self.reuses += 1
+                return memoryview(buf)[:size]
+            self.allocations += 1
+
+        buf = bytearray(_round_size(size) if size <= self.max_pooled_size else size)
+        return memoryview(buf)[:size]
+
+    def release(self, data: Union[memoryview, bytes, bytearray]):
+        """
+        Returns the buffer to the pool. The buffer must not be used after
+        that.
+
+        :param data: memoryview, returned by :py:meth:`acquire`. Other
+         objects are ignored.
+        """
+        if not isinstance(data, memoryview):
+            return
+
+        try:
+            buf = data.obj
+        except ValueError:
+            # already released
+            return
+        if not isinstance(buf, bytearray):
+            return
+
+        data.release()
+        if len(buf) > self.max_pooled_size:
+            return
+
+        with self._lock:
+            if len(self._free) < self.max_buffers and self._free_bytes + len(buf) <= self.max_pooled_bytes:
+                self._free.append(buf)
+                self._free_bytes += len(buf)
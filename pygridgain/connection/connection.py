@@ -14,10 +14,13 @@
 # limitations under the License.
 #
 
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 import logging
 from collections import OrderedDict
 import socket
-from typing import Union
+from threading import Lock, RLock, Thread, current_thread
+import time
+from typing import Optional, Union
 from tzlocal import get_localzone
 
 from pygridgain.constants import PROTOCOLS, DEFAULT_HOST, DEFAULT_PORT, PROTOCOL_BYTE_ORDER
@@ -54,6 +57,9 @@ class BaseConnection:
 
         self.ssl_params = ssl_params
         self._failed = False
+        self.last_used = time.monotonic()
+        # pool, that the connection belongs to
+        self.pool = None
 
     @property
     def closed(self) -> bool:
@@ -74,6 +80,24 @@ class BaseConnection:
         """ Tells if connection is up and no failure detected. """
         return not self.failed and not self.closed
 
+    @property
+    def in_use(self) -> int:
+        """ Number of requests in flight (or waiting to be sent). """
+        raise NotImplementedError
+
+    def pin(self):
+        """
+        Keep the pooled connection open, while a cursor or a transaction
+        is using it. See :py:meth:`~pygridgain.connection.pool.BasePool.pin`.
+        """
+        if self.pool is not None:
+            self.pool.pin(self)
+
+    def unpin(self):
+        """ Undo :py:meth:`pin`. """
+        if self.pool is not None:
+            self.pool.unpin(self)
+
     def __repr__(self) -> str:
         return '{}:{}'.format(self.host or '?', self.port or '?')
 
@@ -111,7 +135,10 @@ class BaseConnection:
     def _on_handshake_success(self, result):
         features = BitmaskFeature.from_array(result.get('features', None))
         self.client.protocol_context.features = features
-        self.uuid = result.get('node_uuid', None)  # version-specific (1.4+)
+        node_uuid = result.get('node_uuid', None)  # version-specific (1.4+)
+        if node_uuid != self.uuid:
+            self.uuid = node_uuid
+            self.client._invalidate_nodes_by_uuid()
         self.failed = False
 
         if logger.isEnabledFor(logging.DEBUG):
@@ -157,9 +184,6 @@ class BaseConnection:
         return self.client._event_listeners
 
 
-DEFAULT_INITIAL_BUF_SIZE = 1024
-
-
 class Connection(BaseConnection):
     """
     This is a `pygridgain` class, that represents a connection to GridGain
@@ -167,11 +191,14 @@ class Connection(BaseConnection):
 
      * socket wrapper. Detects fragmentation and network errors. See also
        https://docs.python.org/3/howto/sockets.html,
-     * binary protocol connector. Encapsulates handshake and failover reconnection.
+     * binary protocol connector. Encapsulates handshake and failover reconnection,
+     * optionally, a request multiplexer. A background reader thread matches
+       the responses to the requests by query ID, so the connection can be
+       shared by many threads with several requests in flight.
     """
 
     def __init__(self, client: 'Client', host: str, port: int, username: str = None, password: str = None,
-                 timeout: float = None, handshake_timeout: float = 10.0,
+                 timeout: float = None, handshake_timeout: float = 10.0, multiplexed: bool = False,
                  **ssl_params):
         """
         Initialize connection.
@@ -188,6 +215,9 @@ class Connection(BaseConnection):
          Default is None (blocking mode),
         :param handshake_timeout: (optional) sets timeout (in seconds) for performing handshake (connection)
          with node. Default is 10.0.
+        :param multiplexed: (optional) share the connection between threads,
+         reading the responses in a background thread and matching them
+         to the requests by query ID. Default is False (one request at a time),
         :param use_ssl: (optional) set to True if GridGain server uses SSL
          on its binary connector. Defaults to use SSL when username
          and password has been supplied, not to use SSL otherwise,
@@ -220,15 +250,30 @@ class Connection(BaseConnection):
         """
         super().__init__(client, host, port, username, password, handshake_timeout, **ssl_params)
         self.timeout = timeout
+        self.multiplexed = multiplexed
         self._socket = None
+        self._pending_reqs = {}
+        self._pending_lock = Lock()
+        self._send_lock = Lock()
+        self._reconnect_lock = RLock()
+        self._request_lock = Lock()
+        self._reader = None
+        self._in_use = 0
 
     @property
     def closed(self) -> bool:
         return self._socket is None
 
-    def connect(self):
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    def connect(self, handshake_timeout: Optional[float] = None):
         """
         Connect to the given server node with protocol version fallback.
+
+        :param handshake_timeout: (optional) caps the handshake timeout
+         of this attempt. Default is None (the connection handshake timeout).
         """
         detecting_protocol = False
 
@@ -240,9 +285,11 @@ class Connection(BaseConnection):
         while True:
             try:
                 self._on_handshake_start()
-                result = self._connect_version()
+                result = self._connect_version(handshake_timeout)
                 self._socket.settimeout(self.timeout)
                 self._on_handshake_success(result)
+                if self.multiplexed:
+                    self._start_reader()
                 return
             except HandshakeError as e:
                 if e.expected_version in PROTOCOLS:
@@ -261,14 +308,16 @@ class Connection(BaseConnection):
                     self.client.protocol_context = None
                 raise e
 
-    def _connect_version(self) -> Union[dict, OrderedDict]:
+    def _connect_version(self, handshake_timeout: Optional[float] = None) -> Union[dict, OrderedDict]:
         """
         Connect to the given server node using protocol version
         defined on client.
         """
+        if handshake_timeout is None or handshake_timeout > self.handshake_timeout:
+            handshake_timeout = self.handshake_timeout
 
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._socket.settimeout(self.handshake_timeout)
+        self._socket.settimeout(handshake_timeout)
         self._socket = wrap(self._socket, self.ssl_params)
         self._socket.connect((self.host, self.port))
 
@@ -283,7 +332,7 @@ class Connection(BaseConnection):
 
         with BinaryStream(self.client) as stream:
             hs_request.from_python(stream)
-            self.send(stream.getvalue(), reconnect=False)
+            self.send(stream.getbuffer(), reconnect=False)
 
         with BinaryStream(self.client, self.recv(reconnect=False)) as stream:
             hs_response = HandshakeResponse.parse(stream, self.protocol_context)
@@ -295,34 +344,148 @@ class Connection(BaseConnection):
             return hs_response
 
     def reconnect(self):
-        if self.alive:
-            return
+        with self._reconnect_lock:
+            if self.alive:
+                return
 
-        self.close(on_reconnect=True)
+            self.close(on_reconnect=True)
 
-        # connect and silence the connection errors
-        try:
-            self.connect()
-        except connection_errors:
-            pass
+            # connect and silence the connection errors
+            try:
+                self.connect()
+            except connection_errors:
+                pass
 
-    def request(self, data: Union[bytes, bytearray], flags=None) -> bytearray:
+    def request(self, data: Union[bytes, bytearray, memoryview], flags=None, query_id: int = None) -> memoryview:
         """
         Perform request.
 
         :param data: bytes to send,
-        :param flags: (optional) OS-specific flags.
+        :param flags: (optional) OS-specific flags,
+        :param query_id: (optional) query ID of the request. Used to match
+         the response in multiplexed mode, read from `data` if not given.
+        :return: response data, see :py:meth:`recv`.
         """
-        self.send(data, flags=flags)
-        return self.recv()
+        with self._pending_lock:
+            self._in_use += 1
+        try:
+            if self.multiplexed:
+                return self._request_multiplexed(data, flags, query_id)
+
+            # the connection may be shared by the pool, so do not interleave
+            # the requests of different threads
+            with self._request_lock:
+                self.send(data, flags=flags)
+                return self.recv()
+        finally:
+            with self._pending_lock:
+                self._in_use -= 1
+            self.last_used = time.monotonic()
+            if self.pool is not None:
+                self.pool.release(self)
+
+    def _request_multiplexed(self, data, flags, query_id):
+        if query_id is None:
+            query_id = int.from_bytes(data[6:14], byteorder=PROTOCOL_BYTE_ORDER, signed=True)
+
+        fut = Future()
+        with self._pending_lock:
+            sock = self._socket
+            if not self.alive:
+                raise SocketError('Attempt to use closed connection.')
+            self._pending_reqs[query_id] = fut
+
+        kwargs = {}
+        if flags is not None:
+            kwargs['flags'] = flags
 
-    def send(self, data: Union[bytes, bytearray], flags=None, reconnect=True):
+        try:
+            with self._send_lock:
+                sock.sendall(data, **kwargs)
+            return fut.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            self._pop_pending(query_id)
+            raise socket.timeout('timed out') from None
+        except connection_errors as e:
+            self._pop_pending(query_id)
+            self._process_connection_lost(e)
+            raise e
+
+    def _pop_pending(self, query_id):
+        with self._pending_lock:
+            return self._pending_reqs.pop(query_id, None)
+
+    def _start_reader(self):
+        self._reader = Thread(
+            target=self._read_loop, args=(self._socket,), name=f'pygridgain-reader-{self.host}:{self.port}',
+            daemon=True
+        )
+        self._reader.start()
+
+    def _read_loop(self, sock):
+        while True:
+            try:
+                data = self._recv_message(sock)
+            except Exception as e:
+                # closed on purpose, pending requests are already failed
+                if sock is self._socket:
+                    self._process_connection_lost(e if isinstance(e, connection_errors) else SocketError(str(e)))
+                return
+
+            fut = self._pop_pending(int.from_bytes(data[4:12], byteorder=PROTOCOL_BYTE_ORDER, signed=True))
+            if fut:
+                fut.set_result(data)
+            else:
+                # the request has timed out
+                self.release_buffer(data)
+
+    def _recv_message(self, sock) -> memoryview:
+        header = bytearray(4)
+        self._recv_exactly(sock, memoryview(header))
+        packet_len = int.from_bytes(header, PROTOCOL_BYTE_ORDER, signed=True) + 4
+
+        data = self.client._buffer_pool.acquire(packet_len)
+        data[0:4] = header
+        try:
+            self._recv_exactly(sock, data[4:])
+        except Exception:
+            self.client._buffer_pool.release(data)
+            raise
+        return data
+
+    def _recv_exactly(self, sock, buffer):
+        while len(buffer) > 0:
+            try:
+                bytes_rcvd = sock.recv_into(buffer, len(buffer))
+            except socket.timeout:
+                # idle connection, keep waiting unless it was closed
+                if sock is not self._socket:
+                    raise
+                continue
+            if bytes_rcvd == 0:
+                raise SocketError('Connection broken.')
+            buffer = buffer[bytes_rcvd:]
+
+    def _process_connection_lost(self, err):
+        with self._pending_lock:
+            was_failed, self.failed = self.failed, True
+            pending, self._pending_reqs = self._pending_reqs, {}
+
+        for fut in pending.values():
+            fut.set_exception(err)
+
+        if not was_failed:
+            self._on_connection_lost(err)
+            self.client._schedule_reconnect(self)
+
+    def send(self, data: Union[bytes, bytearray, memoryview], flags=None, reconnect=True):
         """
         Send data down the socket.
 
         :param data: bytes to send,
         :param flags: (optional) OS-specific flags.
-        :param reconnect: (optional) reconnect on failure, default True.
+        :param reconnect: (optional) reconnect in background on failure,
+         default True.
         """
         if self.closed:
             raise SocketError('Attempt to use closed connection.')
@@ -337,15 +500,20 @@ class Connection(BaseConnection):
             self.failed = True
             if reconnect:
                 self._on_connection_lost(e)
-                self.reconnect()
+                self.client._schedule_reconnect(self)
             raise e
 
-    def recv(self, flags=None, reconnect=True) -> bytearray:
+    def recv(self, flags=None, reconnect=True) -> memoryview:
         """
-        Receive data from the socket.
+        Receive a response from the socket. The length of the response is
+        read first, then the response is received straight into a buffer
+        from the client buffer pool.
 
         :param flags: (optional) OS-specific flags.
-        :param reconnect: (optional) reconnect on failure, default True.
+        :param reconnect: (optional) reconnect in background on failure,
+         default True.
+        :return: memoryview of the response. Pass it to
+         :py:meth:`release_buffer`, when the response is decoded.
         """
         if self.closed:
             raise SocketError('Attempt to use closed connection.')
@@ -354,37 +522,41 @@ class Connection(BaseConnection):
         if flags is not None:
             kwargs['flags'] = flags
 
-        data = bytearray(DEFAULT_INITIAL_BUF_SIZE)
-        buffer = memoryview(data)
-        total_rcvd, packet_len = 0, 0
-        while True:
-            try:
-                bytes_rcvd = self._socket.recv_into(buffer, len(buffer), **kwargs)
-                if bytes_rcvd == 0:
-                    raise SocketError('Connection broken.')
-                total_rcvd += bytes_rcvd
-            except connection_errors as e:
-                self.failed = True
-                if reconnect:
-                    self._on_connection_lost(e)
-                    self.reconnect()
-                raise e
+        data = None
+        try:
+            header = bytearray(4)
+            self.__recv_into(memoryview(header), kwargs)
+            packet_len = int.from_bytes(header, PROTOCOL_BYTE_ORDER, signed=True) + 4
 
-            if packet_len == 0 and total_rcvd > 4:
-                packet_len = int.from_bytes(data[0:4], PROTOCOL_BYTE_ORDER, signed=True) + 4
-                if packet_len > len(data):
-                    buffer.release()
-                    data.extend(bytearray(packet_len - len(data)))
-                    buffer = memoryview(data)[total_rcvd:]
-                    continue
+            data = self.client._buffer_pool.acquire(packet_len)
+            data[0:4] = header
+            self.__recv_into(data[4:], kwargs)
+        except connection_errors as e:
+            self.release_buffer(data)
+            self.failed = True
+            if reconnect:
+                self._on_connection_lost(e)
+                self.client._schedule_reconnect(self)
+            raise e
 
-            if 0 < packet_len <= total_rcvd:
-                buffer.release()
-                break
+        return data
 
+    def __recv_into(self, buffer, kwargs):
+        while len(buffer) > 0:
+            bytes_rcvd = self._socket.recv_into(buffer, len(buffer), **kwargs)
+            if bytes_rcvd == 0:
+                raise SocketError('Connection broken.')
             buffer = buffer[bytes_rcvd:]
 
-        return data
+    def release_buffer(self, data):
+        """
+        Returns the buffer of a response, received with :py:meth:`recv`
+        or :py:meth:`request`, to the client buffer pool.
+
+        :param data: response data. The data must not be used after that.
+        """
+        if data is not None:
+            self.client._buffer_pool.release(data)
 
     def close(self, on_reconnect=False):
         """
@@ -393,11 +565,23 @@ class Connection(BaseConnection):
         garbage-collected.
         """
         if self._socket:
+            sock, self._socket = self._socket, None
             try:
-                self._socket.shutdown(socket.SHUT_RDWR)
-                self._socket.close()
+                sock.shutdown(socket.SHUT_RDWR)
+                sock.close()
             except connection_errors:
                 pass
             if not on_reconnect and not self.failed:
                 self._on_connection_lost(expected=True)
-            self._socket = None
+            if self.multiplexed:
+                self._close_reader()
+
+    def _close_reader(self):
+        with self._pending_lock:
+            pending, self._pending_reqs = self._pending_reqs, {}
+        for fut in pending.values():
+            fut.set_exception(SocketError('Connection closed.'))
+
+        reader, self._reader = self._reader, None
+        if reader and reader.is_alive() and reader is not current_thread():
+            reader.join(1.0)
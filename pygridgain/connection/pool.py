@@ -0,0 +1,406 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Per-node connection pools.
+
+The client keeps one pool per server node. The first (primary) connection
+of the pool is the one the client opens on `connect()` and uses for
+the topology-related bookkeeping (node UUID, reconnection, et c.).
+The others are opened on demand, when all the pooled connections are busy,
+and are closed after being idle for a while.
+
+A checked out connection is reserved for the thread (or task), that checked
+it out, until that thread's request on it is done, so the other checkouts
+do not pick it as an idle one and it is not evicted in between. Cursors
+and transactions, that keep using the same connection for several requests,
+also pin it, so it is not evicted between their requests.
+"""
+import asyncio
+import threading
+import time
+from threading import Lock
+from typing import Callable, List, Tuple, Union
+
+from pygridgain.constants import POOL_IDLE_TIMEOUT
+from pygridgain.exceptions import ParameterError, connection_errors
+
+__all__ = ['ConnectionPool', 'AioConnectionPool', 'parse_pool_size']
+
+
+def parse_pool_size(pool_size: Union[int, Tuple[int, int], None]) -> Tuple[int, int]:
+    """
+    Convert the `pool_size` client parameter to the (min, max) pair.
+
+    :param pool_size: None (one connection per node), a number of connections
+     per node or a (min, max) pair,
+    :return: (min, max) pool size.
+    """
+    if pool_size is None:
+        return 1, 1
+
+    if isinstance(pool_size, int):
+        min_size, max_size = pool_size, pool_size
+    else:
+        try:
+            min_size, max_size = pool_size
+        except (TypeError, ValueError):
+            raise ParameterError('pool_size should be an integer or a (min, max) pair.') from None
+
+    if not isinstance(min_size, int) or not isinstance(max_size, int) or not 1 <= min_size <= max_size:
+        raise ParameterError(f'Invalid pool_size: {pool_size}. Expected 1 <= min <= max.')
+
+    return min_size, max_size
+
+
+class BasePool:
+    def __init__(self, node, factory: Callable, min_size: int = 1, max_size: int = 1,
+                 idle_timeout: float = POOL_IDLE_TIMEOUT):
+        """
+        :param node: primary connection to the node,
+        :param factory: callable, that creates (but not opens) a new connection
+         to the same node,
+        :param min_size: (optional) number of connections to keep open,
+        :param max_size: (optional) maximum number of connections,
+        :param idle_timeout: (optional) time (in seconds) after which the idle
+         connections above `min_size` are closed.
+        """
+        self.node = node
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._factory = factory
+        self._connections = [node]
+        self._opening = 0
+        self._lock = Lock()
+        # connection -> number of the reservations
+        self._reserved = {}
+        # owner (thread or task) -> reserved connection
+        self._leases = {}
+        # connection -> number of the cursors and transactions using it
+        self._pinned = {}
+        node.pool = self
+
+        self.checkouts = 0
+        self.busy_checkouts = 0
+        self.created = 0
+        self.evicted = 0
+
+    @property
+    def connections(self) -> List:
+        """ Pooled connections, the primary connection goes first. """
+        return list(self._connections)
+
+    def __len__(self):
+        return len(self._connections)
+
+    @staticmethod
+    def _owner():
+        """ Thread or task, that checks out a connection. """
+        raise NotImplementedError
+
+    @staticmethod
+    def _owner_finished(owner) -> bool:
+        raise NotImplementedError
+
+    def _load(self, conn) -> int:
+        return conn.in_use + self._reserved.get(conn, 0)
+
+    def _reserve(self, conn, owner):
+        # an owner holds one reservation at a time
+        self._unreserve(owner)
+        self._leases[owner] = conn
+        self._reserved[conn] = self._reserved.get(conn, 0) + 1
+
+    def _unreserve(self, owner):
+        conn = self._leases.pop(owner, None)
+        if conn is not None:
+            if self._reserved[conn] > 1:
+                self._reserved[conn] -= 1
+            else:
+                del self._reserved[conn]
+
+    def _lease(self, conn):
+        """ Reserve the given connection for the current owner. """
+        with self._lock:
+            self._reserve(conn, self._owner())
+        return conn
+
+    def release(self, conn):
+        """
+        Drop the reservation of the connection by the current thread (task),
+        made on checkout. Called by the connection, when a request is done.
+
+        :param conn: pooled connection.
+        """
+        if not self._leases:
+            return
+        owner = self._owner()
+        with self._lock:
+            if self._leases.get(owner) is conn:
+                self._unreserve(owner)
+
+    def pin(self, conn):
+        """
+        Keep the connection from being evicted, until it is unpinned.
+        Used by the cursors and the transactions, that make several requests
+        on the same connection.
+
+        :param conn: pooled connection.
+        """
+        with self._lock:
+            self._pinned[conn] = self._pinned.get(conn, 0) + 1
+
+    def unpin(self, conn):
+        """
+        Drop a pin of the connection.
+
+        :param conn: pooled connection.
+        """
+        with self._lock:
+            if self._pinned.get(conn, 0) > 1:
+                self._pinned[conn] -= 1
+            else:
+                self._pinned.pop(conn, None)
+
+    def _select(self):
+        """
+        Choose the least loaded connection, reserve it and decide if the pool
+        should grow.
+
+        :return: tuple of chosen connection, grow flag and a list of
+         the stale connections to close.
+        """
+        now = time.monotonic()
+        owner = self._owner()
+        with self._lock:
+            self.checkouts += 1
+            # the previous checkout of the same owner is done with, even if
+            # it did not come to a request; so are the ones of the finished owners
+            for finished in [o for o in self._leases if o is owner or self._owner_finished(o)]:
+                self._unreserve(finished)
+
+            stale = []
+            for conn in self._connections[1:]:
+                if self._load(conn) == 0 and (not conn.alive or conn not in self._pinned and (
+                    len(self._connections) - len(stale) > self.min_size and now - conn.last_used > self.idle_timeout
+                )):
+                    stale.append(conn)
+            for conn in stale:
+                self._connections.remove(conn)
+            self.evicted += len(stale)
+
+            alive = [c for c in self._connections if c.alive]
+            if not alive:
+                # let the primary connection deal with the failure
+                return self.node, False, stale
+
+            best = min(alive, key=lambda c: (self._load(c), c.last_used))
+            best_load = self._load(best)
+            grow = self.node.alive and len(self._connections) + self._opening < self.max_size and (
+                best_load > 0 or len(self._connections) + self._opening < self.min_size
+            )
+            if grow:
+                self._opening += 1
+            else:
+                if best_load > 0:
+                    self.busy_checkouts += 1
+                self._reserve(best, owner)
+            return best, grow, stale
+
+    def _add(self, conn, reserve: bool = False):
+        with self._lock:
+            self._opening -= 1
+            if conn is not None:
+                conn.pool = self
+                self._connections.append(conn)
+                self.created += 1
+                if reserve:
+                    self._reserve(conn, self._owner())
+
+    def _reserve_missing(self) -> int:
+        with self._lock:
+            if not self.node.alive:
+                return 0
+            missing = max(self.min_size - len(self._connections) - self._opening, 0)
+            self._opening += missing
+            return missing
+
+    def metrics(self) -> dict:
+        """
+        Pool usage metrics.
+
+        :return: dict with the following keys:
+
+         * `host`, `port`, `node_uuid` − node address and ID,
+         * `size` − number of pooled connections,
+         * `in_use` − number of connections with requests in flight
+           or checked out,
+         * `idle` − number of the other connections,
+         * `pending_requests` − total number of requests in flight,
+         * `min_size`, `max_size` − pool bounds,
+         * `checkouts` − total number of checkouts,
+         * `busy_checkouts` − number of checkouts, that had to share
+           a busy connection, because the pool is exhausted,
+         * `created` − number of connections opened on demand,
+         * `evicted` − number of closed idle or failed connections.
+        """
+        with self._lock:
+            connections = list(self._connections)
+            busy = sum(1 for c in connections if self._load(c) > 0)
+        in_use = [c.in_use for c in connections]
+        return {
+            'host': self.node.host,
+            'port': self.node.port,
+            'node_uuid': self.node.uuid,
+            'size': len(connections),
+            'in_use': busy,
+            'idle': len(connections) - busy,
+            'pending_requests': sum(in_use),
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'checkouts': self.checkouts,
+            'busy_checkouts': self.busy_checkouts,
+            'created': self.created,
+            'evicted': self.evicted,
+        }
+
+    def _take_all(self):
+        with self._lock:
+            connections, self._connections = self._connections, [self.node]
+            self._reserved.clear()
+            self._leases.clear()
+            self._pinned.clear()
+        return connections
+
+
+class ConnectionPool(BasePool):
+    """
+    Pool of the synchronous connections to a single node.
+    """
+    @staticmethod
+    def _owner():
+        return threading.current_thread()
+
+    @staticmethod
+    def _owner_finished(owner) -> bool:
+        return not owner.is_alive()
+
+    def acquire(self):
+        """
+        Check out the least loaded connection. Opens a new connection,
+        if all the pooled connections are busy and the pool is not full.
+
+        :return: connection to the node.
+        """
+        if self.max_size == 1:
+            self.checkouts += 1
+            return self.node
+
+        conn, grow, stale = self._select()
+        for c in stale:
+            c.close()
+
+        if grow:
+            conn = self._open(reserve=True) or self._lease(conn)
+        return conn
+
+    def _open(self, reserve: bool = False):
+        conn = self._factory()
+        try:
+            conn.connect()
+        except connection_errors:
+            conn = None
+        finally:
+            self._add(conn, reserve)
+        return conn
+
+    def fill(self):
+        """ Open the connections up to the pool minimum size. """
+        for _ in range(self._reserve_missing()):
+            self._open()
+
+    def close(self):
+        """ Close all the pooled connections. """
+        for conn in self._take_all():
+            conn.close()
+
+
+class AioConnectionPool(BasePool):
+    """
+    Pool of the asynchronous connections to a single node.
+    """
+    @staticmethod
+    def _owner():
+        return asyncio.current_task()
+
+    @staticmethod
+    def _owner_finished(owner) -> bool:
+        return owner is not None and owner.done()
+
+    async def acquire(self):
+        """
+        Check out the least loaded connection. Opens a new connection,
+        if all the pooled connections are busy and the pool is not full.
+
+        :return: connection to the node.
+        """
+        if self.max_size == 1:
+            self.checkouts += 1
+            return self.node
+
+        conn, grow, stale = self._select()
+        if stale:
+            await asyncio.gather(*[c.close() for c in stale], return_exceptions=True)
+
+        if grow:
+            conn = await self._open(reserve=True) or self._lease(conn)
+        return conn
+
+    async def _open(self, reserve: bool = False):
+        conn = self._factory()
+        try:
+            await conn.connect()
+        except connection_errors:
+            conn = None
+        finally:
+            self._add(conn, reserve)
+        return conn
+
+    async def fill(self):
+        """ Open the connections up to the pool minimum size. """
+        await asyncio.gather(*[self._open() for _ in range(self._reserve_missing())])
+
+    def metrics(self) -> dict:
+        """
+        Pool usage metrics.
+
+        :return: dict with the keys of :py:meth:`BasePool.metrics` and
+         the write coalescing metrics of the pooled connections:
+
+         * `coalesced_writes` − number of coalesced writes,
+         * `coalesced_frames` − number of requests they carried,
+         * `max_coalesced_frames` − maximum number of requests per write.
+        """
+        metrics = super().metrics()
+        coalescing = [c.coalescing_metrics() for c in self.connections]
+        metrics['coalesced_writes'] = sum(m['writes'] for m in coalescing)
+        metrics['coalesced_frames'] = sum(m['frames'] for m in coalescing)
+        metrics['max_coalesced_frames'] = max((m['max_frames'] for m in coalescing), default=0)
+        return metrics
+
+    async def close(self):
+        """ Close all the pooled connections. """
+        await asyncio.gather(*[c.close() for c in self._take_all()], return_exceptions=True)
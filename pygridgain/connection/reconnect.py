@@ -0,0 +1,153 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Background reconnection of the failed nodes.
+
+The requests are not held up by reconnecting the failed nodes: they go
+to the live nodes, while the failed ones are retried in background after
+the delays from :py:data:`~pygridgain.constants.RECONNECT_BACKOFF_SEQUENCE`
+(the last delay repeats until the node is back). The node is used again
+as soon as it is reconnected.
+"""
+import asyncio
+import contextvars
+from threading import Event, Lock, Thread, current_thread
+from typing import Iterator, Optional, Sequence
+
+from pygridgain.constants import RECONNECT_BACKOFF_SEQUENCE
+
+__all__ = ['ReconnectScheduler', 'AioReconnectScheduler']
+
+
+def backoff_delays(sequence: Sequence[float]) -> Iterator[float]:
+    """
+    Delays (in seconds) before the reconnection attempts.
+
+    :param sequence: backoff sequence,
+    :return: the sequence values, then its last value forever.
+    """
+    yield from sequence
+    while True:
+        yield sequence[-1]
+
+
+class BaseReconnectScheduler:
+    def __init__(self, sequence: Optional[Sequence[float]] = None):
+        """
+        :param sequence: (optional) delays (in seconds) before the consecutive
+         reconnection attempts. Default is `RECONNECT_BACKOFF_SEQUENCE`.
+        """
+        self.sequence = list(sequence or RECONNECT_BACKOFF_SEQUENCE)
+        # node -> thread or task, that reconnects it
+        self._workers = {}
+
+    def scheduled(self, node) -> bool:
+        """ Tells if the node is being reconnected. """
+        return node in self._workers
+
+
+class ReconnectScheduler(BaseReconnectScheduler):
+    """
+    Reconnects the failed nodes in background threads, one per node.
+    """
+    def __init__(self, sequence: Optional[Sequence[float]] = None):
+        super().__init__(sequence)
+        self._lock = Lock()
+        self._stopped = Event()
+
+    def schedule(self, node):
+        """
+        Starts reconnecting the node, unless it is already being reconnected.
+
+        :param node: connection to the node.
+        """
+        with self._lock:
+            if node in self._workers:
+                return
+            thread = Thread(
+                target=self._reconnect_loop, args=(node, self._stopped),
+                name=f'pygridgain-reconnect-{node.host}:{node.port}', daemon=True
+            )
+            self._workers[node] = thread
+        thread.start()
+
+    def _reconnect_loop(self, node, stopped: Event):
+        try:
+            for delay in backoff_delays(self.sequence):
+                if stopped.wait(delay) or node.alive:
+                    return
+                try:
+                    node.reconnect()
+                except Exception:
+                    # not a connection error (e.g. authentication failure),
+                    # it is logged and is not retried
+                    return
+                if stopped.is_set():
+                    # the client was closed while connecting
+                    node.close()
+                    return
+                if node.alive:
+                    return
+        finally:
+            with self._lock:
+                if self._workers.get(node) is current_thread():
+                    del self._workers[node]
+
+    def stop(self):
+        """ Stops reconnecting all the nodes. """
+        with self._lock:
+            stopped, self._stopped = self._stopped, Event()
+            self._workers.clear()
+        stopped.set()
+
+
+class AioReconnectScheduler(BaseReconnectScheduler):
+    """
+    Reconnects the failed nodes in background tasks, one per node.
+    """
+    def schedule(self, node):
+        """
+        Starts reconnecting the node, unless it is already being reconnected.
+
+        :param node: connection to the node.
+        """
+        if node not in self._workers:
+            # the task should not inherit the caller's transaction or batch
+            self._workers[node] = contextvars.Context().run(asyncio.ensure_future, self._reconnect_loop(node))
+
+    async def _reconnect_loop(self, node):
+        try:
+            for delay in backoff_delays(self.sequence):
+                await asyncio.sleep(delay)
+                if node.alive:
+                    return
+                try:
+                    await node.reconnect()
+                except Exception:
+                    # not a connection error (e.g. authentication failure),
+                    # it is logged and is not retried
+                    return
+                if node.alive:
+                    return
+        finally:
+            if self._workers.get(node) is asyncio.current_task():
+                del self._workers[node]
+
+    def stop(self):
+        """ Stops reconnecting all the nodes. """
+        workers, self._workers = self._workers, {}
+        for task in workers.values():
+            task.cancel()
@@ -26,7 +26,7 @@ __all__ = [
     'PROTOCOL_CHAR_ENCODING', 'SSL_DEFAULT_VERSION', 'SSL_DEFAULT_CIPHERS',
     'FNV1_OFFSET_BASIS', 'FNV1_PRIME', 'DEFAULT_HOST', 'DEFAULT_PORT',
     'RHF_ERROR', 'RHF_TOPOLOGY_CHANGED', 'AFFINITY_DELAY', 'AFFINITY_RETRIES',
-    'RECONNECT_BACKOFF_SEQUENCE',
+    'RECONNECT_BACKOFF_SEQUENCE', 'POOL_IDLE_TIMEOUT', 'MAX_CONNECT_THREADS',
 ]
 
 PROTOCOLS = {
@@ -69,3 +69,9 @@ AFFINITY_DELAY = 0.01
 AFFINITY_RETRIES = 32
 
 RECONNECT_BACKOFF_SEQUENCE = [0, 1, 1, 2, 3, 5, 8, 13]
+
+# seconds before the idle pooled connection above the pool minimum is closed
+POOL_IDLE_TIMEOUT = 60.0
+
+# threads, that open the connections to the nodes in parallel
+MAX_CONNECT_THREADS = 16
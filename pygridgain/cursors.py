@@ -19,18 +19,190 @@ This module contains sync and async cursors for different types of queries.
 """
 
 import asyncio
+import queue
+import weakref
+from functools import partial
+from threading import Event, Thread
 
 from pygridgain.api import (
     scan, scan_cursor_get_page, resource_close, scan_async, scan_cursor_get_page_async, resource_close_async, sql,
     sql_cursor_get_page, sql_fields, sql_fields_cursor_get_page, sql_fields_cursor_get_page_async, sql_fields_async
 )
 from pygridgain.api.sql import vector, vector_cursor_get_page, vector_async, vector_cursor_get_page_async
-from pygridgain.exceptions import CacheError, SQLError
+from pygridgain.columnar import Column
+from pygridgain.exceptions import CacheError, ParameterError, SQLError
 
 
 __all__ = ['ScanCursor', 'SqlCursor', 'SqlFieldsCursor', 'AioScanCursor', 'AioSqlFieldsCursor']
 
 
+def _validate_prefetch(prefetch):
+    if not isinstance(prefetch, int) or prefetch < 0:
+        raise ParameterError('prefetch should be a non-negative integer.')
+    return prefetch
+
+
+class _PagePrefetcher:
+    """
+    Requests the next pages of a cursor in a background thread, while
+    the current page is being processed. At most `depth` pages are kept
+    fetched ahead.
+
+    The prefetcher does not keep the cursor alive. If the cursor is dropped
+    without being closed, the thread stops and closes the server-side cursor.
+    """
+    # how often a thread, that waits for a free slot in the queue, checks
+    # if it should stop
+    _PUT_TIMEOUT = 0.1
+
+    def __init__(self, request_page, depth, close_resource):
+        """
+        :param request_page: bound method of the cursor, that requests
+         the next page,
+        :param depth: maximum number of the pages, fetched ahead,
+        :param close_resource: callable, that closes the server-side cursor.
+        """
+        self._request_page = weakref.WeakMethod(request_page)
+        self._close_resource = close_resource
+        self._queue = queue.Queue(depth)
+        self._stop = Event()
+        self._abandoned = False
+        # whether the server-side cursor still has pages
+        self.more = True
+        self._thread = Thread(target=self._run, name='pygridgain-cursor-prefetch', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                request_page = self._request_page()
+                if request_page is None:
+                    return
+                try:
+                    result = request_page()
+                except Exception as e:
+                    self._put(e)
+                    return
+                finally:
+                    # do not keep the cursor alive while waiting
+                    del request_page
+
+                if result.status == 0:
+                    self.more = result.value['more']
+                if not self._put(result) or result.status != 0 or not self.more:
+                    return
+        finally:
+            if self._abandoned and self.more:
+                try:
+                    self._close_resource()
+                except Exception:
+                    pass
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=self._PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def get(self):
+        """
+        Takes the next page, waits for it if needed.
+
+        :return: API result.
+        """
+        result = self._queue.get()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def abandon(self):
+        """
+        Stops fetching and closes the server-side cursor, that is not needed
+        anymore, in the background.
+        """
+        self._abandoned = True
+        self._stop.set()
+
+    def close(self) -> bool:
+        """
+        Stops fetching.
+
+        :return: whether the server-side cursor still has pages.
+        """
+        self._stop.set()
+        self._thread.join()
+        return self.more
+
+
+class _AioPagePrefetcher:
+    """
+    Requests the next pages of an async cursor in a background task.
+
+    Like :class:`_PagePrefetcher`, it does not keep the cursor alive.
+    """
+    def __init__(self, request_page, depth, close_resource):
+        self._request_page = weakref.WeakMethod(request_page)
+        self._close_resource = close_resource
+        self._queue = asyncio.Queue(depth)
+        self._abandoned = False
+        self.more = True
+        self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        try:
+            while not self._abandoned:
+                request_page = self._request_page()
+                if request_page is None:
+                    return
+                try:
+                    result = await request_page()
+                except Exception as e:
+                    await self._put(e)
+                    return
+                finally:
+                    del request_page
+
+                if result.status == 0:
+                    self.more = result.value['more']
+                if not await self._put(result) or result.status != 0 or not self.more:
+                    return
+        finally:
+            if self._abandoned and self.more:
+                try:
+                    await self._close_resource()
+                except Exception:
+                    pass
+
+    async def _put(self, item) -> bool:
+        while not self._abandoned:
+            try:
+                await asyncio.wait_for(self._queue.put(item), _PagePrefetcher._PUT_TIMEOUT)
+                return True
+            except asyncio.TimeoutError:
+                pass
+        return False
+
+    async def get(self):
+        result = await self._queue.get()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def abandon(self):
+        self._abandoned = True
+
+    async def close(self) -> bool:
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        return self.more
+
+
 class BaseCursorMixin:
     @property
     def connection(self):
@@ -41,7 +213,17 @@ class BaseCursorMixin:
 
     @connection.setter
     def connection(self, value):
+        self._unpin_connection()
         setattr(self, '_conn', value)
+        if value is not None:
+            # the pooled connection is not evicted between the pages
+            value.pin()
+            setattr(self, '_unpin', weakref.finalize(self, value.unpin))
+
+    def _unpin_connection(self):
+        unpin = getattr(self, '_unpin', None)
+        if unpin is not None:
+            unpin()
 
     @property
     def cursor_id(self):
@@ -100,6 +282,25 @@ class BaseCursorMixin:
 
 
 class CursorMixin(BaseCursorMixin):
+    _prefetcher = None
+    _finalizer = None
+
+    def _request_page(self):
+        raise NotImplementedError
+
+    def _start_prefetch(self, prefetch: int):
+        if prefetch and self.more:
+            self._prefetcher = _PagePrefetcher(
+                self._request_page, prefetch, partial(resource_close, self.connection, self.cursor_id)
+            )
+            # stop the prefetching, if the cursor is dropped without closing
+            self._finalizer = weakref.finalize(self, self._prefetcher.abandon)
+
+    def _next_page(self):
+        if self._prefetcher is not None:
+            return self._prefetcher.get()
+        return self._request_page()
+
     def __enter__(self):
         return self
 
@@ -113,11 +314,37 @@ class CursorMixin(BaseCursorMixin):
         """
         Close cursor.
         """
-        if self.connection and self.cursor_id and self.more:
-            resource_close(self.connection, self.cursor_id)
+        more = self.more
+        if self._prefetcher is not None:
+            self._finalizer.detach()
+            more = self._prefetcher.close()
+            self._prefetcher = None
+        try:
+            if self.connection and self.cursor_id and more:
+                resource_close(self.connection, self.cursor_id)
+        finally:
+            self._unpin_connection()
 
 
 class AioCursorMixin(BaseCursorMixin):
+    _prefetcher = None
+    _finalizer = None
+
+    async def _request_page(self):
+        raise NotImplementedError
+
+    def _start_prefetch(self, prefetch: int):
+        if prefetch and self.more:
+            self._prefetcher = _AioPagePrefetcher(
+                self._request_page, prefetch, partial(resource_close_async, self.connection, self.cursor_id)
+            )
+            self._finalizer = weakref.finalize(self, self._prefetcher.abandon)
+
+    async def _next_page(self):
+        if self._prefetcher is not None:
+            return await self._prefetcher.get()
+        return await self._request_page()
+
     def __await__(self):
         return (yield from self.__aenter__().__await__())
 
@@ -131,17 +358,26 @@ class AioCursorMixin(BaseCursorMixin):
         """
         Close cursor.
         """
-        if self.connection and self.cursor_id and self.more:
-            await resource_close_async(self.connection, self.cursor_id)
+        more = self.more
+        if self._prefetcher is not None:
+            self._finalizer.detach()
+            more = await self._prefetcher.close()
+            self._prefetcher = None
+        try:
+            if self.connection and self.cursor_id and more:
+                await resource_close_async(self.connection, self.cursor_id)
+        finally:
+            self._unpin_connection()
 
 
 class AbstractScanCursor:
-    def __init__(self, client, cache_info, page_size, partitions, local):
+    def __init__(self, client, cache_info, page_size, partitions, local, prefetch=0):
         self.client = client
         self.cache_info = cache_info
         self._page_size = page_size
         self._partitions = partitions
         self._local = local
+        self._prefetch = _validate_prefetch(prefetch)
 
     def _finalize_init(self, result):
         if result.status != 0:
@@ -161,19 +397,24 @@ class ScanCursor(AbstractScanCursor, CursorMixin):
     """
     Synchronous scan cursor.
     """
-    def __init__(self, client, cache_info, page_size, partitions, local):
+    def __init__(self, client, cache_info, page_size, partitions, local, prefetch=0):
         """
         :param client: Synchronous client.
         :param cache_info: Cache meta info.
         :param page_size: page size.
         :param partitions: number of partitions to query (negative to query entire cache).
         :param local: pass True if this query should be executed on local node only.
+        :param prefetch: number of pages to fetch ahead in background (0 to fetch pages on demand).
         """
-        super().__init__(client, cache_info, page_size, partitions, local)
+        super().__init__(client, cache_info, page_size, partitions, local, prefetch)
 
         self.connection = self.client.random_node
         result = scan(self.connection, self.cache_info, self._page_size, self._partitions, self._local)
         self._finalize_init(result)
+        self._start_prefetch(self._prefetch)
+
+    def _request_page(self):
+        return scan_cursor_get_page(self.connection, self.cursor_id)
 
     def __next__(self):
         if not self.data:
@@ -183,7 +424,7 @@ class ScanCursor(AbstractScanCursor, CursorMixin):
             k, v = next(self.data)
         except StopIteration:
             if self.more:
-                self._process_page_response(scan_cursor_get_page(self.connection, self.cursor_id))
+                self._process_page_response(self._next_page())
                 k, v = next(self.data)
             else:
                 raise StopIteration
@@ -195,23 +436,28 @@ class AioScanCursor(AbstractScanCursor, AioCursorMixin):
     """
     Asynchronous scan query cursor.
     """
-    def __init__(self, client, cache_info, page_size, partitions, local):
+    def __init__(self, client, cache_info, page_size, partitions, local, prefetch=0):
         """
         :param client: Asynchronous client.
         :param cache_info: Cache meta info.
         :param page_size: page size.
         :param partitions: number of partitions to query (negative to query entire cache).
         :param local: pass True if this query should be executed on local node only.
+        :param prefetch: number of pages to fetch ahead in background (0 to fetch pages on demand).
         """
-        super().__init__(client, cache_info, page_size, partitions, local)
+        super().__init__(client, cache_info, page_size, partitions, local, prefetch)
 
     async def __aenter__(self):
         if not self.connection:
             self.connection = await self.client.random_node()
             result = await scan_async(self.connection, self.cache_info, self._page_size, self._partitions, self._local)
             self._finalize_init(result)
+            self._start_prefetch(self._prefetch)
         return self
 
+    async def _request_page(self):
+        return await scan_cursor_get_page_async(self.connection, self.cursor_id)
+
     async def __anext__(self):
         if not self.connection:
             raise CacheError("Using uninitialized cursor, initialize it using async with expression.")
@@ -223,7 +469,7 @@ class AioScanCursor(AbstractScanCursor, AioCursorMixin):
             k, v = next(self.data)
         except StopIteration:
             if self.more:
-                self._process_page_response(await scan_cursor_get_page_async(self.connection, self.cursor_id))
+                self._process_page_response(await self._next_page())
                 try:
                     k, v = next(self.data)
                 except StopIteration:
@@ -240,11 +486,13 @@ class SqlCursor(CursorMixin):
     """
     Synchronous SQL query cursor.
     """
-    def __init__(self, client, cache_info, *args, **kwargs):
+    def __init__(self, client, cache_info, *args, prefetch=0, **kwargs):
         """
         :param client: Synchronous client.
         :param cache_info: Cache meta info.
+        :param prefetch: number of pages to fetch ahead in background (0 to fetch pages on demand).
         """
+        _validate_prefetch(prefetch)
         self.client = client
         self.cache_info = cache_info
         self.connection = self.client.random_node
@@ -254,6 +502,10 @@ class SqlCursor(CursorMixin):
 
         self.cursor_id, self.more = result.value['cursor'], result.value['more']
         self.data = iter(result.value['data'].items())
+        self._start_prefetch(prefetch)
+
+    def _request_page(self):
+        return sql_cursor_get_page(self.connection, self.cursor_id)
 
     def __next__(self):
         if not self.data:
@@ -263,7 +515,7 @@ class SqlCursor(CursorMixin):
             k, v = next(self.data)
         except StopIteration:
             if self.more:
-                result = sql_cursor_get_page(self.connection, self.cursor_id)
+                result = self._next_page()
                 if result.status != 0:
                     raise SQLError(result.message)
                 self.data, self.more = iter(result.value['data'].items()), result.value['more']
@@ -276,35 +528,78 @@ class SqlCursor(CursorMixin):
 
 
 class AbstractSqlFieldsCursor:
-    def __init__(self, client, cache_info):
+    def __init__(self, client, cache_info, prefetch=0, as_columns=False):
         self.client = client
         self.cache_info = cache_info
+        self._prefetch = _validate_prefetch(prefetch)
+        self._as_columns = as_columns
+        self._column_names = None
 
     def _finalize_init(self, result):
         if result.status != 0:
             raise SQLError(result.message)
 
         self.cursor_id, self.more = result.value['cursor'], result.value['more']
-        self.data = iter(result.value['data'])
+        self.data = self._page_data(result.value['data'])
         self._field_names = result.value.get('fields', None)
         if self._field_names:
             self._field_count = len(self._field_names)
         else:
             self._field_count = result.value['field_count']
 
+        if self._as_columns:
+            # field names are the names of the columns, not a header row
+            self._column_names = [column.name for column in result.value['data']]
+            self._field_names = None
+
+    def _page_data(self, data):
+        # in the columnar mode the whole page is a single item
+        return iter([data] if self._as_columns else data)
+
+    @staticmethod
+    def _join_columns(pages) -> dict:
+        pieces = {}
+        for page in pages:
+            for column in page:
+                pieces.setdefault(column.name, []).append(column)
+        return {name: Column.concat(columns) for name, columns in pieces.items()}
+
 
 class SqlFieldsCursor(AbstractSqlFieldsCursor, CursorMixin):
     """
     Synchronous SQL fields query cursor.
     """
-    def __init__(self, client, cache_info, *args, **kwargs):
+    def __init__(self, client, cache_info, *args, prefetch=0, as_columns=False, **kwargs):
         """
         :param client: Synchronous client.
         :param cache_info: Cache meta info.
+        :param prefetch: number of pages to fetch ahead in background (0 to fetch pages on demand).
+        :param as_columns: yield result pages as lists of columns instead of rows.
         """
-        super().__init__(client, cache_info)
+        super().__init__(client, cache_info, prefetch, as_columns)
         self.connection = self.client.random_node
-        self._finalize_init(sql_fields(self.connection, self.cache_info, *args, **kwargs))
+        self._finalize_init(sql_fields(self.connection, self.cache_info, *args, as_columns=as_columns, **kwargs))
+        self._start_prefetch(self._prefetch)
+
+    def _request_page(self):
+        return sql_fields_cursor_get_page(self.connection, self.cursor_id, self._field_count, self._column_names)
+
+    def fetch_columns(self) -> dict:
+        """
+        Fetches the rest of the result in the columnar mode.
+
+        :return: dict of field name (or index) to
+         :class:`~pygridgain.columnar.Column`.
+        """
+        if not self._as_columns:
+            raise SQLError('Cursor is not in the columnar mode, use `as_columns=True`.')
+        with self:
+            return self._join_columns(self)
+
+    def _unwrap_column(self, column):
+        if column.dtype is None:
+            column.values = [self.client.unwrap_binary(v) for v in column.values]
+        return column
 
     def __next__(self):
         if not self.data:
@@ -319,16 +614,18 @@ class SqlFieldsCursor(AbstractSqlFieldsCursor, CursorMixin):
             row = next(self.data)
         except StopIteration:
             if self.more:
-                result = sql_fields_cursor_get_page(self.connection, self.cursor_id, self._field_count)
+                result = self._next_page()
                 if result.status != 0:
                     raise SQLError(result.message)
 
-                self.data, self.more = iter(result.value['data']), result.value['more']
+                self.data, self.more = self._page_data(result.value['data']), result.value['more']
 
                 row = next(self.data)
             else:
                 raise StopIteration
 
+        if self._as_columns:
+            return [self._unwrap_column(column) for column in row]
         return [self.client.unwrap_binary(v) for v in row]
 
 
@@ -336,12 +633,14 @@ class AioSqlFieldsCursor(AbstractSqlFieldsCursor, AioCursorMixin):
     """
     Asynchronous SQL fields query cursor.
     """
-    def __init__(self, client, cache_info, *args, **kwargs):
+    def __init__(self, client, cache_info, *args, prefetch=0, as_columns=False, **kwargs):
         """
         :param client: Synchronous client.
         :param cache_info: Cache meta info.
+        :param prefetch: number of pages to fetch ahead in background (0 to fetch pages on demand).
+        :param as_columns: yield result pages as lists of columns instead of rows.
         """
-        super().__init__(client, cache_info)
+        super().__init__(client, cache_info, prefetch, as_columns)
         self._params = (args, kwargs)
 
     async def __aenter__(self):
@@ -364,11 +663,11 @@ class AioSqlFieldsCursor(AbstractSqlFieldsCursor, AioCursorMixin):
             row = next(self.data)
         except StopIteration:
             if self.more:
-                result = await sql_fields_cursor_get_page_async(self.connection, self.cursor_id, self._field_count)
+                result = await self._next_page()
                 if result.status != 0:
                     raise SQLError(result.message)
 
-                self.data, self.more = iter(result.value['data']), result.value['more']
+                self.data, self.more = self._page_data(result.value['data']), result.value['more']
                 try:
                     row = next(self.data)
                 except StopIteration:
@@ -376,18 +675,45 @@ class AioSqlFieldsCursor(AbstractSqlFieldsCursor, AioCursorMixin):
             else:
                 raise StopAsyncIteration
 
+        if self._as_columns:
+            return [await self._unwrap_column(column) for column in row]
         return await asyncio.gather(*[self.client.unwrap_binary(v) for v in row])
 
+    async def fetch_columns(self) -> dict:
+        """
+        Fetches the rest of the result in the columnar mode.
+
+        :return: dict of field name (or index) to
+         :class:`~pygridgain.columnar.Column`.
+        """
+        if not self._as_columns:
+            raise SQLError('Cursor is not in the columnar mode, use `as_columns=True`.')
+        async with self:
+            return self._join_columns([page async for page in self])
+
+    async def _unwrap_column(self, column):
+        if column.dtype is None:
+            column.values = await asyncio.gather(*[self.client.unwrap_binary(v) for v in column.values])
+        return column
+
     async def _initialize(self, *args, **kwargs):
         if self.connection and self.cursor_id:
             return
 
         self.connection = await self.client.random_node()
-        self._finalize_init(await sql_fields_async(self.connection, self.cache_info, *args, **kwargs))
+        self._finalize_init(
+            await sql_fields_async(self.connection, self.cache_info, *args, as_columns=self._as_columns, **kwargs)
+        )
+        self._start_prefetch(self._prefetch)
+
+    async def _request_page(self):
+        return await sql_fields_cursor_get_page_async(
+            self.connection, self.cursor_id, self._field_count, self._column_names
+        )
 
 
 class AbstractVectorCursor:
-    def __init__(self, client, cache_info, page_size, type_name, field, clause_vector, k, threshold):
+    def __init__(self, client, cache_info, page_size, type_name, field, clause_vector, k, threshold, prefetch=0):
         self.client = client
         self.cache_info = cache_info
         self._page_size = page_size
@@ -396,6 +722,7 @@ class AbstractVectorCursor:
         self._clause_vector = clause_vector
         self._k = k
         self._threshold = threshold
+        self._prefetch = _validate_prefetch(prefetch)
 
     def _finalize_init(self, result):
         if result.status != 0:
@@ -415,7 +742,7 @@ class VectorCursor(AbstractVectorCursor, CursorMixin):
     """
     Synchronous vector cursor.
     """
-    def __init__(self, client, cache_info, page_size, type_name, field, clause_vector, k, threshold):
+    def __init__(self, client, cache_info, page_size, type_name, field, clause_vector, k, threshold, prefetch=0):
         """
         :param client: Synchronous client.
         :param cache_info: Cache meta info.
@@ -424,13 +751,18 @@ class VectorCursor(AbstractVectorCursor, CursorMixin):
         :param field: Name of the field.
         :param clause_vector: Search vector.
         :param k: [K]NN, how many vectors to return.
+        :param prefetch: number of pages to fetch ahead in background (0 to fetch pages on demand).
         """
-        super().__init__(client, cache_info, page_size, type_name, field, clause_vector, k, threshold)
+        super().__init__(client, cache_info, page_size, type_name, field, clause_vector, k, threshold, prefetch)
 
         self.connection = self.client.random_node
         result = vector(self.connection, self.cache_info, self._page_size,
                         self._type_name, self._field, self._clause_vector, self._k, self._threshold)
         self._finalize_init(result)
+        self._start_prefetch(self._prefetch)
+
+    def _request_page(self):
+        return vector_cursor_get_page(self.connection, self.cursor_id)
 
     def __next__(self):
         if not self.data:
@@ -440,7 +772,7 @@ class VectorCursor(AbstractVectorCursor, CursorMixin):
             k, v = next(self.data)
         except StopIteration:
             if self.more:
-                self._process_page_response(vector_cursor_get_page(self.connection, self.cursor_id))
+                self._process_page_response(self._next_page())
                 k, v = next(self.data)
             else:
                 raise StopIteration
@@ -452,7 +784,7 @@ class AioVectorCursor(AbstractVectorCursor, AioCursorMixin):
     """
     Asynchronous vector query cursor.
     """
-    def __init__(self, client, cache_info, page_size, type_name, field, clause_vector, k, threshold):
+    def __init__(self, client, cache_info, page_size, type_name, field, clause_vector, k, threshold, prefetch=0):
         """
         :param client: Asynchronous client.
         :param cache_info: Cache meta info.
@@ -461,8 +793,9 @@ class AioVectorCursor(AbstractVectorCursor, AioCursorMixin):
         :param field: Name of the field.
         :param clause_vector: Search vector.
         :param k: [K]NN, how many vectors to return.
+        :param prefetch: number of pages to fetch ahead in background (0 to fetch pages on demand).
         """
-        super().__init__(client, cache_info, page_size, type_name, field, clause_vector, k, threshold)
+        super().__init__(client, cache_info, page_size, type_name, field, clause_vector, k, threshold, prefetch)
 
     async def __aenter__(self):
         if not self.connection:
@@ -470,8 +803,12 @@ class AioVectorCursor(AbstractVectorCursor, AioCursorMixin):
             result = await vector_async(self.connection, self.cache_info, self._page_size,
                                         self._type_name, self._field, self._clause_vector, self._k, self._threshold)
             self._finalize_init(result)
+            self._start_prefetch(self._prefetch)
         return self
 
+    async def _request_page(self):
+        return await vector_cursor_get_page_async(self.connection, self.cursor_id)
+
     async def __anext__(self):
         if not self.connection:
             raise CacheError("Using uninitialized cursor, initialize it using async with expression.")
@@ -483,7 +820,7 @@ class AioVectorCursor(AbstractVectorCursor, AioCursorMixin):
             k, v = next(self.data)
         except StopIteration:
             if self.more:
-                self._process_page_response(await vector_cursor_get_page_async(self.connection, self.cursor_id))
+                self._process_page_response(await self._next_page())
                 try:
                     k, v = next(self.data)
                 except StopIteration:
@@ -0,0 +1,407 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Data streamers load large amounts of data into a cache.
+
+The entries are buffered per primary node (when partition awareness is
+available) and sent to the nodes as `OP_CACHE_PUT_ALL` batches when
+the buffer is full or when the flush interval elapses. A limited number
+of batches per node is allowed to be in flight; adding more data blocks
+until one of them completes.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import BoundedSemaphore, Event, Lock, Thread
+from typing import Any, Iterable, Optional, Union
+
+from pygridgain.api.key_value import cache_put_all, cache_put_all_async
+from pygridgain.exceptions import CacheError, ParameterError, connection_errors
+from pygridgain.utils import is_hinted
+
+__all__ = ['DataStreamer', 'AioDataStreamer']
+
+DEFAULT_BATCH_SIZE = 512
+DEFAULT_PARALLEL_OPS_PER_NODE = 4
+
+
+class _BaseDataStreamer:
+    def __init__(self, cache, batch_size: int = DEFAULT_BATCH_SIZE, flush_interval: Optional[float] = None,
+                 parallel_ops_per_node: int = DEFAULT_PARALLEL_OPS_PER_NODE):
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ParameterError('batch_size should be a positive integer.')
+        if not isinstance(parallel_ops_per_node, int) or parallel_ops_per_node < 1:
+            raise ParameterError('parallel_ops_per_node should be a positive integer.')
+        if flush_interval is not None and flush_interval <= 0:
+            raise ParameterError('flush_interval should be positive.')
+
+        self.cache = cache
+        self.client = cache.client
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.parallel_ops_per_node = parallel_ops_per_node
+        self.closed = False
+
+        # primary node (None if unknown) -> {key: value}
+        self._buffers = {}
+        self._error = None
+        self.entries_sent = 0
+        self.batches_sent = 0
+
+    @staticmethod
+    def _entry(key, value, key_hint=None, value_hint=None):
+        return (key, key_hint) if key_hint else key, (value, value_hint) if value_hint else value
+
+    @staticmethod
+    def _iter_entries(entries: Union[dict, Iterable]):
+        return entries.items() if isinstance(entries, dict) else entries
+
+    def _buffer(self, node, key, value) -> Optional[dict]:
+        """
+        Buffer the entry.
+
+        :return: the node buffer, if it is full and should be sent.
+        """
+        buffer = self._buffers.get(node)
+        if buffer is None:
+            buffer = self._buffers[node] = {}
+        buffer[key] = value
+        if len(buffer) >= self.batch_size:
+            return self._buffers.pop(node)
+
+    def _take_buffers(self) -> list:
+        buffers, self._buffers = self._buffers, {}
+        return [(node, buffer) for node, buffer in buffers.items() if buffer]
+
+    def _on_batch_done(self, entries: dict, err: Optional[Exception]):
+        self.cache._invalidate_near_cache(entries)
+        if err is None:
+            self.entries_sent += len(entries)
+            self.batches_sent += 1
+        elif self._error is None:
+            self._error = err
+
+    def _check_error(self):
+        err, self._error = self._error, None
+        if err is not None:
+            raise err
+
+    def _check_closed(self):
+        if self.closed:
+            raise CacheError('Data streamer is closed.')
+
+
+class DataStreamer(_BaseDataStreamer):
+    """
+    Loads the data into the cache in batches, sent to the primary nodes
+    of the keys in parallel. Create it with
+    :py:meth:`~pygridgain.client.Client.data_streamer` and use it
+    as a context manager, or call :py:meth:`close` explicitly
+    to send the remaining data.
+
+    Errors of the background batches are raised from the next call
+    to :py:meth:`add`, :py:meth:`add_all`, :py:meth:`flush`
+    or :py:meth:`close`.
+    """
+    def __init__(self, cache: 'Cache', batch_size: int = DEFAULT_BATCH_SIZE, flush_interval: Optional[float] = None,
+                 parallel_ops_per_node: int = DEFAULT_PARALLEL_OPS_PER_NODE):
+        """
+        :param cache: cache to load data into,
+        :param batch_size: (optional) number of entries per node, that
+         triggers sending a batch. Default is 512,
+        :param flush_interval: (optional) time (in seconds) after which all
+         the buffered entries are sent, regardless of the batch size.
+         Default is None (send full batches only),
+        :param parallel_ops_per_node: (optional) maximum number of batches
+         in flight per node. Adding the data blocks when the limit is
+         reached. Default is 4.
+        """
+        super().__init__(cache, batch_size, flush_interval, parallel_ops_per_node)
+        self._lock = Lock()
+        self._semaphores = {}
+        self._futures = set()
+        self._executor = ThreadPoolExecutor(thread_name_prefix='pygridgain-streamer')
+        self._stop = Event()
+        self._flusher = None
+        if self.client.partition_aware:
+            self.client._refresh_affinity(self.client._get_usable_node())
+        if flush_interval:
+            self._flusher = Thread(target=self._flush_loop, name='pygridgain-streamer-flusher', daemon=True)
+            self._flusher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def add(self, key: Any, value: Any, key_hint: object = None, value_hint: object = None):
+        """
+        Add an entry to the stream.
+
+        :param key: key for the cache entry,
+        :param value: value for the key,
+        :param key_hint: (optional) GridGain data type, for which the given
+         key should be converted,
+        :param value_hint: (optional) GridGain data type, for which the given
+         value should be converted.
+        """
+        self.add_all([self._entry(key, value, key_hint, value_hint)])
+
+    def add_all(self, entries: Union[dict, Iterable]):
+        """
+        Add entries to the stream.
+
+        :param entries: dict or iterable of (key, value) pairs. Each key
+         or value can be an item of representable Python type or a tuple
+         of (item, hint).
+        """
+        self._check_closed()
+        self._check_error()
+
+        for key, value in self._iter_entries(entries):
+            node = self._primary_node(key)
+            with self._lock:
+                full_buffer = self._buffer(node, key, value)
+            if full_buffer:
+                self._send(node, full_buffer)
+
+    def flush(self):
+        """
+        Send all the buffered entries and wait for all the batches in flight
+        to complete.
+        """
+        self._flush_buffers()
+        wait(list(self._futures))
+        self._check_error()
+
+    def close(self):
+        """
+        Flush the data and release the streamer resources.
+        """
+        if self.closed:
+            return
+
+        self._stop.set()
+        if self._flusher:
+            self._flusher.join()
+        try:
+            self.flush()
+        finally:
+            self.closed = True
+            self._executor.shutdown()
+
+    def _primary_node(self, key):
+        if not self.client.partition_aware:
+            return None
+        key, key_hint = key if is_hinted(key) else (key, None)
+        return self.client._get_primary_node(self.cache, key, key_hint)
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self._flush_buffers()
+
+    def _flush_buffers(self):
+        with self._lock:
+            buffers = self._take_buffers()
+        for node, buffer in buffers:
+            self._send(node, buffer)
+
+    def _send(self, node, entries: dict):
+        with self._lock:
+            semaphore = self._semaphores.get(node)
+            if semaphore is None:
+                semaphore = self._semaphores[node] = BoundedSemaphore(self.parallel_ops_per_node)
+
+        # backpressure: wait for the node to complete one of its batches
+        semaphore.acquire()
+        try:
+            future = self._executor.submit(self._put_batch, node, entries)
+        except RuntimeError:
+            semaphore.release()
+            raise
+
+        with self._lock:
+            self._futures.add(future)
+
+        def on_done(f):
+            semaphore.release()
+            with self._lock:
+                self._futures.discard(f)
+                self._on_batch_done(entries, f.exception())
+
+        future.add_done_callback(on_done)
+
+    def _put_batch(self, node, entries: dict):
+        if self.client.partition_aware:
+            self.client._refresh_affinity(self.client._get_usable_node())
+
+        conn = self.client._checkout(node) if node is not None else self.client.random_node
+        try:
+            result = cache_put_all(conn, self.cache.cache_info, entries)
+        except connection_errors:
+            # the node is gone, let the cluster route the batch
+            result = cache_put_all(self.client.random_node, self.cache.cache_info, entries)
+
+        if result.status != 0:
+            raise CacheError(result.message)
+
+
+class AioDataStreamer(_BaseDataStreamer):
+    """
+    Asynchronous data streamer. Create it with
+    :py:meth:`~pygridgain.aio_client.AioClient.data_streamer` and use it
+    as an async context manager, or await :py:meth:`close` explicitly
+    to send the remaining data.
+
+    Errors of the background batches are raised from the next call
+    to :py:meth:`add`, :py:meth:`add_all`, :py:meth:`flush`
+    or :py:meth:`close`.
+    """
+    def __init__(self, cache: 'AioCache', batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: Optional[float] = None,
+                 parallel_ops_per_node: int = DEFAULT_PARALLEL_OPS_PER_NODE):
+        """
+        :param cache: async cache to load data into,
+        :param batch_size: (optional) number of entries per node, that
+         triggers sending a batch. Default is 512,
+        :param flush_interval: (optional) time (in seconds) after which all
+         the buffered entries are sent, regardless of the batch size.
+         Default is None (send full batches only),
+        :param parallel_ops_per_node: (optional) maximum number of batches
+         in flight per node. Adding the data waits when the limit is
+         reached. Default is 4.
+        """
+        super().__init__(cache, batch_size, flush_interval, parallel_ops_per_node)
+        self._semaphores = {}
+        self._tasks = set()
+        self._started = False
+        self._flusher = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def add(self, key: Any, value: Any, key_hint: object = None, value_hint: object = None):
+        """
+        Add an entry to the stream.
+
+        :param key: key for the cache entry,
+        :param value: value for the key,
+        :param key_hint: (optional) Ignite data type, for which the given key
+         should be converted,
+        :param value_hint: (optional) Ignite data type, for which the given
+         value should be converted.
+        """
+        await self.add_all([self._entry(key, value, key_hint, value_hint)])
+
+    async def add_all(self, entries: Union[dict, Iterable]):
+        """
+        Add entries to the stream.
+
+        :param entries: dict or iterable of (key, value) pairs. Each key
+         or value can be an item of representable Python type or a tuple
+         of (item, hint).
+        """
+        self._check_closed()
+        self._check_error()
+        if not self._started:
+            await self._start()
+
+        for key, value in self._iter_entries(entries):
+            node = await self._primary_node(key)
+            full_buffer = self._buffer(node, key, value)
+            if full_buffer:
+                await self._send(node, full_buffer)
+
+    async def flush(self):
+        """
+        Send all the buffered entries and wait for all the batches in flight
+        to complete.
+        """
+        await self._flush_buffers()
+        if self._tasks:
+            await asyncio.wait(list(self._tasks))
+        self._check_error()
+
+    async def close(self):
+        """
+        Flush the data and release the streamer resources.
+        """
+        if self.closed:
+            return
+
+        if self._flusher:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+        try:
+            await self.flush()
+        finally:
+            self.closed = True
+
+    async def _start(self):
+        self._started = True
+        if self.client.partition_aware:
+            await self.client._refresh_affinity(await self.client._get_usable_node())
+        if self.flush_interval:
+            self._flusher = asyncio.ensure_future(self._flush_loop())
+
+    async def _primary_node(self, key):
+        if not self.client.partition_aware:
+            return None
+        key, key_hint = key if is_hinted(key) else (key, None)
+        return await self.client._get_primary_node(self.cache, key, key_hint)
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush_buffers()
+
+    async def _flush_buffers(self):
+        for node, buffer in self._take_buffers():
+            await self._send(node, buffer)
+
+    async def _send(self, node, entries: dict):
+        semaphore = self._semaphores.get(node)
+        if semaphore is None:
+            semaphore = self._semaphores[node] = asyncio.Semaphore(self.parallel_ops_per_node)
+
+        # backpressure: wait for the node to complete one of its batches
+        await semaphore.acquire()
+        task = asyncio.ensure_future(self._put_batch(node, entries))
+        self._tasks.add(task)
+
+        def on_done(t):
+            semaphore.release()
+            self._tasks.discard(t)
+            self._on_batch_done(entries, None if t.cancelled() else t.exception())
+
+        task.add_done_callback(on_done)
+
+    async def _put_batch(self, node, entries: dict):
+        if self.client.partition_aware:
+            await self.client._refresh_affinity(await self.client._get_usable_node())
+
+        conn = await self.client._checkout(node) if node is not None else await self.client.random_node()
+        try:
+            result = await cache_put_all_async(conn, self.cache.cache_info, entries)
+        except connection_errors:
+            # the node is gone, let the cluster route the batch
+            result = await cache_put_all_async(await self.client.random_node(), self.cache.cache_info, entries)
+
+        if result.status != 0:
+            raise CacheError(result.message)
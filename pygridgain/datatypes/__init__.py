@@ -20,6 +20,7 @@ creating binary data.
 
 from .complex import *
 from .internal import *
+from .layout_cache import *
 from .null_object import *
 from .primitive import *
 from .primitive_arrays import *
@@ -18,6 +18,7 @@ import math
 from typing import Union
 
 from . import ExpiryPolicy
+from .layout_cache import build_layout
 from .prop_codes import *
 from .cache_config import (
     CacheMode, CacheAtomicityMode, PartitionLossPolicy, RebalanceMode,
@@ -86,16 +87,9 @@ class PropBase:
 
     @classmethod
     def build_header(cls):
-        return type(
-            cls.__name__ + 'Header',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('prop_code', ctypes.c_short),
-                ],
-            }
-        )
+        return build_layout(cls.__name__ + 'Header', [
+            ('prop_code', ctypes.c_short),
+        ])
 
     @classmethod
     def parse(cls, stream):
@@ -103,16 +97,9 @@ class PropBase:
         header_class = cls.build_header()
         data_class = cls.prop_data_class.parse(stream)
 
-        prop_class = type(
-            cls.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('data', data_class),
-                ],
-            }
-        )
+        prop_class = build_layout(cls.__name__, [
+            ('data', data_class),
+        ], base=header_class)
 
         stream.seek(init_pos + ctypes.sizeof(prop_class))
         return prop_class
@@ -23,12 +23,18 @@ from pygridgain.constants import *
 from pygridgain.exceptions import ParseError
 from .base import GridGainDataType
 from .internal import AnyDataObject, Struct, infer_from_python, infer_from_python_async
+from .layout_cache import build_layout
 from .type_codes import *
 from .type_ids import *
 from .type_names import *
 from .null_object import Null, Nullable
 from ..stream import AioBinaryStream, BinaryStream
 
+try:
+    from pygridgain._cutils import read_binary_object as _read_binary_object
+except ImportError:
+    _read_binary_object = None
+
 __all__ = ['Map', 'ObjectArrayObject', 'CollectionObject', 'MapObject', 'WrappedDataObject', 'BinaryObject']
 
 
@@ -81,14 +87,7 @@ class ObjectArrayObject(Nullable):
 
     @classmethod
     def __build_final_class(cls, fields):
-        return type(
-            cls.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': cls._fields + fields,
-            }
-        )
+        return build_layout(cls.__name__, cls._fields + fields)
 
     @classmethod
     def to_python_not_null(cls, ctypes_object, **kwargs):
@@ -157,19 +156,12 @@ class WrappedDataObject(Nullable):
             byteorder=PROTOCOL_BYTE_ORDER
         )
 
-        final_class = type(
-            cls.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('length', ctypes.c_int),
-                    ('payload', ctypes.c_byte * length),
-                    ('offset', ctypes.c_int),
-                ],
-            }
-        )
+        final_class = build_layout(cls.__name__, [
+            ('type_code', ctypes.c_byte),
+            ('length', ctypes.c_int),
+            ('payload', ctypes.c_byte * length),
+            ('offset', ctypes.c_int),
+        ])
 
         stream.seek(ctypes.sizeof(final_class), SEEK_CUR)
         return final_class
@@ -257,14 +249,7 @@ class CollectionObject(Nullable):
 
     @classmethod
     def __build_final_class(cls, fields):
-        return type(
-            cls.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            }
-        )
+        return build_layout(cls.__name__, fields)
 
     @classmethod
     def to_python_not_null(cls, ctypes_object, *args, **kwargs):
@@ -349,14 +334,7 @@ class _MapBase:
 
     @classmethod
     def __build_final_class(cls, fields):
-        return type(
-            cls.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            }
-        )
+        return build_layout(cls.__name__, fields)
 
     @classmethod
     def _to_python(cls, ctypes_object, **kwargs):
@@ -597,21 +575,16 @@ class BinaryObject(Nullable):
     def schema_type(cls, flags: int):
         if flags & cls.COMPACT_FOOTER:
             return cls.offset_c_type(flags)
-        return type(
-            'SchemaElement',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('field_id', ctypes.c_int),
-                    ('offset', cls.offset_c_type(flags)),
-                ],
-            },
-        )
+        return build_layout('SchemaElement', [
+            ('field_id', ctypes.c_int),
+            ('offset', cls.offset_c_type(flags)),
+        ])
 
     @classmethod
     def parse_not_null(cls, stream):
         header, header_class = cls.__parse_header(stream)
+        if _read_binary_object:
+            return cls.__build_raw_class(stream, header, header_class)
 
         # ignore full schema, always retrieve fields' types and order
         # from complex types registry
@@ -625,6 +598,8 @@ class BinaryObject(Nullable):
     @classmethod
     async def parse_not_null_async(cls, stream):
         header, header_class = cls.__parse_header(stream)
+        if _read_binary_object:
+            return cls.__build_raw_class(stream, header, header_class)
 
         # ignore full schema, always retrieve fields' types and order
         # from complex types registry
@@ -655,20 +630,27 @@ class BinaryObject(Nullable):
             stream.seek(ctypes.sizeof(schema), SEEK_CUR)
             final_class_fields.append(('schema', schema))
 
-        final_class = type(
-            cls.__name__,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': final_class_fields,
-            }
-        )
+        final_class = build_layout(cls.__name__, final_class_fields, base=header_class)
         # register schema encoding approach
         stream.compact_footer = bool(header.flags & cls.COMPACT_FOOTER)
         return final_class
 
+    @classmethod
+    def __build_raw_class(cls, stream, header, header_class):
+        # fields are left undecoded, the C extension decodes them
+        # in `to_python` straight into the data class instance
+        data_len = header.length - ctypes.sizeof(header_class)
+        stream.seek(data_len, SEEK_CUR)
+        stream.compact_footer = bool(header.flags & cls.COMPACT_FOOTER)
+        return build_layout(cls.__name__, [('data', ctypes.c_byte * data_len)], base=header_class)
+
     @classmethod
     def to_python_not_null(cls, ctypes_object, client: 'Client' = None, **kwargs):
+        if _read_binary_object:
+            from .decoder import decode_value
+
+            return decode_value(client, bytes(ctypes_object))
+
         type_id = ctypes_object.type_id
         if not client:
             raise ParseError(f'Can not query binary type {type_id}')
@@ -687,6 +669,11 @@ class BinaryObject(Nullable):
 
     @classmethod
     async def to_python_not_null_async(cls, ctypes_object, client: 'AioClient' = None, **kwargs):
+        if _read_binary_object:
+            from .decoder import decode_value_async
+
+            return await decode_value_async(client, bytes(ctypes_object))
+
         type_id = ctypes_object.type_id
         if not client:
             raise ParseError(f'Can not query binary type {type_id}')
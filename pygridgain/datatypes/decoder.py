@@ -0,0 +1,448 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Single-pass decoder of GridGain binary data.
+
+The default decoding path builds a ctypes class for the data (`parse`),
+copies the buffer into it (`read_ctype`) and then walks it once again to get
+the Python values (`to_python`). :class:`DirectDecoder` walks the buffer once
+with :func:`struct.unpack_from` and produces the same Python values directly.
+The default path stays the reference implementation; this one is enabled
+with the `direct_decode` client parameter.
+"""
+import ctypes
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import decimal
+import struct
+from typing import Any, Tuple
+import uuid
+
+from pygridgain.constants import PROTOCOL_CHAR_ENCODING, PROTOCOL_STRING_ENCODING
+from pygridgain.exceptions import ParseError
+from .complex import BinaryObject, Map
+from .internal import AnyDataArray, AnyDataObject, Conditional, Struct, StructArray
+from .null_object import Null, Nullable
+from .primitive import Bool, Char, Primitive
+from .primitive_arrays import ARRAY_FORMAT_LIST, PrimitiveArray, _array_format, _array_from_bytes
+from .standard import StandardArray
+from .type_codes import *
+
+try:
+    from pygridgain._cutils import read_binary_object as _read_binary_object
+except ImportError:
+    _read_binary_object = None
+
+__all__ = ['DirectDecoder', 'UnresolvedBinaryType', 'decode_value', 'decode_value_async']
+
+_BYTE = struct.Struct('<b')
+_INT = struct.Struct('<i')
+_INT_PAIR = struct.Struct('<ii')
+_LONG = struct.Struct('<q')
+_TIMESTAMP = struct.Struct('<qi')
+_DECIMAL_HEADER = struct.Struct('<ii')
+_COLLECTION_HEADER = struct.Struct('<ib')
+_BINARY_OBJECT_HEADER = struct.Struct('<bhiiiii')
+
+_CTYPES_FORMATS = {
+    ctypes.c_byte: 'b',
+    ctypes.c_ubyte: 'B',
+    ctypes.c_short: 'h',
+    ctypes.c_int: 'i',
+    ctypes.c_longlong: 'q',
+    ctypes.c_float: 'f',
+    ctypes.c_double: 'd',
+}
+
+_UUID_BYTE_ORDER = (7, 6, 5, 4, 3, 2, 1, 0, 15, 14, 13, 12, 11, 10, 9, 8)
+
+_PRIMITIVE_ARRAYS = {
+    TC_SHORT_ARRAY[0]: 'h',
+    TC_INT_ARRAY[0]: 'i',
+    TC_LONG_ARRAY[0]: 'q',
+    TC_FLOAT_ARRAY[0]: 'f',
+    TC_DOUBLE_ARRAY[0]: 'd',
+}
+
+_SCALARS = {
+    TC_BYTE[0]: struct.Struct('<b'),
+    TC_SHORT[0]: struct.Struct('<h'),
+    TC_INT[0]: struct.Struct('<i'),
+    TC_LONG[0]: struct.Struct('<q'),
+    TC_FLOAT[0]: struct.Struct('<f'),
+    TC_DOUBLE[0]: struct.Struct('<d'),
+}
+
+
+def _field_names(data_class) -> tuple:
+    """
+    Field names of the Complex object class in the schema order. This is
+    the field plan of the C extension decoder, built once per class.
+    """
+    names = data_class.__dict__.get('_read_plan')
+    if names is None:
+        names = tuple(data_class.schema.keys())
+        data_class._read_plan = names
+    return names
+
+
+class UnresolvedBinaryType(Exception):
+    """
+    Raised by the asynchronous flavor of the decoder, when the binary type
+    is not yet in the client registry and has to be queried from the server.
+    """
+    def __init__(self, type_id: int, schema_id: int):
+        super().__init__(f'Binary type {type_id} (schema {schema_id}) is not registered')
+        self.type_id = type_id
+        self.schema_id = schema_id
+
+
+class DirectDecoder:
+    """
+    Decodes GridGain binary data from a buffer in a single pass.
+
+    Each decoding method takes the offset of the data and returns a tuple of
+    the decoded value and the offset of the data that follows.
+    """
+    def __init__(self, buf, client=None, aio: bool = False):
+        """
+        :param buf: bytes-like object to decode,
+        :param client: (optional) client, required for decoding Complex
+         objects,
+        :param aio: (optional) whether the client is an `AioClient`. In that
+         case unknown binary types are not queried, but reported with
+         :class:`UnresolvedBinaryType`.
+        """
+        self.buf = buf if isinstance(buf, memoryview) else memoryview(buf)
+        self.client = client
+        self.aio = aio
+
+    @classmethod
+    def supports(cls, datatype) -> bool:
+        """
+        Checks whether the data of the given parser/constructor class can be
+        decoded by :meth:`decode`.
+
+        :param datatype: parser/constructor class or instance,
+        :return: True if decoding is supported, False otherwise.
+        """
+        if isinstance(datatype, Struct):
+            return all(cls.supports(t) for _, t in datatype.fields)
+        if isinstance(datatype, StructArray):
+            return datatype.counter_type in _CTYPES_FORMATS and all(cls.supports(t) for _, t in datatype.following)
+        if isinstance(datatype, AnyDataArray):
+            return datatype.counter_type in _CTYPES_FORMATS
+        if isinstance(datatype, Conditional) or not isinstance(datatype, type):
+            return False
+        return issubclass(datatype, (AnyDataObject, Nullable, Null, Primitive, PrimitiveArray, StandardArray, Map))
+
+    def decode(self, datatype, pos: int) -> Tuple[Any, int]:
+        """
+        Decodes the data of the given parser/constructor class.
+
+        :param datatype: parser/constructor class or instance, see
+         :meth:`supports`,
+        :param pos: offset of the data,
+        :return: tuple of the decoded value and the new offset.
+        """
+        if isinstance(datatype, Struct):
+            return self.__decode_struct(datatype.fields, datatype.dict_type, pos)
+
+        if isinstance(datatype, StructArray):
+            length, pos = self.__decode_counter(datatype.counter_type, pos)
+            result = []
+            for _ in range(length):
+                value, pos = self.__decode_struct(datatype.following, dict, pos)
+                result.append(value)
+            return result, pos
+
+        if isinstance(datatype, AnyDataArray):
+            length, pos = self.__decode_counter(datatype.counter_type, pos)
+            return self.__decode_elements(length, pos)
+
+        if issubclass(datatype, Primitive):
+            value, pos = self.__decode_counter(datatype.c_type, pos)
+            if issubclass(datatype, Bool):
+                return value != 0, pos
+            if issubclass(datatype, Char):
+                return bytes(self.buf[pos - 2:pos]).decode(PROTOCOL_CHAR_ENCODING), pos
+            return value, pos
+
+        if issubclass(datatype, PrimitiveArray):
+            return self.__decode_primitive_array(
+                _CTYPES_FORMATS[datatype.primitive_type.c_type], pos,
+                _array_format(datatype.primitive_type, self.client)
+            )
+
+        if issubclass(datatype, StandardArray):
+            length = _INT.unpack_from(self.buf, pos)[0]
+            return self.__decode_elements(length, pos + _INT.size)
+
+        if issubclass(datatype, Map):
+            length = _INT.unpack_from(self.buf, pos)[0]
+            return self.__decode_map(length, Map.HASH_MAP, pos + _INT.size)
+
+        return self.decode_any(pos)
+
+    def decode_any(self, pos: int) -> Tuple[Any, int]:
+        """
+        Decodes the data object, using its type code.
+
+        :param pos: offset of the data object (its type code),
+        :return: tuple of the decoded value and the new offset.
+        """
+        type_code = self.buf[pos]
+        try:
+            handler = _HANDLERS[type_code]
+        except KeyError:
+            raise ParseError('Unknown type code: `{}`'.format(bytes([type_code]))) from None
+        return handler(self, type_code, pos + 1)
+
+    def __decode_counter(self, c_type, pos):
+        fmt = struct.Struct('<' + _CTYPES_FORMATS[c_type])
+        return fmt.unpack_from(self.buf, pos)[0], pos + fmt.size
+
+    def __decode_struct(self, fields, dict_type, pos):
+        result = dict_type()
+        for name, datatype in fields:
+            result[name], pos = self.decode(datatype, pos)
+        return result, pos
+
+    def __decode_elements(self, length, pos):
+        result = []
+        for _ in range(length):
+            value, pos = self.decode_any(pos)
+            result.append(value)
+        return result, pos
+
+    def __decode_map(self, length, map_type, pos):
+        result = OrderedDict() if map_type == Map.LINKED_HASH_MAP else dict()
+        for _ in range(length):
+            key, pos = self.decode_any(pos)
+            result[key], pos = self.decode_any(pos)
+        return result, pos
+
+    def __decode_primitive_array(self, fmt, pos, array_format=ARRAY_FORMAT_LIST):
+        length = _INT.unpack_from(self.buf, pos)[0]
+        pos += _INT.size
+        end = pos + length * struct.calcsize(fmt)
+        if array_format != ARRAY_FORMAT_LIST:
+            return _array_from_bytes(fmt, self.buf[pos:end], array_format), end
+        return list(struct.unpack_from(f'<{length}{fmt}', self.buf, pos)), end
+
+    def _null(self, type_code, pos):
+        return None, pos
+
+    def _scalar(self, type_code, pos):
+        fmt = _SCALARS[type_code]
+        return fmt.unpack_from(self.buf, pos)[0], pos + fmt.size
+
+    def _char(self, type_code, pos):
+        return bytes(self.buf[pos:pos + 2]).decode(PROTOCOL_CHAR_ENCODING), pos + 2
+
+    def _bool(self, type_code, pos):
+        return self.buf[pos] != 0, pos + 1
+
+    def _string(self, type_code, pos):
+        length = _INT.unpack_from(self.buf, pos)[0]
+        pos += _INT.size
+        return str(self.buf[pos:pos + length], PROTOCOL_STRING_ENCODING), pos + length
+
+    def _uuid(self, type_code, pos):
+        data = self.buf[pos:pos + 16]
+        return uuid.UUID(bytes=bytes([data[i] for i in _UUID_BYTE_ORDER])), pos + 16
+
+    def _date(self, type_code, pos):
+        return datetime.fromtimestamp(_LONG.unpack_from(self.buf, pos)[0] / 1000), pos + _LONG.size
+
+    def _timestamp(self, type_code, pos):
+        epoch, fraction = _TIMESTAMP.unpack_from(self.buf, pos)
+        return (datetime.fromtimestamp(epoch / 1000), fraction), pos + _TIMESTAMP.size
+
+    def _time(self, type_code, pos):
+        return timedelta(milliseconds=_LONG.unpack_from(self.buf, pos)[0]), pos + _LONG.size
+
+    def _enum(self, type_code, pos):
+        return _INT_PAIR.unpack_from(self.buf, pos), pos + _INT_PAIR.size
+
+    def _decimal(self, type_code, pos):
+        scale, length = _DECIMAL_HEADER.unpack_from(self.buf, pos)
+        pos += _DECIMAL_HEADER.size
+        data = bytearray(self.buf[pos:pos + length])
+        sign = data[0] & 0x80
+        data[0] &= 0x7f
+        result = int.from_bytes(data, byteorder='big') / decimal.Decimal('10') ** decimal.Decimal(scale)
+        return -result if sign else result, pos + length
+
+    def _byte_array(self, type_code, pos):
+        length = _INT.unpack_from(self.buf, pos)[0]
+        pos += _INT.size
+        return bytes(self.buf[pos:pos + length]), pos + length
+
+    def _bool_array(self, type_code, pos):
+        length = _INT.unpack_from(self.buf, pos)[0]
+        pos += _INT.size
+        return [b != 0 for b in self.buf[pos:pos + length]], pos + length
+
+    def _char_array(self, type_code, pos):
+        length = _INT.unpack_from(self.buf, pos)[0]
+        pos += _INT.size
+        return [
+            bytes(self.buf[p:p + 2]).decode(PROTOCOL_CHAR_ENCODING) for p in range(pos, pos + 2 * length, 2)
+        ], pos + 2 * length
+
+    def _primitive_array(self, type_code, pos):
+        array_format = self.client.array_format if self.client is not None else ARRAY_FORMAT_LIST
+        return self.__decode_primitive_array(_PRIMITIVE_ARRAYS[type_code], pos, array_format)
+
+    def _standard_array(self, type_code, pos):
+        length = _INT.unpack_from(self.buf, pos)[0]
+        return self.__decode_elements(length, pos + _INT.size)
+
+    def _typed_array(self, type_code, pos):
+        type_id, length = _INT_PAIR.unpack_from(self.buf, pos)
+        result, pos = self.__decode_elements(length, pos + _INT_PAIR.size)
+        return (type_id, result), pos
+
+    def _collection(self, type_code, pos):
+        length, col_type = _COLLECTION_HEADER.unpack_from(self.buf, pos)
+        result, pos = self.__decode_elements(length, pos + _COLLECTION_HEADER.size)
+        return (col_type, result), pos
+
+    def _map(self, type_code, pos):
+        length, map_type = _COLLECTION_HEADER.unpack_from(self.buf, pos)
+        result, pos = self.__decode_map(length, map_type, pos + _COLLECTION_HEADER.size)
+        return (map_type, result), pos
+
+    def _wrapped(self, type_code, pos):
+        length = _INT.unpack_from(self.buf, pos)[0]
+        pos += _INT.size
+        payload = bytes(self.buf[pos:pos + length])
+        pos += length
+        return (payload, _INT.unpack_from(self.buf, pos)[0]), pos + _INT.size
+
+    def _binary_object(self, type_code, pos):
+        start = pos - 1
+        version, flags, type_id, _, length, schema_id, _ = _BINARY_OBJECT_HEADER.unpack_from(self.buf, pos)
+        data_class = self.__get_dataclass(type_id, schema_id)
+
+        if _read_binary_object:
+            # primitive and string fields are decoded by the C extension,
+            # the rest of the fields are passed back to `decode_any`
+            result, _ = _read_binary_object(self.buf, start, data_class, _field_names(data_class), self.decode_any)
+        else:
+            result = data_class()
+            result.version = version
+            pos += _BINARY_OBJECT_HEADER.size
+            for field_name in data_class.schema.keys():
+                value, pos = self.decode_any(pos)
+                setattr(result, field_name, value)
+
+        # register schema encoding approach
+        self.client.compact_footer = bool(flags & BinaryObject.COMPACT_FOOTER)
+        return result, start + length
+
+    def __get_dataclass(self, type_id, schema_id):
+        if not self.client:
+            raise ParseError(f'Can not query binary type {type_id}')
+
+        if self.aio:
+            result = self.client._get_from_registry(type_id, schema_id)
+            if not result:
+                raise UnresolvedBinaryType(type_id, schema_id)
+            return result
+
+        result = self.client.query_binary_type(type_id, schema_id)
+        if not result:
+            raise RuntimeError('Binary type is not registered')
+        return result
+
+
+_HANDLERS = {
+    TC_NULL[0]: DirectDecoder._null,
+
+    TC_BYTE[0]: DirectDecoder._scalar,
+    TC_SHORT[0]: DirectDecoder._scalar,
+    TC_INT[0]: DirectDecoder._scalar,
+    TC_LONG[0]: DirectDecoder._scalar,
+    TC_FLOAT[0]: DirectDecoder._scalar,
+    TC_DOUBLE[0]: DirectDecoder._scalar,
+    TC_CHAR[0]: DirectDecoder._char,
+    TC_BOOL[0]: DirectDecoder._bool,
+
+    TC_UUID[0]: DirectDecoder._uuid,
+    TC_DATE[0]: DirectDecoder._date,
+    TC_TIMESTAMP[0]: DirectDecoder._timestamp,
+    TC_TIME[0]: DirectDecoder._time,
+    TC_ENUM[0]: DirectDecoder._enum,
+    TC_BINARY_ENUM[0]: DirectDecoder._enum,
+
+    TC_BYTE_ARRAY[0]: DirectDecoder._byte_array,
+    TC_SHORT_ARRAY[0]: DirectDecoder._primitive_array,
+    TC_INT_ARRAY[0]: DirectDecoder._primitive_array,
+    TC_LONG_ARRAY[0]: DirectDecoder._primitive_array,
+    TC_FLOAT_ARRAY[0]: DirectDecoder._primitive_array,
+    TC_DOUBLE_ARRAY[0]: DirectDecoder._primitive_array,
+    TC_CHAR_ARRAY[0]: DirectDecoder._char_array,
+    TC_BOOL_ARRAY[0]: DirectDecoder._bool_array,
+
+    TC_UUID_ARRAY[0]: DirectDecoder._standard_array,
+    TC_DATE_ARRAY[0]: DirectDecoder._standard_array,
+    TC_TIMESTAMP_ARRAY[0]: DirectDecoder._standard_array,
+    TC_TIME_ARRAY[0]: DirectDecoder._standard_array,
+    TC_ENUM_ARRAY[0]: DirectDecoder._typed_array,
+
+    TC_STRING[0]: DirectDecoder._string,
+    TC_STRING_ARRAY[0]: DirectDecoder._standard_array,
+    TC_DECIMAL[0]: DirectDecoder._decimal,
+    TC_DECIMAL_ARRAY[0]: DirectDecoder._standard_array,
+
+    TC_OBJECT_ARRAY[0]: DirectDecoder._typed_array,
+    TC_COLLECTION[0]: DirectDecoder._collection,
+    TC_MAP[0]: DirectDecoder._map,
+
+    TC_COMPLEX_OBJECT[0]: DirectDecoder._binary_object,
+    TC_ARRAY_WRAPPED_OBJECTS[0]: DirectDecoder._wrapped,
+}
+
+
+def decode_value(client, buf, pos: int = 0) -> Any:
+    """
+    Decodes a single data object with the synchronous client.
+
+    :param client: `Client` instance,
+    :param buf: bytes-like object to decode,
+    :param pos: (optional) offset of the data object,
+    :return: decoded value.
+    """
+    return DirectDecoder(buf, client).decode_any(pos)[0]
+
+
+async def decode_value_async(client, buf, pos: int = 0) -> Any:
+    """
+    Decodes a single data object with the asynchronous client.
+
+    :param client: `AioClient` instance,
+    :param buf: bytes-like object to decode,
+    :param pos: (optional) offset of the data object,
+    :return: decoded value.
+    """
+    decoder = DirectDecoder(buf, client, aio=True)
+    while True:
+        try:
+            return decoder.decode_any(pos)[0]
+        except UnresolvedBinaryType as e:
+            await client.query_binary_type(e.type_id, e.schema_id)
@@ -27,6 +27,7 @@ import attr
 from pygridgain.constants import PROTOCOL_BYTE_ORDER
 from pygridgain.exceptions import ParseError
 from pygridgain.utils import is_binary, is_hinted, is_iterable
+from .layout_cache import build_layout
 from .type_codes import *
 
 
@@ -184,14 +185,7 @@ class StructArray:
 
     @staticmethod
     def build_c_type(fields):
-        return type(
-            'StructArray',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            },
-        )
+        return build_layout('StructArray', fields)
 
     def to_python(self, ctypes_object, **kwargs):
         length = getattr(ctypes_object, 'length', 0)
@@ -274,14 +268,7 @@ class Struct:
 
     @staticmethod
     def build_c_type(fields):
-        return type(
-            'StructLE',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            },
-        )
+        return build_layout('StructLE', fields)
 
     def to_python(self, ctypes_object, **kwargs) -> Union[dict, OrderedDict]:
         result = self.dict_type()
@@ -569,14 +556,7 @@ class AnyDataArray(AnyDataObject):
         return [('length', self.counter_type)], length
 
     def build_c_type(self, fields):
-        return type(
-            self.__class__.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            }
-        )
+        return build_layout(self.__class__.__name__, fields)
 
     @classmethod
     def to_python(cls, ctypes_object, **kwargs):
@@ -0,0 +1,147 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Shared cache of the ctypes layouts (structure classes), that are generated
+while parsing and serializing variable-length GridGain data types.
+
+Most of the parsers build their ctypes structure from the data they see in
+the stream: string length, array length, binary object schema, et c.
+The same layouts reappear over and over again (think of SQL pages or scan
+results with the values of the same type), so building the class once
+and reusing it saves both CPU and memory.
+"""
+
+import ctypes
+from collections import OrderedDict
+from threading import Lock
+
+__all__ = ['LayoutCache', 'layout_cache', 'build_layout', 'layout_cache_stats']
+
+DEFAULT_LAYOUT_CACHE_SIZE = 4096
+
+
+class LayoutCache:
+    """
+    Bounded LRU cache of the ctypes structure classes.
+
+    The layout is keyed by its name, base class and fields signature, i.e.
+    the sequence of (field name, field ctypes type) pairs. Nested layouts are
+    cached as well, so the same nested signature always yields the same key.
+    """
+    def __init__(self, max_size: int = DEFAULT_LAYOUT_CACHE_SIZE):
+        """
+        :param max_size: (optional) maximum number of layouts to keep. Least
+         recently used layouts are evicted when the cache is full.
+        """
+        if max_size < 1:
+            raise ValueError('Layout cache size must be positive.')
+        self._max_size = max_size
+        self._layouts = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        if value < 1:
+            raise ValueError('Layout cache size must be positive.')
+        with self._lock:
+            self._max_size = value
+            self.__evict()
+
+    def __len__(self):
+        return len(self._layouts)
+
+    def get(self, name: str, base: type, fields) -> type:
+        """
+        Get the ctypes structure class with the given layout, build it
+        if needed.
+
+        :param name: class name,
+        :param base: base class (ctypes structure or a header structure),
+        :param fields: iterable of (name, ctypes type) pairs,
+        :return: ctypes structure class.
+        """
+        fields = tuple(fields)
+        key = (name, base, fields)
+        with self._lock:
+            layout = self._layouts.get(key)
+            if layout is not None:
+                self._layouts.move_to_end(key)
+                self.hits += 1
+                return layout
+
+            self.misses += 1
+            layout = type(
+                name,
+                (base,),
+                {
+                    '_pack_': 1,
+                    '_fields_': list(fields),
+                }
+            )
+            self._layouts[key] = layout
+            self.__evict()
+            return layout
+
+    def __evict(self):
+        while len(self._layouts) > self._max_size:
+            self._layouts.popitem(last=False)
+
+    def stats(self) -> dict:
+        """
+        :return: dict with `hits`, `misses`, `size` and `max_size` keys.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._layouts),
+            'max_size': self._max_size,
+        }
+
+    def clear(self):
+        """ Drop all the cached layouts and reset the counters. """
+        with self._lock:
+            self._layouts.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+layout_cache = LayoutCache()
+
+
+def build_layout(name: str, fields, base: type = ctypes.LittleEndianStructure) -> type:
+    """
+    Get the packed ctypes structure class from the shared layout cache.
+
+    :param name: class name,
+    :param fields: iterable of (name, ctypes type) pairs,
+    :param base: (optional) base class, `ctypes.LittleEndianStructure`
+     by default,
+    :return: ctypes structure class.
+    """
+    return layout_cache.get(name, base, fields)
+
+
+def layout_cache_stats() -> dict:
+    """
+    :return: the shared layout cache statistics.
+    """
+    return layout_cache.stats()
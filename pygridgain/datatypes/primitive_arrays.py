@@ -13,12 +13,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import array
 import ctypes
+import struct
 import sys
 from io import SEEK_CUR
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from pygridgain.constants import *
 from .base import GridGainDataType
+from .layout_cache import build_layout
 from .null_object import Nullable
 from .primitive import *
 from .type_codes import *
@@ -31,12 +39,50 @@ __all__ = [
     'IntArray', 'IntArrayObject', 'LongArray', 'LongArrayObject',
     'FloatArray', 'FloatArrayObject', 'DoubleArray', 'DoubleArrayObject',
     'CharArray', 'CharArrayObject', 'BoolArray', 'BoolArrayObject',
+    'ARRAY_FORMAT_LIST', 'ARRAY_FORMAT_ARRAY', 'ARRAY_FORMAT_NUMPY', 'ARRAY_FORMATS',
 ]
 
+ARRAY_FORMAT_LIST = 'list'
+ARRAY_FORMAT_ARRAY = 'array'
+ARRAY_FORMAT_NUMPY = 'numpy'
+ARRAY_FORMATS = (ARRAY_FORMAT_LIST, ARRAY_FORMAT_ARRAY, ARRAY_FORMAT_NUMPY)
+
+
+def _array_format(primitive_type, client) -> str:
+    # chars and bools are always decoded into lists
+    if client is None or primitive_type not in (Short, Int, Long, Float, Double):
+        return ARRAY_FORMAT_LIST
+    return client.array_format
+
+
+def _array_from_bytes(fmt, data, array_format):
+    """
+    Decode the little-endian payload of a primitive array into
+    an ``array.array`` or a NumPy array with a single copy.
+
+    The payload is copied rather than viewed, since the receive buffers
+    are reused once the response is decoded.
 
-def _bulk_to_python(ctypes_object):
+    :param fmt: element format (`struct` character),
+    :param data: bytes-like payload,
+    :param array_format: :data:`ARRAY_FORMAT_ARRAY` or
+     :data:`ARRAY_FORMAT_NUMPY`,
+    :return: array of the elements.
+    """
+    if array_format == ARRAY_FORMAT_NUMPY:
+        return numpy.frombuffer(data, dtype='<' + fmt).copy()
+
+    result = array.array(fmt)
+    result.frombytes(data)
+    if sys.byteorder != 'little':
+        result.byteswap()
+    return result
+
+
+def _bulk_to_python(ctypes_object, array_format=ARRAY_FORMAT_LIST):
     """
     Decode a ctypes primitive array into a Python list in a single C-level pass.
+    With the other `array_format`, see :func:`_array_from_bytes`.
 
     Replaces the element-wise ``[data[i] for i in range(length)]`` comprehension,
     which is the dominant client cost for large primitive arrays (e.g. the 1536-d
@@ -50,12 +96,80 @@ def _bulk_to_python(ctypes_object):
     bulk-decode; on a big-endian host that would misread the bytes, so we keep the
     correct (and there, equally cheap relative to the byte-swap) element-wise path.
     """
+    if array_format != ARRAY_FORMAT_LIST:
+        mv = memoryview(ctypes_object.data)
+        return _array_from_bytes(mv.format.lstrip('<>=!@'), mv.cast('B'), array_format)
     if sys.byteorder == 'little':
         mv = memoryview(ctypes_object.data)
         return mv.cast('B').cast(mv.format.lstrip('<>=!@')).tolist()
     return [ctypes_object.data[i] for i in range(ctypes_object.length)]
 
 
+# little-endian `struct` formats of the array elements
+_PACK_FORMATS = {Short: 'h', Int: 'i', Long: 'q', Float: 'f', Double: 'd', Bool: '?'}
+# buffer formats, that have the same representation as the array elements,
+# provided the item sizes are the same
+_BUFFER_FORMATS = {'h': 'bhilqn', 'i': 'bhilqn', 'q': 'bhilqn', 'f': 'f', 'd': 'd', '?': '?'}
+
+
+def _same_layout(view, fmt):
+    code = view.format
+    order = '@'
+    if code[:1] in ('<', '>', '!', '=', '@'):
+        order, code = code[0], code[1:]
+    if order in ('>', '!') or (order in ('@', '=') and sys.byteorder != 'little'):
+        return False
+    return view.ndim == 1 and view.c_contiguous and view.itemsize == struct.calcsize(fmt) \
+        and code in _BUFFER_FORMATS[fmt]
+
+
+def _bulk_from_python(primitive_type, value):
+    """
+    Encode a sequence of primitive values into the array payload in a single
+    C-level pass, the counterpart of :func:`_bulk_to_python`.
+
+    Buffers (``array.array``, NumPy arrays), which items are already laid out
+    like the array elements, are written as is. Other sequences are packed
+    with one ``struct.pack`` call, that checks the values just like
+    the element-wise ``primitive_type.from_python`` does.
+
+    :return: bytes-like payload, or None if the values should be written
+     element by element.
+    """
+    if primitive_type is Char:
+        if isinstance(value, str):
+            text = value
+        else:
+            try:
+                text = ''.join(value)
+            except TypeError:
+                return None
+            # exactly one character per element
+            if len(text) != len(value) or max(map(len, value), default=1) != 1:
+                return None
+        data = text.encode(PROTOCOL_CHAR_ENCODING)
+        # characters out of the BMP do not fit
+        return data if len(data) == 2 * len(text) else None
+
+    fmt = _PACK_FORMATS[primitive_type]
+    try:
+        view = memoryview(value)
+    except (TypeError, ValueError):
+        pass
+    else:
+        with view:
+            if _same_layout(view, fmt):
+                return view.cast('B')
+            try:
+                value = view.tolist()
+            except NotImplementedError:
+                pass
+
+    if fmt == '?':
+        return bytes(map(bool, value))
+    return struct.pack(f'<{len(value)}{fmt}', *value)
+
+
 class PrimitiveArray(GridGainDataType):
     """
     Base class for array of primitives. Payload-only.
@@ -71,17 +185,10 @@ class PrimitiveArray(GridGainDataType):
             byteorder=PROTOCOL_BYTE_ORDER
         )
 
-        return type(
-            cls.__name__,
-            (ctypes.LittleEndianStructure, ),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('length', ctypes.c_int),
-                    ('data', cls.primitive_type.c_type * length),
-                ],
-            }
-        )
+        return build_layout(cls.__name__, [
+            ('length', ctypes.c_int),
+            ('data', cls.primitive_type.c_type * length),
+        ])
 
     @classmethod
     def parse(cls, stream):
@@ -90,8 +197,8 @@ class PrimitiveArray(GridGainDataType):
         return c_type
 
     @classmethod
-    def to_python(cls, ctypes_object, **kwargs):
-        return _bulk_to_python(ctypes_object)
+    def to_python(cls, ctypes_object, client=None, **kwargs):
+        return _bulk_to_python(ctypes_object, _array_format(cls.primitive_type, client))
 
     @classmethod
     def _write_header(cls, stream, value):
@@ -100,6 +207,10 @@ class PrimitiveArray(GridGainDataType):
     @classmethod
     def from_python(cls, stream, value, **kwargs):
         cls._write_header(stream, value)
+        data = _bulk_from_python(cls.primitive_type, value)
+        if data is not None:
+            stream.write(data)
+            return
         for x in value:
             cls.primitive_type.from_python(stream, x)
 
@@ -187,18 +298,11 @@ class PrimitiveArrayObject(Nullable):
             byteorder=PROTOCOL_BYTE_ORDER
         )
 
-        return type(
-            cls.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('length', ctypes.c_int),
-                    ('data', cls.primitive_type.c_type * length),
-                ],
-            }
-        )
+        return build_layout(cls.__name__, [
+            ('type_code', ctypes.c_byte),
+            ('length', ctypes.c_int),
+            ('data', cls.primitive_type.c_type * length),
+        ])
 
     @classmethod
     def parse_not_null(cls, stream):
@@ -207,12 +311,16 @@ class PrimitiveArrayObject(Nullable):
         return c_type
 
     @classmethod
-    def to_python_not_null(cls, ctypes_object, **kwargs):
-        return _bulk_to_python(ctypes_object)
+    def to_python_not_null(cls, ctypes_object, client=None, **kwargs):
+        return _bulk_to_python(ctypes_object, _array_format(cls.primitive_type, client))
 
     @classmethod
     def from_python_not_null(cls, stream, value, **kwargs):
         cls._write_header(stream, value)
+        data = _bulk_from_python(cls.primitive_type, value)
+        if data is not None:
+            stream.write(data)
+            return
         for x in value:
             cls.primitive_type.from_python(stream, x)
 
@@ -301,7 +409,7 @@ class CharArrayObject(PrimitiveArrayObject):
 
     @classmethod
     def to_python_not_null(cls, ctypes_object, **kwargs):
-        values = super().to_python_not_null(ctypes_object, **kwargs)
+        values = _bulk_to_python(ctypes_object)
         return [
             v.to_bytes(
                 ctypes.sizeof(cls.primitive_type.c_type),
@@ -24,6 +24,7 @@ import uuid
 from pygridgain.constants import *
 from pygridgain.utils import datetime_hashcode, decimal_hashcode, hashcode
 from .base import GridGainDataType
+from .layout_cache import build_layout
 from .type_codes import *
 from .type_ids import *
 from .type_names import *
@@ -76,18 +77,11 @@ class String(Nullable):
 
     @classmethod
     def build_c_type(cls, length: int):
-        return type(
-            cls.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('length', ctypes.c_int),
-                    ('data', ctypes.c_char * length),
-                ],
-            },
-        )
+        return build_layout(cls.__name__, [
+            ('type_code', ctypes.c_byte),
+            ('length', ctypes.c_int),
+            ('data', ctypes.c_char * length),
+        ])
 
     @classmethod
     def parse_not_null(cls, stream):
@@ -137,19 +131,12 @@ class DecimalObject(Nullable):
 
     @classmethod
     def build_c_type(cls, length):
-        return type(
-            cls.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': [
-                    ('type_code', ctypes.c_byte),
-                    ('scale', ctypes.c_int),
-                    ('length', ctypes.c_int),
-                    ('data', ctypes.c_ubyte * length)
-                ]
-            }
-        )
+        return build_layout(cls.__name__, [
+            ('type_code', ctypes.c_byte),
+            ('scale', ctypes.c_int),
+            ('length', ctypes.c_int),
+            ('data', ctypes.c_ubyte * length)
+        ])
 
     @classmethod
     def parse_not_null(cls, stream):
@@ -504,14 +491,7 @@ class _StandardArrayBase:
             c_type = cls.standard_type.parse(stream)
             fields.append((f'element_{i}', c_type))
 
-        return type(
-            cls.__name__,
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            }
-        )
+        return build_layout(cls.__name__, fields)
 
     @classmethod
     def _write_header(cls, stream, value, **kwargs):
@@ -0,0 +1,364 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Client-side near cache keeps the recently read values of a cache
+in the client memory, so repeated reads of the hot keys do not go
+to the cluster.
+
+The near cache is bounded by the number of entries and (optionally)
+by the estimated memory size of the entries. Entries are invalidated
+by the writes, made through the same client, and expire after a TTL.
+Changes made by other clients are not tracked, so TTL is the upper
+bound of staleness for them.
+"""
+import sys
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from threading import Lock
+from typing import Any, Hashable, Iterable, Optional, Tuple
+
+from pygridgain.datatypes import ExpiryPolicy
+from pygridgain.exceptions import ParameterError
+
+__all__ = ['NearCache']
+
+DEFAULT_MAX_ENTRIES = 10000
+
+EVICTION_LRU = 'lru'
+EVICTION_LFU = 'lfu'
+
+_MAX_SIZE_DEPTH = 4
+
+
+def _estimate_size(value: Any, depth: int = 0) -> int:
+    """
+    Rough estimate of the memory, taken by a decoded value.
+    """
+    if isinstance(value, type):
+        # type hints of the keys are shared, not counted
+        return 0
+    size = sys.getsizeof(value)
+    if depth >= _MAX_SIZE_DEPTH or isinstance(value, (str, bytes, bytearray, int, float)):
+        return size
+    if isinstance(value, dict):
+        return size + sum(_estimate_size(k, depth + 1) + _estimate_size(v, depth + 1) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(_estimate_size(item, depth + 1) for item in value)
+    fields = getattr(value, '__dict__', None)
+    if fields:
+        return size + sum(_estimate_size(v, depth + 1) for v in fields.values())
+    return size
+
+
+def _duration_to_seconds(duration) -> Optional[float]:
+    """
+    Converts expiry policy duration to seconds.
+
+    :return: None if the duration does not limit the entry lifetime.
+    """
+    if isinstance(duration, timedelta):
+        return duration.total_seconds()
+    if duration in (ExpiryPolicy.UNCHANGED, ExpiryPolicy.ETERNAL):
+        return None
+    return duration / 1000
+
+
+def expiry_policy_ttl(expiry_policy: Optional[ExpiryPolicy]) -> Optional[float]:
+    """
+    Finds a TTL of the near cache entry, that does not outlive the cluster
+    entry under the given expiry policy.
+
+    :param expiry_policy: expiry policy of the cache or None,
+    :return: TTL in seconds (0 means the entry should not be cached),
+     or None for no limit.
+    """
+    if expiry_policy is None:
+        return None
+    durations = [
+        _duration_to_seconds(d) for d in (expiry_policy.create, expiry_policy.update, expiry_policy.access)
+    ]
+    durations = [d for d in durations if d is not None]
+    return min(durations) if durations else None
+
+
+class _LRUOrder:
+    """ Evicts the least recently used key. """
+    def __init__(self):
+        self._keys = OrderedDict()
+
+    def add(self, key):
+        self._keys[key] = None
+
+    def touch(self, key):
+        self._keys.move_to_end(key)
+
+    def remove(self, key):
+        del self._keys[key]
+
+    def victim(self):
+        return next(iter(self._keys))
+
+    def clear(self):
+        self._keys.clear()
+
+
+class _LFUOrder:
+    """
+    Evicts the least frequently used key, the least recently used one
+    among the keys with the same frequency.
+    """
+    def __init__(self):
+        self._freqs = {}
+        self._buckets = {}
+        self._min_freq = 0
+
+    def add(self, key):
+        self._freqs[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def touch(self, key):
+        freq = self._freqs[key]
+        self._unlink(key, freq)
+        self._freqs[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+        if self._min_freq == freq and freq not in self._buckets:
+            self._min_freq = freq + 1
+
+    def remove(self, key):
+        self._unlink(key, self._freqs.pop(key))
+
+    def _unlink(self, key, freq):
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+
+    def victim(self):
+        if self._min_freq not in self._buckets:
+            self._min_freq = min(self._buckets)
+        return next(iter(self._buckets[self._min_freq]))
+
+    def clear(self):
+        self._freqs.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+
+class NearCache:
+    """
+    Thread-safe bounded storage of the decoded cache values. Enable it
+    on a cache with :py:meth:`~pygridgain.cache.Cache.with_near_cache`.
+
+    Keep in mind, that the cached values are shared between the callers,
+    so modifying a value, returned from the near cache, modifies
+    the cached one.
+    """
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, max_memory: Optional[int] = None,
+        ttl: Optional[float] = None, eviction_policy: str = EVICTION_LRU,
+        expiry_policy: Optional[ExpiryPolicy] = None
+    ):
+        """
+        :param max_entries: (optional) maximum number of entries. Default
+         is 10000,
+        :param max_memory: (optional) maximum estimated size of the entries
+         in bytes. Default is None (not limited),
+        :param ttl: (optional) time (in seconds) after which the entry
+         is dropped and re-read from the cluster. Default is None (entries
+         live until evicted or invalidated, or as the cache expiry policy
+         allows),
+        :param eviction_policy: (optional) 'lru' (evict the least recently
+         used entry) or 'lfu' (evict the least frequently used entry).
+         Default is 'lru',
+        :param expiry_policy: (optional) expiry policy, configured for
+         the cache. The entries do not outlive the cluster entries under it.
+         Default is None (no expiry).
+        """
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ParameterError('max_entries should be a positive integer.')
+        if max_memory is not None and (not isinstance(max_memory, int) or max_memory < 1):
+            raise ParameterError('max_memory should be a positive integer.')
+        if ttl is not None and ttl <= 0:
+            raise ParameterError('ttl should be positive.')
+        if eviction_policy not in (EVICTION_LRU, EVICTION_LFU):
+            raise ParameterError(f'Unknown eviction policy: {eviction_policy}.')
+
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.ttl = ttl
+        self.eviction_policy = eviction_policy
+        self.expiry_policy = expiry_policy
+        self._policy_ttl = expiry_policy_ttl(expiry_policy)
+
+        self._lock = Lock()
+        # key -> [value, size, expiration time or None]
+        self._entries = {}
+        self._order = _LRUOrder() if eviction_policy == EVICTION_LRU else _LFUOrder()
+        self._memory = 0
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """
+        Counter of the invalidations. Take it before reading a value from
+        the cluster and pass it to :py:meth:`put`, so the value, that was
+        changed while being read, is not cached.
+        """
+        return self._generation
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Looks up the key.
+
+        :param key: near cache key,
+        :return: tuple of (found, value).
+        """
+        with self._lock:
+            try:
+                entry = self._entries.get(key)
+            except TypeError:
+                # unhashable keys are never cached
+                entry = None
+
+            if entry is not None and entry[2] is not None and entry[2] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            self._order.touch(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def put(
+        self, key: Hashable, value: Any, expiry_policy: Optional[ExpiryPolicy] = None,
+        generation: Optional[int] = None
+    ):
+        """
+        Stores the value, read from the cluster.
+
+        :param key: near cache key,
+        :param value: decoded value,
+        :param expiry_policy: (optional) expiry policy, the value was read
+         with (see :py:meth:`~pygridgain.cache.Cache.with_expire_policy`).
+         The entry should outlive the cluster entry neither under it, nor
+         under the configured one,
+        :param generation: (optional) :py:attr:`generation`, taken before
+         the value was read. The value is not stored if any invalidation
+         happened since then.
+        """
+        ttl = self.ttl
+        for policy_ttl in (self._policy_ttl, expiry_policy_ttl(expiry_policy)):
+            if policy_ttl is not None:
+                if policy_ttl <= 0:
+                    return
+                ttl = policy_ttl if ttl is None else min(ttl, policy_ttl)
+
+        try:
+            hash(key)
+        except TypeError:
+            return
+
+        size = _estimate_size(key) + _estimate_size(value)
+        if self.max_memory is not None and size > self.max_memory:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            # make room before adding, so the new entry is not the victim
+            while len(self._entries) >= self.max_entries or (
+                self.max_memory is not None and self._memory + size > self.max_memory
+            ):
+                self._remove(self._order.victim())
+                self.evictions += 1
+
+            self._entries[key] = [value, size, time.monotonic() + ttl if ttl else None]
+            self._order.add(key)
+            self._memory += size
+
+    def invalidate(self, keys: Iterable[Hashable]):
+        """
+        Drops the given keys.
+
+        :param keys: near cache keys.
+        """
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                try:
+                    found = key in self._entries
+                except TypeError:
+                    continue
+                if found:
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self):
+        """
+        Drops all the entries.
+        """
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._order.clear()
+            self._memory = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._order.remove(key)
+        self._memory -= entry[1]
+
+    def stats(self) -> dict:
+        """
+        Near cache statistics.
+
+        :return: dict with the number of entries (`size`), their estimated
+         size in bytes (`memory`), `hits`, `misses`, `hit_ratio`, and the
+         numbers of entries, dropped by `evictions`, `expirations`
+         and `invalidations`.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'memory': self._memory,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
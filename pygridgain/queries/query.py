@@ -19,6 +19,7 @@ import inspect
 import logging
 import time
 from io import SEEK_CUR
+from threading import Lock
 
 import attr
 
@@ -51,14 +52,17 @@ def query_perform(query_struct, conn, post_process_fun=None, **kwargs):
 
 
 _QUERY_COUNTER = 0
+_QUERY_COUNTER_LOCK = Lock()
 
 
 def _get_query_id():
     global _QUERY_COUNTER
-    if _QUERY_COUNTER >= MAX_LONG:
-        return 0
-    _QUERY_COUNTER += 1
-    return _QUERY_COUNTER
+    # query IDs must be unique per connection, which may be shared by threads
+    with _QUERY_COUNTER_LOCK:
+        if _QUERY_COUNTER >= MAX_LONG:
+            return 0
+        _QUERY_COUNTER += 1
+        return _QUERY_COUNTER
 
 
 _OP_CODES = {code: name for name, code in inspect.getmembers(op_codes) if name.startswith('OP_')}
@@ -159,18 +163,27 @@ class Query:
 
             with BinaryStream(conn.client) as stream:
                 self.from_python(stream, query_params)
-                response_data = conn.request(stream.getvalue())
+                # the request is sent before the stream is closed, no need to copy it
+                response_data = conn.request(stream.getbuffer(), query_id=self.query_id)
 
             response_struct = self.response_type(protocol_context=conn.protocol_context,
                                                  following=response_config, **kwargs)
 
-            with BinaryStream(conn.client, response_data) as stream:
-                response_ctype = response_struct.parse(stream)
-                response = stream.read_ctype(response_ctype, direction=READ_BACKWARD)
-
-            result = self.__post_process_response(conn, response_struct, response)
-            if result.status == 0:
-                result.value = response_struct.to_python(response)
+            direct_decode = self.__use_direct_decode(conn, response_struct)
+            try:
+                with BinaryStream(conn.client, response_data) as stream:
+                    if direct_decode:
+                        response, value = response_struct.decode(stream)
+                    else:
+                        response_ctype = response_struct.parse(stream)
+                        response = stream.read_ctype(response_ctype, direction=READ_BACKWARD)
+
+                result = self.__post_process_response(conn, response_struct, response)
+                if result.status == 0:
+                    result.value = value if direct_decode else response_struct.to_python(response, client=conn.client)
+            finally:
+                # the response is decoded, so its buffer can be reused
+                conn.release_buffer(response_data)
             self._on_query_finished(conn, result=result)
             return result
         except Exception as e:
@@ -202,19 +215,31 @@ class Query:
             response_struct = self.response_type(protocol_context=conn.protocol_context,
                                                  following=response_config, **kwargs)
 
+            direct_decode = self.__use_direct_decode(conn, response_struct)
             with AioBinaryStream(conn.client, data) as stream:
-                response_ctype = await response_struct.parse_async(stream)
-                response = stream.read_ctype(response_ctype, direction=READ_BACKWARD)
+                if direct_decode:
+                    response, value = await response_struct.decode_async(stream)
+                else:
+                    response_ctype = await response_struct.parse_async(stream)
+                    response = stream.read_ctype(response_ctype, direction=READ_BACKWARD)
 
             result = self.__post_process_response(conn, response_struct, response)
             if result.status == 0:
-                result.value = await response_struct.to_python_async(response)
+                if not direct_decode:
+                    value = await response_struct.to_python_async(response, client=conn.client)
+                result.value = value
             self._on_query_finished(conn, result=result)
             return result
         except Exception as e:
             self._on_query_finished(conn, err=e)
             raise e
 
+    @staticmethod
+    def __use_direct_decode(conn, response_struct):
+        if response_struct.requires_direct_decode():
+            return True
+        return conn.client.direct_decode and response_struct.supports_direct_decode()
+
     @staticmethod
     def __post_process_response(conn, response_struct, response):
         if getattr(response, 'flags', False) & RHF_TOPOLOGY_CHANGED:
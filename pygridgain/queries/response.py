@@ -20,10 +20,13 @@ import attr
 from collections import OrderedDict
 import ctypes
 
+from pygridgain.columnar import decode_columns
 from pygridgain.connection.protocol_context import ProtocolContext
 from pygridgain.constants import RHF_TOPOLOGY_CHANGED, RHF_ERROR
 from pygridgain.datatypes import AnyDataObject, Bool, Int, Long, String, StringArray, Struct
 from pygridgain.datatypes.binary import body_struct, enum_struct, schema_struct
+from pygridgain.datatypes.decoder import DirectDecoder, UnresolvedBinaryType
+from pygridgain.datatypes.layout_cache import build_layout
 from pygridgain.queries.op_codes import OP_SUCCESS
 from pygridgain.stream import READ_BACKWARD
 
@@ -93,14 +96,7 @@ class Response:
         return not has_error, init_pos, header_class, fields
 
     def __build_response_class(self, stream, init_pos, header_class, fields):
-        response_class = type(
-            self._response_class_name,
-            (header_class,),
-            {
-                '_pack_': 1,
-                '_fields_': fields,
-            }
-        )
+        response_class = build_layout(self._response_class_name, fields, base=header_class)
 
         stream.seek(init_pos + ctypes.sizeof(response_class))
         return response_class
@@ -119,6 +115,57 @@ class Response:
 
         return self.__build_response_class(stream, init_pos, header_class, fields)
 
+    def supports_direct_decode(self) -> bool:
+        """
+        Checks whether the response can be decoded with :meth:`decode`.
+        """
+        return all(DirectDecoder.supports(ignite_type) for _, ignite_type in self.following)
+
+    def requires_direct_decode(self) -> bool:
+        """
+        Checks whether the response can be decoded with :meth:`decode` only.
+        """
+        return False
+
+    def decode(self, stream):
+        """
+        Single-pass alternative to `parse`, `read_ctype` and `to_python`.
+
+        :param stream: binary stream, positioned at the start of the response,
+        :return: tuple of the response header (ctypes object) and the Python
+         value of the response body (None in case of an error).
+        """
+        return self.__decode(stream, DirectDecoder(stream.getbuffer(), stream.client))
+
+    async def decode_async(self, stream):
+        init_pos = stream.tell()
+        decoder = DirectDecoder(stream.getbuffer(), stream.client, aio=True)
+        while True:
+            try:
+                return self.__decode(stream, decoder)
+            except UnresolvedBinaryType as e:
+                await stream.client.query_binary_type(e.type_id, e.schema_id)
+                stream.seek(init_pos)
+
+    def __decode(self, stream, decoder):
+        success, init_pos, header_class, fields = self.__parse_header(stream)
+        response_class = self.__build_response_class(stream, init_pos, header_class, fields)
+        response = stream.read_ctype(response_class, position=init_pos)
+
+        value = None
+        if success:
+            value = self._decode_success(decoder, stream.tell())
+        return response, value
+
+    def _decode_success(self, decoder, pos: int):
+        if not self.following:
+            return None
+
+        result = OrderedDict()
+        for name, ignite_type in self.following:
+            result[name], pos = decoder.decode(ignite_type, pos)
+        return result
+
     def _parse_success(self, stream, fields: list):
         for name, ignite_type in self.following:
             c_type = ignite_type.parse(stream)
@@ -199,6 +246,28 @@ class SQLResponse(Response):
 
         self.__body_class_post_process(body_class, fields, data_fields)
 
+    def supports_direct_decode(self) -> bool:
+        return True
+
+    def _decode_success(self, decoder, pos: int):
+        body, pos = decoder.decode(self.__create_body_struct(), pos)
+        field_count = len(body['fields']) if self.include_field_names else body['field_count']
+
+        data = []
+        for _ in range(body['row_count']):
+            row = []
+            for _ in range(field_count):
+                value, pos = decoder.decode_any(pos)
+                row.append(value)
+            data.append(row)
+
+        more, _ = decoder.decode(Bool, pos)
+        result = {'more': more, 'data': data}
+        for name in ('fields', 'field_count', 'cursor'):
+            if name in body:
+                result[name] = body[name]
+        return result
+
     def __create_body_struct(self):
         following = [self.fields_or_field_count(), ('row_count', Int)]
         if self.has_cursor:
@@ -212,26 +281,12 @@ class SQLResponse(Response):
 
     @staticmethod
     def __row_post_process(idx, row_fields, data_fields):
-        row_class = type(
-            'SQLResponseRow',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': row_fields,
-            }
-        )
+        row_class = build_layout('SQLResponseRow', row_fields)
         data_fields.append((f'row_{idx}', row_class))
 
     @staticmethod
     def __body_class_post_process(body_class, fields, data_fields):
-        data_class = type(
-            'SQLResponseData',
-            (ctypes.LittleEndianStructure,),
-            {
-                '_pack_': 1,
-                '_fields_': data_fields,
-            }
-        )
+        data_class = build_layout('SQLResponseData', data_fields)
         fields += body_class._fields_ + [
             ('data', data_class),
             ('more', ctypes.c_byte),
@@ -287,9 +342,47 @@ class SQLResponse(Response):
         return result
 
 
+@attr.s
+class SQLColumnsResponse(SQLResponse):
+    """
+    SQL fields query response (or the next page of it) with the rows
+    decoded into columns, see :mod:`pygridgain.columnar`. Only the direct
+    decoding is supported.
+    """
+    #: field names or indexes, known for the next pages of the result
+    field_names = attr.ib(type=list, default=None)
+    _response_class_name = 'SQLColumnsResponse'
+
+    def requires_direct_decode(self) -> bool:
+        return True
+
+    def _decode_success(self, decoder, pos: int):
+        following = [('row_count', Int)]
+        if self.field_names is None:
+            following.insert(0, self.fields_or_field_count())
+            if self.has_cursor:
+                following.insert(0, ('cursor', Long))
+        body, pos = decoder.decode(Struct(following), pos)
+
+        names = self.field_names
+        if names is None:
+            names = body['fields'] if self.include_field_names else list(range(body['field_count']))
+
+        columns, pos = decode_columns(decoder, names, body['row_count'], pos)
+        more, _ = decoder.decode(Bool, pos)
+        result = {'more': more, 'data': columns}
+        for name in ('fields', 'field_count', 'cursor'):
+            if name in body:
+                result[name] = body[name]
+        return result
+
+
 class BinaryTypeResponse(Response):
     _response_class_name = 'GetBinaryTypeResponse'
 
+    def supports_direct_decode(self) -> bool:
+        return False
+
     def _parse_success(self, stream, fields: list):
         type_exists = self.__process_type_exists(stream, fields)
 
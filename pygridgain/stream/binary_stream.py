@@ -14,7 +14,7 @@
 # limitations under the License.
 #
 import ctypes
-from io import BytesIO
+from io import SEEK_CUR, SEEK_END, SEEK_SET
 from typing import Union, Optional
 
 import pygridgain
@@ -24,10 +24,36 @@ READ_FORWARD = 0
 READ_BACKWARD = 1
 
 
+def _as_bytes_view(buf) -> memoryview:
+    view = memoryview(buf)
+    # ctypes objects export their own formats (and may be 0-dimensional),
+    # packed structures even report the 'B' format with a wider item
+    if view.ndim != 1 or view.itemsize != 1 or view.format != 'B':
+        view = view.cast('B')
+    return view
+
+
 class BinaryStreamBase:
+    """
+    Binary stream over a memory buffer.
+
+    A stream, created without a buffer, writes into a growable `bytearray`.
+    A stream, created over a buffer, reads it in place: ctypes objects are
+    mapped onto the writable buffers with no copying, so the buffer must
+    outlive the objects, read from the stream. The buffer is copied only
+    if the stream is written to.
+    """
     def __init__(self, client, buf=None):
         self.client = client
-        self.stream = BytesIO(buf) if buf else BytesIO()
+        if buf:
+            self._data = None
+            self._view = _as_bytes_view(buf)
+            self._size = len(self._view)
+        else:
+            self._data = bytearray()
+            self._view = None
+            self._size = 0
+        self._pos = 0
         self._buffer = None
 
     @property
@@ -39,9 +65,12 @@ class BinaryStreamBase:
         self.client.compact_footer = value
 
     def read(self, size):
-        buf = bytearray(size)
-        self.stream.readinto(buf)
-        return buf
+        start = self._pos
+        end = min(start + size, self._size)
+        self._pos = max(end, start)
+        if self._data is None:
+            return self._view[start:end]
+        return bytes(self._data[start:end])
 
     def read_ctype(self, ctype_class, position=None, direction=READ_FORWARD):
         ctype_len = ctypes.sizeof(ctype_class)
@@ -52,32 +81,72 @@ class BinaryStreamBase:
             init_position = self.tell()
 
         if direction == READ_FORWARD:
-            start, end = init_position, init_position + ctype_len
+            start = init_position
         else:
-            start, end = init_position - ctype_len, init_position
+            start = init_position - ctype_len
 
-        with self.getbuffer()[start:end] as buf:
+        if self._data is None and not self._view.readonly:
+            return ctype_class.from_buffer(self._view, start)
+
+        with self.getbuffer()[start:start + ctype_len] as buf:
             return ctype_class.from_buffer_copy(buf)
 
     def write(self, buf):
-        self._release_buffer()
-        return self.stream.write(buf)
+        if self._data is None:
+            # copy on write, the original buffer is not changed
+            self._data = bytearray(self._view)
+            self._view = None
+        if self._buffer is not None:
+            self._release_buffer()
+
+        data, start = self._data, self._pos
+        if start >= len(data):
+            if start > len(data):
+                data.extend(bytes(start - len(data)))
+            # appending takes any buffer without an intermediate copy
+            data += buf
+            size = len(data) - start
+        else:
+            # overwriting the headers, reserved before
+            size = memoryview(buf).nbytes
+            data[start:start + size] = buf
 
-    def tell(self):
-        return self.stream.tell()
+        self._pos = start + size
+        self._size = len(data)
+        return size
 
-    def seek(self, *args, **kwargs):
-        return self.stream.seek(*args, **kwargs)
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=SEEK_SET):
+        if whence == SEEK_CUR:
+            offset += self._pos
+        elif whence == SEEK_END:
+            offset += self._size
+        if offset < 0:
+            raise ValueError(f'negative seek value {offset}')
+        self._pos = offset
+        return offset
 
     def getbuffer(self):
-        if self._buffer:
-            return self._buffer
+        """
+        Memory view of the stream contents. It is released on the next
+        write and when the stream is closed.
+        """
+        if self._data is None:
+            return self._view
 
-        self._buffer = self.stream.getbuffer()
+        if self._buffer is None:
+            self._buffer = memoryview(self._data)
         return self._buffer
 
     def getvalue(self):
-        return self.stream.getvalue()
+        """
+        Copy of the stream contents.
+        """
+        if self._data is None:
+            return bytes(self._view)
+        return bytes(self._data)
 
     def slice(self, start=-1, offset=0):
         start = start if start >= 0 else self.tell()
@@ -89,7 +158,8 @@ class BinaryStreamBase:
             return ignite_utils.hashcode(buf)
 
     def _release_buffer(self):
-        if self._buffer:
+        # a growing bytearray may not be exported
+        if self._buffer is not None:
             self._buffer.release()
             self._buffer = None
 
@@ -98,7 +168,6 @@ class BinaryStreamBase:
 
     def __exit__(self, exc_type, exc_value, traceback):
         self._release_buffer()
-        self.stream.close()
 
 
 class BinaryStream(BinaryStreamBase):
@@ -108,12 +177,16 @@ class BinaryStream(BinaryStreamBase):
     def __init__(self, client: 'pygridgain.Client', buf: Optional[Union[bytes, bytearray, memoryview]] = None):
         """
         :param client: Client instance, required.
-        :param buf: Buffer, optional parameter. If not passed, creates empty BytesIO.
+        :param buf: Buffer, optional parameter. If not passed, creates empty bytearray.
         """
         super().__init__(client, buf)
 
     def get_dataclass(self, header):
         result = self.client.query_binary_type(header.type_id, header.schema_id)
+        if result in self.client._cached_classes:
+            # the fields are parsed by the field types of the schema
+            self.client._confirm_binary_type(result)
+            result = self.client.query_binary_type(header.type_id, header.schema_id)
         if not result:
             raise RuntimeError('Binary type is not registered')
         return result
@@ -131,12 +204,16 @@ class AioBinaryStream(BinaryStreamBase):
         Initialize binary stream around buffers.
 
         :param client: AioClient instance, required.
-        :param buf: Buffer, optional parameter. If not passed, creates empty BytesIO.
+        :param buf: Buffer, optional parameter. If not passed, creates empty bytearray.
         """
         super().__init__(client, buf)
 
     async def get_dataclass(self, header):
         result = await self.client.query_binary_type(header.type_id, header.schema_id)
+        if result in self.client._cached_classes:
+            # the fields are parsed by the field types of the schema
+            await self.client._confirm_binary_type(result)
+            result = await self.client.query_binary_type(header.type_id, header.schema_id)
         if not result:
             raise RuntimeError('Binary type is not registered')
         return result
@@ -49,6 +49,19 @@ class _BaseTransaction:
         self.isolation = _validate_int_enum_param(isolation, TransactionIsolation)
         self.timeout = _validate_timeout(timeout)
         self.label, self.closed = _validate_label(label), False
+        self._conn = None
+
+    def _pin(self, result, conn):
+        # the pooled connection is not evicted until the transaction ends
+        if result.status == 0:
+            self._conn = conn
+            conn.pin()
+        return result
+
+    def _unpin(self):
+        if self._conn is not None:
+            self._conn.unpin()
+            self._conn = None
 
 
 class Transaction(_BaseTransaction):
@@ -66,7 +79,11 @@ class Transaction(_BaseTransaction):
         """
         if not self.closed:
             self.closed = True
-            return self.__end_tx(True)
+            try:
+                return self.__end_tx(True)
+            finally:
+                # writes, made in the transaction, become visible to the others
+                self.client._clear_near_caches()
 
     def rollback(self) -> None:
         """
@@ -91,11 +108,14 @@ class Transaction(_BaseTransaction):
     @status_to_exception(CacheError)
     def __start_tx(self):
         conn = self.client.random_node
-        return tx_start(conn, self.concurrency, self.isolation, self.timeout, self.label)
+        return self._pin(tx_start(conn, self.concurrency, self.isolation, self.timeout, self.label), conn)
 
     @status_to_exception(CacheError)
     def __end_tx(self, committed):
-        return tx_end(self.tx_id, committed)
+        try:
+            return tx_end(self.tx_id, committed)
+        finally:
+            self._unpin()
 
 
 class AioTransaction(_BaseTransaction):
@@ -115,7 +135,11 @@ class AioTransaction(_BaseTransaction):
         """
         if not self.closed:
             self.closed = True
-            return await self.__end_tx(True)
+            try:
+                return await self.__end_tx(True)
+            finally:
+                # writes, made in the transaction, become visible to the others
+                self.client._clear_near_caches()
 
     async def rollback(self) -> None:
         """
@@ -142,8 +166,11 @@ class AioTransaction(_BaseTransaction):
     @status_to_exception(CacheError)
     async def __start_tx(self):
         conn = await self.client.random_node()
-        return await tx_start_async(conn, self.concurrency, self.isolation, self.timeout, self.label)
+        return self._pin(await tx_start_async(conn, self.concurrency, self.isolation, self.timeout, self.label), conn)
 
     @status_to_exception(CacheError)
     async def __end_tx(self, committed):
-        return await tx_end_async(self.tx_id, committed)
+        try:
+            return await tx_end_async(self.tx_id, committed)
+        finally:
+            self._unpin()
@@ -166,6 +166,45 @@ def __perform_operations_on_primitive_key(client, cache, key, grid_idx):
     return inner_async() if isinstance(client, AioClient) else inner()
 
 
+BATCH_KEYS = {1: 1, 2: 2, 3: 3, 4: 1, 6: 2}
+
+
+@pytest.mark.parametrize("op_name", ['get_all', 'put_all', 'contains_keys', 'clear_keys', 'remove_keys'])
+def test_batch_operation_is_split_by_primary_nodes(request, op_name, client):
+    cache = client.get_or_create_cache(request.node.name)
+    try:
+        for key, grid_idx in BATCH_KEYS.items():
+            cache.put(key, key)
+            wait_for_affinity_distribution(cache, key, grid_idx)
+        requests.clear()
+
+        op = getattr(cache, op_name)
+        op({key: key for key in BATCH_KEYS} if op_name == 'put_all' else list(BATCH_KEYS))
+
+        assert sorted(requests) == sorted(set(BATCH_KEYS.values()))
+    finally:
+        cache.destroy()
+
+
+@pytest.mark.asyncio
+async def test_batch_operation_is_split_by_primary_nodes_async(request, async_client):
+    cache = await async_client.get_or_create_cache(request.node.name)
+    try:
+        for key, grid_idx in BATCH_KEYS.items():
+            await cache.put(key, key)
+            await wait_for_affinity_distribution_async(cache, key, grid_idx)
+        requests.clear()
+
+        assert await cache.get_all(list(BATCH_KEYS)) == {key: key for key in BATCH_KEYS}
+        assert sorted(requests) == sorted(set(BATCH_KEYS.values()))
+
+        requests.clear()
+        assert await cache.contains_keys(list(BATCH_KEYS))
+        assert sorted(requests) == sorted(set(BATCH_KEYS.values()))
+    finally:
+        await cache.destroy()
+
+
 @pytest.mark.skip(reason="GG-25823: Custom key objects are not supported yet")
 def test_cache_operation_on_complex_key_routes_request_to_primary_node():
     pass
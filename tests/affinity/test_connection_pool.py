@@ -0,0 +1,86 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pygridgain import Client, AioClient
+from tests.affinity.conftest import CLIENT_SOCKET_TIMEOUT
+
+
+@pytest.fixture
+def pooled_client(connection_param):
+    client = Client(partition_aware=True, timeout=CLIENT_SOCKET_TIMEOUT, pool_size=(2, 4))
+    try:
+        client.connect(connection_param)
+        yield client
+    finally:
+        client.close()
+
+
+@pytest.fixture
+async def async_pooled_client(connection_param, event_loop):
+    client = AioClient(partition_aware=True, pool_size=(2, 4))
+    try:
+        await client.connect(connection_param)
+        yield client
+    finally:
+        await client.close()
+
+
+def test_pooled_client_multithreaded(request, pooled_client):
+    cache = pooled_client.get_or_create_cache(request.node.name)
+    try:
+        def put_get(key):
+            cache.put(key, key * 2)
+            return cache.get(key)
+
+        with ThreadPoolExecutor(16) as executor:
+            results = list(executor.map(put_get, range(500)))
+
+        assert results == [key * 2 for key in range(500)]
+
+        metrics = pooled_client.pool_metrics()
+        assert len(metrics) == 3
+        for node_metrics in metrics:
+            assert 2 <= node_metrics['size'] <= 4
+            assert node_metrics['node_uuid'] is not None
+            assert node_metrics['pending_requests'] == 0
+        assert sum(m['checkouts'] for m in metrics) >= 1000
+    finally:
+        cache.destroy()
+
+
+def test_pooled_client_best_node(request, pooled_client):
+    cache = pooled_client.get_or_create_cache(request.node.name)
+    try:
+        cache.put(1, 1)
+        conn = pooled_client.get_best_node(cache, 1)
+        primary = next(n for n in pooled_client._nodes if n.uuid == conn.uuid)
+        assert conn in pooled_client._pools[primary].connections
+    finally:
+        cache.destroy()
+
+
+@pytest.mark.asyncio
+async def test_async_pooled_client(request, async_pooled_client):
+    cache = await async_pooled_client.get_or_create_cache(request.node.name)
+    try:
+        await cache.put_all({key: key for key in range(100)})
+        assert await cache.get_all(list(range(100))) == {key: key for key in range(100)}
+        assert all(m['size'] >= 2 for m in async_pooled_client.pool_metrics())
+    finally:
+        await cache.destroy()
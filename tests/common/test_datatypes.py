@@ -20,7 +20,7 @@ import decimal
 import pytest
 import uuid
 
-from pygridgain import GenericObjectMeta
+from pygridgain import Client, GenericObjectMeta
 from pygridgain.datatypes import (
     ByteObject, IntObject, FloatObject, CharObject, ShortObject, BoolObject, ByteArrayObject, IntArrayObject,
     ShortArrayObject, FloatArrayObject, BoolArrayObject, CharArrayObject, TimestampObject, String, BinaryEnumObject,
@@ -166,6 +166,34 @@ async def test_put_get_data_async(async_cache, value, value_hint):
     assert await async_cache.get('my_key') == value
 
 
+@pytest.fixture(scope='module')
+def direct_decode_client():
+    client = Client(direct_decode=True)
+    try:
+        client.connect('127.0.0.1', 10801)
+        yield client
+    finally:
+        client.close()
+
+
+@pytest.fixture
+def direct_decode_cache(direct_decode_client):
+    cache = direct_decode_client.get_or_create_cache('my_bucket')
+    try:
+        yield cache
+    finally:
+        cache.destroy()
+
+
+@pytest.mark.parametrize(
+    'value, value_hint',
+    put_get_data_params
+)
+def test_put_get_data_direct_decode(direct_decode_cache, value, value_hint):
+    direct_decode_cache.put('my_key', value, value_hint=value_hint)
+    assert direct_decode_cache.get('my_key') == value
+
+
 nested_array_objects_params = [
     [
         (ObjectArrayObject.OBJECT, [
@@ -0,0 +1,101 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+from datetime import timedelta
+
+import pytest
+
+from pygridgain.datatypes import ExpiryPolicy
+from pygridgain.datatypes.cache_config import CacheAtomicityMode
+from pygridgain.datatypes.prop_codes import PROP_NAME, PROP_CACHE_ATOMICITY_MODE, PROP_EXPIRY_POLICY
+
+
+def test_near_cache(cache):
+    cache.with_near_cache(max_entries=100)
+    cache.put_all({key: key for key in range(10)})
+
+    assert cache.get(1) == 1
+    assert cache.get(1) == 1
+    assert cache.get_all([1, 2, 3]) == {1: 1, 2: 2, 3: 3}
+    stats = cache.near_cache.stats()
+    assert (stats['hits'], stats['misses']) == (2, 3)
+
+    cache.put(1, 100)
+    assert cache.get(1) == 100
+    cache.remove_keys([2])
+    assert cache.get_all([1, 2]) == {1: 100}
+    cache.replace(1, 200)
+    assert cache.get(1) == 200
+
+    cache.clear()
+    assert len(cache.near_cache) == 0
+    assert cache.get(1) is None
+
+
+def test_near_cache_in_transaction(client):
+    cache = client.get_or_create_cache({
+        PROP_NAME: 'tx_near_cache',
+        PROP_CACHE_ATOMICITY_MODE: CacheAtomicityMode.TRANSACTIONAL
+    }).with_near_cache()
+    try:
+        cache.put(1, 1)
+        assert cache.get(1) == 1
+
+        with client.tx_start() as tx:
+            cache.put(1, 2)
+            assert cache.get(1) == 2
+            tx.commit()
+
+        assert len(cache.near_cache) == 0
+        assert cache.get(1) == 2
+    finally:
+        cache.destroy()
+
+
+@pytest.mark.skip_if_no_expiry_policy
+def test_near_cache_with_configured_expiry_policy(client):
+    cache = client.get_or_create_cache({
+        PROP_NAME: 'expiring_near_cache',
+        PROP_EXPIRY_POLICY: ExpiryPolicy(create=timedelta(milliseconds=500)),
+    }).with_near_cache()
+    try:
+        cache.put(1, 1)
+        assert cache.get(1) == 1
+        assert len(cache.near_cache) == 1
+
+        time.sleep(1)
+        # expired both in the cluster and in the near cache
+        assert cache.get(1) is None
+        assert cache.near_cache.stats()['expirations'] == 1
+    finally:
+        cache.destroy()
+
+
+@pytest.mark.asyncio
+async def test_near_cache_async(async_cache):
+    await async_cache.with_near_cache(max_entries=100)
+    await async_cache.put_all({key: key for key in range(10)})
+
+    assert await async_cache.get(1) == 1
+    assert await async_cache.get(1) == 1
+    assert await async_cache.get_all([1, 2, 3]) == {1: 1, 2: 2, 3: 3}
+    stats = async_cache.near_cache.stats()
+    assert (stats['hits'], stats['misses']) == (2, 3)
+
+    await async_cache.put(1, 100)
+    assert await async_cache.get(1) == 100
+    await async_cache.remove_all()
+    assert await async_cache.get(1) is None
@@ -111,22 +111,33 @@ def cache_scan_data():
 
 
 @pytest.mark.parametrize('page_size', range(1, 17, 5))
-def test_cache_scan(cache, cache_scan_data, page_size):
+@pytest.mark.parametrize('prefetch', [0, 2])
+def test_cache_scan(cache, cache_scan_data, page_size, prefetch):
     cache.put_all(cache_scan_data)
 
-    with cache.scan(page_size=page_size) as cursor:
+    with cache.scan(page_size=page_size, prefetch=prefetch) as cursor:
         assert {k: v for k, v in cursor} == cache_scan_data
 
 
 @pytest.mark.parametrize('page_size', range(1, 17, 5))
+@pytest.mark.parametrize('prefetch', [0, 2])
 @pytest.mark.asyncio
-async def test_cache_scan_async(async_cache, cache_scan_data, page_size):
+async def test_cache_scan_async(async_cache, cache_scan_data, page_size, prefetch):
     await async_cache.put_all(cache_scan_data)
 
-    async with async_cache.scan(page_size=page_size) as cursor:
+    async with async_cache.scan(page_size=page_size, prefetch=prefetch) as cursor:
         assert {k: v async for k, v in cursor} == cache_scan_data
 
 
+def test_prefetching_cursor_closed(cache, test_objects_data):
+    cache.put_all(test_objects_data)
+
+    with cache.scan(1, prefetch=2) as cursor:
+        next(cursor)
+
+    __check_cursor_closed(cursor)
+
+
 def test_uninitialized_cursor(cache, test_objects_data):
     cache.put_all(test_objects_data)
 
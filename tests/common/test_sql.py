@@ -132,6 +132,29 @@ async def test_sql_fields_async(async_client, async_student_table_fixture, page_
         await cursor.close()
 
 
+def __check_student_columns(columns):
+    assert list(columns) == ['ID', 'FIRST_NAME', 'LAST_NAME', 'GRADE']
+    assert columns['ID'].to_list() == list(range(len(student_table_data)))
+    assert columns['FIRST_NAME'].to_list() == [row[0] for row in student_table_data]
+    assert columns['GRADE'].to_list() == [row[2] for row in student_table_data]
+    assert columns['GRADE'].dtype == 'int32'
+
+
+@pytest.mark.parametrize('page_size', range(1, 6, 2))
+def test_sql_fields_as_columns(client, student_table_fixture, page_size):
+    with client.sql(student_table_select_query, page_size=page_size, include_field_names=True,
+                    as_columns=True) as cursor:
+        __check_student_columns(cursor.fetch_columns())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('page_size', range(1, 6, 2))
+async def test_sql_fields_as_columns_async(async_client, async_student_table_fixture, page_size):
+    cursor = async_client.sql(student_table_select_query, page_size=page_size, include_field_names=True,
+                              as_columns=True)
+    __check_student_columns(await cursor.fetch_columns())
+
+
 multipage_fields = ["id", "abc", "ghi", "def", "jkl", "prs", "mno", "tuw", "zyz", "abc1", "def1", "jkl1", "prs1"]
 
 
@@ -0,0 +1,197 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the client-side partition mapping: partition lookup
+table and splitting of the batch operations by primary nodes.
+"""
+import asyncio
+import threading
+import time
+import uuid
+
+import pytest
+
+from pygridgain import AioClient, Client
+from pygridgain.aio_cache import AioCache
+from pygridgain.cache import Cache
+from pygridgain.connection.bitmask_feature import BitmaskFeature
+from pygridgain.connection.protocol_context import ProtocolContext
+from pygridgain.datatypes import IntObject
+
+PARTS = 8
+
+
+class FakeNode:
+    def __init__(self, node_uuid):
+        self.uuid = node_uuid
+        self.alive = True
+
+
+def _with_fake_nodes(client):
+    client.protocol_context = ProtocolContext((1, 7, 1), BitmaskFeature.all_supported())
+    client._nodes = [FakeNode(uuid.uuid4()) for _ in range(3)]
+    return client
+
+
+def _cache_mapping(node_mapping):
+    return {
+        'is_applicable': True,
+        'cache_config': {},
+        'node_mapping': node_mapping,
+        'number_of_partitions': PARTS,
+    }
+
+
+def _map_cache(client, cache):
+    node_mapping = {
+        client._nodes[0].uuid: {0, 1, 2},
+        client._nodes[1].uuid: {3, 4, 5},
+        client._nodes[2].uuid: {6, 7},
+    }
+    client._update_affinity({
+        'version': client.affinity_version,
+        'partition_mapping': {cache.cache_id: _cache_mapping(node_mapping)},
+    })
+
+
+def _all_on_last_node(client, cache):
+    """ Mapping after the topology change: all the partitions moved to the last node. """
+    return {
+        'version': (1, 0),
+        'partition_mapping': {cache.cache_id: _cache_mapping({client._nodes[2].uuid: set(range(PARTS))})},
+    }
+
+
+@pytest.fixture
+def client():
+    return _with_fake_nodes(Client(partition_aware=True))
+
+
+@pytest.fixture
+def cache(client):
+    cache = Cache(client, 'test-cache')
+    _map_cache(client, cache)
+    return cache
+
+
+def _expected_node(client, key):
+    return client._nodes[[0, 0, 0, 1, 1, 1, 2, 2][key % PARTS]]
+
+
+def test_partition_table(client, cache):
+    table = client._cache_partition_mapping(cache.cache_id)['partition_table']
+    assert table == [client._nodes[i].uuid for i in (0, 0, 0, 1, 1, 1, 2, 2)]
+
+
+def test_node_by_hashcode(client, cache):
+    for key in range(PARTS * 2):
+        assert client._get_node_by_hashcode(cache.cache_id, key, PARTS) is _expected_node(client, key)
+
+
+def test_node_by_hashcode_skips_dead_node(client, cache):
+    client._nodes[1].alive = False
+    assert client._get_node_by_hashcode(cache.cache_id, 3, PARTS) is None
+
+
+def test_node_uuid_change_is_noticed(client, cache):
+    assert client._get_node_by_hashcode(cache.cache_id, 0, PARTS) is client._nodes[0]
+
+    # node 0 restarted with the new ID, and node 1 took over its partitions
+    old_uuid = client._nodes[0].uuid
+    client._nodes[0].uuid = uuid.uuid4()
+    client._nodes[1].uuid = old_uuid
+    client._invalidate_nodes_by_uuid()
+
+    assert client._get_node_by_hashcode(cache.cache_id, 0, PARTS) is client._nodes[1]
+
+
+def test_group_by_node(client, cache):
+    keys = list(range(20)) + [(100, IntObject)]
+    batches = client._group_by_node(cache, keys)
+
+    assert sorted(k for _, node_keys in batches for k in node_keys if not isinstance(k, tuple)) == list(range(20))
+    assert len(batches) == 3
+    for conn, node_keys in batches:
+        for key in node_keys:
+            key = key[0] if isinstance(key, tuple) else key
+            assert conn is _expected_node(client, IntObject.hashcode(key))
+
+
+def test_outdated_mapping_is_refreshed_in_background(client, cache):
+    key = next(k for k in range(100) if client.get_best_node(cache, k) is not client._nodes[2])
+    old_node = client.get_best_node(cache, key)
+    release = threading.Event()
+
+    def get_affinity(conn, caches):
+        assert threading.current_thread() is not threading.main_thread()
+        release.wait(5)
+        return _all_on_last_node(client, cache)
+
+    client._get_affinity = get_affinity
+    client.affinity_version = (1, 0)
+
+    # the old mapping is used until the new one arrives
+    assert client.get_best_node(cache, key) is old_node
+    assert client.affinity_metrics()['refresh_in_progress']
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while client.affinity_metrics()['refresh_in_progress'] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert client.get_best_node(cache, key) is client._nodes[2]
+    metrics = client.affinity_metrics()
+    assert (metrics['refreshes'], metrics['failed_refreshes']) == (1, 0)
+    assert metrics['last_refresh_latency'] > 0
+
+
+def test_new_cache_mapping_is_requested_at_once(client):
+    cache = Cache(client, 'new-cache')
+    client._get_affinity = lambda conn, caches: _all_on_last_node(client, cache)
+
+    assert client.get_best_node(cache, 1) is client._nodes[2]
+    assert client.affinity_metrics()['refreshes'] == 1
+    assert not client.affinity_metrics()['refresh_in_progress']
+
+
+def test_aio_outdated_mapping_is_refreshed_in_background():
+    async def inner():
+        client = _with_fake_nodes(AioClient(partition_aware=True))
+        cache = AioCache(client, 'test-cache')
+        _map_cache(client, cache)
+        release = asyncio.Event()
+
+        async def get_affinity(conn, caches):
+            await release.wait()
+            return _all_on_last_node(client, cache)
+
+        client._get_affinity = get_affinity
+        key = 0
+        while await client.get_best_node(cache, key) is client._nodes[2]:
+            key += 1
+        old_node = await client.get_best_node(cache, key)
+        client.affinity_version = (1, 0)
+
+        assert await client.get_best_node(cache, key) is old_node
+        task = client._affinity_refresh
+        assert task is not None
+
+        release.set()
+        await task
+        assert await client.get_best_node(cache, key) is client._nodes[2]
+        assert client.affinity_metrics()['refreshes'] == 1
+
+    asyncio.run(inner())
@@ -0,0 +1,105 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the pipelined asynchronous operations. The peer side
+of a socket pair plays the server node: it keeps the values of the put
+requests and answers the get requests with them. Negative keys are refused.
+"""
+import asyncio
+import struct
+
+import pytest
+
+from pygridgain.aio_cache import AioCache
+from pygridgain.exceptions import CacheError
+from pygridgain.queries.op_codes import OP_CACHE_GET, OP_CACHE_PUT
+from tests.util import FakeNode, error_response, fake_node_aio_client
+
+ERROR_STATUS = 1000
+NULL_TYPE_CODE = 101
+# sizes of the integer objects by type code
+KEY_SIZES = {3: 5, 4: 9}
+
+
+class KeyValueNode(FakeNode):
+    def __init__(self, sock):
+        self.data = {}
+        super().__init__(sock)
+
+    def respond(self, op_code, query_id, request):
+        # cache ID (i32), flags (byte)
+        key_pos = 10 + 4 + 1
+        key_end = key_pos + KEY_SIZES[request[key_pos]]
+        key = request[key_pos:key_end]
+        if int.from_bytes(key[1:], 'little', signed=True) < 0:
+            return error_response(query_id, ERROR_STATUS)
+        if op_code == OP_CACHE_PUT:
+            self.data[key] = request[key_end:]
+            return struct.pack('<qh', query_id, 0)
+        assert op_code == OP_CACHE_GET
+        return struct.pack('<qh', query_id, 0) + self.data.get(key, bytes([NULL_TYPE_CODE]))
+
+
+def _run_with_node(test, **conn_kwargs):
+    async def inner():
+        async with fake_node_aio_client(KeyValueNode, partition_aware=False, **conn_kwargs) as (client, node):
+            await test(AioCache(client, 'test'), node, client._nodes[0])
+
+    asyncio.run(inner())
+
+
+def test_batch_coalesces_requests():
+    async def test(cache, node, conn):
+        async with cache.client.batch() as batch:
+            for key in range(1000):
+                batch.submit(cache.put(key, str(key)))
+        assert (batch.requests, batch.writes) == (1000, 1)
+        assert len(node.requests) == 1000
+
+        async with cache.client.batch() as batch:
+            futures = [batch.submit(cache.get(key)) for key in range(1001)]
+        assert [fut.result() for fut in futures] == [str(key) for key in range(1000)] + [None]
+        assert batch.writes == 1
+
+        # operations outside of the batch are written one by one
+        await cache.put(1, 'one')
+        assert await cache.get(1) == 'one'
+        assert batch.requests == 1001
+
+    _run_with_node(test)
+
+
+def test_batch_mixed_operations():
+    async def test(cache, node, conn):
+        async with cache.client.batch() as batch:
+            batch.submit(cache.put(1, 'a'))
+            get_fut = batch.submit(cache.get(1))
+        # requests of one connection are sent in order of submission
+        assert get_fut.result() == 'a'
+
+    _run_with_node(test)
+
+
+def test_batch_error_is_raised():
+    async def test(cache, node, conn):
+        with pytest.raises(CacheError, match='Fail!'):
+            async with cache.client.batch() as batch:
+                ok_fut = batch.submit(cache.put(1, 'a'))
+                failed_fut = batch.submit(cache.put(-1, 'b'))
+        assert ok_fut.done() and ok_fut.exception() is None
+        assert isinstance(failed_fut.exception(), CacheError)
+
+    _run_with_node(test)
@@ -0,0 +1,75 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the write coalescing in the asynchronous connection.
+"""
+import asyncio
+
+import pytest
+
+from pygridgain import AioClient
+from pygridgain.connection import AioConnection, AioConnectionPool
+from pygridgain.exceptions import ParameterError
+from tests.test_aio_batch import _run_with_node
+
+
+def test_concurrent_requests_are_coalesced():
+    async def test(cache, node, conn):
+        await asyncio.gather(*[cache.put(key, str(key)) for key in range(100)])
+        assert await asyncio.gather(*[cache.get(key) for key in range(100)]) == [str(key) for key in range(100)]
+        assert conn.coalescing_metrics() == {'writes': 2, 'frames': 200, 'avg_frames': 100.0, 'max_frames': 100}
+
+        metrics = AioConnectionPool(conn, None).metrics()
+        assert (metrics['coalesced_writes'], metrics['coalesced_frames'], metrics['max_coalesced_frames']) == \
+            (2, 200, 100)
+
+    _run_with_node(test, coalesce_delay=0)
+
+
+def test_coalesce_delay():
+    async def test(cache, node, conn):
+        await cache.put(1, 'one')
+        assert await cache.get(1) == 'one'
+        assert conn.coalescing_metrics()['writes'] == 2
+
+    _run_with_node(test, coalesce_delay=0.01)
+
+
+def test_coalesce_size_triggers_write():
+    async def test(cache, node, conn):
+        await asyncio.gather(*[cache.put(key, 'x' * 100) for key in range(10)])
+        # every request exceeds the limit and is written at once
+        assert conn.coalescing_metrics()['max_frames'] == 1
+        assert len(node.requests) == 10
+
+    _run_with_node(test, coalesce_delay=1.0, coalesce_size=100)
+
+
+def test_coalescing_is_off_by_default():
+    async def test(cache, node, conn):
+        await asyncio.gather(*[cache.put(key, key) for key in range(10)])
+        assert conn.coalescing_metrics()['writes'] == 0
+
+    _run_with_node(test)
+
+
+@pytest.mark.parametrize('kwargs', [{'coalesce_delay': -1}, {'coalesce_size': 0}])
+def test_invalid_parameters(kwargs):
+    async def inner():
+        with pytest.raises(ParameterError):
+            AioConnection(AioClient(), 'localhost', 10800, **kwargs)
+
+    asyncio.run(inner())
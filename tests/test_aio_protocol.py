@@ -0,0 +1,74 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of splitting the received data into the response frames.
+"""
+import asyncio
+import struct
+
+import pytest
+
+from pygridgain.connection.aio_connection import BaseProtocol, RECEIVE_BUFFER_SIZE
+
+
+class FakeConnection:
+    def __init__(self):
+        self.frames = []
+
+    def process_message(self, data):
+        assert isinstance(data, memoryview)
+        self.frames.append(data)
+
+
+def _frame(i, size=8):
+    body = struct.pack('<q', i) + bytes(size - 8)
+    return struct.pack('<i', len(body)) + body
+
+
+def _feed(protocol, data, chunk_size):
+    while data:
+        buf = protocol.get_buffer(-1)
+        chunk, data = data[:min(chunk_size, len(buf))], data[min(chunk_size, len(buf)):]
+        buf[:len(chunk)] = chunk
+        protocol.buffer_updated(len(chunk))
+
+
+@pytest.fixture
+def protocol_and_conn():
+    loop = asyncio.new_event_loop()
+    handshake_fut = loop.create_future()
+    handshake_fut.set_result(None)
+    conn = FakeConnection()
+    yield BaseProtocol(conn, handshake_fut), conn
+    loop.close()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 100, 5000, RECEIVE_BUFFER_SIZE])
+def test_frames(protocol_and_conn, chunk_size):
+    protocol, conn = protocol_and_conn
+    frames = [_frame(i, size=8 + i % 50) for i in range(3000)]
+    _feed(protocol, b''.join(frames), chunk_size)
+
+    # the frames, passed on earlier, are not overwritten
+    assert [bytes(frame) for frame in conn.frames] == frames
+
+
+def test_large_frame(protocol_and_conn):
+    protocol, conn = protocol_and_conn
+    frames = [_frame(1), _frame(2, size=RECEIVE_BUFFER_SIZE * 3), _frame(3)]
+    _feed(protocol, b''.join(frames), 10000)
+
+    assert [bytes(frame) for frame in conn.frames] == frames
@@ -0,0 +1,216 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the file-backed binary type metadata cache.
+"""
+import json
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+from pygridgain import Client, GenericObjectMeta
+from pygridgain.binary_cache import BinaryMetadataCache, cluster_key
+from pygridgain.datatypes import BinaryObject, IntObject, String
+from pygridgain.stream import BinaryStream
+from pygridgain.utils import entity_id, hashcode, schema_id
+
+NODES = [('127.0.0.1', 10801), ('127.0.0.1', 10800)]
+TYPE_NAME = 'org.example.Person'
+SCHEMA = OrderedDict([('id', IntObject), ('name', String)])
+
+
+def _binary_type_result(type_name=TYPE_NAME):
+    """ `OP_GET_BINARY_TYPE` result, as it is parsed from the response. """
+    return SimpleNamespace(status=0, value={
+        'type_exists': True,
+        'type_id': entity_id(type_name),
+        'type_name': type_name,
+        'affinity_key_field': None,
+        'is_enum': False,
+        'binary_fields': [
+            {'field_name': 'id', 'type_id': 3, 'field_id': hashcode('id')},
+            {'field_name': 'name', 'type_id': 9, 'field_id': hashcode('name')},
+        ],
+        'schema': {schema_id(SCHEMA): [hashcode('id'), hashcode('name')]},
+    })
+
+
+def _client(path):
+    client = Client(binary_metadata_cache=str(path))
+    client._bind_binary_metadata_cache(NODES)
+    return client
+
+
+def test_metadata_is_loaded_by_next_client(tmp_path):
+    path = tmp_path / 'binary.json'
+    client = _client(path)
+    client.get_binary_type = lambda type_id: client._process_get_binary_type_result(_binary_type_result()).value
+    fetched_class = client.query_binary_type(TYPE_NAME, schema_id(SCHEMA))
+    assert fetched_class.schema == SCHEMA
+
+    def get_binary_type(type_id):
+        raise AssertionError('Binary type should be found in the cache.')
+
+    next_client = _client(path)
+    next_client.get_binary_type = get_binary_type
+    data_class = next_client.query_binary_type(TYPE_NAME, schema_id(SCHEMA))
+    assert data_class.type_name == fetched_class.type_name
+    assert data_class.schema == SCHEMA
+    assert next_client.query_binary_type(TYPE_NAME, SCHEMA) is data_class
+
+
+def test_unknown_schema_is_requested(tmp_path):
+    path = tmp_path / 'binary.json'
+    _client(path)._process_get_binary_type_result(_binary_type_result())
+
+    requested = []
+    client = _client(path)
+    client.get_binary_type = lambda type_id: requested.append(type_id) or {'type_exists': False}
+    assert client.query_binary_type(TYPE_NAME, 12345) is None
+    assert requested == [entity_id(TYPE_NAME)]
+
+
+def test_clusters_are_kept_apart(tmp_path):
+    path = tmp_path / 'binary.json'
+    cache = BinaryMetadataCache(str(path))
+    cache.cluster = cluster_key(NODES)
+    cache.put(1, 'A', {10: [('a', 3)]})
+
+    other = BinaryMetadataCache(str(path))
+    other.cluster = cluster_key([('10.0.0.1', 10800)])
+    assert other.get(1, 10) is None
+    other.put(2, 'B', {20: [('b', 9)]})
+
+    # both writers are merged in the file
+    merged = BinaryMetadataCache(str(path))
+    merged.cluster = cluster_key(reversed(NODES))
+    assert merged.get(1, 10) == ('A', [('a', 3)])
+    assert merged.get(2, 20) is None
+    assert len(json.loads(path.read_text())['clusters']) == 2
+
+
+def test_schemas_are_merged(tmp_path):
+    path = tmp_path / 'binary.json'
+    first, second = BinaryMetadataCache(str(path)), BinaryMetadataCache(str(path))
+    first.cluster = second.cluster = cluster_key(NODES)
+    assert first.get(1, 10) is None and second.get(1, 20) is None
+
+    first.put(1, 'A', {10: [('a', 3)]})
+    second.put(1, 'A', {20: [('a', 3), ('b', 9)]})
+
+    cache = BinaryMetadataCache(str(path))
+    cache.cluster = cluster_key(NODES)
+    assert cache.get(1, 10) == ('A', [('a', 3)])
+    assert cache.get(1, 20) == ('A', [('a', 3), ('b', 9)])
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.parametrize('content', ['', '{"version": 1, "clusters"', '[]', '{"version": 0, "clusters": {}}'])
+def test_damaged_file_is_ignored(tmp_path, content):
+    path = tmp_path / 'binary.json'
+    path.write_text(content)
+    cache = BinaryMetadataCache(str(path))
+    cache.cluster = cluster_key(NODES)
+    assert cache.get(1, 10) is None
+
+    cache.put(1, 'A', {10: [('a', 3)]})
+    assert json.loads(path.read_text())['version'] == 1
+
+
+def test_damaged_schema_is_requested(tmp_path):
+    path = tmp_path / 'binary.json'
+    cache = BinaryMetadataCache(str(path))
+    cache.cluster = cluster_key(NODES)
+    # field names do not match the schema ID
+    cache.put(entity_id(TYPE_NAME), TYPE_NAME, {schema_id(SCHEMA): [('other', 3)]})
+
+    client = _client(path)
+    client.get_binary_type = lambda type_id: client._process_get_binary_type_result(_binary_type_result()).value
+    assert client.query_binary_type(TYPE_NAME, schema_id(SCHEMA)).schema == SCHEMA
+
+    cache = BinaryMetadataCache(str(path))
+    cache.cluster = cluster_key(NODES)
+    assert cache.get(entity_id(TYPE_NAME), schema_id(SCHEMA)) == (TYPE_NAME, [('id', 3), ('name', 9)])
+
+
+def test_stale_field_types_are_corrected(tmp_path):
+    path = tmp_path / 'binary.json'
+    cache = BinaryMetadataCache(str(path))
+    cache.cluster = cluster_key(NODES)
+    # the same field names, but the other field types, than on the server
+    cache.put(entity_id(TYPE_NAME), TYPE_NAME, {schema_id(SCHEMA): [('id', 3), ('name', 3)]})
+
+    requested = []
+    client = _client(path)
+
+    def get_binary_type(type_id):
+        requested.append(type_id)
+        if type_id != entity_id(TYPE_NAME):
+            return {'type_exists': False}
+        return client._process_get_binary_type_result(_binary_type_result()).value
+
+    client.get_binary_type = get_binary_type
+    client.put_binary_type = lambda *args, **kwargs: None
+    data_class = client.query_binary_type(TYPE_NAME, schema_id(SCHEMA))
+    assert data_class.schema == OrderedDict([('id', IntObject), ('name', IntObject)])
+    assert requested == []
+    obj = data_class(id=1, name='Alice')
+
+    # the cached field types are confirmed before writing
+    with BinaryStream(client) as stream:
+        BinaryObject.from_python(stream, obj)
+        data = stream.getvalue()
+    assert requested[0] == entity_id(TYPE_NAME)
+    assert data_class.schema == SCHEMA
+    assert client.query_binary_type(TYPE_NAME, schema_id(SCHEMA)) is data_class
+
+    expected_class = GenericObjectMeta(data_class.__name__, (), {}, schema=SCHEMA)
+    with BinaryStream(client) as stream:
+        BinaryObject.from_python(stream, expected_class(id=1, name='Alice'))
+        assert data == stream.getvalue()
+
+    cache = BinaryMetadataCache(str(path))
+    cache.cluster = cluster_key(NODES)
+    assert cache.get(entity_id(TYPE_NAME), schema_id(SCHEMA)) == (TYPE_NAME, [('id', 3), ('name', 9)])
+
+
+def test_cached_type_unknown_to_server_is_dropped(tmp_path):
+    path = tmp_path / 'binary.json'
+    _client(path)._process_get_binary_type_result(_binary_type_result())
+
+    client = _client(path)
+    client.get_binary_type = lambda type_id: {'type_exists': False}
+    registered = []
+    client.put_binary_type = lambda type_name, affinity_key_field, schema: registered.append((type_name, schema))
+    data_class = client.query_binary_type(TYPE_NAME, schema_id(SCHEMA))
+
+    client.register_binary_type(data_class)
+    assert registered == [(data_class.type_name, SCHEMA)]
+    assert client.query_binary_type(TYPE_NAME, schema_id(SCHEMA)) is None
+
+
+def test_stale_field_types_are_corrected_before_parsing(tmp_path):
+    path = tmp_path / 'binary.json'
+    cache = BinaryMetadataCache(str(path))
+    cache.cluster = cluster_key(NODES)
+    cache.put(entity_id(TYPE_NAME), TYPE_NAME, {schema_id(SCHEMA): [('id', 3), ('name', 3)]})
+
+    client = _client(path)
+    client.get_binary_type = lambda type_id: client._process_get_binary_type_result(_binary_type_result()).value
+    header = SimpleNamespace(type_id=entity_id(TYPE_NAME), schema_id=schema_id(SCHEMA))
+    with BinaryStream(client) as stream:
+        assert stream.get_dataclass(header).schema == SCHEMA
@@ -0,0 +1,126 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the bulk binary type prefetch. `OP_GET_BINARY_TYPE`
+requests are answered by a stub, that knows the given type names.
+"""
+import asyncio
+import threading
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from pygridgain import AioClient, Client
+from pygridgain.aio_cache import AioCache
+from pygridgain.cache import Cache
+from pygridgain.datatypes.prop_codes import PROP_QUERY_ENTITIES
+from pygridgain.exceptions import BinaryTypeError
+from pygridgain.utils import entity_id
+from tests.test_binary_cache import SCHEMA, _binary_type_result
+
+KNOWN_TYPES = ['org.example.Person', 'org.example.Order', 'org.example.OrderKey', 'org.example.Product']
+SETTINGS = {
+    PROP_QUERY_ENTITIES: [
+        {'key_type_name': 'java.lang.Long', 'value_type_name': 'org.example.Person'},
+        {'key_type_name': 'org.example.OrderKey', 'value_type_name': 'org.example.Order'},
+    ],
+}
+
+
+class FakeNode:
+    def __init__(self):
+        self.uuid = uuid.uuid4()
+        self.alive = True
+
+
+def _get_binary_type(requests, conn, type_id):
+    requests.append((conn, type_id, threading.current_thread()))
+    if type_id == entity_id('org.example.Broken'):
+        return SimpleNamespace(status=1, message='Broken!', value=None)
+    for type_name in KNOWN_TYPES:
+        if entity_id(type_name) == type_id:
+            return _binary_type_result(type_name)
+    return SimpleNamespace(status=0, value={'type_exists': False})
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    requests = []
+    monkeypatch.setattr('pygridgain.client.get_binary_type', lambda conn, type_id: _get_binary_type(
+        requests, conn, type_id
+    ))
+
+    async def get_binary_type_async(conn, type_id):
+        await asyncio.sleep(0)
+        return _get_binary_type(requests, conn, type_id)
+
+    monkeypatch.setattr('pygridgain.aio_client.get_binary_type_async', get_binary_type_async)
+    return requests
+
+
+def _with_fake_nodes(client):
+    client._nodes = [FakeNode(), FakeNode()]
+    return client
+
+
+def test_types_are_fetched_from_all_nodes(requests):
+    client = _with_fake_nodes(Client())
+    report = client.prefetch_binary_types(KNOWN_TYPES + ['org.example.Unknown', KNOWN_TYPES[0]])
+
+    assert {k: report[k] for k in ('types', 'found', 'schemas')} == {'types': 5, 'found': 4, 'schemas': 4}
+    assert report['duration'] >= 0
+    assert sorted(type_id for _, type_id, _ in requests) == sorted(
+        entity_id(t) for t in KNOWN_TYPES + ['org.example.Unknown']
+    )
+    assert {conn for conn, _, _ in requests} == set(client._nodes)
+    assert threading.main_thread() not in {thread for _, _, thread in requests}
+    for type_name in KNOWN_TYPES:
+        assert client._get_from_registry(entity_id(type_name), SCHEMA).schema == SCHEMA
+
+
+def test_warmup_fetches_query_entity_types(requests):
+    client = _with_fake_nodes(Client())
+    cache = Cache(client, 'orders')
+    cache._settings = SETTINGS
+    report = client.warmup(caches=[cache], binary_types=['org.example.Product'])
+
+    assert (report['types'], report['found']) == (4, 4)
+    assert sorted(type_id for _, type_id, _ in requests) == sorted(entity_id(t) for t in KNOWN_TYPES)
+
+
+def test_prefetch_error_is_raised(requests):
+    client = _with_fake_nodes(Client())
+    with pytest.raises(BinaryTypeError, match='Broken!'):
+        client.prefetch_binary_types(['org.example.Person', 'org.example.Broken'])
+
+
+def test_aio_warmup(requests):
+    async def inner():
+        client = _with_fake_nodes(AioClient())
+        cache = AioCache(client, 'orders')
+        cache._settings = SETTINGS
+        report = await client.warmup(caches=[cache], binary_types=['org.example.Product', 'org.example.Unknown'])
+
+        assert (report['types'], report['found'], report['schemas']) == (5, 4, 4)
+        assert {conn for conn, _, _ in requests} == set(client._nodes)
+        for type_name in KNOWN_TYPES:
+            assert client._get_from_registry(entity_id(type_name), SCHEMA).schema == SCHEMA
+
+        with pytest.raises(BinaryTypeError, match='Broken!'):
+            await client.prefetch_binary_types(['org.example.Broken'])
+
+    asyncio.run(inner())
@@ -0,0 +1,107 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Checks of the binary stream: writing into a growable buffer and in-place
+reading of the given buffer.
+"""
+import ctypes
+from io import SEEK_CUR
+
+import pytest
+
+from pygridgain.connection.buffer_pool import BufferPool
+from pygridgain.datatypes.complex import BinaryObject
+from pygridgain.stream import BinaryStream, READ_BACKWARD
+
+
+def test_write():
+    with BinaryStream(None) as stream:
+        # reserve a header
+        stream.seek(ctypes.sizeof(ctypes.c_int), SEEK_CUR)
+        assert stream.write(b'abc') == 3
+        schema = (BinaryObject.schema_type(BinaryObject.OFFSET_ONE_BYTE) * 2)()
+        schema[1].offset = 1
+        assert stream.write(schema) == ctypes.sizeof(schema)
+        length = stream.tell()
+
+        stream.seek(0)
+        assert stream.write(ctypes.c_int(length)) == ctypes.sizeof(ctypes.c_int)
+        assert stream.tell() == ctypes.sizeof(ctypes.c_int)
+
+        expected = length.to_bytes(4, 'little') + b'abc' + bytes(ctypes.sizeof(schema) - 1) + b'\x01'
+        assert stream.getvalue() == expected
+        assert bytes(stream.getbuffer()) == expected
+        assert stream.slice(4, 3) == b'abc'
+
+
+def test_write_past_end():
+    with BinaryStream(None) as stream:
+        stream.write(b'a')
+        stream.seek(3)
+        stream.write(b'b')
+        assert stream.getvalue() == b'a\x00\x00b'
+
+
+def test_write_after_getbuffer():
+    with BinaryStream(None) as stream:
+        stream.write(b'a')
+        buf = stream.getbuffer()
+        stream.write(b'b' * 1024)
+        # the view is released, so the buffer can grow
+        with pytest.raises(ValueError):
+            len(buf)
+        assert len(stream.getbuffer()) == 1025
+
+
+def test_read_in_place():
+    data = bytearray(ctypes.c_longlong(42))
+    with BinaryStream(None, data) as stream:
+        value = stream.read_ctype(ctypes.c_longlong)
+        stream.seek(ctypes.sizeof(ctypes.c_longlong))
+        backward = stream.read_ctype(ctypes.c_int, direction=READ_BACKWARD)
+
+    # no copies are made
+    data[0] = 43
+    assert value.value == 43
+    assert backward.value == 0
+
+
+def test_read_read_only_buffer():
+    with BinaryStream(None, bytes(ctypes.c_int(42))) as stream:
+        assert stream.read_ctype(ctypes.c_int).value == 42
+
+
+def test_write_does_not_change_given_buffer():
+    data = bytearray(b'abcd')
+    with BinaryStream(None, data) as stream:
+        stream.seek(1)
+        stream.write(b'x')
+        assert stream.getvalue() == b'axcd'
+    assert data == b'abcd'
+
+
+def test_pooled_buffer_is_released():
+    pool = BufferPool()
+    data = pool.acquire(8)
+    data[:] = bytes(ctypes.c_longlong(42))
+    with BinaryStream(None, data) as stream:
+        value = stream.read_ctype(ctypes.c_longlong)
+    assert value.value == 42
+
+    # ctypes objects, read from the stream, do not prevent the release
+    pool.release(data)
+    pool.acquire(8)
+    assert pool.reuses == 1
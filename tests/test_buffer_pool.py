@@ -0,0 +1,114 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the receive buffer pool and of the length-first
+receive path of the synchronous connection.
+"""
+import socket
+import struct
+import threading
+
+import pytest
+
+from pygridgain import Client
+from pygridgain.connection import Connection
+from pygridgain.connection.buffer_pool import BufferPool, MIN_BUFFER_SIZE
+
+
+def test_buffers_are_reused():
+    pool = BufferPool()
+    data = pool.acquire(100)
+    assert len(data) == 100
+    buf = data.obj
+    assert len(buf) == MIN_BUFFER_SIZE
+
+    pool.release(data)
+    # released twice by mistake, must not be pooled twice
+    pool.release(data)
+
+    assert pool.acquire(MIN_BUFFER_SIZE).obj is buf
+    assert pool.acquire(10).obj is not buf
+    assert (pool.allocations, pool.reuses) == (2, 1)
+
+
+def test_smallest_fitting_buffer_is_taken():
+    pool = BufferPool()
+    large, small = pool.acquire(100000), pool.acquire(5000)
+    large_buf, small_buf = large.obj, small.obj
+    pool.release(large)
+    pool.release(small)
+
+    assert pool.acquire(5000).obj is small_buf
+    assert pool.acquire(5000).obj is large_buf
+
+
+def test_pool_limits():
+    pool = BufferPool(max_buffers=2, max_pooled_size=MIN_BUFFER_SIZE * 2, max_pooled_bytes=MIN_BUFFER_SIZE * 3)
+
+    oversized = pool.acquire(MIN_BUFFER_SIZE * 2 + 1)
+    assert len(oversized.obj) == MIN_BUFFER_SIZE * 2 + 1
+    pool.release(oversized)
+    assert not pool._free
+
+    views = [pool.acquire(MIN_BUFFER_SIZE * 2), pool.acquire(1), pool.acquire(1)]
+    for view in views:
+        pool.release(view)
+    assert [len(buf) for buf in pool._free] == [MIN_BUFFER_SIZE * 2, MIN_BUFFER_SIZE]
+
+    pool.release(b'not pooled')
+    pool.release(memoryview(b'not pooled'))
+    assert len(pool._free) == 2
+
+
+@pytest.fixture
+def connection():
+    client_sock, server_sock = socket.socketpair()
+    conn = Connection(Client(), 'localhost', 10800)
+    conn._socket = client_sock
+    yield conn, server_sock
+    conn.close()
+    server_sock.close()
+
+
+@pytest.mark.parametrize('payload_size', [0, 10, 100000])
+def test_recv_into_pooled_buffer(connection, payload_size):
+    conn, server_sock = connection
+    message = struct.pack('<i', payload_size) + bytes(range(256)) * (payload_size // 256) + b'x' * (payload_size % 256)
+
+    def send():
+        # the length and the payload come in pieces
+        server_sock.sendall(message[:2])
+        server_sock.sendall(message[2:7])
+        server_sock.sendall(message[7:])
+
+    for _ in range(2):
+        threading.Thread(target=send, daemon=True).start()
+        data = conn.recv()
+        assert bytes(data) == message
+        conn.release_buffer(data)
+
+    pool = conn.client._buffer_pool
+    assert (pool.allocations, pool.reuses) == (1, 1)
+
+
+def test_recv_connection_broken(connection):
+    conn, server_sock = connection
+    server_sock.sendall(struct.pack('<i', 100) + b'partial')
+    server_sock.close()
+
+    with pytest.raises(OSError):
+        conn.recv(reconnect=False)
+    assert conn.failed
@@ -0,0 +1,165 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the columnar decoding of SQL fields query results.
+The peer side of a socket pair plays the server node, that serves
+a query result of two pages.
+"""
+import asyncio
+import struct
+
+import pytest
+
+from pygridgain.columnar import Column, decode_columns, numpy
+from pygridgain.datatypes.decoder import DirectDecoder
+from pygridgain.exceptions import SQLError
+from pygridgain.queries.op_codes import (
+    OP_QUERY_SQL_FIELDS, OP_QUERY_SQL_FIELDS_CURSOR_GET_PAGE, OP_RESOURCE_CLOSE
+)
+from tests.util import FakeNode, fake_node_aio_client, fake_node_client
+
+CURSOR_ID = 42
+FIELDS = ['ID', 'NAME', 'SCORE', 'ACTIVE']
+
+
+def _null():
+    return struct.pack('<b', 101)
+
+
+def _int(value):
+    return struct.pack('<bi', 3, value)
+
+
+def _double(value):
+    return struct.pack('<bd', 6, value)
+
+
+def _bool(value):
+    return struct.pack('<b?', 8, value)
+
+
+def _string(value):
+    data = value.encode()
+    return struct.pack('<bi', 9, len(data)) + data
+
+
+def _row(key):
+    return b''.join([
+        _int(key),
+        _string(f'name-{key}'),
+        _null() if key % 3 == 0 else _double(key / 2),
+        _bool(key % 2 == 0),
+    ])
+
+
+def _rows(keys):
+    return struct.pack('<i', len(keys)) + b''.join(_row(key) for key in keys)
+
+
+class SqlNode(FakeNode):
+    def respond(self, op_code, query_id, request):
+        body = struct.pack('<qh', query_id, 0)
+        if op_code == OP_QUERY_SQL_FIELDS:
+            body += struct.pack('<qi', CURSOR_ID, len(FIELDS))
+            body += b''.join(_string(name) for name in FIELDS)
+            body += _rows(range(5)) + struct.pack('<?', True)
+        elif op_code == OP_QUERY_SQL_FIELDS_CURSOR_GET_PAGE:
+            body += _rows(range(5, 8)) + struct.pack('<?', False)
+        else:
+            assert op_code == OP_RESOURCE_CLOSE
+        return body
+
+
+@pytest.fixture
+def client():
+    with fake_node_client(SqlNode) as (client, _):
+        yield client
+
+
+def _expected(keys):
+    return {
+        'ID': list(keys),
+        'NAME': [f'name-{key}' for key in keys],
+        'SCORE': [None if key % 3 == 0 else key / 2 for key in keys],
+        'ACTIVE': [key % 2 == 0 for key in keys],
+    }
+
+
+def test_decode_columns():
+    buf = _rows(range(4))
+    columns, pos = decode_columns(DirectDecoder(buf), FIELDS, 4, 4)
+
+    assert pos == len(buf)
+    assert {c.name: c.to_list() for c in columns} == _expected(range(4))
+    assert [c.dtype for c in columns] == ['int32', None, 'float64', 'bool']
+    assert columns[0].mask is None
+    assert list(columns[2].mask) == [True, False, False, True]
+    if numpy is not None:
+        assert isinstance(columns[0].values, numpy.ndarray)
+
+
+def test_leading_nulls_and_mixed_types():
+    # rows of (A, B)
+    buf = _null() + _null() + _int(1) + _string('x') + _null() + _int(2)
+    columns, pos = decode_columns(DirectDecoder(buf), ['A', 'B'], 3, 0)
+
+    assert pos == len(buf)
+    assert columns[0].dtype == 'int32'
+    assert columns[0].to_list() == [None, 1, None]
+    # mixed types are kept as values
+    assert columns[1].dtype is None
+    assert columns[1].to_list() == [None, 'x', 2]
+
+
+def test_concat():
+    first, _ = decode_columns(DirectDecoder(_int(1) + _null()), ['A'], 2, 0)
+    second, _ = decode_columns(DirectDecoder(_int(3)), ['A'], 1, 0)
+    column = Column.concat(first + second)
+
+    assert (column.name, column.dtype) == ('A', 'int32')
+    assert column.to_list() == [1, None, 3]
+
+
+def test_fetch_columns(client):
+    with client.sql('SELECT * FROM T', include_field_names=True, as_columns=True) as cursor:
+        columns = cursor.fetch_columns()
+
+    assert list(columns) == FIELDS
+    assert {name: column.to_list() for name, column in columns.items()} == _expected(range(8))
+
+
+def test_columnar_pages(client):
+    with client.sql('SELECT * FROM T', include_field_names=True, as_columns=True) as cursor:
+        pages = list(cursor)
+
+    assert [len(page[0]) for page in pages] == [5, 3]
+    assert [column.name for column in pages[1]] == FIELDS
+
+
+def test_aio_fetch_columns():
+    async def inner():
+        async with fake_node_aio_client(SqlNode) as (client, _):
+            cursor = client.sql('SELECT * FROM T', include_field_names=True, as_columns=True)
+            columns = await cursor.fetch_columns()
+            assert {name: column.to_list() for name, column in columns.items()} == _expected(range(8))
+
+    asyncio.run(inner())
+
+
+def test_fetch_columns_requires_columnar_mode(client):
+    with client.sql('SELECT * FROM T', include_field_names=True) as cursor:
+        with pytest.raises(SQLError):
+            cursor.fetch_columns()
@@ -0,0 +1,246 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the per-node connection pools
+(:mod:`pygridgain.connection.pool`).
+"""
+import asyncio
+import struct
+import threading
+import time
+
+import pytest
+
+from pygridgain.connection import AioConnectionPool, ConnectionPool
+from pygridgain.connection.pool import parse_pool_size
+from pygridgain.exceptions import ParameterError, SocketError
+from pygridgain.queries.op_codes import OP_TX_END, OP_TX_START
+from tests.util import FakeNode, fake_node_client
+
+
+class FakeConnection:
+    host, port, uuid = 'localhost', 10800, None
+
+    def __init__(self, fail=False):
+        self.alive = False
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.fail = fail
+
+    def connect(self):
+        if self.fail:
+            raise SocketError('Connection refused.')
+        self.alive = True
+
+    def close(self):
+        self.alive = False
+
+
+class AioFakeConnection(FakeConnection):
+    async def connect(self):
+        super().connect()
+
+    async def close(self):
+        super().close()
+
+
+@pytest.mark.parametrize('pool_size,expected', [
+    (None, (1, 1)),
+    (4, (4, 4)),
+    ((1, 8), (1, 8)),
+])
+def test_parse_pool_size(pool_size, expected):
+    assert parse_pool_size(pool_size) == expected
+
+
+@pytest.mark.parametrize('pool_size', [0, (2, 1), (0, 2), 'big', (1, 2, 3)])
+def test_parse_invalid_pool_size(pool_size):
+    with pytest.raises(ParameterError):
+        parse_pool_size(pool_size)
+
+
+def _pool(min_size, max_size, factory=FakeConnection, idle_timeout=60.0):
+    node = factory()
+    node.connect()
+    return ConnectionPool(node, factory, min_size, max_size, idle_timeout)
+
+
+def test_grows_when_busy():
+    pool = _pool(1, 3)
+    assert pool.acquire() is pool.node
+
+    pool.node.in_use = 1
+    second = pool.acquire()
+    assert second is not pool.node and len(pool) == 2
+
+    second.in_use = 1
+    third = pool.acquire()
+    third.in_use = 1
+    assert len(pool) == 3
+
+    # pool is exhausted, the least loaded connection is shared
+    pool.node.in_use = 5
+    assert pool.acquire() in (second, third)
+    assert len(pool) == 3
+
+    metrics = pool.metrics()
+    assert (metrics['size'], metrics['in_use'], metrics['idle']) == (3, 3, 0)
+    assert (metrics['checkouts'], metrics['busy_checkouts'], metrics['created']) == (4, 1, 2)
+
+
+def test_fill_and_idle_eviction():
+    pool = _pool(2, 4, idle_timeout=0.0)
+    pool.fill()
+    assert len(pool) == 2
+
+    for conn in pool.connections:
+        conn.in_use = 1
+    pool.acquire()
+    assert len(pool) == 3
+
+    for conn in pool.connections:
+        conn.in_use = 0
+    pool.acquire()
+    assert len(pool) == 2
+    assert sum(not conn.alive for conn in pool.connections) == 0
+    assert pool.metrics()['evicted'] == 1
+
+
+def test_failed_connections_are_dropped():
+    pool = _pool(1, 2)
+    pool.node.in_use = 1
+    extra = pool.acquire()
+    extra.alive = False
+    pool.node.in_use = 0
+
+    assert pool.acquire() is pool.node
+    assert pool.connections == [pool.node]
+
+
+def test_connect_failure_falls_back():
+    node = FakeConnection()
+    node.connect()
+    pool = ConnectionPool(node, lambda: FakeConnection(fail=True), 1, 2)
+    node.in_use = 1
+
+    assert pool.acquire() is node
+    assert len(pool) == 1
+
+
+def _acquire_in_thread(pool):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(pool.acquire()))
+    thread.start()
+    thread.join()
+    return result[0], thread
+
+
+def test_checkout_is_exclusive():
+    pool = _pool(1, 2)
+    first = pool.acquire()
+
+    # no request is made yet, but the connection is taken
+    second, _ = _acquire_in_thread(pool)
+    assert second is not first and len(pool) == 2
+    assert pool.metrics()['in_use'] == 2
+
+    # the request is done, the connection is free again
+    first.pool.release(first)
+    assert pool.metrics()['in_use'] == 1
+
+
+def test_reserved_connection_is_not_evicted():
+    pool = _pool(1, 3, idle_timeout=0.0)
+    pool.node.in_use = 1
+    extra = pool.acquire()
+    assert extra is not pool.node
+
+    # another thread checks out, the idle connection of this thread stays
+    other, thread = _acquire_in_thread(pool)
+    assert other is not extra and extra in pool.connections and extra.alive
+
+    # the connections of a finished thread are not reserved anymore
+    assert not thread.is_alive()
+    extra.pool.release(extra)
+    pool.acquire()
+    assert pool.metrics()['evicted'] == 2
+
+
+def test_pinned_connection_is_not_evicted():
+    pool = _pool(1, 2, idle_timeout=0.0)
+    pool.node.in_use = 1
+    extra = pool.acquire()
+    pool.release(extra)
+    pool.node.in_use = 0
+
+    # e.g. a cursor keeps using the idle connection between its pages
+    pool.pin(extra)
+    pool.acquire()
+    assert extra in pool.connections and extra.alive
+
+    pool.unpin(extra)
+    pool.acquire()
+    assert pool.connections == [pool.node] and not extra.alive
+
+
+class TxNode(FakeNode):
+    def respond(self, op_code, query_id, request):
+        body = struct.pack('<qh', query_id, 0)
+        if op_code == OP_TX_START:
+            body += struct.pack('<i', 1)
+        else:
+            assert op_code == OP_TX_END
+        return body
+
+
+def test_transaction_pins_connection():
+    with fake_node_client(TxNode) as (client, _):
+        node = client._nodes[0]
+        pool = ConnectionPool(node, lambda: None, 1, 2)
+        with client.tx_start():
+            assert pool._pinned == {node: 1}
+        assert not pool._pinned
+
+
+def test_aio_pool():
+    async def inner():
+        node = AioFakeConnection()
+        await node.connect()
+        pool = AioConnectionPool(node, AioFakeConnection, 2, 2)
+        await pool.fill()
+        assert len(pool) == 2
+
+        node.in_use = 1
+        conn = await pool.acquire()
+        assert conn is not node and conn.alive
+
+        # concurrent checkouts get the different connections
+        node.in_use = 0
+        pool.release(conn)
+
+        async def checkout():
+            conn = await pool.acquire()
+            # the request is in progress
+            await asyncio.sleep(0.01)
+            return conn
+
+        conns = await asyncio.gather(checkout(), checkout())
+        assert set(conns) == {node, conn}
+
+        await pool.close()
+        assert not conn.alive and not node.alive
+
+    asyncio.run(inner())
@@ -0,0 +1,194 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the cursor page prefetching. The peer side
+of a socket pair plays the server node, that serves a scan query
+in pages of `PAGE_SIZE` entries.
+"""
+import asyncio
+import gc
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from pygridgain.cache import Cache
+from pygridgain.aio_cache import AioCache
+from pygridgain.connection import Connection, ConnectionPool
+from pygridgain.exceptions import ParameterError
+from pygridgain.queries.op_codes import OP_QUERY_SCAN, OP_QUERY_SCAN_CURSOR_GET_PAGE, OP_RESOURCE_CLOSE
+from tests.util import FakeNode, fake_node_aio_client, fake_node_client
+
+CURSOR_ID = 42
+PAGE_SIZE = 10
+PAGES = 5
+INT_TYPE_CODE = 3
+
+
+class ScanNode(FakeNode):
+    def __init__(self, sock):
+        self.next_page = 0
+        super().__init__(sock)
+
+    def _page(self):
+        page, self.next_page = self.next_page, self.next_page + 1
+        keys = range(page * PAGE_SIZE, (page + 1) * PAGE_SIZE)
+        data = struct.pack('<i', len(keys)) + b''.join(
+            struct.pack('<bibi', INT_TYPE_CODE, key, INT_TYPE_CODE, key * 2) for key in keys
+        )
+        return data + struct.pack('<b', self.next_page < PAGES)
+
+    def respond(self, op_code, query_id, request):
+        body = struct.pack('<qh', query_id, 0)
+        if op_code == OP_QUERY_SCAN:
+            body += struct.pack('<q', CURSOR_ID) + self._page()
+        elif op_code == OP_QUERY_SCAN_CURSOR_GET_PAGE:
+            assert struct.unpack_from('<q', request, 10)[0] == CURSOR_ID
+            body += self._page()
+        else:
+            assert op_code == OP_RESOURCE_CLOSE
+        return body
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def client_and_node():
+    with fake_node_client(ScanNode) as (client, node):
+        yield client, node
+
+
+def test_prefetch_ahead(client_and_node):
+    client, node = client_and_node
+    with Cache(client, 'test').scan(page_size=PAGE_SIZE, prefetch=2) as cursor:
+        # the pages are requested before the first one is consumed
+        _wait_for(lambda: node.count(OP_QUERY_SCAN_CURSOR_GET_PAGE) >= 2)
+        assert node.count(OP_QUERY_SCAN_CURSOR_GET_PAGE) >= 2
+        assert dict(cursor) == {key: key * 2 for key in range(PAGE_SIZE * PAGES)}
+
+    # the cursor is exhausted, nothing to close
+    assert node.count(OP_QUERY_SCAN_CURSOR_GET_PAGE) == PAGES - 1
+    assert node.count(OP_RESOURCE_CLOSE) == 0
+
+
+def test_close_prefetching_cursor(client_and_node):
+    client, node = client_and_node
+    with Cache(client, 'test').scan(page_size=PAGE_SIZE, prefetch=1) as cursor:
+        assert next(cursor) == (0, 0)
+
+    _wait_for(lambda: node.count(OP_RESOURCE_CLOSE) > 0)
+    assert node.count(OP_RESOURCE_CLOSE) == 1
+
+
+def test_dropped_cursor_stops_prefetching(client_and_node):
+    client, node = client_and_node
+    cursor = Cache(client, 'test').scan(page_size=PAGE_SIZE, prefetch=1)
+    for _ in cursor:
+        # the caller breaks out of the iteration and drops the cursor
+        break
+    thread = cursor._prefetcher._thread
+    # one page is queued, the next one waits for a free slot
+    _wait_for(lambda: node.count(OP_QUERY_SCAN_CURSOR_GET_PAGE) >= 2)
+
+    del cursor
+    gc.collect()
+    thread.join(5)
+    assert not thread.is_alive()
+    _wait_for(lambda: node.count(OP_RESOURCE_CLOSE) > 0)
+    assert node.count(OP_RESOURCE_CLOSE) == 1
+
+
+class _ScanConnection(Connection):
+    """ Pooled connection to a fake node of its own. """
+    def connect(self):
+        client_sock, server_sock = socket.socketpair()
+        self._socket = client_sock
+        self._start_reader()
+        self.node = ScanNode(server_sock)
+
+
+def test_cursor_connection_is_not_evicted(client_and_node):
+    client, _ = client_and_node
+    primary = client._nodes[0]
+    pool = ConnectionPool(primary, lambda: _ScanConnection(client, 'localhost', 10800, multiplexed=True),
+                          1, 2, idle_timeout=0.0)
+    client._pools[primary] = pool
+
+    # another thread holds the primary connection, so the cursor gets a new one
+    checked_out, done = threading.Event(), threading.Event()
+    holder = threading.Thread(target=lambda: (pool.acquire(), checked_out.set(), done.wait()))
+    holder.start()
+    checked_out.wait()
+    cursor = Cache(client, 'test').scan(page_size=PAGE_SIZE)
+    done.set()
+    holder.join()
+    assert cursor.connection is not primary
+
+    # the cursor connection is idle between the pages, but it is not evicted
+    assert next(cursor) == (0, 0)
+    assert pool.acquire() is primary
+    assert cursor.connection in pool.connections
+    assert len(list(cursor)) == PAGE_SIZE * PAGES - 1
+
+    cursor.close()
+    pool.acquire()
+    assert pool.connections == [primary]
+
+
+def test_no_prefetch_by_default(client_and_node):
+    client, node = client_and_node
+    with Cache(client, 'test').scan(page_size=PAGE_SIZE) as cursor:
+        time.sleep(0.1)
+        assert node.count(OP_QUERY_SCAN_CURSOR_GET_PAGE) == 0
+        assert len(list(cursor)) == PAGE_SIZE * PAGES
+
+
+def test_aio_prefetch():
+    async def inner():
+        async with fake_node_aio_client(ScanNode) as (client, node):
+            async with AioCache(client, 'test').scan(page_size=PAGE_SIZE, prefetch=2) as cursor:
+                await asyncio.sleep(0.1)
+                assert node.count(OP_QUERY_SCAN_CURSOR_GET_PAGE) >= 2
+                assert {k: v async for k, v in cursor} == {key: key * 2 for key in range(PAGE_SIZE * PAGES)}
+
+            node.next_page = 0
+            async with AioCache(client, 'test').scan(page_size=PAGE_SIZE, prefetch=1) as cursor:
+                await cursor.__anext__()
+            assert node.count(OP_RESOURCE_CLOSE) == 1
+
+            # dropped without closing
+            node.next_page = 0
+            cursor = await AioCache(client, 'test').scan(page_size=PAGE_SIZE, prefetch=1)
+            await cursor.__anext__()
+            task = cursor._prefetcher._task
+            del cursor
+            gc.collect()
+            await asyncio.wait_for(task, 5)
+            assert node.count(OP_RESOURCE_CLOSE) == 2
+
+    asyncio.run(inner())
+
+
+def test_invalid_prefetch(client_and_node):
+    client, _ = client_and_node
+    with pytest.raises(ParameterError):
+        Cache(client, 'test').scan(page_size=PAGE_SIZE, prefetch=-1)
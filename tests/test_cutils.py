@@ -14,13 +14,24 @@
 # limitations under the License.
 #
 
+import asyncio
+import decimal
 import random
 from collections import OrderedDict
 
 import pytest
 
+import pygridgain.binary as _pbinary
+import pygridgain.datatypes.complex as _pcomplex
+import pygridgain.datatypes.decoder as _pdecoder
 import pygridgain.utils as _putils
-from pygridgain.datatypes import IntObject
+from pygridgain import AioClient, Client, GenericObjectMeta
+from pygridgain.datatypes import (
+    BoolObject, ByteObject, CharObject, DecimalObject, DoubleObject, FloatObject, IntArrayObject, IntObject, LongObject,
+    ShortObject, String, BinaryObject
+)
+from pygridgain.datatypes.decoder import decode_value, decode_value_async
+from pygridgain.stream import AioBinaryStream, BinaryStream, READ_BACKWARD
 
 try:
     from pygridgain import _cutils
@@ -106,6 +117,115 @@ def test_handling_errors(func, args, kwargs, err_cls):
         func(*args, **kwargs)
 
 
+class Address(
+    metaclass=GenericObjectMeta,
+    schema=OrderedDict([
+        ('city', String),
+        ('zip', IntObject),
+    ])
+):
+    pass
+
+
+class Entity(
+    metaclass=GenericObjectMeta,
+    schema=OrderedDict([
+        ('byte', ByteObject),
+        ('short', ShortObject),
+        ('int', IntObject),
+        ('long', LongObject),
+        ('float', FloatObject),
+        ('double', DoubleObject),
+        ('char', CharObject),
+        ('bool', BoolObject),
+        ('str', String),
+        ('decimal', DecimalObject),
+        ('ints', IntArrayObject),
+        ('address', BinaryObject),
+    ])
+):
+    pass
+
+
+class WideEntity(
+    metaclass=GenericObjectMeta,
+    schema=OrderedDict([(f'field_{i}', String) for i in range(300)])
+):
+    pass
+
+
+ENTITIES = [
+    Entity(byte=-1, short=-300, int=2 ** 31 - 1, long=-2 ** 63, float=1.5, double=-1e300, char='ы', bool=True,
+           str='Съешь же ещё этих мягких французских булок', decimal=decimal.Decimal('-1.25'), ints=[1, 2],
+           address=Address(city='Moscow', zip=101000)),
+    Entity(),
+    Entity(byte=None, short=None, int=None, long=None, float=None, double=None, char=None, bool=None, str=None,
+           decimal=None, ints=None, address=None),
+    # values, that are written by the Python fallback
+    Entity(byte=300, int=True, long=2 ** 64 - 1, float=2, double=3, char=b'\x01\x00', bool=1, str=b'bytes'),
+    WideEntity(),
+    WideEntity(**{f'field_{i}': 'x' * 300 for i in range(300)}),
+]
+
+
+def _write(client, obj, stream_class=BinaryStream):
+    obj._buffer, obj._hashcode = None, None
+    with stream_class(client) as stream:
+        if stream_class is BinaryStream:
+            obj._from_python(stream, save_to_buf=True)
+        else:
+            asyncio.run(obj._from_python_async(stream, save_to_buf=True))
+        assert obj._buffer == stream.getvalue()
+        return stream.getvalue(), obj._hashcode
+
+
+@pytest.mark.skip_if_no_cext
+@pytest.mark.parametrize('compact_footer', [True, False])
+@pytest.mark.parametrize('client_class,stream_class', [(Client, BinaryStream), (AioClient, AioBinaryStream)])
+@pytest.mark.parametrize('obj', ENTITIES)
+def test_write_binary_object(monkeypatch, compact_footer, client_class, stream_class, obj):
+    client = client_class(compact_footer=compact_footer)
+    client._registry[Address.type_id][Address.schema_id] = Address
+
+    result = _write(client, obj, stream_class)
+    monkeypatch.setattr(_pbinary, '_write_binary_object', None)
+    assert result == _write(client, obj, stream_class)
+
+
+def _read(client, buf):
+    if isinstance(client, AioClient):
+        async def inner():
+            with AioBinaryStream(client, buf) as stream:
+                c_type = await BinaryObject.parse_async(stream)
+                value = await BinaryObject.to_python_async(
+                    stream.read_ctype(c_type, direction=READ_BACKWARD), client=client
+                )
+            return value, await decode_value_async(client, buf)
+
+        return asyncio.run(inner())
+
+    with BinaryStream(client, buf) as stream:
+        c_type = BinaryObject.parse(stream)
+        value = BinaryObject.to_python(stream.read_ctype(c_type, direction=READ_BACKWARD), client=client)
+    return value, decode_value(client, buf)
+
+
+@pytest.mark.skip_if_no_cext
+@pytest.mark.parametrize('client_class', [Client, AioClient])
+@pytest.mark.parametrize('obj', ENTITIES)
+def test_read_binary_object(monkeypatch, client_class, obj):
+    client = client_class()
+    for data_class in (Address, Entity, WideEntity):
+        client._registry[data_class.type_id][data_class.schema_id] = data_class
+    buf, _ = _write(client, obj, AioBinaryStream if client_class is AioClient else BinaryStream)
+
+    result = _read(client, buf)
+    assert type(result[0]) is type(obj)
+    monkeypatch.setattr(_pcomplex, '_read_binary_object', None)
+    monkeypatch.setattr(_pdecoder, '_read_binary_object', None)
+    assert result == _read(client, buf)
+
+
 def get_random_field_name(length):
     first = get_random_unicode(length // 2, latin=True)
     second = get_random_unicode(length - length // 2, latin=True)
@@ -0,0 +1,94 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the synchronous data streamer. The peer side
+of a socket pair plays the server node: it counts the `OP_CACHE_PUT_ALL`
+requests and their entries and answers them with success (or an error).
+"""
+import struct
+import time
+from functools import partial
+
+import pytest
+
+from pygridgain.exceptions import CacheError, ParameterError
+from pygridgain.queries.op_codes import OP_CACHE_PUT_ALL
+from tests.util import FakeNode, error_response, fake_node_client
+
+ERROR_STATUS = 1000
+
+
+class StreamerNode(FakeNode):
+    def __init__(self, sock, fail=False):
+        self.fail = fail
+        self.batches = []
+        super().__init__(sock)
+
+    def respond(self, op_code, query_id, request):
+        assert op_code == OP_CACHE_PUT_ALL
+        # cache ID (i32), flags (byte), map length (i32)
+        self.batches.append(struct.unpack_from('<i', request, 10 + 4 + 1)[0])
+        if self.fail:
+            return error_response(query_id, ERROR_STATUS)
+        return struct.pack('<qh', query_id, 0)
+
+
+@pytest.fixture
+def client_and_node():
+    with fake_node_client(StreamerNode, partition_aware=False) as (client, node):
+        yield client, node
+
+
+def test_entries_are_sent_in_batches(client_and_node):
+    client, node = client_and_node
+    with client.data_streamer('test', batch_size=100, parallel_ops_per_node=2) as streamer:
+        streamer.add_all({i: str(i) for i in range(250)})
+        streamer.add(250, 'last')
+
+    assert sorted(node.batches) == [51, 100, 100]
+    assert (streamer.entries_sent, streamer.batches_sent) == (251, 3)
+
+    with pytest.raises(CacheError):
+        streamer.add(1, 1)
+
+
+def test_flush_interval(client_and_node):
+    client, node = client_and_node
+    streamer = client.data_streamer('test', batch_size=100, flush_interval=0.05)
+    try:
+        streamer.add(1, 1)
+        deadline = time.monotonic() + 5
+        while not node.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert node.batches == [1]
+    finally:
+        streamer.close()
+
+
+def test_batch_error_is_raised():
+    with fake_node_client(partial(StreamerNode, fail=True), partition_aware=False) as (client, _):
+        streamer = client.data_streamer('test', batch_size=10)
+        streamer.add_all([(i, i) for i in range(10)])
+        with pytest.raises(CacheError, match='Fail!'):
+            streamer.flush()
+        streamer.close()
+
+
+@pytest.mark.parametrize('kwargs', [{'batch_size': 0}, {'parallel_ops_per_node': 0}, {'flush_interval': -1}])
+def test_invalid_parameters(client_and_node, kwargs):
+    client, _ = client_and_node
+    with pytest.raises(ParameterError):
+        client.data_streamer('test', **kwargs)
@@ -0,0 +1,219 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free equivalence checks of the single-pass decoder
+(:mod:`pygridgain.datatypes.decoder`) against the reference
+parse -> read_ctype -> to_python path.
+"""
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import decimal
+import struct
+import uuid
+
+import pytest
+
+from pygridgain import AioClient, Client, GenericObjectMeta
+from pygridgain.connection.protocol_context import ProtocolContext
+from pygridgain.datatypes import (
+    AnyDataObject, Bool, BinaryEnumObject, BoolArrayObject, ByteArrayObject, ByteObject, CharArrayObject, CharObject,
+    CollectionObject, DateArrayObject, DecimalArrayObject, DecimalObject, DoubleArrayObject, EnumArrayObject,
+    FloatArrayObject, FloatObject, Int, IntArrayObject, IntObject, Long, LongArrayObject, Map, MapObject,
+    ObjectArrayObject, ShortArrayObject, ShortObject, String, StringArray, StringArrayObject, StructArray,
+    TimeArrayObject, TimeObject, TimestampArrayObject, TimestampObject, UUIDArrayObject, BinaryObject,
+)
+from pygridgain.datatypes.decoder import DirectDecoder, decode_value, decode_value_async
+from pygridgain.queries.response import Response, SQLResponse
+from pygridgain.stream import BinaryStream, READ_BACKWARD
+
+
+class Person(
+    metaclass=GenericObjectMeta,
+    schema=OrderedDict([
+        ('id', IntObject),
+        ('name', String),
+        ('tags', StringArrayObject),
+    ])
+):
+    pass
+
+
+def _serialize(datatype, value):
+    with BinaryStream(None) as stream:
+        datatype.from_python(stream, value)
+        return stream.getvalue()
+
+
+def _reference(datatype, buf, client=None):
+    with BinaryStream(client, buf) as stream:
+        c_type = datatype.parse(stream)
+        return datatype.to_python(stream.read_ctype(c_type, direction=READ_BACKWARD), client=client)
+
+
+DATA_CASES = [
+    (None, AnyDataObject),
+    (42, ByteObject),
+    (-42, ShortObject),
+    (2 ** 31 - 1, IntObject),
+    (2 ** 63 - 1, AnyDataObject),
+    (3.5, FloatObject),
+    (3.141592653589793, AnyDataObject),
+    ('ы', CharObject),
+    (True, AnyDataObject),
+    (False, AnyDataObject),
+    ('', String),
+    ('Съешь же ещё этих мягких французских булок', String),
+    (uuid.UUID('12345678-1234-5678-1234-567812345678'), AnyDataObject),
+    (datetime(2021, 3, 4, 5, 6, 7), AnyDataObject),
+    ((datetime(2021, 3, 4, 5, 6, 7), 999), TimestampObject),
+    (timedelta(hours=3, milliseconds=5), TimeObject),
+    ((-1, 3), BinaryEnumObject),
+    (decimal.Decimal('-123.4567'), DecimalObject),
+    (decimal.Decimal('1e-20'), DecimalObject),
+    (decimal.Decimal('98765432109876543210.5'), DecimalObject),
+    (b'\x00\x01\xff', ByteArrayObject),
+    ([-1, 0, 1], ShortArrayObject),
+    ([-2 ** 31, 2 ** 31 - 1], IntArrayObject),
+    ([-2 ** 63, 2 ** 63 - 1], LongArrayObject),
+    ([1.5, -2.25], FloatArrayObject),
+    ([1e300, -1e-300], DoubleArrayObject),
+    (['a', 'ы', 'カ'], CharArrayObject),
+    ([True, False, True], BoolArrayObject),
+    ([], IntArrayObject),
+    (['a', None, 'ccc'], StringArrayObject),
+    ([uuid.UUID(int=1), None], UUIDArrayObject),
+    ([datetime(2020, 1, 1)], DateArrayObject),
+    ([(datetime(2020, 1, 1), 1)], TimestampArrayObject),
+    ([timedelta(seconds=1)], TimeArrayObject),
+    ([decimal.Decimal('1.5'), decimal.Decimal('-0.001')], DecimalArrayObject),
+    ((-1, [(-1, 1), (-1, 2)]), EnumArrayObject),
+    ((ObjectArrayObject.OBJECT, [1, 'two', None, [3.0]]), ObjectArrayObject),
+    ((CollectionObject.ARR_LIST, [1, 'two', (CollectionObject.USER_SET, [3])]), CollectionObject),
+    ((MapObject.HASH_MAP, {1: 'one', 'two': [2]}), MapObject),
+    ((MapObject.LINKED_HASH_MAP, OrderedDict([('b', 1), ('a', 2)])), MapObject),
+]
+
+
+@pytest.mark.parametrize('value,datatype', DATA_CASES)
+def test_decode_any_matches_reference(value, datatype):
+    buf = _serialize(datatype, value)
+    expected = _reference(AnyDataObject, buf)
+
+    decoded, pos = DirectDecoder(buf).decode_any(0)
+    assert decoded == expected
+    assert type(decoded) is type(expected)
+    assert pos == len(buf)
+
+
+@pytest.mark.parametrize('value,datatype', [
+    ({'a': 1, 'b': [1, 2]}, Map),
+    (['x', 'y'], StringArray),
+    ([{'key': 1, 'value': 'a'}, {'key': 2, 'value': None}],
+     StructArray([('key', AnyDataObject), ('value', AnyDataObject)])),
+])
+def test_decode_payload_only_matches_reference(value, datatype):
+    buf = _serialize(datatype, value)
+    assert DirectDecoder.supports(datatype)
+    assert DirectDecoder(buf).decode(datatype, 0) == (_reference(datatype, buf), len(buf))
+
+
+def test_unknown_type_code():
+    with pytest.raises(Exception, match='Unknown type code'):
+        DirectDecoder(b'\x7f').decode_any(0)
+
+
+@pytest.fixture
+def person_buf():
+    client = Client()
+    client._registry[Person.type_id][Person.schema_id] = Person
+    person = Person(id=1, name='Ivan', tags=['a', None])
+    with BinaryStream(client) as stream:
+        person._from_python(stream)
+        return client, stream.getvalue()
+
+
+def test_binary_object_matches_reference(person_buf):
+    client, buf = person_buf
+    expected = _reference(BinaryObject, buf, client=client)
+    decoded = decode_value(client, buf)
+
+    assert type(decoded) is Person
+    assert (decoded.version, decoded.id, decoded.name, decoded.tags) == \
+           (expected.version, expected.id, expected.name, expected.tags)
+
+
+def test_binary_object_async_resolves_type(person_buf):
+    _, buf = person_buf
+    client = AioClient()
+
+    async def query_binary_type(type_id, schema_id):
+        client._registry[type_id][schema_id] = Person
+
+    client.query_binary_type = query_binary_type
+    decoded = asyncio.run(decode_value_async(client, buf))
+    assert (decoded.id, decoded.name, decoded.tags) == (1, 'Ivan', ['a', None])
+
+
+def _response_buf(body: bytes):
+    return struct.pack('<iqh', len(body) + 10, 1, 0) + body
+
+
+def _decode_response(response_struct, buf):
+    with BinaryStream(None, buf) as stream:
+        header, value = response_struct.decode(stream)
+    with BinaryStream(None, buf) as stream:
+        c_type = response_struct.parse(stream)
+        expected = response_struct.to_python(stream.read_ctype(c_type, direction=READ_BACKWARD))
+    return header, value, expected
+
+
+PROTOCOL_CONTEXT = ProtocolContext((1, 7, 1))
+
+
+def test_response_matches_reference():
+    following = [('data', Map), ('more', Bool)]
+    body = _serialize(Map, {1: 'a', 2: None}) + _serialize(Bool, True)
+    header, value, expected = _decode_response(Response(following, PROTOCOL_CONTEXT), _response_buf(body))
+
+    assert header.query_id == 1
+    assert value == expected
+
+
+@pytest.mark.parametrize('include_field_names', [False, True])
+def test_sql_response_matches_reference(include_field_names):
+    rows = [[1, 'a', None], [2, 'b', 3.5]]
+    if include_field_names:
+        body = _serialize(Long, 7) + _serialize(StringArray, ['ID', 'NAME', 'VAL'])
+    else:
+        body = _serialize(Long, 7) + _serialize(Int, 3)
+    body += _serialize(Int, len(rows))
+    for row in rows:
+        body += b''.join(_serialize(AnyDataObject, v) for v in row)
+    body += _serialize(Bool, False)
+
+    response_struct = SQLResponse(protocol_context=PROTOCOL_CONTEXT, include_field_names=include_field_names,
+                                  has_cursor=True)
+    _, value, expected = _decode_response(response_struct, _response_buf(body))
+    assert value == expected
+    assert value['data'] == rows
+
+
+def test_wrapped_objects_match_reference():
+    payload = bytes(range(10))
+    buf = b'\x1b' + struct.pack('<i', len(payload)) + payload + struct.pack('<i', 3)
+
+    assert DirectDecoder(buf).decode_any(0) == (_reference(AnyDataObject, buf), len(buf))
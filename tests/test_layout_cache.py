@@ -0,0 +1,88 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free coverage for the shared ctypes layout cache
+(:mod:`pygridgain.datatypes.layout_cache`).
+"""
+import ctypes
+import decimal
+
+import pytest
+
+from pygridgain.datatypes import (
+    DecimalObject, IntArray, IntArrayObject, LongObject, ObjectArrayObject, String, Struct,
+    StructArray,
+)
+from pygridgain.datatypes.layout_cache import LayoutCache, layout_cache
+from pygridgain.stream.binary_stream import BinaryStream
+
+
+def _parse(datatype, value):
+    stream = BinaryStream(None)
+    datatype.from_python(stream, value)
+    stream = BinaryStream(None, stream.getvalue())
+    c_type = datatype.parse(stream)
+    return c_type, datatype.to_python(stream.read_ctype(c_type, position=0))
+
+
+@pytest.fixture
+def clean_cache():
+    layout_cache.clear()
+    yield layout_cache
+    layout_cache.clear()
+
+
+@pytest.mark.parametrize('datatype,value', [
+    (String, 'abc'),
+    (DecimalObject, decimal.Decimal('12.345')),
+    (IntArray, [1, 2, 3]),
+    (IntArrayObject, [1, 2, 3]),
+    (ObjectArrayObject, (ObjectArrayObject.OBJECT, [1, 'a'])),
+    (StructArray([('a', String), ('b', LongObject)]), [{'a': 'x', 'b': 1}, {'a': 'y', 'b': 2}]),
+    (Struct([('a', String), ('b', LongObject)], dict_type=dict), {'a': 'x', 'b': 1}),
+])
+def test_same_layout_is_reused(clean_cache, datatype, value):
+    first, first_value = _parse(datatype, value)
+    misses = clean_cache.misses
+
+    second, second_value = _parse(datatype, value)
+    assert second is first
+    assert second_value == first_value == value
+    assert clean_cache.misses == misses
+    assert clean_cache.hits > 0
+
+
+def test_different_lengths_get_different_layouts(clean_cache):
+    short, _ = _parse(String, 'a')
+    long, _ = _parse(String, 'abcdef')
+    assert short is not long
+    assert ctypes.sizeof(long) - ctypes.sizeof(short) == 5
+    assert clean_cache.stats()['size'] == 2
+
+
+def test_lru_eviction():
+    cache = LayoutCache(max_size=2)
+    a = cache.get('A', ctypes.LittleEndianStructure, [('x', ctypes.c_int)])
+    cache.get('B', ctypes.LittleEndianStructure, [('x', ctypes.c_int)])
+    assert cache.get('A', ctypes.LittleEndianStructure, [('x', ctypes.c_int)]) is a
+    cache.get('C', ctypes.LittleEndianStructure, [('x', ctypes.c_int)])
+
+    assert len(cache) == 2
+    assert cache.get('A', ctypes.LittleEndianStructure, [('x', ctypes.c_int)]) is a
+    assert cache.stats() == {'hits': 2, 'misses': 3, 'size': 2, 'max_size': 2}
+
+    cache.max_size = 1
+    assert len(cache) == 1
@@ -0,0 +1,105 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the multiplexed mode of the synchronous
+:class:`~pygridgain.connection.Connection`: the peer side of a socket pair
+answers the requests out of order, and the reader thread has to route
+the responses back to the right callers.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import socket
+import struct
+import threading
+
+import pytest
+
+from pygridgain import Client
+from pygridgain.connection import Connection
+from tests.util import recv_exactly
+
+
+def _request(query_id, payload: bytes):
+    body = struct.pack('<hq', 1000, query_id) + payload
+    return struct.pack('<i', len(body)) + body
+
+
+def _response(query_id, payload: bytes):
+    body = struct.pack('<qh', query_id, 0) + payload
+    return struct.pack('<i', len(body)) + body
+
+
+def _serve_reversed(sock, batch_size):
+    """ Collect `batch_size` requests, then answer them in reverse order. """
+    try:
+        while True:
+            batch = []
+            for _ in range(batch_size):
+                length = struct.unpack('<i', recv_exactly(sock, 4))[0]
+                request = recv_exactly(sock, length)
+                query_id = struct.unpack_from('<q', request, 2)[0]
+                batch.append((query_id, request[10:]))
+            for query_id, payload in reversed(batch):
+                # split the response to exercise the frame reassembly
+                data = _response(query_id, payload)
+                sock.sendall(data[:3])
+                sock.sendall(data[3:])
+    except (EOFError, OSError):
+        pass
+
+
+@pytest.fixture
+def multiplexed_conn():
+    client_sock, server_sock = socket.socketpair()
+    conn = Connection(Client(), 'localhost', 10800, multiplexed=True)
+    conn._socket = client_sock
+    conn._start_reader()
+    yield conn, server_sock
+    conn.close()
+    server_sock.close()
+
+
+def test_responses_are_matched_by_query_id(multiplexed_conn):
+    conn, server_sock = multiplexed_conn
+    threads = 8
+    server = threading.Thread(target=_serve_reversed, args=(server_sock, threads), daemon=True)
+    server.start()
+
+    def perform(i):
+        payload = f'payload-{i}'.encode()
+        response = conn.request(_request(i + 1, payload))
+        assert struct.unpack_from('<q', response, 4)[0] == i + 1
+        return bytes(response[14:])
+
+    with ThreadPoolExecutor(threads) as executor:
+        results = list(executor.map(perform, range(threads * 4)))
+
+    assert results == [f'payload-{i}'.encode() for i in range(threads * 4)]
+
+
+def test_pending_requests_fail_on_connection_loss(multiplexed_conn):
+    conn, server_sock = multiplexed_conn
+    conn.reconnect = lambda: None
+
+    def drop_connection():
+        recv_exactly(server_sock, 4)
+        server_sock.shutdown(socket.SHUT_RDWR)
+
+    threading.Thread(target=drop_connection, daemon=True).start()
+    with pytest.raises(OSError):
+        conn.request(_request(1, b'data'))
+
+    assert conn.failed
+    assert not conn._pending_reqs
@@ -0,0 +1,197 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the near cache storage (:mod:`pygridgain.near_cache`).
+"""
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+
+from pygridgain import AioClient, Client
+from pygridgain.aio_cache import AioCache
+from pygridgain.cache import Cache
+from pygridgain.datatypes import ExpiryPolicy
+from pygridgain.datatypes.prop_codes import PROP_EXPIRY_POLICY, PROP_NAME
+from pygridgain.exceptions import ParameterError
+from pygridgain.near_cache import NearCache, expiry_policy_ttl
+
+
+def test_lru_eviction():
+    near_cache = NearCache(max_entries=3)
+    for key in range(3):
+        near_cache.put(key, str(key))
+    assert near_cache.get(0) == (True, '0')
+
+    near_cache.put(3, '3')
+    assert len(near_cache) == 3
+    assert near_cache.get(1) == (False, None)
+    assert all(near_cache.get(key)[0] for key in (0, 2, 3))
+    assert near_cache.stats()['evictions'] == 1
+
+
+def test_lfu_eviction():
+    near_cache = NearCache(max_entries=3, eviction_policy='lfu')
+    for key in range(3):
+        near_cache.put(key, key)
+    for key in (0, 0, 1, 2, 2):
+        near_cache.get(key)
+
+    near_cache.put(3, 3)
+    assert near_cache.get(1) == (False, None)
+
+    # a new key has the lowest frequency, so it goes first
+    near_cache.put(4, 4)
+    assert near_cache.get(3) == (False, None)
+    assert all(near_cache.get(key)[0] for key in (0, 2, 4))
+
+
+def test_memory_limit():
+    near_cache = NearCache(max_memory=10000)
+    for key in range(100):
+        near_cache.put(key, 'x' * 1000)
+
+    stats = near_cache.stats()
+    assert 0 < stats['memory'] <= 10000
+    assert stats['size'] + stats['evictions'] == 100
+    assert near_cache.get(99)[0]
+
+    # too big to be cached at all
+    near_cache.put('big', 'x' * 20000)
+    assert near_cache.get('big') == (False, None)
+
+
+def test_ttl():
+    near_cache = NearCache(ttl=0.05)
+    near_cache.put(1, 1)
+    near_cache.put(2, 2, expiry_policy=ExpiryPolicy(access=timedelta(seconds=10)))
+    assert near_cache.get(1) == (True, 1)
+
+    time.sleep(0.1)
+    assert near_cache.get(1) == (False, None)
+    assert near_cache.get(2) == (False, None)
+    assert near_cache.stats()['expirations'] == 2
+
+
+@pytest.mark.parametrize('expiry_policy,expected', [
+    (None, None),
+    (ExpiryPolicy(), None),
+    (ExpiryPolicy(create=ExpiryPolicy.ETERNAL), None),
+    (ExpiryPolicy(create=2000, access=timedelta(seconds=1)), 1.0),
+    (ExpiryPolicy(update=0), 0),
+])
+def test_expiry_policy_ttl(expiry_policy, expected):
+    assert expiry_policy_ttl(expiry_policy) == expected
+
+
+def test_zero_expiry_policy_is_not_cached():
+    near_cache = NearCache()
+    near_cache.put(1, 1, expiry_policy=ExpiryPolicy(access=0))
+    assert len(near_cache) == 0
+
+
+def test_configured_expiry_policy_bounds_ttl():
+    near_cache = NearCache(ttl=10, expiry_policy=ExpiryPolicy(create=timedelta(milliseconds=50)))
+    near_cache.put(1, 1)
+    near_cache.put(2, 2, expiry_policy=ExpiryPolicy(access=timedelta(seconds=10)))
+    assert near_cache.get(1) == (True, 1)
+
+    time.sleep(0.1)
+    assert near_cache.get(1) == (False, None)
+    assert near_cache.get(2) == (False, None)
+
+
+def _created_with_expiry_policy(cache):
+    # as if the cache was created with the expiry policy in its configuration
+    cache._settings = {PROP_NAME: cache.name, PROP_EXPIRY_POLICY: ExpiryPolicy(create=timedelta(milliseconds=50))}
+    reads = []
+
+    def get(key, key_hint):
+        reads.append(key)
+        return 'value'
+    return get, reads
+
+
+def test_cache_expiry_policy_is_honoured():
+    cache = Cache(Client(), 'expiring')
+    cache._get, reads = _created_with_expiry_policy(cache)
+    cache.with_near_cache(ttl=10)
+    assert cache.near_cache.expiry_policy.create == timedelta(milliseconds=50)
+
+    assert cache.get(1) == cache.get(1) == 'value'
+    assert reads == [1]
+    time.sleep(0.1)
+    assert cache.get(1) == 'value'
+    assert reads == [1, 1]
+
+
+def test_aio_cache_expiry_policy_is_honoured():
+    async def inner():
+        cache = AioCache(AioClient(), 'expiring')
+        get, reads = _created_with_expiry_policy(cache)
+
+        async def get_async(key, key_hint):
+            return get(key, key_hint)
+
+        cache._get = get_async
+        await cache.with_near_cache(ttl=10)
+
+        assert await cache.get(1) == await cache.get(1) == 'value'
+        assert reads == [1]
+        await asyncio.sleep(0.1)
+        assert await cache.get(1) == 'value'
+        assert reads == [1, 1]
+
+    asyncio.run(inner())
+
+
+def test_invalidation():
+    near_cache = NearCache()
+    for key in range(3):
+        near_cache.put(key, key)
+    generation = near_cache.generation
+
+    near_cache.invalidate([0, 1, 10, ['unhashable']])
+    assert near_cache.get(0) == (False, None)
+    assert near_cache.get(2) == (True, 2)
+
+    # the value was read before the invalidation, it might be stale
+    near_cache.put(0, 'stale', generation=generation)
+    assert near_cache.get(0) == (False, None)
+
+    near_cache.clear()
+    assert len(near_cache) == 0
+    assert near_cache.stats()['invalidations'] == 3
+
+
+def test_stats():
+    near_cache = NearCache()
+    near_cache.put(1, 1)
+    near_cache.get(1)
+    near_cache.get(2)
+    near_cache.get([3])
+
+    stats = near_cache.stats()
+    assert (stats['hits'], stats['misses'], stats['hit_ratio']) == (1, 2, 1 / 3)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'max_entries': 0}, {'max_memory': 0}, {'ttl': -1}, {'eviction_policy': 'fifo'}
+])
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ParameterError):
+        NearCache(**kwargs)
@@ -0,0 +1,113 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the initial connection of the synchronous client.
+The fake nodes are local sockets: the live ones answer the handshake,
+the silent ones accept the connection, but never answer, and the refused
+ones are closed ports.
+"""
+import socket
+import time
+
+import pytest
+
+from pygridgain import Client
+from pygridgain.exceptions import ParameterError, ReconnectError
+from tests.util import FakeServer
+
+HANDSHAKE_TIMEOUT = 1.0
+
+
+class SilentNode:
+    def __init__(self):
+        self.sock = socket.create_server(('127.0.0.1', 0), backlog=8)
+        self.port = self.sock.getsockname()[1]
+
+    def close(self):
+        self.sock.close()
+
+
+def _refused_port():
+    with socket.create_server(('127.0.0.1', 0)) as sock:
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def nodes():
+    live = [FakeServer(), FakeServer()]
+    silent = [SilentNode() for _ in range(3)]
+    yield live, silent
+    for node in live + silent:
+        node.close()
+
+
+def _addresses(live, silent):
+    ports = [_refused_port(), live[0].port] + [node.port for node in silent] + [live[1].port]
+    return [('127.0.0.1', port) for port in ports]
+
+
+def test_nodes_are_connected_in_parallel(nodes):
+    live, silent = nodes
+    client = Client(partition_aware=True, handshake_timeout=HANDSHAKE_TIMEOUT)
+    try:
+        started = time.monotonic()
+        client.connect(_addresses(live, silent))
+        # the silent nodes time out at once, not one after another
+        assert time.monotonic() - started < HANDSHAKE_TIMEOUT * 2
+
+        assert [conn.alive for conn in client._nodes] == [False, True, False, False, False, True]
+        # the failed nodes are reconnected in background
+        for i in (0, 2, 3, 4):
+            assert client._reconnect_scheduler.scheduled(client._nodes[i])
+    finally:
+        client.close()
+
+
+def test_connect_timeout(nodes):
+    live, silent = nodes
+    client = Client(partition_aware=True, handshake_timeout=HANDSHAKE_TIMEOUT, connect_timeout=0.2)
+    try:
+        started = time.monotonic()
+        client.connect(_addresses(live, silent))
+        assert time.monotonic() - started < HANDSHAKE_TIMEOUT
+        assert client._nodes[1].alive
+    finally:
+        client.close()
+
+
+@pytest.mark.parametrize('partition_aware', [True, False])
+def test_connect_timeout_bounds_foreground_handshake(nodes, partition_aware):
+    live, silent = nodes
+    client = Client(partition_aware=partition_aware, handshake_timeout=HANDSHAKE_TIMEOUT * 1.5, connect_timeout=0.3)
+    try:
+        started = time.monotonic()
+        client.connect([('127.0.0.1', silent[0].port), ('127.0.0.1', live[0].port)])
+        # the silent node takes the connect timeout, not the handshake timeout
+        assert time.monotonic() - started < HANDSHAKE_TIMEOUT
+        assert [conn.alive for conn in client._nodes] == [False, True]
+    finally:
+        client.close()
+
+
+def test_no_reachable_nodes():
+    client = Client(partition_aware=True)
+    with pytest.raises(ReconnectError):
+        client.connect([('127.0.0.1', _refused_port()), ('127.0.0.1', _refused_port())])
+
+
+def test_invalid_connect_timeout():
+    with pytest.raises(ParameterError):
+        Client(connect_timeout=0)
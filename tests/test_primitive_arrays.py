@@ -15,22 +15,29 @@
 #
 """
 Server-free coverage for the bulk primitive-array deserialization fast path
-(:func:`pygridgain.datatypes.primitive_arrays._bulk_to_python`, GG-49287).
+(:func:`pygridgain.datatypes.primitive_arrays._bulk_to_python`, GG-49287)
+and its serialization counterpart (:func:`~pygridgain.datatypes.primitive_arrays._bulk_from_python`).
 
 These exercise the real serialize -> parse -> read_ctype -> to_python codec
 without a running node, so the decode path is checked in CI's unit run rather
 than only via the live put/get round-trips in ``tests/common/test_datatypes.py``.
 """
+import array
+import struct
 import sys
 
 import pytest
 
+from pygridgain import Client
+from pygridgain.datatypes import primitive_arrays
+from pygridgain.datatypes.decoder import DirectDecoder
 from pygridgain.datatypes.primitive_arrays import (
     _bulk_to_python,
     ByteArrayObject, ShortArrayObject, IntArrayObject, LongArrayObject,
     FloatArrayObject, DoubleArrayObject, CharArrayObject, BoolArrayObject,
     FloatArray, IntArray, ShortArray, LongArray, DoubleArray,
 )
+from pygridgain.exceptions import ParameterError
 from pygridgain.stream.binary_stream import BinaryStream
 
 
@@ -118,3 +125,82 @@ def test_bulk_decode_matches_elementwise_and_big_endian_fallback(monkeypatch):
     monkeypatch.setattr(sys, 'byteorder', 'big')   # force the element-wise fallback branch
     fallback = _bulk_to_python(ctypes_object)
     assert fallback == reference == value
+
+
+def _serialize_elementwise(monkeypatch, datatype, value):
+    with monkeypatch.context() as m:
+        m.setattr(primitive_arrays, '_bulk_from_python', lambda *args: None)
+        return _serialize(datatype, value)
+
+
+@pytest.mark.parametrize('datatype,value', NUMERIC_CASES + [
+    (BoolArrayObject, [True, False, 1, 0, 'x', None]),
+    (CharArrayObject, ['A', 'я', 'カ', '好', '€']),
+    (CharArrayObject, 'Aя€'),
+])
+def test_bulk_encode_matches_elementwise(monkeypatch, datatype, value):
+    assert _serialize(datatype, value) == _serialize_elementwise(monkeypatch, datatype, value)
+
+
+@pytest.mark.parametrize('datatype,typecode,value', [
+    (FloatArrayObject, 'f', [float(i) for i in range(1536)]),
+    # converted, since the item types differ
+    (FloatArrayObject, 'd', [0.5, -2.25]),
+    (DoubleArrayObject, 'd', [0.5, -2.25]),
+    (IntArrayObject, 'i', [-1, 0, 2 ** 31 - 1]),
+    (LongArrayObject, 'q', [-1, 0, 2 ** 63 - 1]),
+    (LongArrayObject, 'i', [-1, 0, 2 ** 31 - 1]),
+    (ShortArray, 'h', [-1, 0, 7]),
+])
+def test_array_module_arrays(datatype, typecode, value):
+    assert _serialize(datatype, array.array(typecode, value)) == _serialize(datatype, value)
+
+
+def test_numpy_arrays():
+    np = pytest.importorskip('numpy')
+    value = [float(i) for i in range(1536)]
+    for dtype in ('<f4', '>f4', '<f8'):
+        assert _serialize(FloatArrayObject, np.array(value, dtype=dtype)) == _serialize(FloatArrayObject, value)
+    # not contiguous
+    assert _serialize(IntArrayObject, np.arange(10)[::2]) == _serialize(IntArrayObject, [0, 2, 4, 6, 8])
+    assert _serialize(BoolArrayObject, np.array([True, False])) == _serialize(BoolArrayObject, [True, False])
+
+
+def test_bulk_encode_errors():
+    with pytest.raises(struct.error):
+        _serialize(IntArrayObject, [2 ** 31])
+    # unsigned values are range-checked too
+    with pytest.raises(struct.error):
+        _serialize(IntArrayObject, array.array('I', [2 ** 31]))
+    # out of the BMP, falls back to the element-wise encoding
+    with pytest.raises(OverflowError):
+        _serialize(CharArrayObject, ['\U0001f600'])
+
+
+@pytest.mark.parametrize('direct', [False, True])
+def test_array_format(direct):
+    client = Client(array_format='array')
+    value = [0.0, 1.5, -2.25]
+    buf = _serialize(DoubleArrayObject, value)
+    if direct:
+        result = DirectDecoder(buf, client).decode_any(0)[0]
+    else:
+        result = DoubleArrayObject.to_python(_to_ctypes_object(DoubleArrayObject, value), client=client)
+    assert result == array.array('d', value)
+
+    # chars and bools are still lists
+    assert CharArrayObject.to_python(_to_ctypes_object(CharArrayObject, ['a']), client=client) == ['a']
+
+
+def test_numpy_array_format():
+    np = pytest.importorskip('numpy')
+    client = Client(array_format='numpy')
+    value = [float(i) for i in range(1536)]
+    result = FloatArrayObject.to_python(_to_ctypes_object(FloatArrayObject, value), client=client)
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == value
+
+
+def test_invalid_array_format():
+    with pytest.raises(ParameterError):
+        Client(array_format='tuple')
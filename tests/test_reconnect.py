@@ -0,0 +1,175 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the background reconnection of the failed nodes.
+"""
+import asyncio
+import threading
+import time
+from itertools import islice
+
+from pygridgain import AioClient, Client
+from pygridgain.connection.bitmask_feature import BitmaskFeature
+from pygridgain.connection.protocol_context import ProtocolContext
+from pygridgain.connection.reconnect import AioReconnectScheduler, ReconnectScheduler, backoff_delays
+
+SEQUENCE = [0, 0.01, 0.02]
+
+
+class FakeNode:
+    host = 'localhost'
+    port = 10800
+
+    def __init__(self, alive=False, attempts_to_connect=1):
+        self.alive = alive
+        self.attempts = 0
+        self.attempts_to_connect = attempts_to_connect
+        self.reconnect_threads = set()
+
+    def reconnect(self):
+        self.reconnect_threads.add(threading.current_thread())
+        self.attempts += 1
+        self.alive = self.attempts >= self.attempts_to_connect
+
+    def connect(self):
+        self.alive = True
+
+    def close(self):
+        self.alive = False
+
+
+class AioFakeNode(FakeNode):
+    async def reconnect(self):
+        super().reconnect()
+
+
+def _partition_aware(client):
+    client.protocol_context = ProtocolContext((1, 7, 1), BitmaskFeature.all_supported())
+    return client
+
+
+def _wait(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_backoff_delays():
+    assert list(islice(backoff_delays([0, 1, 2]), 6)) == [0, 1, 2, 2, 2, 2]
+
+
+def test_node_is_reconnected_in_background():
+    scheduler = ReconnectScheduler(SEQUENCE)
+    node = FakeNode(attempts_to_connect=5)
+    scheduler.schedule(node)
+    scheduler.schedule(node)
+
+    assert _wait(lambda: not scheduler.scheduled(node))
+    assert node.alive and node.attempts == 5
+    assert threading.current_thread() not in node.reconnect_threads
+    assert len(node.reconnect_threads) == 1
+
+
+def test_stop():
+    scheduler = ReconnectScheduler([0, 10])
+    node = FakeNode(attempts_to_connect=100)
+    scheduler.schedule(node)
+    assert _wait(lambda: node.attempts == 1)
+
+    scheduler.stop()
+    assert not scheduler.scheduled(node)
+    time.sleep(0.05)
+    assert node.attempts == 1
+
+
+def test_requests_go_to_live_nodes():
+    client = _partition_aware(Client(partition_aware=True))
+    client._reconnect_scheduler = ReconnectScheduler(SEQUENCE)
+    live, dead = FakeNode(alive=True), FakeNode(attempts_to_connect=3)
+    client._nodes = [live, dead]
+    client._pools = {live: None, dead: None}
+
+    client._schedule_reconnect(dead)
+    for _ in range(10):
+        assert client._get_random_node() is live
+
+    assert _wait(lambda: dead.alive)
+    assert dead.attempts == 3
+    assert threading.current_thread() not in dead.reconnect_threads
+    client._reconnect_scheduler.stop()
+
+
+def test_only_pooled_nodes_are_scheduled():
+    node = FakeNode(attempts_to_connect=100)
+
+    client = _partition_aware(Client(partition_aware=True))
+    client._schedule_reconnect(node)
+    assert not client._reconnect_scheduler.scheduled(node)
+
+    client = Client(partition_aware=False)
+    client._reconnect_scheduler = ReconnectScheduler([0, 10])
+    client._pools[node] = None
+    client._schedule_reconnect(node)
+    assert client._reconnect_scheduler.scheduled(node)
+    client._reconnect_scheduler.stop()
+
+
+def test_non_partition_aware_client_fails_over_while_reconnecting():
+    client = Client(partition_aware=False)
+    client._reconnect_scheduler = ReconnectScheduler(SEQUENCE)
+    failed, other = FakeNode(attempts_to_connect=3), FakeNode()
+    client._nodes = [failed, other]
+    client._pools = {failed: None, other: None}
+
+    client._schedule_reconnect(failed)
+    assert client._get_usable_node() is other
+    assert client._current_node == 1
+
+    assert _wait(lambda: failed.alive)
+    assert failed.attempts == 3
+    assert threading.current_thread() not in failed.reconnect_threads
+
+    # the reconnected node is used on the next failover
+    other.close()
+    assert client._get_usable_node() is failed
+    assert client._current_node == 0
+    client._reconnect_scheduler.stop()
+
+
+def test_aio_node_is_reconnected_in_background():
+    async def inner():
+        client = _partition_aware(AioClient(partition_aware=True))
+        client._reconnect_scheduler = AioReconnectScheduler(SEQUENCE)
+        node = AioFakeNode(attempts_to_connect=5)
+        client._nodes = [node]
+        client._pools = {node: None}
+
+        client._reconnect_failed_nodes()
+        assert client._reconnect_scheduler.scheduled(node)
+        while client._reconnect_scheduler.scheduled(node):
+            await asyncio.sleep(0.01)
+        assert node.alive and node.attempts == 5
+
+        node.alive = False
+        client._reconnect_failed_nodes()
+        task = client._reconnect_scheduler._workers[node]
+        client._reconnect_scheduler.stop()
+        assert not client._reconnect_scheduler.scheduled(node)
+        await asyncio.gather(task, return_exceptions=True)
+        assert task.cancelled()
+
+    asyncio.run(inner())
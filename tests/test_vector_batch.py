@@ -0,0 +1,98 @@
+#
+# Copyright 2026 GridGain Systems, Inc. and Contributors.
+#
+# Licensed under the GridGain Community Edition License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gridgain.com/products/software/community-edition/gridgain-community-edition-license
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Server-free checks of the batched vector search. The peer side of a socket
+pair plays the server node: the results of a vector query are derived
+from the first element of its search vector.
+"""
+import asyncio
+import struct
+
+from pygridgain.aio_cache import AioCache
+from pygridgain.cache import Cache
+from pygridgain.queries.op_codes import OP_QUERY_VECTOR, OP_QUERY_VECTOR_CURSOR_GET_PAGE, OP_RESOURCE_CLOSE
+from tests.util import FakeNode, fake_node_aio_client, fake_node_client
+
+TYPE_NAME = 'Embedding'
+INT_TYPE_CODE = 3
+K = 5
+
+
+def _expected(vector):
+    base = int(vector[0]) * 100
+    return [(base + i, i) for i in range(K)]
+
+
+class VectorNode(FakeNode):
+    def __init__(self, sock):
+        self.cursors = {}
+        self.page_sizes = {}
+        super().__init__(sock)
+
+    def _page(self, cursor_id):
+        entries = self.cursors[cursor_id]
+        page_size = self.page_sizes[cursor_id]
+        page, self.cursors[cursor_id] = entries[:page_size], entries[page_size:]
+        data = struct.pack('<i', len(page)) + b''.join(
+            struct.pack('<bibi', INT_TYPE_CODE, key, INT_TYPE_CODE, value) for key, value in page
+        )
+        return data + struct.pack('<b', bool(self.cursors[cursor_id]))
+
+    def respond(self, op_code, query_id, request):
+        body = struct.pack('<qh', query_id, 0)
+        if op_code == OP_QUERY_VECTOR:
+            # page size (int), type name and field (strings), search vector (float array)
+            type_pos = request.index(TYPE_NAME.encode())
+            field_pos = type_pos + len(TYPE_NAME)
+            field_len = struct.unpack_from('<i', request, field_pos + 1)[0]
+            first = struct.unpack_from('<f', request, field_pos + 5 + field_len + 5)[0]
+            cursor_id = len(self.cursors) + 1
+            self.cursors[cursor_id] = _expected([first])
+            self.page_sizes[cursor_id] = struct.unpack_from('<i', request, type_pos - 9)[0]
+            body += struct.pack('<q', cursor_id) + self._page(cursor_id)
+        elif op_code == OP_QUERY_VECTOR_CURSOR_GET_PAGE:
+            body += self._page(struct.unpack_from('<q', request, 10)[0])
+        else:
+            assert op_code == OP_RESOURCE_CLOSE
+        return body
+
+
+VECTORS = [[float(i), 0.5, 0.25] for i in range(20)]
+
+
+def test_vector_batch():
+    with fake_node_client(VectorNode) as (client, node):
+        results = Cache(client, 'test').vector_batch(TYPE_NAME, 'vec', VECTORS, K, 0.5)
+        assert results == [_expected(vector) for vector in VECTORS]
+        # the page size is derived from k
+        assert node.count(OP_QUERY_VECTOR) == len(VECTORS)
+        assert node.count(OP_QUERY_VECTOR_CURSOR_GET_PAGE) == 0
+
+        results = Cache(client, 'test').vector_batch(TYPE_NAME, 'vec', VECTORS[:2], K, 0.5, page_size=2)
+        assert results == [_expected(vector) for vector in VECTORS[:2]]
+        assert node.count(OP_QUERY_VECTOR_CURSOR_GET_PAGE) == 4
+
+        assert Cache(client, 'test').vector_batch(TYPE_NAME, 'vec', [], K, 0.5) == []
+
+
+def test_aio_vector_batch():
+    async def inner():
+        async with fake_node_aio_client(VectorNode) as (client, node):
+            results = await AioCache(client, 'test').vector_batch(TYPE_NAME, 'vec', VECTORS, K, 0.5)
+            assert results == [_expected(vector) for vector in VECTORS]
+            assert node.count(OP_QUERY_VECTOR_CURSOR_GET_PAGE) == 0
+
+    asyncio.run(inner())
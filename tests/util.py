@@ -25,8 +25,19 @@ import jinja2 as jinja2
 import psutil
 import re
 import signal
+import socket
+import struct
 import subprocess
+import threading
 import time
+import uuid
+
+from pygridgain import AioClient, Client
+from pygridgain.connection import AioConnection, Connection
+from pygridgain.connection.bitmask_feature import BitmaskFeature
+from pygridgain.connection.protocol_context import ProtocolContext
+from pygridgain.constants import RHF_ERROR
+from pygridgain.exceptions import SocketError
 
 
 try:
@@ -229,3 +240,147 @@ def clear_workdir():
         work_dir = os.path.join(path, 'work')
         if os.path.exists(work_dir):
             shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def recv_exactly(sock, size):
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise EOFError
+        data += chunk
+    return data
+
+
+def error_response(query_id, status, message='Fail!'):
+    message = message.encode()
+    return struct.pack('<qhi', query_id, RHF_ERROR, status) + struct.pack('<bi', 9, len(message)) + message
+
+
+class FakeNode:
+    """
+    Serves the client requests on its end of a socket pair, so the client
+    code can be tested without a server. Subclasses build the response body
+    for each request.
+    """
+    def __init__(self, sock, handshake=False):
+        self.sock = sock
+        self.handshake = handshake
+        self.requests = []
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def respond(self, op_code, query_id, request):
+        raise NotImplementedError
+
+    def _answer_handshake(self):
+        length = struct.unpack('<i', recv_exactly(self.sock, 4))[0]
+        recv_exactly(self.sock, length)
+        features = bytes(BitmaskFeature.all_supported())
+        # success, features (byte array), node UUID
+        body = struct.pack('<bbi', 1, 12, len(features)) + features + struct.pack('<b', 10) + uuid.uuid4().bytes
+        self.sock.sendall(struct.pack('<i', len(body)) + body)
+
+    def _serve(self):
+        try:
+            if self.handshake:
+                self._answer_handshake()
+            while True:
+                length = struct.unpack('<i', recv_exactly(self.sock, 4))[0]
+                request = recv_exactly(self.sock, length)
+                op_code, query_id = struct.unpack_from('<hq', request)
+                self.requests.append(op_code)
+                body = self.respond(op_code, query_id, request)
+                self.sock.sendall(struct.pack('<i', len(body)) + body)
+        except (EOFError, OSError):
+            pass
+
+    def count(self, op_code):
+        return self.requests.count(op_code)
+
+
+class FakeServer:
+    """
+    Listens on a local port and serves every accepted connection
+    with a fake node, that answers the handshake first.
+    """
+    def __init__(self, node_factory=FakeNode):
+        self.node_factory = node_factory
+        self.sock = socket.create_server(('127.0.0.1', 0))
+        self.port = self.sock.getsockname()[1]
+        self.nodes = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        try:
+            while True:
+                conn, _ = self.sock.accept()
+                self.nodes.append(self.node_factory(conn, handshake=True))
+        except OSError:
+            pass
+
+    def close(self):
+        self.sock.close()
+        for node in self.nodes:
+            node.sock.close()
+
+
+class ClientProtocol(asyncio.Protocol):
+    def __init__(self, conn):
+        self.conn = conn
+        self.buffer = b''
+
+    def data_received(self, data):
+        self.buffer += data
+        while len(self.buffer) >= 4:
+            length = struct.unpack_from('<i', self.buffer)[0] + 4
+            if len(self.buffer) < length:
+                break
+            self.conn.process_message(self.buffer[:length])
+            self.buffer = self.buffer[length:]
+
+    def connection_lost(self, exc):
+        self.conn.process_connection_lost(exc or SocketError('Connection closed'))
+
+
+def _fake_protocol_context(client):
+    client.protocol_context = ProtocolContext((1, 7, 1), BitmaskFeature.all_supported())
+    return client
+
+
+@contextlib.contextmanager
+def fake_node_client(node_factory, partition_aware=True):
+    """
+    Connects a client to the fake node created by `node_factory`
+    from its end of a socket pair. Yields the client and the node.
+    """
+    client_sock, server_sock = socket.socketpair()
+    client = _fake_protocol_context(Client(partition_aware=partition_aware))
+    conn = Connection(client, 'localhost', 10800, multiplexed=True)
+    conn._socket = client_sock
+    conn._start_reader()
+    client._nodes.append(conn)
+    try:
+        yield client, node_factory(server_sock)
+    finally:
+        client.close()
+        server_sock.close()
+
+
+@asynccontextmanager
+async def fake_node_aio_client(node_factory, partition_aware=True, **conn_kwargs):
+    """
+    Async counterpart of :func:`fake_node_client`.
+    """
+    client_sock, server_sock = socket.socketpair()
+    node = node_factory(server_sock)
+    client = _fake_protocol_context(AioClient(partition_aware=partition_aware))
+    conn = AioConnection(client, 'localhost', 10800, **conn_kwargs)
+    conn._transport, _ = await asyncio.get_running_loop().create_connection(
+        lambda: ClientProtocol(conn), sock=client_sock
+    )
+    client._nodes.append(conn)
+    try:
+        yield client, node
+    finally:
+        await conn.close()
+        server_sock.close()